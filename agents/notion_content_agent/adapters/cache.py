@@ -1,14 +1,30 @@
 """
 TTL (Time-To-Live) cache for API responses.
 
-Provides async-safe caching with automatic expiration to reduce
-API calls and improve performance.
+Provides a bounded, single-flight cache with automatic expiration to
+reduce API calls and improve performance.
+
+- LRU eviction by entry count and by approximate size in bytes
+- Single-flight: concurrent misses on one key share one fetch, whether the
+  callers are coroutines (AsyncOrchestrator) or executor threads
+- Stale-while-revalidate: for ``stale_seconds`` after expiry the old value
+  is served while one background fetch refreshes it
+- Negative caching: "not found" errors (HTTP 404 / Notion object_not_found)
+  are remembered for ``negative_ttl_seconds`` and re-raised without a fetch
+- Optional SQLite disk tier (``disk_path``) that survives agent restarts
 """
 
 import asyncio
+import concurrent.futures
 import logging
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from pathlib import Path
 from typing import TypeVar, Generic, Optional, Callable, Dict, Any, Awaitable, Union
 
 from constants import Defaults
@@ -18,36 +34,144 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 
 
+def is_not_found(error: BaseException) -> bool:
+    """Check whether an error means the requested object does not exist."""
+    status = getattr(error, "status", None) or getattr(error, "status_code", None)
+    code = getattr(error, "code", None)
+    return status == 404 or code == "object_not_found"
+
+
+def approximate_size(value: Any) -> int:
+    """Approximate memory footprint of a value in bytes (recursive for containers)."""
+    seen = set()
+    stack = [value]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    return total
+
+
 @dataclass
 class CacheEntry(Generic[T]):
-    """A single cache entry with expiration."""
-    value: T
-    expires_at: datetime
-    created_at: datetime = field(default_factory=datetime.now)
+    """A single cache entry with expiration (timestamps are ``time.time()``)."""
+    value: Optional[T]
+    expires_at: float
+    created_at: float = field(default_factory=time.time)
+    size: int = 0
+    error: Optional[BaseException] = None  # Set for negative (not found) entries
 
     @property
     def is_expired(self) -> bool:
         """Check if this entry has expired."""
-        return datetime.now() > self.expires_at
+        return time.time() > self.expires_at
+
+    @property
+    def is_negative(self) -> bool:
+        """Check if this entry records a "not found" result."""
+        return self.error is not None
 
     @property
     def age_seconds(self) -> float:
         """Get the age of this entry in seconds."""
-        return (datetime.now() - self.created_at).total_seconds()
+        return time.time() - self.created_at
+
+
+class _DiskTier:
+    """SQLite store behind the in-memory LRU. Values are pickled; unpicklable ones stay memory-only."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                expires_at REAL NOT NULL,
+                created_at REAL NOT NULL,
+                negative INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at, created_at, negative FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            payload = pickle.loads(row[0])
+        except Exception as e:
+            logger.debug(f"Dropping unreadable disk cache entry {key}: {e}")
+            self.delete(key)
+            return None
+        if row[3]:
+            return CacheEntry(value=None, expires_at=row[1], created_at=row[2], error=payload)
+        return CacheEntry(value=payload, expires_at=row[1], created_at=row[2], size=len(row[0]))
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        try:
+            blob = pickle.dumps(entry.error if entry.is_negative else entry.value, pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"Not persisting cache key {key}: {e}")
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, created_at, negative) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, entry.expires_at, entry.created_at, int(entry.is_negative)),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str) -> None:
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key LIKE ? ESCAPE '\\'", (escaped + "%",))
+
+    def delete_expired(self, before: float) -> int:
+        with self._lock:
+            return self._conn.execute("DELETE FROM cache WHERE expires_at < ?", (before,)).rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
 
 
 class TTLCache(Generic[T]):
     """
-    Thread-safe TTL cache for API responses.
+    Bounded, thread-safe TTL cache for API responses.
 
     Features:
-    - Async-safe with locking
-    - Automatic expiration
-    - Manual invalidation
-    - Statistics tracking
+    - LRU eviction by entry count and approximate bytes
+    - One fetch per key at a time (async and sync callers share it)
+    - Stale-while-revalidate and negative caching of "not found" errors
+    - Optional SQLite disk tier
+    - Manual invalidation and statistics tracking
 
     Usage:
-        cache = TTLCache(ttl_seconds=300)
+        cache = TTLCache(ttl_seconds=300, disk_path="data/notion_cache.db")
 
         # Async usage
         result = await cache.get_or_fetch_async(
@@ -62,12 +186,146 @@ class TTLCache(Generic[T]):
         )
     """
 
-    def __init__(self, ttl_seconds: int = Defaults.CACHE_TTL_SECONDS):
-        self._cache: Dict[str, CacheEntry[T]] = {}
-        self._ttl = timedelta(seconds=ttl_seconds)
-        self._lock = asyncio.Lock()
+    def __init__(
+        self,
+        ttl_seconds: int = Defaults.CACHE_TTL_SECONDS,
+        max_entries: int = Defaults.CACHE_MAX_ENTRIES,
+        max_bytes: int = Defaults.CACHE_MAX_BYTES,
+        stale_seconds: float = Defaults.CACHE_STALE_SECONDS,
+        negative_ttl_seconds: float = Defaults.CACHE_NEGATIVE_TTL_SECONDS,
+        disk_path: Optional[Union[str, Path]] = None,
+        not_found: Callable[[BaseException], bool] = is_not_found,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: How long a fetched value is fresh
+            max_entries: Maximum entries kept in memory
+            max_bytes: Maximum approximate bytes kept in memory
+            stale_seconds: How long after expiry a value may still be served while refreshing
+            negative_ttl_seconds: How long a "not found" result is remembered (0 disables)
+            disk_path: SQLite file for the persistent tier (None for memory only)
+            not_found: Predicate deciding which fetch errors are cached as "not found"
+        """
+        self._cache: "OrderedDict[str, CacheEntry[T]]" = OrderedDict()
+        self._ttl = float(ttl_seconds)
+        self._max_entries = max(1, int(max_entries))
+        self._max_bytes = max(1, int(max_bytes))
+        self._stale = float(stale_seconds)
+        self._negative_ttl = float(negative_ttl_seconds)
+        self._not_found = not_found
+        self._disk = _DiskTier(disk_path) if disk_path else None
+
+        self._lock = threading.RLock()
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        self._refresh_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._bytes = 0
+
         self._hits = 0
         self._misses = 0
+        self._stale_hits = 0
+        self._negative_hits = 0
+        self._coalesced = 0
+        self._disk_hits = 0
+        self._evictions = 0
+        self._fetches = 0
+        self._fetch_errors = 0
+
+    # ==================== Lookup ====================
+
+    def _lookup(self, key: str):
+        """
+        Decide how to serve a key. Must be called with the lock held.
+
+        Returns:
+            (kind, entry, future, owned): kind is 'hit', 'stale', 'wait' or 'fetch';
+            entry is set for hit/stale; future is the key's in-flight fetch, and
+            owned is True when the caller must run that fetch
+        """
+        entry = self._cache.get(key)
+        if entry is None and self._disk is not None:
+            entry = self._disk.get(key)
+            if entry is not None and entry.expires_at + self._stale_window(entry) >= time.time():
+                self._disk_hits += 1
+                self._store(key, entry, persist=False)
+            else:
+                entry = None
+
+        now = time.time()
+        future = self._inflight.get(key)
+        if entry is not None:
+            if now <= entry.expires_at:
+                self._cache.move_to_end(key)
+                return "hit", entry, None, False
+            if now <= entry.expires_at + self._stale_window(entry):
+                self._cache.move_to_end(key)
+                if future is None:
+                    future = self._inflight[key] = concurrent.futures.Future()
+                    return "stale", entry, future, True
+                return "stale", entry, future, False
+
+        if future is not None:
+            self._coalesced += 1
+            return "wait", None, future, False
+        future = self._inflight[key] = concurrent.futures.Future()
+        return "fetch", None, future, True
+
+    def _stale_window(self, entry: CacheEntry) -> float:
+        return 0.0 if entry.is_negative else self._stale
+
+    def _serve(self, key: str, entry: CacheEntry[T], stale: bool) -> T:
+        if entry.is_negative:
+            self._negative_hits += 1
+            logger.debug(f"Cache negative hit for key: {key}")
+            raise entry.error.with_traceback(None)
+        self._hits += 1
+        if stale:
+            self._stale_hits += 1
+            logger.debug(f"Cache stale hit for key: {key} (refreshing)")
+        else:
+            logger.debug(f"Cache hit for key: {key}")
+        return entry.value
+
+    # ==================== Fetch Completion ====================
+
+    def _complete(self, key: str, future: concurrent.futures.Future, value: T = None,
+                  error: Optional[BaseException] = None) -> None:
+        """Record a finished fetch and release everyone waiting on it."""
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            self._fetches += 1
+            if error is None:
+                self._store(key, CacheEntry(value=value, expires_at=time.time() + self._ttl))
+            elif self._negative_ttl > 0 and self._not_found(error):
+                self._store(key, CacheEntry(value=None, expires_at=time.time() + self._negative_ttl, error=error))
+            else:
+                self._fetch_errors += 1
+        if error is None:
+            future.set_result(value)
+        else:
+            future.set_exception(error)
+
+    def _store(self, key: str, entry: CacheEntry[T], persist: bool = True) -> None:
+        """Insert an entry and evict least recently used ones. Must be called with the lock held."""
+        if not entry.size:
+            entry.size = approximate_size(entry.error if entry.is_negative else entry.value)
+        old = self._cache.pop(key, None)
+        if old is not None:
+            self._bytes -= old.size
+        self._cache[key] = entry
+        self._bytes += entry.size
+        if persist and self._disk is not None:
+            self._disk.put(key, entry)
+
+        while self._cache and (len(self._cache) > self._max_entries or self._bytes > self._max_bytes):
+            evicted_key, evicted = self._cache.popitem(last=False)
+            self._bytes -= evicted.size
+            self._evictions += 1
+            logger.debug(f"Evicted cache key: {evicted_key}")
+
+    # ==================== Public API ====================
 
     async def get_or_fetch_async(
         self,
@@ -77,6 +335,8 @@ class TTLCache(Generic[T]):
         """
         Get value from cache or fetch and cache it (async version).
 
+        Concurrent callers missing on the same key wait for a single fetch.
+
         Args:
             key: Cache key
             fetch_fn: Function to call if cache miss (sync or async)
@@ -84,32 +344,36 @@ class TTLCache(Generic[T]):
         Returns:
             Cached or freshly fetched value
         """
-        async with self._lock:
-            # Check cache
-            entry = self._cache.get(key)
-            if entry and not entry.is_expired:
-                self._hits += 1
-                logger.debug(f"Cache hit for key: {key}")
-                return entry.value
-
-            self._misses += 1
-            logger.debug(f"Cache miss for key: {key}")
-
-        # Fetch new value (outside lock to allow concurrent fetches)
-        if asyncio.iscoroutinefunction(fetch_fn):
-            value = await fetch_fn()
-        else:
-            # Run sync function in thread pool
-            value = await asyncio.get_event_loop().run_in_executor(None, fetch_fn)
-
-        # Cache the result
-        async with self._lock:
-            self._cache[key] = CacheEntry(
-                value=value,
-                expires_at=datetime.now() + self._ttl
-            )
-
-        return value
+        with self._lock:
+            kind, entry, future, owned = self._lookup(key)
+            if kind == "fetch":
+                self._misses += 1
+                logger.debug(f"Cache miss for key: {key}")
+
+        if entry is not None:
+            if owned:
+                # Refresh in the background; the stale value is served meanwhile
+                asyncio.ensure_future(self._run_fetch_async(key, future, fetch_fn))
+            return self._serve(key, entry, stale=kind == "stale")
+
+        if owned:
+            await self._run_fetch_async(key, future, fetch_fn)
+        return await asyncio.wrap_future(future)
+
+    async def _run_fetch_async(self, key: str, future: concurrent.futures.Future,
+                               fetch_fn: Union[Callable[[], T], Callable[[], Awaitable[T]]]) -> None:
+        try:
+            if asyncio.iscoroutinefunction(fetch_fn):
+                value = await fetch_fn()
+            else:
+                # Run sync function in thread pool
+                value = await asyncio.get_running_loop().run_in_executor(None, fetch_fn)
+        except BaseException as e:
+            self._complete(key, future, error=e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        self._complete(key, future, value=value)
 
     def get_or_fetch(
         self,
@@ -119,6 +383,9 @@ class TTLCache(Generic[T]):
         """
         Get value from cache or fetch and cache it (sync version).
 
+        Safe to call from several threads; concurrent misses on the same key
+        wait for a single fetch.
+
         Args:
             key: Cache key
             fetch_fn: Function to call if cache miss
@@ -126,26 +393,39 @@ class TTLCache(Generic[T]):
         Returns:
             Cached or freshly fetched value
         """
-        # Check cache
-        entry = self._cache.get(key)
-        if entry and not entry.is_expired:
-            self._hits += 1
-            logger.debug(f"Cache hit for key: {key}")
-            return entry.value
-
-        self._misses += 1
-        logger.debug(f"Cache miss for key: {key}")
-
-        # Fetch new value
-        value = fetch_fn()
-
-        # Cache the result
-        self._cache[key] = CacheEntry(
-            value=value,
-            expires_at=datetime.now() + self._ttl
-        )
-
-        return value
+        with self._lock:
+            kind, entry, future, owned = self._lookup(key)
+            if kind == "fetch":
+                self._misses += 1
+                logger.debug(f"Cache miss for key: {key}")
+
+        if entry is not None:
+            if owned:
+                # Refresh in the background; the stale value is served meanwhile
+                self._refresh_executor().submit(self._run_fetch, key, future, fetch_fn)
+            return self._serve(key, entry, stale=kind == "stale")
+
+        if owned:
+            self._run_fetch(key, future, fetch_fn)
+        return future.result()
+
+    def _run_fetch(self, key: str, future: concurrent.futures.Future, fetch_fn: Callable[[], T]) -> None:
+        try:
+            value = fetch_fn()
+        except BaseException as e:
+            self._complete(key, future, error=e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        self._complete(key, future, value=value)
+
+    def _refresh_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._refresh_pool is None:
+                self._refresh_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="cache-refresh"
+                )
+            return self._refresh_pool
 
     def get(self, key: str) -> Optional[T]:
         """
@@ -157,9 +437,15 @@ class TTLCache(Generic[T]):
         Returns:
             Cached value or None if not found/expired
         """
-        entry = self._cache.get(key)
-        if entry and not entry.is_expired:
-            return entry.value
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None and self._disk is not None:
+                entry = self._disk.get(key)
+                if entry is not None and not entry.is_expired:
+                    self._store(key, entry, persist=False)
+            if entry and not entry.is_expired and not entry.is_negative:
+                self._cache.move_to_end(key)
+                return entry.value
         return None
 
     def set(self, key: str, value: T, ttl_seconds: Optional[int] = None) -> None:
@@ -171,11 +457,9 @@ class TTLCache(Generic[T]):
             value: Value to cache
             ttl_seconds: Optional custom TTL (uses default if not specified)
         """
-        ttl = timedelta(seconds=ttl_seconds) if ttl_seconds else self._ttl
-        self._cache[key] = CacheEntry(
-            value=value,
-            expires_at=datetime.now() + ttl
-        )
+        ttl = ttl_seconds if ttl_seconds else self._ttl
+        with self._lock:
+            self._store(key, CacheEntry(value=value, expires_at=time.time() + ttl))
 
     def invalidate(self, key: str) -> bool:
         """
@@ -187,8 +471,13 @@ class TTLCache(Generic[T]):
         Returns:
             True if entry was removed, False if not found
         """
-        if key in self._cache:
-            del self._cache[key]
+        with self._lock:
+            entry = self._cache.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry.size
+            if self._disk is not None:
+                self._disk.delete(key)
+        if entry is not None:
             logger.debug(f"Invalidated cache key: {key}")
             return True
         return False
@@ -203,9 +492,12 @@ class TTLCache(Generic[T]):
         Returns:
             Number of entries removed
         """
-        keys_to_remove = [k for k in self._cache.keys() if k.startswith(prefix)]
-        for key in keys_to_remove:
-            del self._cache[key]
+        with self._lock:
+            keys_to_remove = [k for k in self._cache.keys() if k.startswith(prefix)]
+            for key in keys_to_remove:
+                self._bytes -= self._cache.pop(key).size
+            if self._disk is not None:
+                self._disk.delete_prefix(prefix)
 
         if keys_to_remove:
             logger.debug(f"Invalidated {len(keys_to_remove)} cache entries with prefix: {prefix}")
@@ -214,45 +506,70 @@ class TTLCache(Generic[T]):
 
     def clear(self) -> int:
         """
-        Clear all cached entries.
+        Clear all cached entries (memory and disk).
 
         Returns:
-            Number of entries cleared
+            Number of in-memory entries cleared
         """
-        count = len(self._cache)
-        self._cache.clear()
+        with self._lock:
+            count = len(self._cache)
+            self._cache.clear()
+            self._bytes = 0
+            if self._disk is not None:
+                self._disk.clear()
         logger.debug(f"Cleared {count} cache entries")
         return count
 
     def cleanup_expired(self) -> int:
         """
-        Remove all expired entries.
+        Remove all entries past their expiry and stale window.
 
         Returns:
-            Number of expired entries removed
+            Number of expired in-memory entries removed
         """
-        expired_keys = [k for k, v in self._cache.items() if v.is_expired]
-        for key in expired_keys:
-            del self._cache[key]
+        now = time.time()
+        with self._lock:
+            expired_keys = [
+                k for k, v in self._cache.items()
+                if now > v.expires_at + self._stale_window(v)
+            ]
+            for key in expired_keys:
+                self._bytes -= self._cache.pop(key).size
+            if self._disk is not None:
+                self._disk.delete_expired(now - self._stale)
 
         if expired_keys:
             logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
 
         return len(expired_keys)
 
+    def close(self) -> None:
+        """Stop background refreshes and close the disk tier."""
+        if self._refresh_pool is not None:
+            self._refresh_pool.shutdown(wait=True)
+            self._refresh_pool = None
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
     @property
     def size(self) -> int:
-        """Get number of entries in cache."""
+        """Get number of entries in memory."""
         return len(self._cache)
 
+    @property
+    def size_bytes(self) -> int:
+        """Get approximate bytes held in memory."""
+        return self._bytes
+
     @property
     def hits(self) -> int:
-        """Get number of cache hits."""
+        """Get number of cache hits (including stale hits)."""
         return self._hits
 
     @property
     def misses(self) -> int:
-        """Get number of cache misses."""
+        """Get number of cache misses (each one started a fetch)."""
         return self._misses
 
     @property
@@ -265,15 +582,36 @@ class TTLCache(Generic[T]):
 
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        return {
-            "size": self.size,
-            "hits": self._hits,
-            "misses": self._misses,
-            "hit_rate": f"{self.hit_rate:.1%}",
-            "ttl_seconds": self._ttl.total_seconds(),
-        }
+        with self._lock:
+            return {
+                "size": self.size,
+                "bytes": self._bytes,
+                "max_entries": self._max_entries,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": f"{self.hit_rate:.1%}",
+                "stale_hits": self._stale_hits,
+                "negative_hits": self._negative_hits,
+                "coalesced": self._coalesced,
+                "disk_hits": self._disk_hits,
+                "evictions": self._evictions,
+                "fetches": self._fetches,
+                "fetch_errors": self._fetch_errors,
+                "inflight": len(self._inflight),
+                "disk_entries": self._disk.count() if self._disk is not None else None,
+                "ttl_seconds": self._ttl,
+            }
 
     def reset_stats(self) -> None:
         """Reset hit/miss counters."""
-        self._hits = 0
-        self._misses = 0
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._stale_hits = 0
+            self._negative_hits = 0
+            self._coalesced = 0
+            self._disk_hits = 0
+            self._evictions = 0
+            self._fetches = 0
+            self._fetch_errors = 0
@@ -18,6 +18,8 @@ class Config:
     NOTION_TOKEN = os.getenv("NOTION_TOKEN")
     # Default to None so we can prompt the user if missing
     NOTION_DB_ID = os.getenv("NOTION_DB_ID")
+    # SQLite file for the persistent Notion response cache (empty = memory only)
+    NOTION_CACHE_DB = os.getenv("NOTION_CACHE_DB", "")
     
     # AI Configuration
     # Defaults to using OpenAI API directly as the most stable "Codex" interface
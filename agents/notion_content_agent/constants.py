@@ -43,6 +43,10 @@ class Defaults:
 
     # Cache
     CACHE_TTL_SECONDS = 300  # 5 minutes
+    CACHE_MAX_ENTRIES = 512
+    CACHE_MAX_BYTES = 64 * 1024 * 1024  # Approximate in-memory size
+    CACHE_STALE_SECONDS = 600  # Serve expired values this long while refreshing
+    CACHE_NEGATIVE_TTL_SECONDS = 60  # Remember "not found" this long
 
     # API
     OPENAI_MODEL = "gpt-4"
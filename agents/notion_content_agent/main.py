@@ -380,6 +380,8 @@ async def run_async(args: argparse.Namespace):
             os.path.join(os.path.dirname(__file__), "content_templates")
         )
         notion = NotionAdapter(Config.NOTION_TOKEN, db_id, codex_client=codex)
+        metrics = MetricsTracker()
+        metrics.track_cache("notion", notion.cache)
         processor = ContentProcessor(notion, codex, monetization, target_path=target_path)
 
         # Create processing function
@@ -412,6 +414,7 @@ async def run_async(args: argparse.Namespace):
             # Print summary
             success_count = sum(1 for r in results if r.success)
             logger.info(f"Batch complete: {success_count}/{len(results)} successful")
+            logger.info(f"Notion cache: {metrics.cache_stats()['notion']}")
 
         else:
             # Polling mode - continuous processing
@@ -427,10 +430,15 @@ async def run_async(args: argparse.Namespace):
             )
             _orchestrator = orchestrator
 
+            def on_batch_complete(results):
+                notion.cache.cleanup_expired()
+                logger.debug(f"Notion cache: {metrics.cache_stats()['notion']}")
+
             # Run polling loop
             await orchestrator.run_polling_loop(
                 fetch_fn=notion.get_pending_articles,
-                interval=args.poll_interval
+                interval=args.poll_interval,
+                on_batch_complete=on_batch_complete
             )
 
     except KeyboardInterrupt:
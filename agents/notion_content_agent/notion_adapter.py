@@ -1,7 +1,7 @@
 import sys
 import os
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Add project root to path to allow importing scripts
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -16,6 +16,9 @@ except ImportError:
     # Fallback or error if script not found
     raise ImportError("Could not import NotionKnowledgeRetriever from scripts.ai. Ensure dreamweaving project structure is intact.")
 
+from adapters.cache import TTLCache
+from config import Config
+
 logger = logging.getLogger(__name__)
 
 class NotionAdapter(NotionKnowledgeRetriever):
@@ -23,12 +26,15 @@ class NotionAdapter(NotionKnowledgeRetriever):
     Extends the existing NotionKnowledgeRetriever to add specific 
     functionality for the Content Agent (status tracking, identifying 'Ready to Write').
     """
-    def __init__(self, api_key: str, database_id: str, codex_client=None):
+    def __init__(self, api_key: str, database_id: str, codex_client=None, cache: Optional[TTLCache] = None):
         super().__init__()
         if api_key:
              self.client.options.auth = api_key
         self.database_id = database_id
         self.codex_client = codex_client
+        # Page content is shared by concurrently processed articles (pillar pages,
+        # re-polled pages), so fetches go through a single-flight cache
+        self.cache = cache if cache is not None else TTLCache(disk_path=Config.NOTION_CACHE_DB or None)
 
     def get_pending_articles(self) -> List[Dict[str, Any]]:
         """
@@ -193,7 +199,16 @@ class NotionAdapter(NotionKnowledgeRetriever):
         """
         Retrieves content from the page AND all its subpages.
         Used for creating comprehensive pillar pages.
+
+        Cached per page; concurrent callers for the same page share one fetch.
         """
+        return self.cache.get_or_fetch(
+            f"page_content:{page_id}",
+            lambda: self._fetch_recursive_page_content(page_id)
+        )
+
+    def _fetch_recursive_page_content(self, page_id: str) -> str:
+        """Fetch a page and its subpages as markdown (uncached)."""
         # 1. Get main page content
         full_content = [f"# Main Page Content\n(Source ID: {page_id})\n"]
         main_blocks = self._get_all_blocks(page_id)
@@ -0,0 +1,185 @@
+"""Tests for the bounded single-flight TTL cache."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from adapters.cache import TTLCache
+
+
+class NotFound(Exception):
+    """Stand-in for notion_client's APIResponseError on a missing page."""
+    status = 404
+    code = "object_not_found"
+
+
+def test_one_fetch_per_key_for_100_async_waiters():
+    cache = TTLCache(ttl_seconds=60)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"content": "page"}
+
+    async def run():
+        return await asyncio.gather(*[
+            cache.get_or_fetch_async("page:1", fetch) for _ in range(100)
+        ])
+
+    results = asyncio.run(run())
+
+    assert calls == 1
+    assert all(r == {"content": "page"} for r in results)
+    assert cache.stats()["coalesced"] == 99
+
+
+def test_one_fetch_per_key_for_sync_fetch_in_executor():
+    cache = TTLCache(ttl_seconds=60)
+    calls = 0
+    lock = threading.Lock()
+
+    def fetch():
+        nonlocal calls
+        with lock:
+            calls += 1
+        time.sleep(0.05)
+        return "page"
+
+    async def run():
+        return await asyncio.gather(*[
+            cache.get_or_fetch_async("page:1", fetch) for _ in range(100)
+        ])
+
+    results = asyncio.run(run())
+
+    assert calls == 1
+    assert results == ["page"] * 100
+
+
+def test_one_fetch_per_key_for_100_threads():
+    cache = TTLCache(ttl_seconds=60)
+    calls = 0
+    lock = threading.Lock()
+    start = threading.Barrier(100)
+
+    def fetch():
+        nonlocal calls
+        with lock:
+            calls += 1
+        time.sleep(0.05)
+        return "page"
+
+    def worker():
+        start.wait()
+        return cache.get_or_fetch("page:1", fetch)
+
+    with ThreadPoolExecutor(max_workers=100) as pool:
+        results = list(pool.map(lambda _: worker(), range(100)))
+
+    assert calls == 1
+    assert results == ["page"] * 100
+
+
+def test_failed_fetch_is_shared_but_not_cached():
+    cache = TTLCache(ttl_seconds=60)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("rate limited")
+
+    async def run():
+        return await asyncio.gather(
+            *[cache.get_or_fetch_async("page:1", fetch) for _ in range(10)],
+            return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(cache.get_or_fetch_async("page:1", fetch))
+    assert calls == 2
+
+
+def test_not_found_is_negatively_cached():
+    cache = TTLCache(ttl_seconds=60, negative_ttl_seconds=60)
+    calls = 0
+
+    def fetch():
+        nonlocal calls
+        calls += 1
+        raise NotFound("Could not find page")
+
+    for _ in range(3):
+        with pytest.raises(NotFound):
+            cache.get_or_fetch("page:missing", fetch)
+
+    assert calls == 1
+    assert cache.stats()["negative_hits"] == 2
+    assert cache.get("page:missing") is None
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = TTLCache(ttl_seconds=60, max_entries=3)
+    for i in range(5):
+        cache.set(f"k{i}", i)
+    cache.get("k2")  # Most recently used survives the next insert
+    cache.set("k5", 5)
+
+    assert cache.size == 3
+    assert cache.get("k2") == 2
+    assert cache.get("k0") is None and cache.get("k3") is None
+
+    small = TTLCache(ttl_seconds=60, max_bytes=20_000)
+    for i in range(10):
+        small.set(f"k{i}", "x" * 5_000)
+    assert small.size_bytes <= 20_000
+    assert small.size < 10
+    assert small.get("k9") is not None
+
+
+def test_stale_value_served_while_refreshing():
+    cache = TTLCache(ttl_seconds=60, stale_seconds=60)
+    cache.set("page:1", "old", ttl_seconds=0.01)
+    time.sleep(0.02)
+    refreshed = threading.Event()
+
+    def fetch():
+        time.sleep(0.05)
+        refreshed.set()
+        return "new"
+
+    assert cache.get_or_fetch("page:1", fetch) == "old"
+    assert cache.get_or_fetch("page:1", fetch) == "old"  # Refresh already running
+    assert refreshed.wait(1.0)
+    time.sleep(0.01)
+    assert cache.get_or_fetch("page:1", fetch) == "new"
+    assert cache.stats()["fetches"] == 1
+    cache.close()
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    path = tmp_path / "cache.db"
+    first = TTLCache(ttl_seconds=60, disk_path=path)
+    first.get_or_fetch("page:1", lambda: {"blocks": [1, 2, 3]})
+    first.close()
+
+    second = TTLCache(ttl_seconds=60, disk_path=path)
+    value = second.get_or_fetch("page:1", lambda: pytest.fail("should not refetch"))
+    assert value == {"blocks": [1, 2, 3]}
+    assert second.stats()["disk_hits"] == 1
+
+    second.invalidate("page:1")
+    second.close()
+    third = TTLCache(ttl_seconds=60, disk_path=path)
+    assert third.get("page:1") is None
+    third.close()
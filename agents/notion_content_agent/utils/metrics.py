@@ -42,6 +42,7 @@ class MetricsTracker:
     cache_hits: int = 0
     cache_misses: int = 0
     errors: List[str] = field(default_factory=list)
+    caches: Dict[str, Any] = field(default_factory=dict, repr=False)
     _current_article_start: Optional[float] = field(default=None, repr=False)
 
     def record_success(self, tokens: int = 0, processing_time: float = 0.0) -> None:
@@ -78,6 +79,20 @@ class MetricsTracker:
         """Record a cache miss."""
         self.cache_misses += 1
 
+    def track_cache(self, name: str, cache: Any) -> None:
+        """
+        Report a cache's own statistics with these metrics.
+
+        Args:
+            name: Label for the cache (e.g. "notion")
+            cache: Object with a ``stats()`` method, such as adapters.cache.TTLCache
+        """
+        self.caches[name] = cache
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get current statistics of all tracked caches."""
+        return {name: cache.stats() for name, cache in self.caches.items()}
+
     @contextmanager
     def track_article(self, article_id: str) -> Generator[None, None, None]:
         """
@@ -171,6 +186,7 @@ class MetricsTracker:
                 "hits": self.cache_hits,
                 "misses": self.cache_misses,
                 "hit_rate": round(self.cache_hit_rate * 100, 1),
+                "tracked": self.cache_stats(),
             },
             "errors": self.errors[-10:],
         }
@@ -204,6 +220,12 @@ class MetricsTracker:
         table.add_row("Total Tokens", f"{self.total_tokens_used:,}")
         table.add_row("API Calls", str(self.api_calls))
         table.add_row("Cache Hit Rate", f"{self.cache_hit_rate:.1%}")
+        for name, stats in self.cache_stats().items():
+            table.add_row(
+                f"Cache ({name})",
+                f"{stats['hit_rate']} hit, {stats['fetches']} fetches, "
+                f"{stats['coalesced']} coalesced, {stats['evictions']} evicted"
+            )
 
         console.print(table)
 
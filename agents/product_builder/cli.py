@@ -58,7 +58,8 @@ def create_command(args):
         orchestrator = StudioOrchestrator(
             context, 
             prompts_only=prompts_only,
-            output_dir=output_dir / "output" if prompts_only else None
+            output_dir=output_dir / "output" if prompts_only else None,
+            chapter_workers=getattr(args, 'chapter_workers', 1)
         )
         
         # 4. Run Full Pipeline
@@ -443,7 +444,9 @@ def generate_bonuses_command(args):
 
 def compile_command(args):
     """Compile product from Antigravity responses (Antigravity-native workflow)."""
+    import json
     from pathlib import Path
+    from .core.compile_cache import CompileCache
     from .core.prompt_interface import PromptInterface
     from .packaging.product_assembler import ProductAssembler, AssemblyConfig
     from .core.pipeline_checklist import PipelineVerifier
@@ -496,110 +499,34 @@ def compile_command(args):
         else:
             logger.info("   ✅ Phase 2 verified - all responses complete")
     
-    # Smart sorting function: extracts chapter numbers and puts bonuses at end
-    def get_chapter_sort_key(filepath):
-        """Sort chapters numerically, putting bonuses/appendices at the end."""
-        import re
-        name = filepath.stem.lower()
-        
-        # Check if it's a bonus/appendix (should go at end)
-        if any(kw in name for kw in ['bonus', 'appendix', 'reference', 'checklist', 'template', 'worksheet', 'supplement', 'resource', 'glossary', 'index']):
-            # Return high number + original name for consistent ordering
-            return (1000, name)
-        
-        # Extract chapter number from various formats:
-        # ch01, ch1, chapter_01, chapter_1, ch01_name, foundation_complete (no number)
-        patterns = [
-            r'ch(\d+)',           # ch01, ch1, ch12
-            r'chapter[_\s]*(\d+)',  # chapter_1, chapter 12
-            r'^(\d+)',             # 01_something, 1_intro
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, name)
-            if match:
-                return (int(match.group(1)), name)
-        
-        # Special cases for common chapter names without numbers
-        # (foundation, application, mastery are often chapters 1, 2, 3)
-        common_order = {
-            'foundation': 1, 'intro': 1, 'introduction': 1,
-            'application': 2,
-            'mastery': 3,
-            'synthesis': 99,  # Usually last regular chapter
-            'conclusion': 99,
-        }
-        for keyword, num in common_order.items():
-            if keyword in name:
-                return (num, name)
-        
-        # No number found, put in middle (500 range)
-        return (500, name)
-    
-    # Sort response files intelligently
-    sorted_response_files = sorted(response_files, key=get_chapter_sort_key)
+    # Incremental parse/render: only changed responses are re-read and re-rendered
+    cache = CompileCache(product_dir)
+    # The index is saved only after a successful assembly, so a failed run
+    # is not mistaken for an up-to-date product next time
+    refresh = cache.refresh(render=True, save=False)
     
     logger.info(f"   📚 Sorted chapter order:")
-    for i, f in enumerate(sorted_response_files):
-        logger.info(f"      {i+1}. {f.stem}")
+    for i, entry in enumerate(refresh.entries):
+        status = "re-rendered" if entry.slug in refresh.changed else "cached"
+        logger.info(f"      {i+1}. {entry.slug} ({status})")
+    logger.info(f"   ♻️  Compile cache: {len(refresh.changed)} changed, "
+                f"{len(refresh.entries) - len(refresh.changed)} reused, {len(refresh.removed)} removed")
+    
+    manifest_path = output_dir / "manifest.json"
+    if not refresh.dirty and not getattr(args, 'rebuild', False) and manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text())
+        pdf_path = manifest.get("files", {}).get("pdf")
+        if (manifest.get("success") and manifest.get("title") == args.title
+                and pdf_path and Path(pdf_path).exists()):
+            cache.save()
+            logger.info("\n✅ Product is up to date (no response changes). Use --rebuild to force.")
+            logger.info(f"   📄 PDF: {pdf_path}")
+            return 0
     
-    def extract_key_takeaways(content: str) -> list:
-        """Extract key takeaways from markdown content."""
-        import re
-        takeaways = []
-        
-        # Look for "Key Takeaways" or similar sections
-        patterns = [
-            r'(?:##?\s*Key\s*Takeaways?|##?\s*Summary|##?\s*Main\s*Points?)\s*\n((?:[-*•]\s*.+\n?)+)',
-            r'(?:##?\s*What\s*You\'ll\s*Learn|##?\s*Takeaways?)\s*\n((?:[-*•]\s*.+\n?)+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE | re.MULTILINE)
-            if match:
-                bullet_section = match.group(1)
-                # Extract individual bullets
-                bullets = re.findall(r'[-*•]\s*(.+)', bullet_section)
-                takeaways.extend([b.strip() for b in bullets[:5]])  # Max 5
-                break
-        
-        # If no takeaways section found, extract from first paragraph or headings
-        if not takeaways:
-            # Try to get main headings as takeaways
-            headings = re.findall(r'^##\s+(.+)$', content, re.MULTILINE)
-            if headings:
-                takeaways = [h.strip() for h in headings[:5]]
-        
-        # Fallback: Extract first sentence of first few paragraphs
-        if not takeaways:
-            paragraphs = [p.strip() for p in content.split('\n\n') if p.strip() and not p.startswith('#')]
-            for p in paragraphs[:3]:
-                first_sentence = p.split('.')[0].strip()
-                if len(first_sentence) > 20 and len(first_sentence) < 200:
-                    takeaways.append(first_sentence)
-        
-        return takeaways if takeaways else ["Key concepts covered in this chapter"]
-    
-    # Load responses into chapters
-    chapters = []
-    for resp_file in sorted_response_files:
-        slug = resp_file.stem.replace(".response", "")
-        content = resp_file.read_text().strip()
-        
-        # Extract actual key takeaways from content
-        takeaways = extract_key_takeaways(content)
-        
-        # Strip chapter prefixes (ch01_, ch00a_, etc) from display title
-        import re
-        clean_slug = re.sub(r'^ch\d+[a-z]?_', '', slug)
-        
-        chapters.append({
-            "title": clean_slug.replace("_", " ").title(),
-            "purpose": f"Content from Antigravity response: {slug}",
-            "content": content,
-            "key_takeaways": takeaways
-        })
-        logger.info(f"   ✅ Loaded: {slug} ({len(takeaways)} takeaways)")
+    # Load responses into chapters (cached fragments are stitched, not re-rendered)
+    chapters = cache.chapters(refresh)
+    for chapter, entry in zip(chapters, refresh.entries):
+        logger.info(f"   ✅ Loaded: {entry.slug} ({len(entry.key_takeaways)} takeaways)")
     
     # Assemble the product
     assembly_config = AssemblyConfig(
@@ -615,6 +542,7 @@ def compile_command(args):
     result = assembler.assemble(chapters=chapters, config=assembly_config)
     
     if result.success:
+        cache.save()
         logger.info(f"\n✅ Compilation Complete!")
         logger.info(f"   📄 PDF: {result.pdf_path}")
         logger.info(f"   📊 Stats: {result.stats}")
@@ -1695,10 +1623,19 @@ def validate_command(args):
     return 0 if result.is_valid else 1
 
 
+def _batch_validation():
+    """Import the shared batch validation runner (scripts/utilities/batch_validate.py)."""
+    project_root = str(Path(__file__).resolve().parent.parent.parent)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    from scripts.utilities import batch_validate
+    return batch_validate
+
+
 def validate_all_command(args):
     """Validate all responses in a product."""
     from pathlib import Path
-    from .core.antigravity import validate_response, ValidationResult
+    batch = _batch_validation()
     
     product_dir = Path(args.product_dir)
     responses_dir = product_dir / "output" / "responses"
@@ -1721,15 +1658,20 @@ def validate_all_command(args):
     logger.info("                    VALIDATING ALL RESPONSES")
     logger.info("═" * 68 + "\n")
     
-    for response_file in response_files:
-        result = validate_response(response_file, min_words=args.min_words)
-        total_words += result.word_count
+    runner = batch.BatchValidator(workers=getattr(args, 'workers', 1))
+    summary = runner.run([
+        batch.BatchItem("response", response_file, {"min_words": args.min_words})
+        for response_file in response_files
+    ])
+    
+    for result in summary.results:
+        total_words += result.metrics.get("word_count", 0)
         
-        status = "✅" if result.is_valid else "❌"
-        issues = f"({len(result.issues)} issues)" if result.issues else ""
-        logger.info(f"  {status} {response_file.name[:40]:40} {result.word_count:,} words {issues}")
+        status = "✅" if result.valid else "❌"
+        issues = f"({len(result.errors)} issues)" if result.errors else ""
+        logger.info(f"  {status} {result.name[:40]:40} {result.metrics.get('word_count', 0):,} words {issues}")
         
-        if result.is_valid:
+        if result.valid:
             valid_count += 1
         else:
             invalid_count += 1
@@ -3439,22 +3381,51 @@ def completeness_check_command(args):
 
 
 def quality_gate_command(args):
-    """Check if product passes quality gate for deployment."""
+    """Check if products pass the quality gate for deployment."""
     from pathlib import Path
-    from .core.antigravity import check_quality_gate, format_quality_gate
+    from .core.antigravity import format_quality_gate
+    batch = _batch_validation()
     
-    product_dir = Path(args.product_dir)
+    product_dirs = [Path(d) for d in args.product_dir]
     
-    if not product_dir.exists():
-        logger.error(f"❌ Product directory not found: {product_dir}")
+    for product_dir in product_dirs:
+        if not product_dir.exists():
+            logger.error(f"❌ Product directory not found: {product_dir}")
+            return 1
+    
+    report_path = Path(args.jsonl) if getattr(args, 'jsonl', None) else None
+    try:
+        changed_since = batch.parse_changed_since(getattr(args, 'changed_since', None), report_path)
+    except ValueError as e:
+        logger.error(f"❌ {e}")
         return 1
     
     threshold = args.threshold if hasattr(args, 'threshold') else None
-    gate = check_quality_gate(product_dir, threshold)
-    logger.info(format_quality_gate(gate))
+    runner = batch.BatchValidator(
+        workers=getattr(args, 'workers', 1),
+        report_path=report_path,
+        changed_since=changed_since,
+    )
+    summary = runner.run([
+        batch.BatchItem("product", product_dir, {"threshold": threshold, "check_responses": False})
+        for product_dir in product_dirs
+    ])
+    
+    for result in summary.results:
+        if len(product_dirs) > 1:
+            logger.info(f"\n📦 {result.name}")
+        if result.payload is not None:
+            logger.info(format_quality_gate(result.payload))
+        else:
+            logger.error(f"❌ {'; '.join(result.errors)}")
+    
+    if summary.skipped:
+        logger.info(f"\n⏭️  Skipped {len(summary.skipped)} products unchanged since {args.changed_since}")
+    if len(summary.results) > 1:
+        logger.info(f"\n🚦 Gates passed: {summary.valid_count}/{len(summary.results)}")
     
-    # Return 0 if passed, 1 if failed (for CI/CD integration)
-    return 0 if gate.passed else 1
+    # Return 0 if all passed, 1 if any failed (for CI/CD integration)
+    return 0 if summary.all_valid else 1
 
 
 def main():
@@ -3508,6 +3479,8 @@ Examples:
                                help='Generate prompt files for Antigravity instead of content')
     create_parser.add_argument('--no-marketing', action='store_true',
                                help='Skip automatic marketing generation (emails + social)')
+    create_parser.add_argument('--chapter-workers', type=int, default=1,
+                               help='Create chapters concurrently on N workers (default: 1, sequential)')
     create_parser.add_argument('--all', action='store_true',
                                help='Generate everything')
     create_parser.set_defaults(func=create_command)
@@ -3540,6 +3513,7 @@ Examples:
     compile_parser.add_argument('--title', '-T', required=True, help='Product title')
     compile_parser.add_argument('--skip-verify', action='store_true', help='Skip Phase 2 verification')
     compile_parser.add_argument('--force', '-f', action='store_true', help='Force continue on verification failures')
+    compile_parser.add_argument('--rebuild', action='store_true', help='Reassemble even if no responses changed')
     compile_parser.set_defaults(func=compile_command)
     
     # Deploy command - deploys to SalarsNet store
@@ -3702,6 +3676,8 @@ Examples:
     validate_all_parser = subparsers.add_parser('validate-all', help='Validate all responses in a product')
     validate_all_parser.add_argument('--product-dir', '-d', required=True, help='Product directory')
     validate_all_parser.add_argument('--min-words', type=int, default=1500, help='Min word count (default: 1500)')
+    validate_all_parser.add_argument('--workers', '-w', type=int, default=1,
+                                     help='Validate responses on N worker processes (default: 1)')
     validate_all_parser.set_defaults(func=validate_all_command)
     
     # Import command - import a response from a file
@@ -4105,8 +4081,14 @@ Examples:
     # Quality-gate command (deploy blocker)
     gate_parser = subparsers.add_parser('quality-gate',
                                          help='Check quality gate for deployment')
-    gate_parser.add_argument('--product-dir', '-d', required=True, help='Product directory')
+    gate_parser.add_argument('--product-dir', '-d', required=True, nargs='+',
+                             help='Product directory (several may be given)')
     gate_parser.add_argument('--threshold', '-t', type=float, default=70, help='Minimum score (0-100)')
+    gate_parser.add_argument('--workers', '-w', type=int, default=1,
+                             help='Check products on N worker processes (default: 1)')
+    gate_parser.add_argument('--changed-since',
+                             help="Only check products modified since ISO date, age (24h, 7d) or 'last'")
+    gate_parser.add_argument('--jsonl', help='Stream results to a JSON-lines report (plus summary line)')
     gate_parser.set_defaults(func=quality_gate_command)
     
     # Parse and execute
@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
+from .compile_cache import load_cached_responses
+
 logger = logging.getLogger(__name__)
 
 
@@ -4166,21 +4168,14 @@ def analyze_compiled_content(product_dir: Path) -> Optional[CompilationStats]:
     import re
     
     output_dir = product_dir / "output"
-    responses_dir = output_dir / "responses"
     
     if not output_dir.exists():
         return None
     
-    # Count chapters
-    chapter_files = list(responses_dir.glob("*.response.md")) if responses_dir.exists() else []
-    total_chapters = len(chapter_files)
-    
-    # Count words
-    total_words = 0
-    for chapter in chapter_files:
-        content = chapter.read_text()
-        words = len(content.split())
-        total_words += words
+    # Count chapters and words from the shared compile cache
+    cached = load_cached_responses(product_dir)
+    total_chapters = len(cached)
+    total_words = sum(entry.word_count for entry in cached)
     
     # Estimate pages (250 words per page)
     total_pages = max(1, total_words // 250)
@@ -4284,14 +4279,14 @@ def verify_compilation(product_dir: Path) -> List[CompileVerification]:
     checks = []
     output_dir = product_dir / "output"
     responses_dir = output_dir / "responses"
+    cached = load_cached_responses(product_dir)
     
     # 1. Check responses directory exists
     if responses_dir.exists():
-        response_files = list(responses_dir.glob("*.response.md"))
-        if len(response_files) > 0:
+        if len(cached) > 0:
             checks.append(CompileVerification(
                 "Response Files", True,
-                f"Found {len(response_files)} chapters",
+                f"Found {len(cached)} chapters",
                 "info"
             ))
         else:
@@ -4308,12 +4303,7 @@ def verify_compilation(product_dir: Path) -> List[CompileVerification]:
         ))
     
     # 2. Check for empty chapters
-    empty_chapters = []
-    if responses_dir.exists():
-        for resp in responses_dir.glob("*.response.md"):
-            content = resp.read_text().strip()
-            if len(content) < 100:
-                empty_chapters.append(resp.name)
+    empty_chapters = [entry.filename for entry in cached if entry.stripped_length < 100]
     
     if empty_chapters:
         checks.append(CompileVerification(
@@ -4391,10 +4381,7 @@ def verify_compilation(product_dir: Path) -> List[CompileVerification]:
             ))
     
     # 6. Word count check
-    total_words = 0
-    if responses_dir.exists():
-        for resp in responses_dir.glob("*.response.md"):
-            total_words += len(resp.read_text().split())
+    total_words = sum(entry.word_count for entry in cached)
     
     if total_words < 5000:
         checks.append(CompileVerification(
@@ -4468,56 +4455,34 @@ class TOCEntry:
 
 
 def extract_toc_from_responses(product_dir: Path) -> List[TOCEntry]:
-    """Extract table of contents from response files."""
-    import re
-    
-    responses_dir = product_dir / "output" / "responses"
-    
-    if not responses_dir.exists():
-        return []
-    
+    """Extract table of contents from response files (via the compile cache)."""
     entries = []
     page = 1
     
-    for idx, resp_file in enumerate(sorted(responses_dir.glob("*.response.md")), 1):
-        content = resp_file.read_text()
-        slug = resp_file.stem.replace(".response", "")
-        
-        # Extract chapter title from first heading
-        lines = content.split('\n')
-        title = slug.replace("_", " ").title()
-        
-        for line in lines[:10]:
-            if line.startswith("# "):
-                title = line[2:].strip()
-                break
-            elif line.startswith("## "):
-                title = line[3:].strip()
-                break
-        
+    # The TOC keeps its alphabetical file order (not compile order), so
+    # existing products keep their TOC order and page numbers
+    for cached in sorted(load_cached_responses(product_dir), key=lambda c: c.filename):
+        slug = cached.slug
         entries.append(TOCEntry(
-            title=title,
+            title=cached.heading_title,
             page=page,
             level=1,
             slug=slug
         ))
         
         # Estimate pages for this chapter (250 words/page)
-        words = len(content.split())
-        pages = max(1, words // 250)
+        pages = max(1, cached.word_count // 250)
         page += pages
         
-        # Extract sections (## headings)
-        for line in lines:
-            if line.startswith("## "):
-                section_title = line[3:].strip()
-                if section_title and len(section_title) < 80:
-                    entries.append(TOCEntry(
-                        title=section_title,
-                        page=page - pages + 1,
-                        level=2,
-                        slug=f"{slug}_{section_title.lower().replace(' ', '-')[:20]}"
-                    ))
+        # Sections (## headings)
+        for section_title in cached.sections:
+            if section_title and len(section_title) < 80:
+                entries.append(TOCEntry(
+                    title=section_title,
+                    page=page - pages + 1,
+                    level=2,
+                    slug=f"{slug}_{section_title.lower().replace(' ', '-')[:20]}"
+                ))
     
     return entries
 
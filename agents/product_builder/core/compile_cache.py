@@ -0,0 +1,321 @@
+"""
+Compile Cache
+Incremental parse/render cache for Antigravity response files.
+
+Stores per-response content hashes, parsed chapter structure, word counts
+and rendered HTML fragments in ``output/.compile_cache/`` so that a
+recompile only re-parses and re-renders the responses that changed.
+The same cached parse backs ``compile-stats``, ``compile-verify`` and
+``generate-toc``.
+"""
+
+import hashlib
+import json
+import logging
+import re
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = ".compile_cache"
+CACHE_VERSION = 1
+
+# Filename keywords that mark bonus/appendix material (sorted after chapters)
+BONUS_KEYWORDS = [
+    'bonus', 'appendix', 'reference', 'checklist', 'template', 'worksheet',
+    'supplement', 'resource', 'glossary', 'index',
+]
+
+_CHAPTER_NUMBER_PATTERNS = [
+    re.compile(r'ch(\d+)'),             # ch01, ch1, ch12
+    re.compile(r'chapter[_\s]*(\d+)'),  # chapter_1, chapter 12
+    re.compile(r'^(\d+)'),              # 01_something, 1_intro
+]
+
+# Chapter names without numbers (foundation, application, mastery are often 1, 2, 3)
+_COMMON_ORDER = {
+    'foundation': 1, 'intro': 1, 'introduction': 1,
+    'application': 2,
+    'mastery': 3,
+    'synthesis': 99,  # Usually last regular chapter
+    'conclusion': 99,
+}
+
+_TAKEAWAY_PATTERNS = [
+    re.compile(r'(?:##?\s*Key\s*Takeaways?|##?\s*Summary|##?\s*Main\s*Points?)\s*\n((?:[-*•]\s*.+\n?)+)',
+               re.IGNORECASE | re.MULTILINE),
+    re.compile(r'(?:##?\s*What\s*You\'ll\s*Learn|##?\s*Takeaways?)\s*\n((?:[-*•]\s*.+\n?)+)',
+               re.IGNORECASE | re.MULTILINE),
+]
+_BULLET_RE = re.compile(r'[-*•]\s*(.+)')
+_H2_RE = re.compile(r'^##\s+(.+)$', re.MULTILINE)
+
+
+def chapter_sort_key(filepath: Path) -> Tuple[int, str]:
+    """Sort chapters numerically, putting bonuses/appendices at the end."""
+    name = filepath.stem.lower()
+
+    if any(kw in name for kw in BONUS_KEYWORDS):
+        return (1000, name)
+
+    for pattern in _CHAPTER_NUMBER_PATTERNS:
+        match = pattern.search(name)
+        if match:
+            return (int(match.group(1)), name)
+
+    for keyword, num in _COMMON_ORDER.items():
+        if keyword in name:
+            return (num, name)
+
+    # No number found, put in middle (500 range)
+    return (500, name)
+
+
+def extract_key_takeaways(content: str) -> List[str]:
+    """Extract key takeaways from markdown content."""
+    takeaways = []
+
+    for pattern in _TAKEAWAY_PATTERNS:
+        match = pattern.search(content)
+        if match:
+            bullets = _BULLET_RE.findall(match.group(1))
+            takeaways.extend([b.strip() for b in bullets[:5]])  # Max 5
+            break
+
+    # If no takeaways section found, use main headings
+    if not takeaways:
+        headings = _H2_RE.findall(content)
+        if headings:
+            takeaways = [h.strip() for h in headings[:5]]
+
+    # Fallback: first sentence of first few paragraphs
+    if not takeaways:
+        paragraphs = [p.strip() for p in content.split('\n\n') if p.strip() and not p.startswith('#')]
+        for p in paragraphs[:3]:
+            first_sentence = p.split('.')[0].strip()
+            if 20 < len(first_sentence) < 200:
+                takeaways.append(first_sentence)
+
+    return takeaways if takeaways else ["Key concepts covered in this chapter"]
+
+
+def render_markdown(content: str) -> str:
+    """Render chapter markdown to an HTML fragment (same engine as PDFGenerator)."""
+    try:
+        from markdown_it import MarkdownIt
+        md = MarkdownIt('commonmark', {'breaks': True, 'html': True})
+        return md.render(content)
+    except ImportError:
+        logger.warning("Markdown library not found. Falling back to plain text.")
+        return "\n".join([f"<p>{p}</p>" for p in content.split("\n\n") if p.strip()])
+
+
+@dataclass
+class CachedResponse:
+    """Parsed structure of a single ``*.response.md`` file."""
+    slug: str
+    filename: str
+    sha256: str
+    mtime: float
+    size: int
+    word_count: int
+    stripped_length: int
+    heading_title: str
+    display_title: str
+    sections: List[str] = field(default_factory=list)
+    key_takeaways: List[str] = field(default_factory=list)
+    fragment: Optional[str] = None  # Relative path of cached HTML fragment
+
+
+@dataclass
+class CacheRefresh:
+    """Outcome of refreshing the cache against the responses directory."""
+    entries: List[CachedResponse]
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.changed or self.removed)
+
+
+class CompileCache:
+    """
+    Content-hash keyed cache of parsed responses and rendered fragments.
+
+    Layout::
+
+        output/.compile_cache/
+            index.json            # slug -> CachedResponse
+            fragments/<slug>.html # rendered markdown
+    """
+
+    def __init__(self, product_dir: Path):
+        self.product_dir = Path(product_dir)
+        self.output_dir = self.product_dir / "output"
+        self.responses_dir = self.output_dir / "responses"
+        self.cache_dir = self.output_dir / CACHE_DIR_NAME
+        self.fragments_dir = self.cache_dir / "fragments"
+        self.index_path = self.cache_dir / "index.json"
+        self._index: Dict[str, CachedResponse] = self._load_index()
+
+    # ─── Persistence ───────────────────────────────────────────────
+
+    def _load_index(self) -> Dict[str, CachedResponse]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            data = json.loads(self.index_path.read_text())
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"⚠️ Compile cache unreadable, rebuilding: {e}")
+            return {}
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        return {slug: CachedResponse(**entry) for slug, entry in data.get("entries", {}).items()}
+
+    def save(self) -> None:
+        """Persist the index. Call once the refreshed entries have been used successfully."""
+        self._save_index()
+
+    def _save_index(self) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": CACHE_VERSION,
+            "entries": {slug: asdict(entry) for slug, entry in self._index.items()},
+        }
+        tmp_path = self.index_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2))
+        tmp_path.replace(self.index_path)
+
+    # ─── Parsing ───────────────────────────────────────────────────
+
+    def _parse(self, resp_file: Path, content: str, digest: str) -> CachedResponse:
+        slug = resp_file.stem.replace(".response", "")
+        lines = content.split('\n')
+
+        heading_title = slug.replace("_", " ").title()
+        for line in lines[:10]:
+            if line.startswith("# "):
+                heading_title = line[2:].strip()
+                break
+            elif line.startswith("## "):
+                heading_title = line[3:].strip()
+                break
+
+        # Strip chapter prefixes (ch01_, ch00a_, etc) from display title
+        clean_slug = re.sub(r'^ch\d+[a-z]?_', '', slug)
+        stripped = content.strip()
+        stat = resp_file.stat()
+
+        return CachedResponse(
+            slug=slug,
+            filename=resp_file.name,
+            sha256=digest,
+            mtime=stat.st_mtime,
+            size=stat.st_size,
+            word_count=len(content.split()),
+            stripped_length=len(stripped),
+            heading_title=heading_title,
+            display_title=clean_slug.replace("_", " ").title(),
+            sections=[line[3:].strip() for line in lines if line.startswith("## ")],
+            key_takeaways=extract_key_takeaways(stripped),
+        )
+
+    def refresh(self, render: bool = False, save: bool = True) -> CacheRefresh:
+        """
+        Bring the cache in line with the responses directory.
+
+        Files whose mtime and size match the cached entry are trusted
+        without being read. Otherwise the content hash decides whether the
+        file is re-parsed (and, with ``render=True``, re-rendered).
+
+        With ``save=False`` the index is left on disk as it was, so a caller
+        whose downstream step fails still sees the changes as dirty next
+        time; it should call :meth:`save` after succeeding.
+        """
+        if not self.responses_dir.exists():
+            return CacheRefresh(entries=[])
+
+        response_files = sorted(self.responses_dir.glob("*.response.md"), key=chapter_sort_key)
+        seen = set()
+        changed = []
+
+        for resp_file in response_files:
+            slug = resp_file.stem.replace(".response", "")
+            seen.add(slug)
+            cached = self._index.get(slug)
+            stat = resp_file.stat()
+
+            if cached and cached.mtime == stat.st_mtime and cached.size == stat.st_size:
+                if render and not self._fragment_exists(cached):
+                    self._render(cached, resp_file.read_text().strip())
+                    changed.append(slug)
+                continue
+
+            content = resp_file.read_text()
+            digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            if cached and cached.sha256 == digest:
+                # Touched but unchanged: refresh stat only
+                cached.mtime, cached.size = stat.st_mtime, stat.st_size
+                if render and not self._fragment_exists(cached):
+                    self._render(cached, content.strip())
+                    changed.append(slug)
+                continue
+
+            entry = self._parse(resp_file, content, digest)
+            if render:
+                self._render(entry, content.strip())
+            self._index[slug] = entry
+            changed.append(slug)
+
+        removed = [slug for slug in self._index if slug not in seen]
+        for slug in removed:
+            fragment = self._index.pop(slug).fragment
+            if fragment:
+                (self.cache_dir / fragment).unlink(missing_ok=True)
+
+        if save:
+            self._save_index()
+        return CacheRefresh(
+            entries=[self._index[resp.stem.replace(".response", "")] for resp in response_files],
+            changed=changed,
+            removed=removed,
+        )
+
+    # ─── Fragments ─────────────────────────────────────────────────
+
+    def _fragment_exists(self, entry: CachedResponse) -> bool:
+        return bool(entry.fragment) and (self.cache_dir / entry.fragment).exists()
+
+    def _render(self, entry: CachedResponse, content: str) -> None:
+        self.fragments_dir.mkdir(parents=True, exist_ok=True)
+        fragment_path = self.fragments_dir / f"{entry.slug}.html"
+        fragment_path.write_text(render_markdown(content), encoding="utf-8")
+        entry.fragment = str(fragment_path.relative_to(self.cache_dir))
+
+    def fragment_html(self, entry: CachedResponse) -> Optional[str]:
+        """Return the cached HTML fragment for an entry, if rendered."""
+        if not self._fragment_exists(entry):
+            return None
+        return (self.cache_dir / entry.fragment).read_text(encoding="utf-8")
+
+    def chapters(self, refresh: CacheRefresh) -> List[Dict]:
+        """Build assembler chapter dicts, attaching cached HTML fragments."""
+        chapters = []
+        for entry in refresh.entries:
+            resp_file = self.responses_dir / entry.filename
+            chapters.append({
+                "title": entry.display_title,
+                "purpose": f"Content from Antigravity response: {entry.slug}",
+                "content": resp_file.read_text().strip(),
+                "content_html": self.fragment_html(entry),
+                "key_takeaways": list(entry.key_takeaways),
+            })
+        return chapters
+
+
+def load_cached_responses(product_dir: Path) -> List[CachedResponse]:
+    """Parsed responses in compile order, refreshing only changed files."""
+    return CompileCache(product_dir).refresh().entries
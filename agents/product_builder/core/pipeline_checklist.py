@@ -13,6 +13,8 @@ from pathlib import Path
 from typing import Dict, List, Optional
 from enum import Enum
 
+from .compile_cache import load_cached_responses
+
 logger = logging.getLogger(__name__)
 
 
@@ -204,24 +206,22 @@ class PipelineVerifier:
         if not exists:
             return results
         
-        # Check 2: Has response files
-        response_files = list(self.responses_dir.glob("*.response.md"))
-        has_responses = len(response_files) >= 3
+        # Check 2: Has response files (parsed via the shared compile cache)
+        cached = load_cached_responses(self.product_dir)
+        has_responses = len(cached) >= 3
         results.append(VerificationResult(
             passed=has_responses,
             check_name="response_files",
-            message=f"Found {len(response_files)} response files" if has_responses else f"Only {len(response_files)} responses",
-            details={"count": len(response_files)}
+            message=f"Found {len(cached)} response files" if has_responses else f"Only {len(cached)} responses",
+            details={"count": len(cached)}
         ))
         
         # Check 3: Responses have content
         min_words = 1000
-        short_responses = []
-        for resp in response_files:
-            content = resp.read_text()
-            word_count = len(content.split())
-            if word_count < min_words:
-                short_responses.append(f"{resp.name}: {word_count} words")
+        short_responses = [
+            f"{entry.filename}: {entry.word_count} words"
+            for entry in cached if entry.word_count < min_words
+        ]
         
         content_ok = len(short_responses) == 0
         results.append(VerificationResult(
@@ -234,7 +234,7 @@ class PipelineVerifier:
         # Check 4: Prompt-response parity
         prompt_files = list(self.prompts_dir.glob("*.prompt.md")) if self.prompts_dir.exists() else []
         prompt_slugs = {f.stem.replace(".prompt", "") for f in prompt_files}
-        response_slugs = {f.stem.replace(".response", "") for f in response_files}
+        response_slugs = {entry.slug for entry in cached}
         
         missing = prompt_slugs - response_slugs
         parity_ok = len(missing) == 0
@@ -12,6 +12,7 @@ The workflow is:
 """
 
 import logging
+import threading
 from pathlib import Path
 from typing import Optional
 import json
@@ -46,8 +47,10 @@ class PromptInterface:
         self.prompts_dir.mkdir(parents=True, exist_ok=True)
         self.responses_dir.mkdir(parents=True, exist_ok=True)
         
-        # Track pending prompts
-        self.pending_prompts = []
+        # Track pending prompts, keyed by slug so a retried chapter
+        # replaces its earlier prompt instead of adding a second entry
+        self._prompts = {}
+        self._lock = threading.Lock()
         
         logger.info(f"✨ PromptInterface initialized (Antigravity-Native Mode)")
         logger.info(f"   Prompts: {self.prompts_dir}")
@@ -95,13 +98,14 @@ After generating your response:
         prompt_path.write_text(content)
         
         # Track this pending prompt
-        self.pending_prompts.append({
-            "slug": slug,
-            "prompt_path": str(prompt_path),
-            "response_path": str(response_path),
-            "metadata": metadata or {},
-            "status": "pending"
-        })
+        with self._lock:
+            self._prompts[slug] = {
+                "slug": slug,
+                "prompt_path": str(prompt_path),
+                "response_path": str(response_path),
+                "metadata": metadata or {},
+                "status": "pending"
+            }
         
         logger.info(f"📝 Prompt written: {prompt_path}")
         
@@ -127,6 +131,19 @@ After generating your response:
             logger.warning(f"⏳ Response not yet available: {response_path}")
             return None
     
+    @property
+    def pending_prompts(self) -> list:
+        """
+        Tracked prompts in chapter order.
+        
+        Chapters may be written concurrently, so insertion order is completion
+        order. Prompts without a chapter number keep their insertion order
+        after the numbered ones.
+        """
+        with self._lock:
+            items = list(self._prompts.values())
+        return sorted(items, key=lambda item: item["metadata"].get("chapter_number") or float("inf"))
+    
     def get_pending_prompts(self) -> list:
         """Return list of prompts awaiting responses."""
         pending = []
@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass
 
+from ..core.compile_cache import render_markdown
+
 logger = logging.getLogger(__name__)
 
 
@@ -613,17 +615,8 @@ class PDFGenerator:
             content = chapter.get("content", "")
             takeaways = chapter.get("key_takeaways", [])
             
-            # Convert content from Markdown to HTML
-            try:
-                from markdown_it import MarkdownIt
-                md = MarkdownIt('commonmark', {'breaks': True, 'html': True})
-                html_content = md.render(content)
-                paragraphs = html_content
-            except ImportError:
-                logger.warning("Markdown library not found. Falling back to plain text.")
-                paragraphs = "\n".join([
-                    f"<p>{p}</p>" for p in content.split("\n\n") if p.strip()
-                ])
+            # Convert content from Markdown to HTML (reuse compile-cache fragment if present)
+            paragraphs = chapter.get("content_html") or render_markdown(content)
             
             # Key takeaways
             takeaways_html = ""
@@ -666,14 +659,7 @@ class PDFGenerator:
                 title = chapter.get("title", f"Appendix {i+1}")
                 content = chapter.get("content", "")
                 
-                try:
-                    from markdown_it import MarkdownIt
-                    md = MarkdownIt('commonmark', {'breaks': True, 'html': True})
-                    paragraphs = md.render(content)
-                except ImportError:
-                    paragraphs = "\n".join([
-                        f"<p>{p}</p>" for p in content.split("\n\n") if p.strip()
-                    ])
+                paragraphs = chapter.get("content_html") or render_markdown(content)
                 
                 html_parts.append(f"""
 <div class="appendix" id="appendix-{i}">
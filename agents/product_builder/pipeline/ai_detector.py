@@ -5,10 +5,23 @@ Identifies and flags AI-sounding writing patterns.
 
 import logging
 import re
+import sys
+from pathlib import Path
 from typing import List, Tuple
 
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+from scripts.utilities.text_scanner import get_scanner
+
 logger = logging.getLogger(__name__)
 
+GENERIC_EXAMPLE_PATTERNS = [
+    r"for example,\s*(imagine|let's say|suppose)",
+    r"consider\s+a\s+(simple|typical|common)\s+example",
+    r"think of\s+it\s+like",
+]
+
 
 class AIDetector:
     """
@@ -73,10 +86,10 @@ class AIDetector:
         logger.info("🔍 AIDetector scanning for AI patterns...")
         
         findings = []
-        content_lower = content.lower()
+        scan = self._scanner().scan(content)
         
         for pattern, fix in self.AI_TELLS:
-            count = content_lower.count(pattern.lower())
+            count = scan.count(pattern)
             if count > 0:
                 findings.append({
                     "pattern": pattern,
@@ -94,7 +107,7 @@ class AIDetector:
             })
         
         # Generic example check
-        generic_examples = self._check_generic_examples(content)
+        generic_examples = self._check_generic_examples(content, scan)
         if generic_examples:
             findings.append({
                 "pattern": "Generic examples detected",
@@ -127,18 +140,23 @@ class AIDetector:
         
         return heading_clusters
     
-    def _check_generic_examples(self, content: str) -> List[str]:
+    def _scanner(self):
+        """One compiled scanner for all AI tells and generic-example patterns."""
+        return get_scanner(
+            literals=[pattern for pattern, _ in self.AI_TELLS],
+            regexes=GENERIC_EXAMPLE_PATTERNS,
+            flags=re.IGNORECASE,
+            literal_ignore_case=True,
+        )
+    
+    def _check_generic_examples(self, content: str, scan=None) -> List[str]:
         """Detect overly generic examples."""
-        generic_patterns = [
-            r"for example,\s*(imagine|let's say|suppose)",
-            r"consider\s+a\s+(simple|typical|common)\s+example",
-            r"think of\s+it\s+like",
-        ]
+        if scan is None:
+            scan = self._scanner().scan(content)
         
         findings = []
-        for pattern in generic_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            findings.extend(matches)
+        for pattern in GENERIC_EXAMPLE_PATTERNS:
+            findings.extend(scan.findall(pattern))
         
         return findings
     
@@ -5,9 +5,11 @@ Runs the complete flow from DemandSignal to Published Product.
 """
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Tuple
+from dataclasses import dataclass, field
 
 from ..core.context import ProductContext
 from ..core.intelligence import DemandSignal
@@ -66,6 +68,51 @@ class StudioArtifacts:
     scorecard: Optional[PremiumScorecard] = None
 
 
+@dataclass(frozen=True)
+class ChapterContextSnapshot:
+    """
+    Immutable view of the shared artifacts a chapter needs.
+
+    Frozen once Phase 3 completes so that chapters created concurrently
+    all read the same positioning, voice and intelligence values.
+    """
+    product_name: str
+    product_promise: str
+    audience_persona: str
+    thesis: str
+    voice_rules: str
+    banned_phrases: Tuple[str, ...] = ()
+
+    def chapter_context(self, concept, index: int) -> Dict[str, Any]:
+        """Build a fresh (mutable) writers-room context for one chapter."""
+        return {
+            "chapter_number": index + 1,
+            "chapter_title": concept.name,
+            "chapter_purpose": concept.description,
+            "voice_rules": self.voice_rules,
+            "banned_phrases": list(self.banned_phrases),
+            "key_takeaways": concept.description,
+            "product_promise": self.product_promise,
+            "audience_persona": self.audience_persona,
+            "product_name": self.product_name,
+            "thesis": self.thesis,
+        }
+
+
+@dataclass
+class PhaseTimings:
+    """Wall-clock timings for pipeline phases and individual chapters."""
+    phases: Dict[str, float] = field(default_factory=dict)
+    chapters: List[Dict[str, Any]] = field(default_factory=list)
+
+    def record(self, phase: str, started: float) -> None:
+        self.phases[phase] = round(time.perf_counter() - started, 3)
+
+    def to_dict(self) -> Dict[str, Any]:
+        chapters = sorted(self.chapters, key=lambda c: c["index"])
+        return {"phases": dict(self.phases), "chapters": chapters}
+
+
 class StudioOrchestrator:
     """
     The Master Conductor for Studio-Grade Product Creation.
@@ -81,15 +128,24 @@ class StudioOrchestrator:
     7. BONUS GENERATION: Create research-backed bonus content (NEW)
     8. VISUALS: Generate images for chapters and bonuses (NEW)
     9. COMPILE: Build final PDFs and package
+
+    Phase 4 runs chapters sequentially by default. With ``chapter_workers > 1``
+    chapters are fanned out across a bounded thread pool against a frozen
+    ChapterContextSnapshot; results keep curriculum order and each chapter
+    is retried up to ``chapter_retries`` times before the pipeline fails.
     """
     
-    def __init__(self, context: ProductContext, prompts_only: bool = False, output_dir: Optional[Path] = None):
+    def __init__(self, context: ProductContext, prompts_only: bool = False, output_dir: Optional[Path] = None,
+                 chapter_workers: int = 1, chapter_retries: int = 2):
         self.context = context
         self.templates_dir = Path(__file__).parent.parent / "templates"
         self.artifacts = StudioArtifacts()
         self.library = LibraryManager()
         self.prompts_only = prompts_only
         self.output_dir = output_dir
+        self.chapter_workers = max(1, chapter_workers)
+        self.chapter_retries = max(0, chapter_retries)
+        self.timings = PhaseTimings()
         
         # Phase 1: Research
         self.cartographer = MarketCartographer(self.templates_dir)
@@ -135,19 +191,23 @@ class StudioOrchestrator:
             Dict with all outputs and scorecard
         """
         logger.info(f"🎬 STUDIO PIPELINE START: {title}")
+        self.timings = PhaseTimings()
         
         # ═══════════════════════════════════════════════════════════════
         # PHASE 1: RESEARCH
         # ═══════════════════════════════════════════════════════════════
         logger.info("═══ PHASE 1: RESEARCH ═══")
+        phase_start = time.perf_counter()
         
         self.artifacts.positioning = self.cartographer.generate(signal, title)
         logger.info(f"✅ PositioningBrief: {self.artifacts.positioning.core_promise[:50]}...")
+        self.timings.record("research", phase_start)
         
         # ═══════════════════════════════════════════════════════════════
         # PHASE 2: DESIGN
         # ═══════════════════════════════════════════════════════════════
         logger.info("═══ PHASE 2: DESIGN ═══")
+        phase_start = time.perf_counter()
         
         self.artifacts.transformation = self.transformation_designer.generate(
             self.artifacts.positioning, title
@@ -158,11 +218,13 @@ class StudioOrchestrator:
             self.artifacts.transformation, title
         )
         logger.info(f"✅ CurriculumGraph: {len(self.artifacts.curriculum.concepts)} concepts")
+        self.timings.record("design", phase_start)
         
         # ═══════════════════════════════════════════════════════════════
         # PHASE 3: NARRATIVE
         # ═══════════════════════════════════════════════════════════════
         logger.info("═══ PHASE 3: NARRATIVE ═══")
+        phase_start = time.perf_counter()
         
         self.artifacts.intelligence = self.product_mind.generate(signal, title)
         logger.info(f"✅ ProductIntelligence: {self.artifacts.intelligence.thesis[:50]}...")
@@ -171,18 +233,30 @@ class StudioOrchestrator:
             self.artifacts.positioning, title
         )
         logger.info(f"✅ VoiceStyleGuide: {len(self.artifacts.voice.banned_phrases)} banned phrases")
+        self.timings.record("narrative", phase_start)
         
         # ═══════════════════════════════════════════════════════════════
         # PHASE 4: CREATION (per chapter)
         # ═══════════════════════════════════════════════════════════════
         logger.info("═══ PHASE 4: CREATION ═══")
+        phase_start = time.perf_counter()
         
         # Build chapters based on curriculum
+        concepts = list(self.artifacts.curriculum.concepts)
+        snapshot = self._snapshot_context()
+        if self.chapter_workers > 1 and len(concepts) > 1:
+            all_content_text = self._create_chapters_concurrent(concepts, snapshot)
+        else:
+            all_content_text = [
+                self._create_chapter_with_retry(concept, i, snapshot)
+                for i, concept in enumerate(concepts)
+            ]
+        self.timings.chapters.sort(key=lambda c: c["index"])
+        if self.prompts_only and self.writers_room.prompt_interface:
+            self.writers_room.prompt_interface.save_manifest()
+        
         chapters = []
-        all_content_text = []
-        for i, concept in enumerate(self.artifacts.curriculum.concepts):
-            chapter_text = self._create_chapter(concept, i)
-            all_content_text.append(chapter_text)
+        for concept, chapter_text in zip(concepts, all_content_text):
             chapters.append({
                 "title": concept.name,
                 "purpose": concept.description,
@@ -191,11 +265,13 @@ class StudioOrchestrator:
             })
         
         combined_content = "\n\n".join(all_content_text)
+        self.timings.record("creation", phase_start)
         
         # ═══════════════════════════════════════════════════════════════
         # PHASE 4.5: CONTENT EXPANSION LOOP (100+ page guarantee)
         # ═══════════════════════════════════════════════════════════════
         logger.info("═══ PHASE 4.5: CONTENT EXPANSION ═══")
+        phase_start = time.perf_counter()
         
         # Validate page count and expand if needed
         page_stats = validate_page_count(chapters, MIN_PAGES_MAIN_PRODUCT)
@@ -258,6 +334,7 @@ The expansion should maintain the existing voice and add genuine value.
         
         # Recalculate combined content after any expansion
         combined_content = "\n\n".join([ch['content'] for ch in chapters])
+        self.timings.record("expansion", phase_start)
 
 
         # ... (QA Phase skipped in truncated code, defining defaults)
@@ -279,6 +356,7 @@ The expansion should maintain the existing voice and add genuine value.
         # PHASE 6: PACKAGING (Bonus Design)
         # ═══════════════════════════════════════════════════════════════
         logger.info("═══ PHASE 6: PACKAGING (Bonus Design) ═══")
+        phase_start = time.perf_counter()
         
         # Design high-value bonuses based on curriculum friction
         bonus_plan = self.bonus_architect.design(
@@ -293,6 +371,8 @@ The expansion should maintain the existing voice and add genuine value.
             ]
         )
         logger.info(f"✅ Bonus Plan: {len(bonus_plan.bonuses)} bonuses designed")
+        self.timings.record("packaging", phase_start)
+        self._log_timings()
         
         return {
             "title": title,
@@ -305,26 +385,79 @@ The expansion should maintain the existing voice and add genuine value.
             "bonus_plan": bonus_plan, # Return the structured plan
             "executive_summary": executive_summary,
             "quickstart": quickstart,
-            "publishable": self.artifacts.scorecard.publishable
+            "publishable": self.artifacts.scorecard.publishable,
+            "timings": self.timings.to_dict()
         }
     
-    def _create_chapter(self, concept, index: int) -> str:
+    def _snapshot_context(self) -> ChapterContextSnapshot:
+        """Freeze the shared Phase 1-3 artifacts for chapter creation."""
+        positioning = self.artifacts.positioning
+        voice = self.artifacts.voice
+        intelligence = self.artifacts.intelligence
+        return ChapterContextSnapshot(
+            product_name=self.context.product_name if hasattr(self.context, 'product_name') else "The Product",
+            product_promise=positioning.core_promise if positioning else "Transform your life.",
+            audience_persona=positioning.audience.primary_persona if positioning and positioning.audience else "Ambitious Learners",
+            thesis=intelligence.thesis if intelligence else "This product changes everything.",
+            voice_rules="\n".join(voice.sentence_rhythm_rules) if voice else "",
+            banned_phrases=tuple(voice.banned_phrases) if voice else (),
+        )
+    
+    def _create_chapters_concurrent(self, concepts: List, snapshot: ChapterContextSnapshot) -> List[str]:
+        """
+        Create chapters on a bounded worker pool.
+        
+        Results are returned in curriculum order regardless of completion
+        order. A chapter that exhausts its retries fails the whole phase.
+        """
+        workers = min(self.chapter_workers, len(concepts))
+        logger.info(f"⚡ Creating {len(concepts)} chapters on {workers} workers")
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chapter") as executor:
+            futures = [
+                executor.submit(self._create_chapter_with_retry, concept, i, snapshot)
+                for i, concept in enumerate(concepts)
+            ]
+            return [future.result() for future in futures]
+    
+    def _create_chapter_with_retry(self, concept, index: int,
+                                   snapshot: Optional[ChapterContextSnapshot] = None) -> str:
+        """Run _create_chapter, retrying transient failures and recording timing."""
+        attempts = self.chapter_retries + 1
+        started = time.perf_counter()
+        for attempt in range(1, attempts + 1):
+            try:
+                text = self._create_chapter(concept, index, snapshot)
+                self.timings.chapters.append({
+                    "index": index + 1,
+                    "title": concept.name,
+                    "seconds": round(time.perf_counter() - started, 3),
+                    "attempts": attempt,
+                })
+                return text
+            except Exception as e:
+                if attempt >= attempts:
+                    logger.error(f"❌ Chapter {index + 1} ({concept.name}) failed after {attempt} attempts: {e}")
+                    raise
+                logger.warning(f"⚠️ Chapter {index + 1} attempt {attempt} failed: {e}. Retrying...")
+                time.sleep(min(2 ** (attempt - 1), 10))
+    
+    def _log_timings(self) -> None:
+        """Log a compact per-phase timing report."""
+        logger.info("⏱️  Phase timings:")
+        for phase, seconds in self.timings.phases.items():
+            logger.info(f"   {phase:<10} {seconds:8.2f}s")
+        if self.timings.chapters:
+            slowest = max(self.timings.chapters, key=lambda c: c["seconds"])
+            logger.info(f"   slowest chapter: #{slowest['index']} {slowest['title'][:40]} ({slowest['seconds']:.2f}s)")
+    
+    def _create_chapter(self, concept, index: int,
+                        snapshot: Optional[ChapterContextSnapshot] = None) -> str:
         """Create a single chapter through the creation pipeline."""
         # Build context
-        context = {
-            "chapter_number": index + 1,
-            "chapter_title": concept.name,
-            "chapter_purpose": concept.description,
-            "voice_rules": "\n".join(self.artifacts.voice.sentence_rhythm_rules) if self.artifacts.voice else "",
-            "banned_phrases": self.artifacts.voice.banned_phrases if self.artifacts.voice else [],
-            "key_takeaways": concept.description,
-            "product_promise": self.artifacts.positioning.core_promise if self.artifacts.positioning else "Transform your life.",
-            "audience_persona": self.artifacts.positioning.audience.primary_persona if self.artifacts.positioning and self.artifacts.positioning.audience else "Ambitious Learners",
-            # MISSING KEYS RESTORED:
-            "product_name": self.context.product_name if hasattr(self.context, 'product_name') else "The Product",
-            "thesis": self.artifacts.intelligence.thesis if self.artifacts.intelligence else "This product changes everything."
-        }
-        
+        if snapshot is None:
+            snapshot = self._snapshot_context()
+        context = snapshot.chapter_context(concept, index)
         
         # Draft
         logger.info(f"ORCHESTRATOR CONTEXT KEYS: {list(context.keys())}")
@@ -182,7 +182,11 @@ class WritersRoom:
             prompt_path = self.prompt_interface.write_prompt(
                 prompt=prompt,
                 slug=slug,
-                metadata={"role": role_name, "chapter": context.get('chapter_title')}
+                metadata={
+                    "role": role_name,
+                    "chapter": context.get('chapter_title'),
+                    "chapter_number": context.get('chapter_number'),
+                }
             )
             logger.info(f"📝 Prompt written: {prompt_path}")
             return f"[AWAITING_ANTIGRAVITY: {slug}]"
@@ -238,6 +242,7 @@ class WritersRoom:
             metadata={
                 "type": "comprehensive_chapter",
                 "chapter": context.get("chapter_title"),
+                "chapter_number": context.get("chapter_number"),
                 "min_words": 1500,
                 "max_words": 3000,
                 "quality_checks": ["story", "teaching", "delight"]
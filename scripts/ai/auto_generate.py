@@ -54,11 +54,11 @@ Cost Optimization Modes:
 """
 
 import argparse
+import functools
 import json
 import os
 import random
 import re
-import shutil
 import subprocess
 import sys
 import time
@@ -86,6 +86,9 @@ load_dotenv(PROJECT_ROOT / ".env")
 from scripts.ai.creative_workflow import CreativeWorkflow
 from scripts.utilities.estimate_duration import estimate_duration
 from scripts.utilities.archetype_selector import ArchetypeSelector, SelectedArchetype
+from scripts.utilities.asset_store import AssetStore
+from scripts.utilities.knowledge_snapshot import load_knowledge
+from scripts.utilities.tracing import span, trace
 
 # Recursive improvement agent (lazy-loaded for performance)
 _recursive_agent = None
@@ -102,6 +105,24 @@ def _get_recursive_agent():
             return None
     return _recursive_agent
 
+def _traced_stage(method):
+    """Record an AutoGenerator stage as a tracing span named after the method.
+
+    Stages report failure by appending to stages_failed rather than raising,
+    so the span is marked failed when its stage lands there.
+    """
+    stage = method.__name__[len("_stage_"):]
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        failed_before = len(self.stages_failed)
+        with span(stage) as stage_span:
+            result = method(self, *args, **kwargs)
+            if stage in self.stages_failed[failed_before:]:
+                stage_span.fail(f"{stage} failed")
+            return result
+    return wrapper
+
 DEFAULT_NOTION_ROOT_PAGE_ID = os.getenv(
     "NOTION_ROOT_PAGE_ID", "1ee2bab3796d80738af6c96bd5077acf"
 )
@@ -657,6 +678,14 @@ class AutoGenerator:
 
     def run(self) -> Dict:
         """Run the complete auto-generation pipeline."""
+        # Dry runs stop after planning; keep them out of the stage timings
+        with trace("auto_generate", session_name=self.session_name, save=not self.dry_run) as build:
+            report = self._run_stages()
+            if self.stages_failed:
+                build.fail("; ".join(self.stages_failed))
+        return report
+
+    def _run_stages(self) -> Dict:
         self.start_time = datetime.now()
 
         self.log(f"Auto-Generate Pipeline", "stage")
@@ -770,6 +799,7 @@ class AutoGenerator:
 
         return report
 
+    @_traced_stage
     def _stage_create_plan(self) -> 'GenerationPlan':
         """Stage 0: Create execution plan before any generation.
 
@@ -896,6 +926,7 @@ class AutoGenerator:
             },
         }
 
+    @_traced_stage
     def _stage_create_session(self):
         """Create session directory structure."""
         self.log("Creating session structure", "stage")
@@ -918,6 +949,7 @@ class AutoGenerator:
         self.stages_completed.append("create_session")
         self.log(f"Created: {self.session_path}", "success")
 
+    @_traced_stage
     def _stage_generate_manifest(self) -> Dict:
         """Generate manifest from topic using CreativeWorkflow."""
         self.log("Generating manifest from topic", "stage")
@@ -1033,6 +1065,7 @@ class AutoGenerator:
         self.stages_completed.append("generate_manifest")
         return manifest
 
+    @_traced_stage
     def _stage_generate_script(self):
         """Generate full SSML script using Claude API."""
         self.log("Generating SSML script", "stage")
@@ -1531,6 +1564,7 @@ Do NOT include any explanation or commentary before or after the SSML.
         pattern = re.compile(r'\[\[?SFX:[^\]]+\]\]?', re.IGNORECASE)
         return len(pattern.findall(ssml or ""))
 
+    @_traced_stage
     def _stage_generate_prompts(self):
         """Generate Midjourney/SD image prompts."""
         self.log("Generating image prompts", "stage")
@@ -1558,6 +1592,7 @@ Do NOT include any explanation or commentary before or after the SSML.
         except Exception as e:
             self.log(f"Prompt generation skipped: {e}", "warning")
 
+    @_traced_stage
     def _stage_generate_voice(self):
         """Generate voice audio from SSML."""
         self.log("Generating voice audio", "stage")
@@ -1649,6 +1684,7 @@ Do NOT include any explanation or commentary before or after the SSML.
         self.log(f"Using target duration: {self.duration_minutes} minutes", "info")
         return self.duration_minutes * 60
 
+    @_traced_stage
     def _stage_generate_binaural(self):
         """Generate binaural beats using YAML presets, manifest, or fallback."""
         self.log("Generating binaural beats", "stage")
@@ -1761,6 +1797,7 @@ Do NOT include any explanation or commentary before or after the SSML.
         except Exception as e:
             self.log(f"Binaural generation skipped: {e}", "warning")
 
+    @_traced_stage
     def _stage_generate_sfx(self):
         """Render SFX track from SSML markers aligned to voice."""
         self.log("Generating SFX track", "stage")
@@ -1814,6 +1851,7 @@ Do NOT include any explanation or commentary before or after the SSML.
         except Exception as e:
             self.log(f"SFX generation skipped: {e}", "warning")
 
+    @_traced_stage
     def _stage_mix_audio(self):
         """Mix audio layers using FFmpeg."""
         self.log("Mixing audio layers", "stage")
@@ -1898,6 +1936,7 @@ Do NOT include any explanation or commentary before or after the SSML.
             self.log(f"Audio mixing failed: {e}", "error")
             self.stages_failed.append("mix_audio")
 
+    @_traced_stage
     def _stage_hypnotic_post_process(self):
         """Apply hypnotic post-processing (MANDATORY)."""
         self.log("Applying hypnotic post-processing (FFmpeg mode for low memory)", "stage")
@@ -1936,6 +1975,7 @@ Do NOT include any explanation or commentary before or after the SSML.
             self.stages_failed.append("hypnotic_post_process")
             raise RuntimeError(f"Hypnotic post-processing failed: {e}")
 
+    @_traced_stage
     def _stage_generate_vtt(self):
         """Generate VTT subtitles."""
         self.log("Generating VTT subtitles", "stage")
@@ -1959,6 +1999,7 @@ Do NOT include any explanation or commentary before or after the SSML.
         except Exception as e:
             self.log(f"VTT generation skipped: {e}", "warning")
 
+    @_traced_stage
     def _stage_generate_images(self):
         """Generate scene images using configured method (sd, stock, midjourney, pil, or random)."""
         self.log("Generating scene images", "stage")
@@ -2030,12 +2071,16 @@ Do NOT include any explanation or commentary before or after the SSML.
         
         self.log(f"Copying {num_images} random images from project folder", "info")
         
-        # Copy images with sequential naming, converting to PNG format
+        # Copy images with sequential naming, converting to PNG format.
+        # Converted files go through the asset store, so an image picked by
+        # many sessions is stored once and linked into each of them.
         copied_count = 0
+        store = AssetStore()
         for i, source_image in enumerate(selected_images, 1):
             # Create a clean filename: scene_01.png, scene_02.png, etc.
             target_filename = f"scene_{i:02d}.png"
             target_path = target_dir / target_filename
+            staged_path = target_dir / f".{target_filename}.converting"
 
             try:
                 # Convert to PNG format for consistency (video assembly expects PNG)
@@ -2043,26 +2088,29 @@ Do NOT include any explanation or commentary before or after the SSML.
                     # Convert to RGB if needed (handles RGBA, palette modes, etc.)
                     if img.mode in ('RGBA', 'LA'):
                         # Preserve transparency by keeping RGBA
-                        img.save(target_path, 'PNG')
+                        img.save(staged_path, 'PNG')
                     elif img.mode == 'P':
                         # Palette mode - convert to RGB
                         img = img.convert('RGB')
-                        img.save(target_path, 'PNG')
+                        img.save(staged_path, 'PNG')
                     else:
                         # RGB or L mode - save directly
                         if img.mode != 'RGB':
                             img = img.convert('RGB')
-                        img.save(target_path, 'PNG')
+                        img.save(staged_path, 'PNG')
+                store.place(staged_path, target_path, session_name=self.session_name, move=True)
                 copied_count += 1
                 self.log(f"  [{i}/{num_images}] Converted {source_image.name} -> {target_filename}", "info")
             except Exception as e:
+                staged_path.unlink(missing_ok=True)
                 # Fallback to simple copy if conversion fails
                 try:
-                    shutil.copy2(source_image, target_path)
+                    store.place(source_image, target_path, session_name=self.session_name)
                     copied_count += 1
                     self.log(f"  [{i}/{num_images}] Copied {source_image.name} -> {target_filename} (no conversion)", "warning")
                 except Exception as copy_error:
                     self.log(f"  Failed to process {source_image.name}: {e}", "warning")
+        store.close()
         
         if copied_count > 0:
             self.log(f"Successfully copied {copied_count} images", "success")
@@ -2146,6 +2194,7 @@ Do NOT include any explanation or commentary before or after the SSML.
             self.log(f"Image generation error ({method}): {e}", "warning")
             return False
 
+    @_traced_stage
     def _stage_assemble_video(self):
         """Assemble final video."""
         self.log("Assembling video", "stage")
@@ -2190,6 +2239,7 @@ Do NOT include any explanation or commentary before or after the SSML.
         except Exception as e:
             self.log(f"Video assembly skipped: {e}", "warning")
 
+    @_traced_stage
     def _stage_package_youtube(self):
         """Create YouTube package with SEO context from knowledge base."""
         self.log("Creating YouTube package", "stage")
@@ -2322,6 +2372,7 @@ Topic: {self.topic}
         except Exception as e:
             self.log(f"YouTube packaging skipped: {e}", "warning")
 
+    @_traced_stage
     def _stage_generate_thumbnail(self):
         """Generate optimized YouTube thumbnail using Ultimate Thumbnail Generator."""
         self.log("Generating optimized YouTube thumbnail", "stage")
@@ -2367,6 +2418,7 @@ Topic: {self.topic}
         except Exception as e:
             self.log(f"Thumbnail generation skipped: {e}", "warning")
 
+    @_traced_stage
     def _stage_upload_website(self):
         """Upload session to salars.net website."""
         self.log("Uploading to website (salars.net)", "stage")
@@ -2462,6 +2514,7 @@ Topic: {self.topic}
             self.log(f"Website upload failed: {e}", "error")
             self.stages_failed.append("upload_website")
 
+    @_traced_stage
     def _stage_cleanup(self):
         """Cleanup intermediate files to save disk space."""
         if self.nightly:
@@ -2501,6 +2554,7 @@ Topic: {self.topic}
         except Exception as e:
             self.log(f"Cleanup skipped: {e}", "warning")
 
+    @_traced_stage
     def _stage_self_improvement(self):
         """Record lessons learned and update knowledge base."""
         self.log("Recording lessons learned", "stage")
@@ -2511,9 +2565,8 @@ Topic: {self.topic}
         lessons = []
         if lessons_file.exists():
             try:
-                with open(lessons_file, 'r') as f:
-                    data = yaml.safe_load(f) or {}
-                    lessons = data.get('lessons', [])
+                data = load_knowledge(lessons_file, mutable=True) or {}
+                lessons = data.get('lessons', [])
             except Exception:
                 lessons = []
 
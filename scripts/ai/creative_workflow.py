@@ -30,6 +30,12 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime
 import random
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.utilities.knowledge_snapshot import load_knowledge
+
 # Import archetype selector for codex-based selection
 try:
     from scripts.utilities.archetype_selector import ArchetypeSelector, SelectedArchetype
@@ -406,8 +412,7 @@ class CreativeWorkflow:
         """Load lessons learned for informed decisions."""
         lessons_path = self.project_root / "knowledge" / "lessons_learned.yaml"
         if lessons_path.exists():
-            with open(lessons_path, 'r') as f:
-                return yaml.safe_load(f)
+            return load_knowledge(lessons_path)
         return {}
 
     def identify_therapeutic_focus(self, topic: str) -> Tuple[str, List[str]]:
@@ -11,10 +11,12 @@ Core Philosophy:
 """
 
 from .email_scheduler import EmailScheduler, EmailType, Subscriber, EmailRecord
+from .email_store import EmailStore
 
 __all__ = [
     "EmailScheduler",
     "EmailType",
     "Subscriber",
-    "EmailRecord"
+    "EmailRecord",
+    "EmailStore"
 ]
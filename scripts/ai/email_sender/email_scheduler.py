@@ -8,10 +8,16 @@ Implements trust-based email scheduling with:
 - Segment-based targeting
 - Readiness signal tracking
 
+Subscribers and send history live in data/subscribers.json and
+data/email_history.json, or in the SQLite EmailStore (email_store.py) when
+one is passed in (CLI: --store), which answers due sends, eligibility and
+invitation limits from indexed queries instead of scanning every subscriber.
+
 Philosophy: "We write when there is something worth sitting with."
 """
 
 import os
+import sys
 import yaml
 import json
 from datetime import datetime, timedelta
@@ -119,24 +125,37 @@ class EmailScheduler:
     # Maximum invitation emails per month
     MAX_INVITATIONS_PER_MONTH = 1
 
-    def __init__(self, config_path: Optional[str] = None):
-        """Initialize the email scheduler"""
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        store: Optional[Any] = None,
+        data_dir: Optional[Path] = None
+    ):
+        """
+        Initialize the email scheduler
+
+        Args:
+            config_path: Email config YAML (default: config/email_config.yaml)
+            store: EmailStore to use instead of the JSON files
+            data_dir: Directory holding the JSON files (default: data/)
+        """
         self.project_root = Path(__file__).parent.parent.parent.parent
         self.config_path = config_path or self.project_root / "config" / "email_config.yaml"
-        self.history_path = self.project_root / "data" / "email_history.json"
-        self.subscribers_path = self.project_root / "data" / "subscribers.json"
+        data_dir = Path(data_dir) if data_dir else self.project_root / "data"
+        self.history_path = data_dir / "email_history.json"
+        self.subscribers_path = data_dir / "subscribers.json"
+        self.sequences_dir = self.project_root / "config" / "sequences"
+        self.store = store
 
         # Ensure data directory exists
-        (self.project_root / "data").mkdir(exist_ok=True)
+        data_dir.mkdir(parents=True, exist_ok=True)
 
         # Load configuration
         self.config = self._load_config()
 
-        # Load email history
-        self.history = self._load_history()
-
-        # Load subscribers
-        self.subscribers = self._load_subscribers()
+        # Load email history and subscribers (the store queries them instead)
+        self.history = self._load_history() if store is None else []
+        self.subscribers = self._load_subscribers() if store is None else {}
 
         # Initialize Resend if available
         if RESEND_AVAILABLE and os.getenv("RESEND_API_KEY"):
@@ -159,97 +178,160 @@ class EmailScheduler:
 
     def _load_sequence(self, slug: str) -> Optional[Dict]:
         """Load a sequence definition from YAML"""
-        seq_path = self.project_root / "config" / "sequences" / f"{slug}.yaml"
+        seq_path = self.sequences_dir / f"{slug}.yaml"
         if seq_path.exists():
             with open(seq_path) as f:
                 return yaml.safe_load(f)
         return None
 
+    def get_subscriber(self, email: str) -> Optional[Subscriber]:
+        """Look up a subscriber by email"""
+        if self.store:
+            return self.store.get_subscriber(email)
+        return self.subscribers.get(email)
+
+    def save_subscriber(self, subscriber: Subscriber):
+        """Persist changes to a subscriber"""
+        if self.store:
+            self.store.save_subscriber(subscriber)
+        else:
+            self.subscribers[subscriber.email] = subscriber
+            self._save_subscribers()
+
     def trigger_sequence(self, recipient: str, sequence_slug: str) -> bool:
         """Manually trigger a sequence for a subscriber"""
-        if recipient not in self.subscribers:
+        subscriber = self.get_subscriber(recipient)
+        if subscriber is None:
             # Create subscriber if doesn't exist
-            self.subscribers[recipient] = Subscriber(
+            subscriber = Subscriber(
                 email=recipient,
                 subscribed_at=datetime.now(),
                 source="sequence_trigger"
             )
-        
-        subscriber = self.subscribers[recipient]
+            if self.store:
+                self.store.save_subscriber(subscriber)
+            else:
+                self.subscribers[recipient] = subscriber
+
         sequence = self._load_sequence(sequence_slug)
-        
+
         if not sequence:
             print(f"Error: Sequence '{sequence_slug}' not found.")
             return False
-            
-        subscriber.active_sequence = sequence_slug
-        subscriber.sequence_index = 0  # Ready for first email
-        self._save_subscribers()
+
+        if self.store:
+            self.store.sync_sequences(self.sequences_dir)
+            self.store.enroll(recipient, sequence_slug)
+        else:
+            subscriber.active_sequence = sequence_slug
+            subscriber.sequence_index = 0  # Ready for first email
+            self._save_subscribers()
         print(f"Triggered sequence '{sequence_slug}' for {recipient}")
         return True
 
-    def process_sequences(self) -> List[Dict]:
-        """Process all active sequences and send pending emails"""
-        results = []
+    def due_sequence_sends(self, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Next sequence email for every subscriber the 7-day rule allows.
+
+        Returns:
+            Dicts with recipient, sequence, index, subject, theme and
+            last_index; subject is None when the sequence has no email at
+            that index (finished or out of bounds)
+        """
+        if self.store:
+            self.store.sync_sequences(self.sequences_dir)
+            return self.store.due_sends(now)
+
+        due = []
+        sequences: Dict[str, Optional[Dict]] = {}
         for email, subscriber in self.subscribers.items():
             if not subscriber.active_sequence:
                 continue
-            
+
             # Check if 7-day rule allows
             if not subscriber.is_ready_for_email:
                 continue
-            
-            sequence = self._load_sequence(subscriber.active_sequence)
+
+            slug = subscriber.active_sequence
+            if slug not in sequences:
+                sequences[slug] = self._load_sequence(slug)
+            sequence = sequences[slug]
             if not sequence:
                 continue
-                
+
             next_index = subscriber.sequence_index + 1
             emails = sequence.get("emails", [])
-            
+
             # Find the email for the next index
             next_email = next((e for e in emails if e["index"] == next_index), None)
-            
-            if next_email:
-                # Load actual content if exists
-                content_path = self.project_root / "config" / "sequences" / "content" / subscriber.active_sequence / f"{next_index:03d}.txt"
-                content = f"Theme: {next_email['theme']}\n\n(Sequence Content Placeholder)"
-                
-                if content_path.exists():
-                    with open(content_path, "r") as f:
-                        file_content = f.read()
-                        # Extract subject if it's on first line (standard format: Subject: ...)
-                        if file_content.startswith("Subject:"):
-                            first_line_end = file_content.find("\n")
-                            # subject = file_content[8:first_line_end].strip() # Use YAML subject as source of truth for now or parse?
-                            content = file_content[first_line_end:].strip()
-                        else:
-                            content = file_content
-                
-                # Schedule/Send the email
-                res = self.schedule_email(
-                    recipient=email,
-                    email_type=EmailType.SEQUENCE,
-                    subject=next_email["subject"],
-                    content=content,
-                    tags=[f"seq:{subscriber.active_sequence}", f"idx:{next_index}"]
-                )
-                
-                # Add subject to return for logging
-                res["subject"] = next_email["subject"]
-                
-                if res.get("success"):
+            due.append({
+                "recipient": email,
+                "sequence": slug,
+                "index": next_index,
+                "subject": next_email["subject"] if next_email else None,
+                "theme": next_email.get("theme", "") if next_email else "",
+                "last_index": max((e["index"] for e in emails), default=0)
+            })
+        return due
+
+    def _sequence_content(self, slug: str, index: int, theme: str) -> str:
+        """Load sequence email content, falling back to a placeholder"""
+        content_path = self.sequences_dir / "content" / slug / f"{index:03d}.txt"
+        content = f"Theme: {theme}\n\n(Sequence Content Placeholder)"
+
+        if content_path.exists():
+            with open(content_path, "r") as f:
+                file_content = f.read()
+                # Extract subject if it's on first line (standard format: Subject: ...)
+                if file_content.startswith("Subject:"):
+                    first_line_end = file_content.find("\n")
+                    # subject = file_content[8:first_line_end].strip() # Use YAML subject as source of truth for now or parse?
+                    content = file_content[first_line_end:].strip()
+                else:
+                    content = file_content
+        return content
+
+    def process_sequences(self) -> List[Dict]:
+        """Process all active sequences and send pending emails"""
+        results = []
+        for due in self.due_sequence_sends():
+            email, slug, next_index = due["recipient"], due["sequence"], due["index"]
+
+            if due["subject"] is None:
+                # Sequence finished or index out of bounds
+                if self.store:
+                    self.store.advance_enrollment(email, slug, due["index"] - 1, completed=True)
+                else:
+                    self.subscribers[email].active_sequence = None
+                continue
+
+            # Schedule/Send the email
+            res = self.schedule_email(
+                recipient=email,
+                email_type=EmailType.SEQUENCE,
+                subject=due["subject"],
+                content=self._sequence_content(slug, next_index, due["theme"]),
+                tags=[f"seq:{slug}", f"idx:{next_index}"]
+            )
+
+            # Add subject to return for logging
+            res["subject"] = due["subject"]
+
+            if res.get("success"):
+                # If this was the last email, clear the active sequence
+                completed = next_index >= due["last_index"]
+                if self.store:
+                    self.store.advance_enrollment(email, slug, next_index, completed=completed)
+                else:
+                    subscriber = self.subscribers[email]
                     subscriber.sequence_index = next_index
-                    # If this was the last email, clear the active sequence
-                    if next_index >= max(e["index"] for e in emails):
+                    if completed:
                         subscriber.active_sequence = None
-                    results.append(res)
-            else:
-                # Sequence finished or index out of bounds
-                subscriber.active_sequence = None
-        
-        if results:
+                results.append(res)
+
+        if results and not self.store:
             self._save_subscribers()
-        
+
         return results
 
     def _load_history(self) -> List[EmailRecord]:
@@ -355,11 +437,10 @@ class EmailScheduler:
             return True, None
 
         # Check subscriber exists
-        if recipient not in self.subscribers:
+        subscriber = self.get_subscriber(recipient)
+        if subscriber is None:
             return True, None  # New subscriber, allow
 
-        subscriber = self.subscribers[recipient]
-
         # Check 7-day rule
         if not subscriber.is_ready_for_email:
             days_left = self.MIN_DAYS_BETWEEN_EMAILS - subscriber.days_since_last_email
@@ -378,6 +459,9 @@ class EmailScheduler:
         now = datetime.now()
         month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
+        if self.store:
+            return self.store.count_sends(recipient, EmailType.INVITATION.value, since=month_start)
+
         count = 0
         for record in self.history:
             if (record.recipient == recipient and
@@ -403,6 +487,15 @@ class EmailScheduler:
         Returns:
             List of eligible email addresses
         """
+        if self.store:
+            return self.store.eligible_recipients(
+                email_type.value,
+                transactional=email_type in self.TRANSACTIONAL_TYPES,
+                max_invitations=self.MAX_INVITATIONS_PER_MONTH,
+                segment=segment,
+                interests=interests
+            )
+
         eligible = []
 
         for email, subscriber in self.subscribers.items():
@@ -491,6 +584,15 @@ class EmailScheduler:
                     "blocked_by": "resend_api"
                 }
 
+        if self.store:
+            self.store.record_send(record)
+            return {
+                "success": True,
+                "email_id": record.email_id,
+                "scheduled_for": send_time.isoformat(),
+                "type": email_type.value
+            }
+
         # Update history
         self.history.append(record)
         self._save_history()
@@ -519,6 +621,9 @@ class EmailScheduler:
 
     def record_open(self, email_id: str):
         """Record that an email was opened"""
+        if self.store:
+            self.store.record_open(email_id)
+            return
         for record in self.history:
             if record.email_id == email_id:
                 record.opened = True
@@ -531,6 +636,9 @@ class EmailScheduler:
 
     def record_reply(self, email_id: str):
         """Record that an email received a reply (MOST IMPORTANT METRIC)"""
+        if self.store:
+            self.store.record_reply(email_id)
+            return
         for record in self.history:
             if record.email_id == email_id:
                 record.replied = True
@@ -542,6 +650,9 @@ class EmailScheduler:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get email statistics"""
+        if self.store:
+            return self.store.get_stats([t.value for t in EmailType])
+
         total_sent = len(self.history)
         total_opened = sum(1 for r in self.history if r.opened)
         total_replied = sum(1 for r in self.history if r.replied)
@@ -618,10 +729,20 @@ def main():
     parser.add_argument("--check", type=str, help="Check if recipient can receive email")
     parser.add_argument("--trigger-sequence", nargs=2, metavar=("EMAIL", "SEQUENCE"), help="Trigger a sequence for a subscriber")
     parser.add_argument("--process-sequences", action="store_true", help="Process all active sequences")
+    parser.add_argument("--store", nargs="?", const="", metavar="DB",
+                        help="Use the SQLite email store (default: data/email_store.db)")
 
     args = parser.parse_args()
 
-    scheduler = EmailScheduler()
+    store = None
+    if args.store is not None:
+        project_root = Path(__file__).resolve().parents[3]
+        if str(project_root) not in sys.path:
+            sys.path.insert(0, str(project_root))
+        from scripts.ai.email_sender.email_store import EmailStore
+        store = EmailStore(args.store or None)
+
+    scheduler = EmailScheduler(store=store)
 
     if args.stats:
         stats = scheduler.get_stats()
@@ -0,0 +1,798 @@
+#!/usr/bin/env python3
+"""
+Dreamweaver Email Store
+
+SQLite store for subscribers, segments, sequence enrollments and send
+events. EmailScheduler and SegmentManager use it in place of the flat files
+(data/subscribers.json, data/email_history.json), which are loaded and
+scanned in full on every run:
+
+- Due sequence sends are one range query on the active-enrollment index
+  (enrollments.due_at is kept at last_email_at + 7 days on every send)
+- Segment membership is materialized in segment_members and re-evaluated
+  for a subscriber whenever that subscriber changes; segments with
+  time-relative filters (new_subscribers, long_term, purchase_ready) are
+  re-evaluated in full at most once a day
+- Eligibility and the monthly invitation limit are indexed lookups
+
+Usage:
+    # Import the current JSON files into data/email_store.db
+    python3 -m scripts.ai.email_sender.email_store --import
+
+    # Sequence emails due right now
+    python3 -m scripts.ai.email_sender.email_store --due
+
+    # Scheduling benchmark with synthetic subscribers
+    python3 -m scripts.ai.email_sender.email_store --benchmark --subscribers 100000
+
+    # Run the scheduler / segment manager against the store
+    python3 -m scripts.ai.email_sender.email_scheduler --store --process-sequences
+    python3 -m scripts.ai.email_sender.segment_manager --store --stats
+"""
+
+import json
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+from .email_scheduler import EmailRecord, EmailScheduler, Subscriber
+from .segment_manager import SegmentManager, subscriber_matches
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_DB_PATH = PROJECT_ROOT / "data" / "email_store.db"
+
+# Filters whose result changes with the clock, not only with subscriber data
+TIME_RELATIVE_FILTERS = {"days_since_subscribe", "min_days_subscribed", "readiness_score"}
+SEGMENT_REFRESH_INTERVAL = timedelta(days=1)
+
+
+def _ts(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _dt(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _sequence_tags(tags: List[str]) -> Tuple[Optional[str], Optional[int]]:
+    """Sequence slug and index from ``seq:<slug>`` / ``idx:<n>`` tags"""
+    sequence = next((t[4:] for t in tags if t.startswith("seq:")), None)
+    index = next((t[4:] for t in tags if t.startswith("idx:")), None)
+    return sequence, int(index) if index and index.isdigit() else None
+
+
+class EmailStore:
+    """SQLite storage for the email scheduler and segment manager."""
+
+    def __init__(self, db_path: Optional[Path] = None,
+                 min_days_between_emails: int = EmailScheduler.MIN_DAYS_BETWEEN_EMAILS):
+        """
+        Args:
+            db_path: SQLite database file. Defaults to data/email_store.db
+            min_days_between_emails: Gap enforced between non-transactional emails
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.min_gap = timedelta(days=min_days_between_emails)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.init_schema()
+        self._segments: Optional[Dict[str, Dict]] = None
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ==================== Schema ====================
+
+    def init_schema(self):
+        """Create tables and indexes if they do not exist."""
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS subscribers (
+                email TEXT PRIMARY KEY,
+                subscribed_at TEXT NOT NULL,
+                source TEXT NOT NULL DEFAULT 'direct',
+                emails_received INTEGER NOT NULL DEFAULT 0,
+                emails_opened INTEGER NOT NULL DEFAULT 0,
+                replies INTEGER NOT NULL DEFAULT 0,
+                purchases INTEGER NOT NULL DEFAULT 0,
+                last_email_at TEXT,
+                last_open_at TEXT,
+                -- last_email_at + min gap; NULL when never emailed
+                next_send_at TEXT,
+                engagement TEXT NOT NULL DEFAULT 'passive',
+                tags TEXT NOT NULL DEFAULT '[]'
+            );
+            CREATE INDEX IF NOT EXISTS idx_subscribers_next_send ON subscribers(next_send_at);
+            CREATE INDEX IF NOT EXISTS idx_subscribers_engagement ON subscribers(engagement);
+
+            CREATE TABLE IF NOT EXISTS subscriber_interests (
+                interest TEXT NOT NULL,
+                email TEXT NOT NULL,
+                PRIMARY KEY (interest, email)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_interests_email ON subscriber_interests(email);
+
+            CREATE TABLE IF NOT EXISTS sequences (
+                slug TEXT PRIMARY KEY,
+                last_step INTEGER NOT NULL,
+                source_mtime REAL
+            );
+
+            CREATE TABLE IF NOT EXISTS sequence_steps (
+                sequence TEXT NOT NULL,
+                step INTEGER NOT NULL,
+                subject TEXT NOT NULL,
+                theme TEXT,
+                content_id TEXT,
+                PRIMARY KEY (sequence, step)
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS enrollments (
+                email TEXT NOT NULL,
+                sequence TEXT NOT NULL,
+                step INTEGER NOT NULL DEFAULT 0,        -- last index sent
+                status TEXT NOT NULL DEFAULT 'active',  -- active, completed, cancelled
+                enrolled_at TEXT NOT NULL,
+                due_at TEXT NOT NULL,                   -- earliest time for the next step
+                completed_at TEXT,
+                PRIMARY KEY (email, sequence)
+            );
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_enrollments_active
+                ON enrollments(email) WHERE status = 'active';
+            CREATE INDEX IF NOT EXISTS idx_enrollments_due
+                ON enrollments(due_at) WHERE status = 'active';
+
+            CREATE TABLE IF NOT EXISTS send_events (
+                email_id TEXT PRIMARY KEY,
+                email TEXT NOT NULL,
+                email_type TEXT NOT NULL,
+                subject TEXT,
+                sent_at TEXT NOT NULL,
+                opened INTEGER NOT NULL DEFAULT 0,
+                clicked INTEGER NOT NULL DEFAULT 0,
+                replied INTEGER NOT NULL DEFAULT 0,
+                tags TEXT NOT NULL DEFAULT '[]',
+                sequence TEXT,
+                step INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS idx_send_events_recipient
+                ON send_events(email, email_type, sent_at);
+            CREATE INDEX IF NOT EXISTS idx_send_events_type ON send_events(email_type);
+
+            CREATE TABLE IF NOT EXISTS segments (
+                name TEXT PRIMARY KEY,
+                description TEXT,
+                filters TEXT NOT NULL,
+                sequence TEXT,
+                time_relative INTEGER NOT NULL DEFAULT 0,
+                refreshed_at TEXT
+            );
+
+            CREATE TABLE IF NOT EXISTS segment_members (
+                segment TEXT NOT NULL,
+                email TEXT NOT NULL,
+                PRIMARY KEY (segment, email)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_segment_members_email ON segment_members(email);
+        """)
+        self.conn.commit()
+
+    # ==================== Subscribers ====================
+
+    _SUBSCRIBER_SELECT = """
+        SELECT s.*,
+               (SELECT group_concat(i.interest, char(31)) FROM subscriber_interests i
+                 WHERE i.email = s.email) AS interests,
+               e.sequence AS active_sequence, e.step AS sequence_index
+          FROM subscribers s
+          LEFT JOIN enrollments e ON e.email = s.email AND e.status = 'active'
+    """
+
+    @staticmethod
+    def _row_to_subscriber(row: sqlite3.Row) -> Subscriber:
+        return Subscriber(
+            email=row["email"],
+            subscribed_at=_dt(row["subscribed_at"]),
+            source=row["source"],
+            interests=row["interests"].split("\x1f") if row["interests"] else [],
+            emails_received=row["emails_received"],
+            emails_opened=row["emails_opened"],
+            replies=row["replies"],
+            purchases=row["purchases"],
+            last_email_at=_dt(row["last_email_at"]),
+            last_open_at=_dt(row["last_open_at"]),
+            active_sequence=row["active_sequence"],
+            sequence_index=row["sequence_index"] or 0,
+            tags=json.loads(row["tags"])
+        )
+
+    def get_subscriber(self, email: str) -> Optional[Subscriber]:
+        row = self.conn.execute(self._SUBSCRIBER_SELECT + " WHERE s.email = ?", (email,)).fetchone()
+        return self._row_to_subscriber(row) if row else None
+
+    def iter_subscribers(self) -> Iterable[Subscriber]:
+        for row in self.conn.execute(self._SUBSCRIBER_SELECT):
+            yield self._row_to_subscriber(row)
+
+    def _write_subscribers(self, subscribers: List[Subscriber]):
+        """Upsert subscriber rows and interests; re-time active enrollments."""
+        rows = []
+        for s in subscribers:
+            next_send = _ts(s.last_email_at + self.min_gap) if s.last_email_at else None
+            rows.append((
+                s.email, _ts(s.subscribed_at), s.source, s.emails_received, s.emails_opened,
+                s.replies, s.purchases, _ts(s.last_email_at), _ts(s.last_open_at),
+                next_send, s.engagement_level, json.dumps(s.tags)
+            ))
+        self.conn.executemany("""
+            INSERT INTO subscribers (email, subscribed_at, source, emails_received, emails_opened,
+                                     replies, purchases, last_email_at, last_open_at,
+                                     next_send_at, engagement, tags)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(email) DO UPDATE SET
+                subscribed_at = excluded.subscribed_at, source = excluded.source,
+                emails_received = excluded.emails_received, emails_opened = excluded.emails_opened,
+                replies = excluded.replies, purchases = excluded.purchases,
+                last_email_at = excluded.last_email_at, last_open_at = excluded.last_open_at,
+                next_send_at = excluded.next_send_at, engagement = excluded.engagement,
+                tags = excluded.tags
+        """, rows)
+        self.conn.executemany("DELETE FROM subscriber_interests WHERE email = ?",
+                              [(s.email,) for s in subscribers])
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO subscriber_interests (interest, email) VALUES (?, ?)",
+            [(i, s.email) for s in subscribers for i in s.interests]
+        )
+        self.conn.executemany(
+            "UPDATE enrollments SET due_at = COALESCE(?, enrolled_at) WHERE email = ? AND status = 'active'",
+            [(row[9], row[0]) for row in rows]
+        )
+
+    def save_subscriber(self, subscriber: Subscriber):
+        """
+        Insert or update a subscriber and re-evaluate its segment membership.
+
+        Sequence state (active_sequence / sequence_index) is managed through
+        enroll() and advance_enrollment(), not here.
+        """
+        self._write_subscribers([subscriber])
+        self._refresh_membership([subscriber])
+        self.conn.commit()
+
+    # ==================== Sequences ====================
+
+    def sync_sequences(self, sequences_dir: Path) -> int:
+        """
+        Load sequence YAML files whose mtime changed into sequence_steps.
+
+        Returns:
+            Number of sequences (re)loaded
+        """
+        known = {
+            row["slug"]: row["source_mtime"]
+            for row in self.conn.execute("SELECT slug, source_mtime FROM sequences")
+        }
+        loaded = 0
+        for path in sorted(Path(sequences_dir).glob("*.yaml")):
+            mtime = path.stat().st_mtime
+            if known.get(path.stem) == mtime:
+                continue
+            with open(path) as f:
+                sequence = yaml.safe_load(f) or {}
+            emails = sequence.get("emails", [])
+            self.conn.execute("DELETE FROM sequence_steps WHERE sequence = ?", (path.stem,))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO sequence_steps (sequence, step, subject, theme, content_id) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(path.stem, e["index"], e["subject"], e.get("theme", ""), e.get("content_id"))
+                 for e in emails]
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sequences (slug, last_step, source_mtime) VALUES (?, ?, ?)",
+                (path.stem, max((e["index"] for e in emails), default=0), mtime)
+            )
+            loaded += 1
+        if loaded:
+            self.conn.commit()
+        return loaded
+
+    def enroll(self, email: str, sequence: str, step: int = 0, now: Optional[datetime] = None):
+        """Start (or restart) a sequence; any other active sequence is cancelled."""
+        now = now or datetime.now()
+        row = self.conn.execute("SELECT next_send_at FROM subscribers WHERE email = ?", (email,)).fetchone()
+        due_at = (row["next_send_at"] if row else None) or _ts(now)
+        self.conn.execute(
+            "UPDATE enrollments SET status = 'cancelled', completed_at = ? "
+            "WHERE email = ? AND status = 'active' AND sequence != ?",
+            (_ts(now), email, sequence)
+        )
+        self.conn.execute("""
+            INSERT INTO enrollments (email, sequence, step, status, enrolled_at, due_at)
+            VALUES (?, ?, ?, 'active', ?, ?)
+            ON CONFLICT(email, sequence) DO UPDATE SET
+                step = excluded.step, status = 'active', enrolled_at = excluded.enrolled_at,
+                due_at = excluded.due_at, completed_at = NULL
+        """, (email, sequence, step, _ts(now), due_at))
+        self.conn.commit()
+
+    def advance_enrollment(self, email: str, sequence: str, step: int, completed: bool = False):
+        """Record the last step sent; completed enrollments leave the due index."""
+        self.conn.execute(
+            "UPDATE enrollments SET step = ?, status = ?, completed_at = ? "
+            "WHERE email = ? AND sequence = ? AND status = 'active'",
+            (step, "completed" if completed else "active",
+             _ts(datetime.now()) if completed else None, email, sequence)
+        )
+        self.conn.commit()
+
+    def due_sends(self, now: Optional[datetime] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Next sequence email for every active enrollment that is due.
+
+        One range scan of the partial due_at index; enrollments in a sequence
+        with no YAML are skipped, like the file-based scheduler.
+
+        Returns:
+            Same shape as EmailScheduler.due_sequence_sends()
+        """
+        rows = self.conn.execute("""
+            SELECT e.email, e.sequence, e.step + 1 AS next_step,
+                   st.subject, st.theme, q.last_step
+              FROM enrollments e
+              JOIN sequences q ON q.slug = e.sequence
+              LEFT JOIN sequence_steps st ON st.sequence = e.sequence AND st.step = e.step + 1
+             WHERE e.status = 'active' AND e.due_at <= ?
+             ORDER BY e.due_at
+             LIMIT ?
+        """, (_ts(now or datetime.now()), -1 if limit is None else limit)).fetchall()
+        return [
+            {
+                "recipient": row["email"],
+                "sequence": row["sequence"],
+                "index": row["next_step"],
+                "subject": row["subject"],
+                "theme": row["theme"] or "",
+                "last_index": row["last_step"],
+            }
+            for row in rows
+        ]
+
+    # ==================== Send events ====================
+
+    def record_send(self, record: EmailRecord):
+        """Store a send event and update the recipient (creating it if new)."""
+        sequence, step = _sequence_tags(record.tags)
+        self.conn.execute("""
+            INSERT OR REPLACE INTO send_events
+                (email_id, email, email_type, subject, sent_at, opened, clicked, replied,
+                 tags, sequence, step)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (record.email_id, record.recipient, record.email_type, record.subject,
+              _ts(record.sent_at), int(record.opened), int(record.clicked), int(record.replied),
+              json.dumps(record.tags), sequence, step))
+
+        subscriber = self.get_subscriber(record.recipient) or Subscriber(
+            email=record.recipient,
+            subscribed_at=datetime.now(),
+            source="direct"
+        )
+        subscriber.emails_received += 1
+        subscriber.last_email_at = record.sent_at
+        self.save_subscriber(subscriber)
+
+    def _record_event(self, email_id: str, column: str) -> Optional[Subscriber]:
+        row = self.conn.execute("SELECT email FROM send_events WHERE email_id = ?", (email_id,)).fetchone()
+        if row is None:
+            return None
+        self.conn.execute(f"UPDATE send_events SET {column} = 1 WHERE email_id = ?", (email_id,))
+        return self.get_subscriber(row["email"])
+
+    def record_open(self, email_id: str):
+        subscriber = self._record_event(email_id, "opened")
+        if subscriber:
+            subscriber.emails_opened += 1
+            subscriber.last_open_at = datetime.now()
+            self.save_subscriber(subscriber)
+        self.conn.commit()
+
+    def record_reply(self, email_id: str):
+        subscriber = self._record_event(email_id, "replied")
+        if subscriber:
+            subscriber.replies += 1
+            self.save_subscriber(subscriber)
+        self.conn.commit()
+
+    def count_sends(self, email: str, email_type: str, since: datetime) -> int:
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM send_events WHERE email = ? AND email_type = ? AND sent_at >= ?",
+            (email, email_type, _ts(since))
+        ).fetchone()[0]
+
+    def eligible_recipients(
+        self,
+        email_type: str,
+        transactional: bool = False,
+        max_invitations: int = EmailScheduler.MAX_INVITATIONS_PER_MONTH,
+        segment: Optional[str] = None,
+        interests: Optional[List[str]] = None,
+        now: Optional[datetime] = None
+    ) -> List[str]:
+        """Recipients EmailScheduler.can_send_email() would allow, as one query."""
+        now = now or datetime.now()
+        clauses, params = [], []
+        if not transactional:
+            clauses.append("(s.next_send_at IS NULL OR s.next_send_at <= ?)")
+            params.append(_ts(now))
+            if email_type == "invitation":
+                month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+                clauses.append(
+                    "(SELECT COUNT(*) FROM send_events v WHERE v.email = s.email "
+                    "AND v.email_type = 'invitation' AND v.sent_at >= ?) < ?"
+                )
+                params += [_ts(month_start), max_invitations]
+        if segment:
+            clauses.append("s.engagement = ?")
+            params.append(segment)
+        if interests:
+            clauses.append(
+                "EXISTS (SELECT 1 FROM subscriber_interests i WHERE i.email = s.email "
+                f"AND i.interest IN ({', '.join('?' * len(interests))}))"
+            )
+            params += interests
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return [row[0] for row in self.conn.execute(f"SELECT s.email FROM subscribers s {where}", params)]
+
+    # ==================== Segments ====================
+
+    def _segment_definitions(self) -> Dict[str, Dict]:
+        if self._segments is None:
+            self._segments = {
+                row["name"]: json.loads(row["filters"])
+                for row in self.conn.execute("SELECT name, filters FROM segments")
+            }
+        return self._segments
+
+    def _refresh_membership(self, subscribers: List[Subscriber], now: Optional[datetime] = None):
+        """Re-evaluate every segment for these subscribers (incremental maintenance)."""
+        now = now or datetime.now()
+        definitions = self._segment_definitions()
+        self.conn.executemany("DELETE FROM segment_members WHERE email = ?",
+                              [(s.email,) for s in subscribers])
+        self.conn.executemany(
+            "INSERT INTO segment_members (segment, email) VALUES (?, ?)",
+            [(name, s.email) for s in subscribers for name, filters in definitions.items()
+             if subscriber_matches(s, filters, now)]
+        )
+
+    def _rebuild_segments(self, names: List[str], now: Optional[datetime] = None):
+        """Full re-evaluation of the named segments over all subscribers."""
+        if not names:
+            return
+        now = now or datetime.now()
+        definitions = {n: f for n, f in self._segment_definitions().items() if n in names}
+        self.conn.executemany("DELETE FROM segment_members WHERE segment = ?", [(n,) for n in names])
+        self.conn.executemany(
+            "INSERT INTO segment_members (segment, email) VALUES (?, ?)",
+            [(name, s.email) for s in self.iter_subscribers() for name, filters in definitions.items()
+             if subscriber_matches(s, filters, now)]
+        )
+        self.conn.executemany("UPDATE segments SET refreshed_at = ? WHERE name = ?",
+                              [(_ts(now), n) for n in names])
+        self.conn.commit()
+
+    def sync_segments(self, definitions: Dict[str, Dict]) -> List[str]:
+        """
+        Store segment definitions; rebuild membership of new or changed ones.
+
+        Returns:
+            Names of the segments that were rebuilt
+        """
+        stored = {
+            row["name"]: row["filters"]
+            for row in self.conn.execute("SELECT name, filters FROM segments")
+        }
+        changed = []
+        for name, config in definitions.items():
+            filters = json.dumps(config.get("filters", {}), sort_keys=True)
+            if stored.get(name) == filters:
+                continue
+            self.conn.execute(
+                "INSERT OR REPLACE INTO segments (name, description, filters, sequence, time_relative) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (name, config.get("description", ""), filters, config.get("sequence"),
+                 int(bool(TIME_RELATIVE_FILTERS & set(config.get("filters", {})))))
+            )
+            changed.append(name)
+        self._segments = None
+        self._rebuild_segments(changed)
+        return changed
+
+    def _refresh_time_relative(self, names: Optional[List[str]] = None, now: Optional[datetime] = None):
+        """Rebuild clock-dependent segments last evaluated over a day ago."""
+        now = now or datetime.now()
+        stale = [
+            row["name"] for row in self.conn.execute(
+                "SELECT name FROM segments WHERE time_relative = 1 "
+                "AND (refreshed_at IS NULL OR refreshed_at < ?)",
+                (_ts(now - SEGMENT_REFRESH_INTERVAL),)
+            )
+            if names is None or row["name"] in names
+        ]
+        self._rebuild_segments(stale, now)
+
+    def segment_members(self, name: str) -> List[str]:
+        self._refresh_time_relative([name])
+        return [row[0] for row in self.conn.execute(
+            "SELECT email FROM segment_members WHERE segment = ? ORDER BY email", (name,)
+        )]
+
+    def segment_counts(self) -> Dict[str, int]:
+        self._refresh_time_relative()
+        return {
+            row[0]: row[1] for row in self.conn.execute(
+                "SELECT segment, COUNT(*) FROM segment_members GROUP BY segment"
+            )
+        }
+
+    # ==================== Stats / import ====================
+
+    def get_stats(self, email_types: List[str]) -> Dict[str, Any]:
+        """Same shape as EmailScheduler.get_stats()"""
+        total_sent, total_opened, total_replied = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(opened), 0), COALESCE(SUM(replied), 0) FROM send_events"
+        ).fetchone()
+        by_type = {t: {"sent": 0, "opened": 0, "replied": 0} for t in email_types}
+        for row in self.conn.execute(
+            "SELECT email_type, COUNT(*), SUM(opened), SUM(replied) FROM send_events GROUP BY email_type"
+        ):
+            by_type[row[0]] = {"sent": row[1], "opened": row[2], "replied": row[3]}
+
+        engagement_levels = {"replier": 0, "engaged": 0, "moderate": 0, "passive": 0}
+        for row in self.conn.execute("SELECT engagement, COUNT(*) FROM subscribers GROUP BY engagement"):
+            engagement_levels[row[0]] = row[1]
+
+        return {
+            "total_subscribers": sum(engagement_levels.values()),
+            "total_emails_sent": total_sent,
+            "total_opens": total_opened,
+            "total_replies": total_replied,  # Most important metric
+            "reply_rate": total_replied / total_sent if total_sent > 0 else 0,
+            "by_type": by_type,
+            "engagement_distribution": engagement_levels
+        }
+
+    def import_from_scheduler(
+        self,
+        scheduler: EmailScheduler,
+        segment_definitions: Optional[Dict[str, Dict]] = None
+    ) -> Dict[str, int]:
+        """
+        Import a file-backed scheduler's subscribers, history and sequence state.
+
+        Counters are copied as-is (not recomputed from history). Re-running
+        the import updates existing rows.
+        """
+        subscribers = list(scheduler.subscribers.values())
+        self._write_subscribers(subscribers)
+
+        for s in subscribers:
+            if s.active_sequence:
+                due_at = _ts(s.last_email_at + self.min_gap) if s.last_email_at else _ts(s.subscribed_at)
+                self.conn.execute("""
+                    INSERT INTO enrollments (email, sequence, step, status, enrolled_at, due_at)
+                    VALUES (?, ?, ?, 'active', ?, ?)
+                    ON CONFLICT(email, sequence) DO UPDATE SET
+                        step = excluded.step, status = 'active', due_at = excluded.due_at,
+                        completed_at = NULL
+                """, (s.email, s.active_sequence, s.sequence_index, _ts(s.subscribed_at), due_at))
+
+        self.conn.executemany("""
+            INSERT OR REPLACE INTO send_events
+                (email_id, email, email_type, subject, sent_at, opened, clicked, replied,
+                 tags, sequence, step)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (r.email_id, r.recipient, r.email_type, r.subject, _ts(r.sent_at),
+             int(r.opened), int(r.clicked), int(r.replied), json.dumps(r.tags),
+             *_sequence_tags(r.tags))
+            for r in scheduler.history
+        ])
+        self.conn.commit()
+
+        self.sync_sequences(scheduler.sequences_dir)
+        definitions = segment_definitions or SegmentManager.BUILT_IN_SEGMENTS
+        changed = self.sync_segments(definitions)
+        self._rebuild_segments([name for name in definitions if name not in changed])
+        return {
+            "subscribers": len(subscribers),
+            "send_events": len(scheduler.history),
+            "enrollments": sum(1 for s in subscribers if s.active_sequence),
+        }
+
+
+# ==================== Benchmark ====================
+
+def _synthetic_subscribers(count: int, sequences: Dict[str, int], now: datetime,
+                           seed: int = 7) -> List[Subscriber]:
+    """Subscribers with mixed sources/interests; half enrolled mid-sequence."""
+    rng = random.Random(seed)
+    interests = ["light", "rest", "faith", "imagination"] + list(sequences)
+    sources = ["article", "youtube", "gift", "direct", "social"]
+    slugs = list(sequences)
+    subscribers = []
+    for n in range(count):
+        received = rng.randint(0, 40)
+        last_email = now - timedelta(days=rng.randint(0, 20), hours=rng.randint(0, 23),
+                                     minutes=rng.randint(1, 59)) if received else None
+        subscriber = Subscriber(
+            email=f"reader{n:06d}@example.com",
+            subscribed_at=now - timedelta(days=rng.randint(1, 720)),
+            source=rng.choice(sources),
+            interests=rng.sample(interests, rng.randint(0, 3)),
+            emails_received=received,
+            emails_opened=rng.randint(0, received),
+            replies=1 if rng.random() < 0.03 else 0,
+            purchases=1 if rng.random() < 0.05 else 0,
+            last_email_at=last_email,
+            last_open_at=last_email + timedelta(days=rng.randint(0, 90)) if last_email and rng.random() < 0.5 else None,
+        )
+        if slugs and rng.random() < 0.5:
+            subscriber.active_sequence = rng.choice(slugs)
+            subscriber.sequence_index = rng.randint(0, sequences[subscriber.active_sequence] - 1)
+        subscribers.append(subscriber)
+    return subscribers
+
+
+def _median_seconds(fn, repeat: int) -> Tuple[float, Any]:
+    timings, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def benchmark(subscribers: int = 100_000, repeat: int = 5) -> Dict[str, Any]:
+    """
+    Compare a scheduling run on the JSON files (load + scan) with the store
+    (open + indexed due query), on the same synthetic subscribers.
+    """
+    now = datetime.now()
+    with tempfile.TemporaryDirectory(prefix="email_store_bench_") as tmp:
+        data_dir = Path(tmp)
+        file_scheduler = EmailScheduler(data_dir=data_dir)
+        sequences = {}
+        for path in sorted(file_scheduler.sequences_dir.glob("*.yaml")):
+            emails = (file_scheduler._load_sequence(path.stem) or {}).get("emails", [])
+            if emails:
+                sequences[path.stem] = max(e["index"] for e in emails)
+        file_scheduler.subscribers = {
+            s.email: s for s in _synthetic_subscribers(subscribers, sequences, now)
+        }
+        file_scheduler._save_subscribers()
+
+        def file_run():
+            return EmailScheduler(data_dir=data_dir).due_sequence_sends()
+
+        file_seconds, file_due = _median_seconds(file_run, max(1, repeat // 2))
+        file_segment_seconds, file_members = _median_seconds(
+            lambda: SegmentManager(file_scheduler).get_segment("seekers_of_rest"), 1
+        )
+
+        db_path = data_dir / "email_store.db"
+        start = time.perf_counter()
+        with EmailStore(db_path) as store:
+            store.import_from_scheduler(file_scheduler)
+        import_seconds = time.perf_counter() - start
+
+        def store_run():
+            with EmailStore(db_path) as store:
+                return EmailScheduler(store=store, data_dir=data_dir).due_sequence_sends()
+
+        store_seconds, store_due = _median_seconds(store_run, repeat)
+        with EmailStore(db_path) as store:
+            segment_seconds, store_members = _median_seconds(
+                lambda: store.segment_members("seekers_of_rest"), repeat
+            )
+            eligible_seconds, eligible = _median_seconds(
+                lambda: store.eligible_recipients("correspondence"), repeat
+            )
+            sample = store.get_subscriber(store_due[0]["recipient"]) if store_due else None
+            update_seconds, _ = _median_seconds(lambda: store.save_subscriber(sample), repeat) if sample else (0.0, None)
+
+    key = lambda d: (d["recipient"], d["sequence"], d["index"])
+    return {
+        "subscribers": subscribers,
+        "enrolled": sum(1 for s in file_scheduler.subscribers.values() if s.active_sequence),
+        "due": len(store_due),
+        "due_match": sorted(map(key, file_due)) == sorted(map(key, store_due)),
+        "segment_match": sorted(file_members) == store_members,
+        "files_run_seconds": round(file_seconds, 3),
+        "store_run_seconds": round(store_seconds, 3),
+        "import_seconds": round(import_seconds, 2),
+        "files_segment_seconds": round(file_segment_seconds, 3),
+        "store_segment_seconds": round(segment_seconds, 4),
+        "store_eligible_seconds": round(eligible_seconds, 3),
+        "eligible": len(eligible),
+        "store_subscriber_update_seconds": round(update_seconds, 4),
+    }
+
+
+def format_benchmark(report: Dict[str, Any]) -> str:
+    return "\n".join([
+        f"Email scheduling benchmark: {report['subscribers']:,} subscribers, "
+        f"{report['enrolled']:,} enrolled, {report['due']:,} due",
+        "",
+        f"  Scheduling run (files: load + scan):   {report['files_run_seconds']:.3f}s",
+        f"  Scheduling run (store: indexed query): {report['store_run_seconds']:.3f}s",
+        f"  Segment lookup (files / store):        {report['files_segment_seconds']:.3f}s / "
+        f"{report['store_segment_seconds']:.4f}s",
+        f"  Eligible for correspondence (store):   {report['store_eligible_seconds']:.3f}s "
+        f"({report['eligible']:,})",
+        f"  Subscriber update + segments (store):  {report['store_subscriber_update_seconds']:.4f}s",
+        f"  One-time import:                       {report['import_seconds']:.2f}s",
+        "",
+        f"  {'✓' if report['due_match'] else '✗'} Due sends match the file-based scheduler",
+        f"  {'✓' if report['segment_match'] else '✗'} Segment membership matches",
+    ])
+
+
+def main():
+    """CLI for the email store"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Dreamweaver Email Store (SQLite)")
+    parser.add_argument("--db", help="Database path (default: data/email_store.db)")
+    parser.add_argument("--import", dest="import_files", action="store_true",
+                        help="Import data/subscribers.json and data/email_history.json")
+    parser.add_argument("--due", action="store_true", help="List sequence emails due now")
+    parser.add_argument("--benchmark", action="store_true", help="Benchmark scheduling on synthetic subscribers")
+    parser.add_argument("--subscribers", type=int, default=100_000, help="Synthetic subscribers (default: 100000)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        report = benchmark(args.subscribers)
+        print(json.dumps(report, indent=2) if args.json else format_benchmark(report))
+        return
+
+    store = EmailStore(args.db)
+    if args.import_files:
+        scheduler = EmailScheduler()
+        manager_definitions = SegmentManager(scheduler).segment_definitions()
+        counts = store.import_from_scheduler(scheduler, manager_definitions)
+        print(f"✓ Imported {counts['subscribers']} subscribers, {counts['send_events']} send events, "
+              f"{counts['enrollments']} active enrollments into {store.db_path}")
+    elif args.due:
+        due = EmailScheduler(store=store).due_sequence_sends()
+        if args.json:
+            print(json.dumps(due, indent=2))
+        else:
+            print(f"\n=== Due Sequence Emails ({len(due)}) ===")
+            for d in due[:20]:
+                print(f"  {d['recipient']}: {d['sequence']} #{d['index']} {d['subject'] or '(finished)'}")
+            if len(due) > 20:
+                print(f"  ... and {len(due) - 20} more")
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
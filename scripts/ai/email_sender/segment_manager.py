@@ -11,6 +11,9 @@ Philosophy:
 - Never announce segmentation
 - Never change core tone based on segment
 - Segmentation shapes what they receive, not how they're treated
+
+With an EmailStore-backed scheduler, membership is read from the store's
+materialized segment_members table instead of re-filtering every subscriber.
 """
 
 import json
@@ -48,6 +51,95 @@ class EngagementLevel(Enum):
     PASSIVE = "passive"       # <30% open rate or inactive
 
 
+def readiness_score(subscriber: Subscriber, now: Optional[datetime] = None) -> float:
+    """
+    Calculate purchase readiness score.
+
+    Signals (from strategy docs):
+    - Multiple email opens (4-6)
+    - Replies (huge signal)
+    - Return after absence
+    - Long subscription duration
+    - Previous purchases
+
+    Returns:
+        Score from 0.0 to 1.0
+    """
+    score = 0.0
+
+    # Email opens (up to 0.3)
+    if subscriber.emails_received > 0:
+        open_rate = subscriber.emails_opened / subscriber.emails_received
+        score += min(open_rate * 0.4, 0.3)
+
+    # Replies (huge signal - up to 0.3)
+    if subscriber.replies > 0:
+        score += min(subscriber.replies * 0.15, 0.3)
+
+    # Subscription duration (up to 0.2)
+    days_subscribed = ((now or datetime.now()) - subscriber.subscribed_at).days
+    if days_subscribed > 180:  # 6+ months
+        score += 0.2
+    elif days_subscribed > 90:  # 3+ months
+        score += 0.15
+    elif days_subscribed > 30:  # 1+ month
+        score += 0.1
+
+    # Previous purchases (up to 0.2)
+    if subscriber.purchases > 0:
+        score += min(subscriber.purchases * 0.1, 0.2)
+
+    return min(score, 1.0)
+
+
+def subscriber_matches(subscriber: Subscriber, filters: Dict, now: datetime) -> bool:
+    """Check if subscriber matches all filters"""
+
+    # Engagement filter
+    if "engagement" in filters:
+        if subscriber.engagement_level != filters["engagement"]:
+            return False
+
+    # Interests filter (any match)
+    if "interests" in filters:
+        if not any(i in subscriber.interests for i in filters["interests"]):
+            return False
+
+    # Source filter
+    if "source" in filters:
+        if subscriber.source != filters["source"]:
+            return False
+
+    # Days since subscribe (new subscribers)
+    if "days_since_subscribe" in filters:
+        days = (now - subscriber.subscribed_at).days
+        if days > filters["days_since_subscribe"]:
+            return False
+
+    # Min days subscribed (long-term)
+    if "min_days_subscribed" in filters:
+        days = (now - subscriber.subscribed_at).days
+        if days < filters["min_days_subscribed"]:
+            return False
+
+    # Returned after absence
+    if "returned_after_days" in filters:
+        if subscriber.last_open_at and subscriber.last_email_at:
+            gap = (subscriber.last_open_at - subscriber.last_email_at).days
+            if gap < filters["returned_after_days"]:
+                return False
+        else:
+            return False
+
+    # Readiness score
+    if "readiness_score" in filters:
+        score = readiness_score(subscriber, now)
+        if score < filters["readiness_score"]:
+            return False
+
+    return True
+
+
 @dataclass
 class Segment:
     """A segment definition"""
@@ -193,6 +285,15 @@ class SegmentManager:
         self.scheduler = scheduler or EmailScheduler()
         self.project_root = Path(__file__).parent.parent.parent.parent
         self.custom_segments_path = self.project_root / "config" / "custom_segments.yaml"
+        self.store = self.scheduler.store
+
+        # Store-backed: only new or changed definitions are re-evaluated
+        if self.store:
+            self.store.sync_segments(self.segment_definitions())
+
+    def segment_definitions(self) -> Dict[str, Dict]:
+        """Built-in and custom segment definitions by name"""
+        return {**self.BUILT_IN_SEGMENTS, **self._load_custom_segments()}
 
     def get_segment(self, segment_name: str) -> List[str]:
         """
@@ -204,6 +305,9 @@ class SegmentManager:
         Returns:
             List of email addresses
         """
+        if self.store:
+            return self.store.segment_members(segment_name)
+
         if segment_name in self.BUILT_IN_SEGMENTS:
             filters = self.BUILT_IN_SEGMENTS[segment_name]["filters"]
             return self._apply_filters(filters)
@@ -233,90 +337,11 @@ class SegmentManager:
         now: datetime
     ) -> bool:
         """Check if subscriber matches all filters"""
-
-        # Engagement filter
-        if "engagement" in filters:
-            if subscriber.engagement_level != filters["engagement"]:
-                return False
-
-        # Interests filter (any match)
-        if "interests" in filters:
-            if not any(i in subscriber.interests for i in filters["interests"]):
-                return False
-
-        # Source filter
-        if "source" in filters:
-            if subscriber.source != filters["source"]:
-                return False
-
-        # Days since subscribe (new subscribers)
-        if "days_since_subscribe" in filters:
-            days = (now - subscriber.subscribed_at).days
-            if days > filters["days_since_subscribe"]:
-                return False
-
-        # Min days subscribed (long-term)
-        if "min_days_subscribed" in filters:
-            days = (now - subscriber.subscribed_at).days
-            if days < filters["min_days_subscribed"]:
-                return False
-
-        # Returned after absence
-        if "returned_after_days" in filters:
-            if subscriber.last_open_at and subscriber.last_email_at:
-                gap = (subscriber.last_open_at - subscriber.last_email_at).days
-                if gap < filters["returned_after_days"]:
-                    return False
-            else:
-                return False
-
-        # Readiness score
-        if "readiness_score" in filters:
-            score = self.calculate_readiness_score(subscriber)
-            if score < filters["readiness_score"]:
-                return False
-
-        return True
+        return subscriber_matches(subscriber, filters, now)
 
     def calculate_readiness_score(self, subscriber: Subscriber) -> float:
-        """
-        Calculate purchase readiness score.
-
-        Signals (from strategy docs):
-        - Multiple email opens (4-6)
-        - Replies (huge signal)
-        - Return after absence
-        - Long subscription duration
-        - Previous purchases
-
-        Returns:
-            Score from 0.0 to 1.0
-        """
-        score = 0.0
-
-        # Email opens (up to 0.3)
-        if subscriber.emails_received > 0:
-            open_rate = subscriber.emails_opened / subscriber.emails_received
-            score += min(open_rate * 0.4, 0.3)
-
-        # Replies (huge signal - up to 0.3)
-        if subscriber.replies > 0:
-            score += min(subscriber.replies * 0.15, 0.3)
-
-        # Subscription duration (up to 0.2)
-        days_subscribed = (datetime.now() - subscriber.subscribed_at).days
-        if days_subscribed > 180:  # 6+ months
-            score += 0.2
-        elif days_subscribed > 90:  # 3+ months
-            score += 0.15
-        elif days_subscribed > 30:  # 1+ month
-            score += 0.1
-
-        # Previous purchases (up to 0.2)
-        if subscriber.purchases > 0:
-            score += min(subscriber.purchases * 0.1, 0.2)
-
-        return min(score, 1.0)
+        """Calculate purchase readiness score (0.0 to 1.0)."""
+        return readiness_score(subscriber)
 
     def tag_subscriber(
         self,
@@ -329,11 +354,10 @@ class SegmentManager:
 
         Tags are used for quiet segmentation.
         """
-        if email not in self.scheduler.subscribers:
+        subscriber = self.scheduler.get_subscriber(email)
+        if subscriber is None:
             return
 
-        subscriber = self.scheduler.subscribers[email]
-
         if remove:
             subscriber.tags = [t for t in subscriber.tags if t not in tags]
         else:
@@ -341,7 +365,7 @@ class SegmentManager:
                 if tag not in subscriber.tags:
                     subscriber.tags.append(tag)
 
-        self.scheduler._save_subscribers()
+        self.scheduler.save_subscriber(subscriber)
 
     def update_interests(
         self,
@@ -353,26 +377,25 @@ class SegmentManager:
 
         Interests are inferred, not asked.
         """
-        if email not in self.scheduler.subscribers:
+        subscriber = self.scheduler.get_subscriber(email)
+        if subscriber is None:
             return
 
-        subscriber = self.scheduler.subscribers[email]
-
         for interest in interests:
             if interest not in subscriber.interests:
                 subscriber.interests.append(interest)
 
-        self.scheduler._save_subscribers()
+        self.scheduler.save_subscriber(subscriber)
 
     def get_segment_stats(self) -> Dict:
         """Get statistics for all segments"""
         stats = {}
+        counts = self.store.segment_counts() if self.store else None
 
         for name, config in self.BUILT_IN_SEGMENTS.items():
-            members = self.get_segment(name)
             stats[name] = {
                 "description": config["description"],
-                "count": len(members)
+                "count": counts.get(name, 0) if counts is not None else len(self.get_segment(name))
             }
 
         return stats
@@ -445,10 +468,16 @@ def main():
     parser.add_argument("--get", type=str, help="Get subscribers in segment")
     parser.add_argument("--stats", action="store_true", help="Show segment statistics")
     parser.add_argument("--suggest", type=str, help="Get content suggestions for segment")
+    parser.add_argument("--store", nargs="?", const="", metavar="DB",
+                        help="Use the SQLite email store (default: data/email_store.db)")
 
     args = parser.parse_args()
 
-    manager = SegmentManager()
+    scheduler = None
+    if args.store is not None:
+        from .email_store import EmailStore
+        scheduler = EmailScheduler(store=EmailStore(args.store or None))
+    manager = SegmentManager(scheduler)
 
     if args.list:
         print("\n=== Available Segments ===")
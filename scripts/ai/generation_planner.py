@@ -37,6 +37,12 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.utilities.knowledge_snapshot import load_knowledge
+
 
 # =============================================================================
 # Data Classes
@@ -670,7 +676,7 @@ class GenerationPlanner:
         lessons_path = self.project_root / "knowledge" / "lessons_learned.yaml"
         if lessons_path.exists():
             try:
-                data = yaml.safe_load(lessons_path.read_text(encoding="utf-8"))
+                data = load_knowledge(lessons_path)
                 # Get recent high-priority lessons
                 for lesson in data.get("lessons", [])[:5]:
                     if lesson.get("priority", "low") in ["high", "critical"]:
@@ -30,18 +30,24 @@ Usage as CLI:
     python3 -m scripts.ai.knowledge_tools --query "Navigator archetype"
     python3 -m scripts.ai.knowledge_tools --archetype Guardian
     python3 -m scripts.ai.knowledge_tools --realm "Atlantean Crystal Spine"
+    python3 -m scripts.ai.knowledge_tools --archetype Guardian --online
+
+Archetype/realm/frequency/ritual lookups read the local Notion mirror
+(scripts/ai/notion_mirror.py) when it was synced within mirror.max_age_hours,
+and query Notion live otherwise or when ``online=True`` / ``--online``.
 """
 
 import os
 import sys
+import copy
 import json
+import time
 import argparse
 import random
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Union
 
-import yaml
-
 # Import local modules
 try:
     from .notion_knowledge_retriever import (
@@ -52,6 +58,12 @@ try:
 except ImportError:
     HAS_RETRIEVER = False
 
+try:
+    from .notion_mirror import NotionMirror, load_mirror_config, DEFAULT_MAX_AGE_HOURS
+    HAS_MIRROR = True
+except ImportError:
+    HAS_MIRROR = False
+
 try:
     from .notion_embeddings_pipeline import (
         NotionEmbeddingsPipeline,
@@ -65,6 +77,14 @@ except ImportError:
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+from scripts.utilities.knowledge_snapshot import load_knowledge
+
+# Bypass the local mirror and query Notion for every lookup (also set by --online)
+FORCE_ONLINE = os.environ.get("DREAMWEAVING_NOTION_ONLINE") == "1"
+MIRROR_RECHECK_SECONDS = 60  # How often a process re-reads mirror sync state
+
 
 # =============================================================================
 # AI AUTHORITY LAYER FUNCTIONS (Layers 1, 2, 4)
@@ -104,8 +124,7 @@ def get_canonical_lexicon() -> Dict[str, Any]:
 
     if lexicon_path.exists():
         try:
-            with open(lexicon_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            return load_knowledge(lexicon_path)
         except Exception as e:
             print(f"Warning: Failed to load canonical lexicon: {e}")
 
@@ -219,8 +238,7 @@ def _load_copywriting_templates() -> Dict[str, Any]:
 
     if templates_path.exists():
         try:
-            with open(templates_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            return load_knowledge(templates_path)
         except Exception as e:
             print(f"Warning: Failed to load copywriting templates: {e}")
 
@@ -1019,9 +1037,86 @@ def query_canonical_knowledge(
     return results
 
 
+# =============================================================================
+# CANONICAL ENTRY LOOKUP (local mirror first, live Notion fallback)
+# =============================================================================
+
+_mirror = None
+_mirror_checks: Dict[str, tuple] = {}  # database_key -> (recheck_at, last_synced_at, fresh)
+
+
+def _get_mirror():
+    global _mirror
+    if _mirror is None:
+        _mirror = NotionMirror()
+    return _mirror
+
+
+@lru_cache(maxsize=1024)
+def _mirror_entry(database_key: str, name: str) -> Optional[Dict[str, Any]]:
+    return _get_mirror().lookup(database_key, name)
+
+
+def _mirror_is_fresh(database_key: str) -> bool:
+    """Freshness of the mirrored database, re-read at most every MIRROR_RECHECK_SECONDS."""
+    now = time.monotonic()
+    check = _mirror_checks.get(database_key)
+    if check and now < check[0]:
+        return check[2]
+
+    mirror = _get_mirror()
+    row = mirror.conn.execute(
+        "SELECT last_synced_at FROM sync_state WHERE database_key = ?", (database_key,)
+    ).fetchone()
+    synced_at = row["last_synced_at"] if row else None
+    if check and check[1] != synced_at:
+        _mirror_entry.cache_clear()  # Re-synced (possibly by another process)
+
+    max_age = float(load_mirror_config().get("max_age_hours", DEFAULT_MAX_AGE_HOURS))
+    fresh = mirror.is_fresh(database_key, max_age)
+    _mirror_checks[database_key] = (now + MIRROR_RECHECK_SECONDS, synced_at, fresh)
+    return fresh
+
+
+def clear_lookup_cache() -> None:
+    """Drop in-process lookup results (e.g. after syncing the mirror)."""
+    _mirror_entry.cache_clear()
+    _mirror_checks.clear()
+
+
+def _lookup_entry(database_key: str, name: str, online: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Look up one canonical database entry by name.
+
+    Reads the local mirror when it is fresh (results are memoized
+    in-process), otherwise queries Notion. A stale mirror entry is still
+    returned if Notion is unreachable.
+    """
+    use_mirror = HAS_MIRROR and not (online or FORCE_ONLINE)
+    if use_mirror:
+        try:
+            if _mirror_is_fresh(database_key):
+                return copy.deepcopy(_mirror_entry(database_key, name))
+        except Exception:
+            use_mirror = False  # Unreadable mirror: behave as before
+
+    try:
+        if not HAS_RETRIEVER:
+            raise RuntimeError("notion-client not installed")
+        retriever = NotionKnowledgeRetriever()
+        results = retriever.query_database(database_key, filter_name=name)
+        return results[0] if results else None
+    except Exception:
+        stale = _mirror_entry(database_key, name) if use_mirror else None
+        if stale is not None:
+            return copy.deepcopy(stale)
+        raise
+
+
 def get_archetype(
     name: str,
-    include_relations: bool = True
+    include_relations: bool = True,
+    online: bool = False
 ) -> Optional[Dict[str, Any]]:
     """
     Get a specific archetype from the knowledge base.
@@ -1029,6 +1124,7 @@ def get_archetype(
     Args:
         name: Archetype name (Navigator, Guardian, etc.)
         include_relations: Include related realms and frequencies
+        online: Query Notion directly instead of the local mirror
 
     Returns:
         Archetype data with all properties, or None if not found
@@ -1037,18 +1133,12 @@ def get_archetype(
         >>> nav = get_archetype("Navigator")
         >>> print(nav["Shadow Aspect"])
     """
-    if not HAS_RETRIEVER:
-        return {"error": "notion-client not installed"}
-
     try:
-        retriever = NotionKnowledgeRetriever()
-        results = retriever.query_database("archetypes", filter_name=name)
+        archetype = _lookup_entry("archetypes", name, online)
 
-        if not results:
+        if not archetype:
             return None
 
-        archetype = results[0]
-
         # Optionally resolve relations
         if include_relations and archetype.get("Associated Realms"):
             # Relations are stored as IDs - would need additional queries
@@ -1062,7 +1152,8 @@ def get_archetype(
 
 def get_realm(
     name: str,
-    include_guardian: bool = True
+    include_guardian: bool = True,
+    online: bool = False
 ) -> Optional[Dict[str, Any]]:
     """
     Get a specific realm from the knowledge base.
@@ -1070,6 +1161,7 @@ def get_realm(
     Args:
         name: Realm name (Atlantean Crystal Spine, Celtic Underworld, etc.)
         include_guardian: Include guardian archetype details
+        online: Query Notion directly instead of the local mirror
 
     Returns:
         Realm data with all properties, or None if not found
@@ -1078,18 +1170,12 @@ def get_realm(
         >>> realm = get_realm("Atlantean Crystal Spine")
         >>> print(realm["Atmosphere"])
     """
-    if not HAS_RETRIEVER:
-        return {"error": "notion-client not installed"}
-
     try:
-        retriever = NotionKnowledgeRetriever()
-        results = retriever.query_database("realms", filter_name=name)
+        realm = _lookup_entry("realms", name, online)
 
-        if not results:
+        if not realm:
             return None
 
-        realm = results[0]
-
         # Optionally resolve guardian
         if include_guardian and realm.get("Guardian"):
             guardian_ids = realm["Guardian"]
@@ -1103,12 +1189,13 @@ def get_realm(
         return {"error": str(e)}
 
 
-def get_frequency(name: str) -> Optional[Dict[str, Any]]:
+def get_frequency(name: str, online: bool = False) -> Optional[Dict[str, Any]]:
     """
     Get a specific frequency/consciousness technology.
 
     Args:
         name: Frequency name (Gamma Flash, Theta Drop, etc.)
+        online: Query Notion directly instead of the local mirror
 
     Returns:
         Frequency data with Hz values, effects, and SSML pacing
@@ -1117,23 +1204,19 @@ def get_frequency(name: str) -> Optional[Dict[str, Any]]:
         >>> freq = get_frequency("Gamma Flash")
         >>> print(f"Hz: {freq['Hz Range']}, State: {freq['Brainwave State']}")
     """
-    if not HAS_RETRIEVER:
-        return {"error": "notion-client not installed"}
-
     try:
-        retriever = NotionKnowledgeRetriever()
-        results = retriever.query_database("frequencies", filter_name=name)
-        return results[0] if results else None
+        return _lookup_entry("frequencies", name, online)
     except Exception as e:
         return {"error": str(e)}
 
 
-def get_ritual(name: str) -> Optional[Dict[str, Any]]:
+def get_ritual(name: str, online: bool = False) -> Optional[Dict[str, Any]]:
     """
     Get a specific ritual/ceremony/activation.
 
     Args:
         name: Ritual name
+        online: Query Notion directly instead of the local mirror
 
     Returns:
         Ritual data with sequence steps and requirements
@@ -1142,13 +1225,8 @@ def get_ritual(name: str) -> Optional[Dict[str, Any]]:
         >>> ritual = get_ritual("Dawn Awakening Activation")
         >>> print(ritual["Sequence Steps"])
     """
-    if not HAS_RETRIEVER:
-        return {"error": "notion-client not installed"}
-
     try:
-        retriever = NotionKnowledgeRetriever()
-        results = retriever.query_database("rituals", filter_name=name)
-        return results[0] if results else None
+        return _lookup_entry("rituals", name, online)
     except Exception as e:
         return {"error": str(e)}
 
@@ -2424,8 +2502,8 @@ def _load_competitor_yaml(filename: str) -> Optional[Dict[str, Any]]:
     filepath = COMPETITOR_DATA_PATH / filename
     if filepath.exists():
         try:
-            with open(filepath) as f:
-                return yaml.safe_load(f)
+            # Callers sort and annotate these lists in place
+            return load_knowledge(filepath, mutable=True)
         except Exception as e:
             print(f"Warning: Failed to load {filename}: {e}")
     return None
@@ -3268,9 +3346,18 @@ def main():
         action="store_true",
         help="Output as JSON"
     )
+    parser.add_argument(
+        "--online",
+        action="store_true",
+        help="Query Notion directly instead of the local mirror"
+    )
 
     args = parser.parse_args()
 
+    if args.online:
+        global FORCE_ONLINE
+        FORCE_ONLINE = True
+
     def output(data):
         if args.json:
             print(json.dumps(data, indent=2, default=str))
@@ -121,10 +121,36 @@ class EffectivenessEngine:
             Score from 0-100, where 50 is neutral
         """
         record = self.feedback_store.get_lesson_effectiveness(lesson_id)
+        return self.score_record(record)
 
+    def score_record(
+        self,
+        record: Optional[LessonEffectivenessRecord],
+        now: Optional[datetime] = None
+    ) -> float:
+        """
+        Composite effectiveness score for an already-loaded record.
+
+        The score is static_score() plus the time-decayed recency term,
+        clamped to 0-100.
+        """
         if not record or record.times_applied < self.MIN_APPLICATIONS:
             return 50.0  # Default neutral score for untested lessons
 
+        composite = (
+            self.static_score(record) +
+            self.recency_score(record, now) * self.weights.recency
+        )
+
+        return min(100, max(0, composite))
+
+    def static_score(self, record: LessonEffectivenessRecord) -> float:
+        """
+        Weighted composite of every component except recency.
+
+        This part only changes when the record (or the baseline) does, so
+        LessonRankings can store and index it.
+        """
         scores = {}
 
         # 1. Success rate (0-100)
@@ -149,51 +175,61 @@ class EffectivenessEngine:
         scores['engagement_impact'] = 50 + (engagement_delta * 1000)
         scores['engagement_impact'] = max(0, min(100, scores['engagement_impact']))
 
-        # 5. Recency (0-100, decays over time)
-        if record.last_applied:
-            days_since_used = (datetime.now() - record.last_applied).days
-            decay_factor = 0.5 ** (days_since_used / self.DECAY_HALF_LIFE_DAYS)
-            scores['recency'] = 100 * decay_factor
-        else:
-            scores['recency'] = 50.0
-
-        # 6. Consistency (0-100, based on variance)
+        # 5. Consistency (0-100, based on variance)
         # Lower variance = higher consistency
         # Variance of 100 = score of 0, variance of 0 = score of 100
         scores['consistency'] = max(0, 100 - (record.quality_variance * 0.5))
 
-        # Weighted composite
-        composite = (
+        return (
             scores['success_rate'] * self.weights.success_rate +
             scores['quality_impact'] * self.weights.quality_impact +
             scores['retention_impact'] * self.weights.retention_impact +
             scores['engagement_impact'] * self.weights.engagement_impact +
-            scores['recency'] * self.weights.recency +
             scores['consistency'] * self.weights.consistency
         )
 
-        return min(100, max(0, composite))
+    def recency_score(
+        self,
+        record: LessonEffectivenessRecord,
+        now: Optional[datetime] = None
+    ) -> float:
+        """Recency component (0-100, halves every DECAY_HALF_LIFE_DAYS)."""
+        if not record.last_applied:
+            return 50.0
+        days_since_used = ((now or datetime.now()) - record.last_applied).days
+        decay_factor = 0.5 ** (days_since_used / self.DECAY_HALF_LIFE_DAYS)
+        return 100 * decay_factor
 
     def get_ranked_lessons(
         self,
         lessons: List[Dict[str, Any]],
         category: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
-        limit: int = 20
+        limit: int = 20,
+        records: Optional[Dict[str, LessonEffectivenessRecord]] = None,
+        now: Optional[datetime] = None
     ) -> List[Dict[str, Any]]:
         """
         Get lessons ranked by effectiveness.
 
+        This is the full recomputation: every lesson is scored on each call.
+        LessonRankings answers the same query from a materialized table.
+
         Args:
             lessons: List of lesson dicts from LessonsManager
             category: Optional category filter ('audio', 'content', etc.)
             context: Optional context for relevance boosting
             limit: Maximum number to return
+            records: Preloaded effectiveness records by lesson ID (skips the
+                per-lesson feedback store lookups)
+            now: Reference time for the recency term (default: now)
 
         Returns:
             List of lesson dicts with 'effectiveness_score' added, sorted by score
         """
         ranked = []
+        now = now or datetime.now()
+        context_key = self._context_to_key(context) if context else None
 
         for lesson in lessons:
             # Filter by category if specified
@@ -204,12 +240,17 @@ class EffectivenessEngine:
             if not lesson_id:
                 continue
 
+            if records is not None:
+                record = records.get(lesson_id)
+            else:
+                record = self.feedback_store.get_lesson_effectiveness(lesson_id)
+
             # Calculate base effectiveness score
-            score = self.calculate_effectiveness(lesson_id)
+            score = self.score_record(record, now)
 
             # Apply context boost if provided
-            if context and lesson_id:
-                context_boost = self._calculate_context_boost(lesson_id, context)
+            if context_key is not None:
+                context_boost = self.context_boost(record, context_key)
                 score = score * (1 + 0.2 * context_boost)  # Max 20% boost
 
             ranked.append({
@@ -233,11 +274,17 @@ class EffectivenessEngine:
         Boosts score if this lesson has performed well in similar contexts.
         """
         record = self.feedback_store.get_lesson_effectiveness(lesson_id)
+        return self.context_boost(record, self._context_to_key(context))
+
+    def context_boost(
+        self,
+        record: Optional[LessonEffectivenessRecord],
+        context_key: str
+    ) -> float:
+        """Context relevance boost (0-1) of a loaded record for a context key."""
         if not record:
             return 0.0
 
-        context_key = self._context_to_key(context)
-
         # Check if this context is in best contexts
         if context_key in record.best_contexts:
             return 1.0
@@ -106,6 +106,67 @@ class LessonEffectivenessRecord:
     # Computed score (set by EffectivenessEngine)
     effectiveness_score: float = 50.0  # 0-100, weighted composite
 
+    def apply_outcome(
+        self,
+        outcome: 'OutcomeRecord',
+        context_key: Optional[str] = None,
+        now: Optional[datetime] = None
+    ):
+        """
+        Fold one outcome into the running aggregates.
+
+        Uses Welford's online algorithm for running variance calculation.
+        """
+        now = now or datetime.now()
+        if self.first_applied is None and self.times_applied == 0:
+            self.first_applied = now
+
+        # Update application count
+        n = self.times_applied
+        self.times_applied = n + 1
+        self.last_applied = now
+
+        # Update success tracking
+        if outcome.generation_success:
+            self.times_successful += 1
+            self.last_successful = now
+
+        self.success_rate = self.times_successful / self.times_applied
+
+        # Update quality impact using exponential moving average
+        alpha = 0.3  # Weight for new observation
+        quality = outcome.quality_score
+
+        if n == 0:
+            self.avg_quality_impact = quality
+        else:
+            self.avg_quality_impact = (
+                (1 - alpha) * self.avg_quality_impact +
+                alpha * quality
+            )
+
+        # Update variance using Welford's algorithm
+        delta = quality - self.avg_quality_impact
+        self._quality_m2 += delta * (quality - self.avg_quality_impact)
+        if self.times_applied > 1:
+            self.quality_variance = self._quality_m2 / (self.times_applied - 1)
+
+        # Update context effectiveness
+        if context_key:
+            current_score = self.context_effectiveness.get(context_key, 50.0)
+            self.context_effectiveness[context_key] = (
+                (1 - alpha) * current_score + alpha * quality
+            )
+
+            # Track best/worst contexts
+            if quality >= 75 and context_key not in self.best_contexts:
+                self.best_contexts.append(context_key)
+                # Keep only top 10
+                self.best_contexts = self.best_contexts[-10:]
+            elif quality < 50 and context_key not in self.worst_contexts:
+                self.worst_contexts.append(context_key)
+                self.worst_contexts = self.worst_contexts[-10:]
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for YAML storage."""
         data = asdict(self)
@@ -177,6 +238,10 @@ class FeedbackStore:
         # Initialize files if they don't exist
         self._initialize_files()
 
+        # Optional materialized ranking table (LessonRankings); kept in step
+        # with every effectiveness write below
+        self.rankings = None
+
     def _initialize_files(self):
         """Create empty files if they don't exist."""
         for file_path in [self.outcomes_file, self.effectiveness_file, self.pending_checks_file]:
@@ -407,53 +472,8 @@ class FeedbackStore:
             record = LessonEffectivenessRecord.from_dict(records[record_idx])
         else:
             record = LessonEffectivenessRecord(lesson_id=lesson_id)
-            record.first_applied = datetime.now()
 
-        # Update application count
-        n = record.times_applied
-        record.times_applied = n + 1
-        record.last_applied = datetime.now()
-
-        # Update success tracking
-        if outcome.generation_success:
-            record.times_successful += 1
-            record.last_successful = datetime.now()
-
-        record.success_rate = record.times_successful / record.times_applied
-
-        # Update quality impact using exponential moving average
-        alpha = 0.3  # Weight for new observation
-        quality = outcome.quality_score
-
-        if n == 0:
-            record.avg_quality_impact = quality
-        else:
-            record.avg_quality_impact = (
-                (1 - alpha) * record.avg_quality_impact +
-                alpha * quality
-            )
-
-        # Update variance using Welford's algorithm
-        delta = quality - record.avg_quality_impact
-        record._quality_m2 += delta * (quality - record.avg_quality_impact)
-        if record.times_applied > 1:
-            record.quality_variance = record._quality_m2 / (record.times_applied - 1)
-
-        # Update context effectiveness
-        if context_key:
-            current_score = record.context_effectiveness.get(context_key, 50.0)
-            record.context_effectiveness[context_key] = (
-                (1 - alpha) * current_score + alpha * quality
-            )
-
-            # Track best/worst contexts
-            if quality >= 75 and context_key not in record.best_contexts:
-                record.best_contexts.append(context_key)
-                # Keep only top 10
-                record.best_contexts = record.best_contexts[-10:]
-            elif quality < 50 and context_key not in record.worst_contexts:
-                record.worst_contexts.append(context_key)
-                record.worst_contexts = record.worst_contexts[-10:]
+        record.apply_outcome(outcome, context_key)
 
         # Save
         if record_idx is not None:
@@ -463,7 +483,7 @@ class FeedbackStore:
 
         data['records'] = records
         data['last_updated'] = datetime.now().isoformat()
-        self._save_yaml(self.effectiveness_file, data)
+        self._save_effectiveness(data, record, context_key)
 
         return record
 
@@ -509,7 +529,7 @@ class FeedbackStore:
                 break
         data['records'] = records
         data['last_updated'] = datetime.now().isoformat()
-        self._save_yaml(self.effectiveness_file, data)
+        self._save_effectiveness(data, record)
 
     def set_effectiveness_score(self, lesson_id: str, score: float):
         """Set the computed effectiveness score for a lesson."""
@@ -523,7 +543,7 @@ class FeedbackStore:
                 break
 
         data['records'] = records
-        self._save_yaml(self.effectiveness_file, data)
+        self._save_effectiveness(data)
 
     def save_effectiveness_record(self, record: LessonEffectivenessRecord) -> bool:
         """
@@ -553,9 +573,23 @@ class FeedbackStore:
 
         data['records'] = records
         data['last_updated'] = datetime.now().isoformat()
-        self._save_yaml(self.effectiveness_file, data)
+        self._save_effectiveness(data, record)
         return True
 
+    def _save_effectiveness(
+        self,
+        data: Dict,
+        record: Optional[LessonEffectivenessRecord] = None,
+        context_key: Optional[str] = None
+    ):
+        """Write lesson_effectiveness.yaml and push the changed record into the ranking table."""
+        if self.rankings is None:
+            self._save_yaml(self.effectiveness_file, data)
+            return
+        version_before = self.rankings.source_version()
+        self._save_yaml(self.effectiveness_file, data)
+        self.rankings.after_write(version_before, record, context_key)
+
     # -------------------------------------------------------------------------
     # Pending Outcome Checks
     # -------------------------------------------------------------------------
@@ -0,0 +1,790 @@
+#!/usr/bin/env python3
+"""
+Lesson Rankings - Materialized lesson-effectiveness ranking table.
+
+EffectivenessEngine.get_ranked_lessons scores every lesson on every call and
+re-reads lesson_effectiveness.yaml for each one. This module keeps the
+ranking inputs in SQLite instead:
+
+- lesson_rankings: one row per lesson with its running aggregates (counts,
+  quality EMA, Welford M2, YouTube impacts) and the static part of the
+  composite score (everything except the recency term), indexed by score
+- lesson_context_rankings: one row per (context bucket, lesson) with the
+  context EMA and whether the bucket is one of the lesson's best contexts
+
+FeedbackStore pushes every effectiveness write into the table, so
+record_outcome costs one row upsert. A ranking lookup is an indexed scan in
+static-score order that stops once no remaining lesson can beat the current
+top-k even with full recency credit, plus an indexed lookup of the lessons
+boosted for the requested context bucket.
+
+Usage:
+    # Rebuild the table from knowledge/feedback/ and knowledge/lessons_learned.yaml
+    python3 -m scripts.ai.learning.lesson_rankings --rebuild
+
+    # Compare the table against a full recomputation
+    python3 -m scripts.ai.learning.lesson_rankings --check
+
+    # Benchmark with synthetic lessons and outcomes
+    python3 -m scripts.ai.learning.lesson_rankings --benchmark --lessons 10000 --outcomes 100000
+"""
+
+import heapq
+import json
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .effectiveness_engine import EffectivenessEngine
+from .feedback_store import FeedbackStore, LessonEffectivenessRecord, OutcomeRecord
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_DB_PATH = PROJECT_ROOT / 'knowledge' / 'feedback' / 'lesson_rankings.db'
+
+# SQLite's default host-parameter limit is 999
+_IN_CHUNK = 900
+
+
+def _ts(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _dt(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _chunks(items: Sequence[str], size: int = _IN_CHUNK) -> Iterable[Sequence[str]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class LessonRankings:
+    """SQLite ranking table kept in step with FeedbackStore effectiveness writes."""
+
+    def __init__(self, engine: EffectivenessEngine, db_path: Optional[Path] = None):
+        """
+        Args:
+            engine: Scoring rules (weights, baseline, context similarity); its
+                feedback store is the source the table is rebuilt from
+            db_path: SQLite database file. Defaults to knowledge/feedback/lesson_rankings.db
+        """
+        self.engine = engine
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.init_schema()
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ==================== Schema ====================
+
+    def init_schema(self):
+        """Create tables and indexes if they do not exist."""
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS lesson_rankings (
+                lesson_id TEXT PRIMARY KEY,
+                -- present in the current lessons list, and its position there
+                active INTEGER NOT NULL DEFAULT 0,
+                position INTEGER,
+                category TEXT,
+                confidence TEXT,
+                times_applied INTEGER NOT NULL DEFAULT 0,
+                times_successful INTEGER NOT NULL DEFAULT 0,
+                success_rate REAL NOT NULL DEFAULT 0,
+                avg_quality_impact REAL NOT NULL DEFAULT 50,
+                quality_m2 REAL NOT NULL DEFAULT 0,
+                quality_variance REAL NOT NULL DEFAULT 0,
+                avg_retention_impact REAL NOT NULL DEFAULT 0,
+                avg_engagement_impact REAL NOT NULL DEFAULT 0,
+                last_applied TEXT,
+                -- composite without recency; 50 until MIN_APPLICATIONS
+                scored INTEGER NOT NULL DEFAULT 0,
+                static_score REAL NOT NULL DEFAULT 50
+            );
+            CREATE INDEX IF NOT EXISTS idx_rankings_static
+                ON lesson_rankings(active, static_score DESC);
+            CREATE INDEX IF NOT EXISTS idx_rankings_category
+                ON lesson_rankings(active, category, static_score DESC);
+
+            CREATE TABLE IF NOT EXISTS lesson_context_rankings (
+                context_key TEXT NOT NULL,
+                lesson_id TEXT NOT NULL,
+                score REAL NOT NULL,
+                best INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (context_key, lesson_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_context_rankings_lesson
+                ON lesson_context_rankings(lesson_id);
+            CREATE INDEX IF NOT EXISTS idx_context_rankings_best
+                ON lesson_context_rankings(best, context_key);
+
+            CREATE TABLE IF NOT EXISTS ranking_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+        self.conn.commit()
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM ranking_meta WHERE key = ?", (key,)).fetchone()
+        return row['value'] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        self.conn.execute(
+            "INSERT INTO ranking_meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    # ==================== Freshness ====================
+
+    def source_version(self) -> str:
+        """Size and mtime of lesson_effectiveness.yaml, the table's source of truth."""
+        try:
+            stat = self.engine.feedback_store.effectiveness_file.stat()
+        except FileNotFoundError:
+            return 'missing'
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    def _scoring_version(self) -> str:
+        return json.dumps({
+            'weights': asdict(self.engine.weights),
+            'baseline': self.engine.baseline_metrics,
+            'min_applications': self.engine.MIN_APPLICATIONS,
+        }, sort_keys=True)
+
+    def after_write(
+        self,
+        version_before: str,
+        record: Optional[LessonEffectivenessRecord] = None,
+        context_key: Optional[str] = None
+    ):
+        """
+        Called by FeedbackStore after it rewrites lesson_effectiveness.yaml.
+
+        If the table matched the file before the write, apply the record and
+        move the table to the new file version. Otherwise another writer got
+        there first and the next ensure_fresh() rebuilds.
+        """
+        if self._get_meta('source') != version_before:
+            return
+        if record is not None:
+            self.update(record, context_key, commit=False)
+        self._set_meta('source', self.source_version())
+        self.conn.commit()
+
+    def ensure_fresh(self, lessons: Optional[List[Dict[str, Any]]] = None) -> bool:
+        """
+        Bring the table up to date before a lookup.
+
+        Rebuilds from the feedback store when the YAML changed behind the
+        table's back, rescores when weights or the baseline changed, and
+        re-syncs lesson metadata when the lessons list changed.
+
+        Returns:
+            True if a full rebuild was needed
+        """
+        rebuilt = False
+        if self._get_meta('source') != self.source_version():
+            self.rebuild(self.engine.feedback_store.get_all_effectiveness_records())
+            rebuilt = True
+        elif self._get_meta('scoring') != self._scoring_version():
+            self.rescore()
+        if lessons is not None:
+            self.sync_lessons(lessons)
+        return rebuilt
+
+    # ==================== Writes ====================
+
+    def _static(self, record: LessonEffectivenessRecord) -> Tuple[int, float]:
+        if record.times_applied < self.engine.MIN_APPLICATIONS:
+            return 0, 50.0
+        return 1, self.engine.static_score(record)
+
+    def _stats_row(self, record: LessonEffectivenessRecord) -> Tuple:
+        scored, static = self._static(record)
+        return (
+            record.lesson_id, record.times_applied, record.times_successful,
+            record.success_rate, record.avg_quality_impact, record._quality_m2,
+            record.quality_variance, record.avg_retention_impact,
+            record.avg_engagement_impact, _ts(record.last_applied), scored, static,
+        )
+
+    _UPSERT_STATS = """
+        INSERT INTO lesson_rankings (
+            lesson_id, times_applied, times_successful, success_rate,
+            avg_quality_impact, quality_m2, quality_variance,
+            avg_retention_impact, avg_engagement_impact, last_applied,
+            scored, static_score
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(lesson_id) DO UPDATE SET
+            times_applied = excluded.times_applied,
+            times_successful = excluded.times_successful,
+            success_rate = excluded.success_rate,
+            avg_quality_impact = excluded.avg_quality_impact,
+            quality_m2 = excluded.quality_m2,
+            quality_variance = excluded.quality_variance,
+            avg_retention_impact = excluded.avg_retention_impact,
+            avg_engagement_impact = excluded.avg_engagement_impact,
+            last_applied = excluded.last_applied,
+            scored = excluded.scored,
+            static_score = excluded.static_score
+    """
+
+    def update(
+        self,
+        record: LessonEffectivenessRecord,
+        context_key: Optional[str] = None,
+        commit: bool = True
+    ):
+        """
+        Apply one updated effectiveness record.
+
+        With a context key (the record_outcome path) only that bucket's row
+        and the lesson's best-context flags change; without one, all of the
+        lesson's context rows are replaced.
+        """
+        self.conn.execute(self._UPSERT_STATS, self._stats_row(record))
+        best = list(record.best_contexts)
+        if context_key:
+            if context_key in record.context_effectiveness:
+                self.conn.execute(
+                    "INSERT INTO lesson_context_rankings (context_key, lesson_id, score, best) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT(context_key, lesson_id) DO UPDATE SET "
+                    "score = excluded.score, best = excluded.best",
+                    (context_key, record.lesson_id,
+                     record.context_effectiveness[context_key], int(context_key in best)),
+                )
+            # best_contexts is a trimmed window, so an append can evict an older key
+            placeholders = ','.join('?' * len(best))
+            self.conn.execute(
+                f"UPDATE lesson_context_rankings SET best = (context_key IN ({placeholders})) "
+                "WHERE lesson_id = ? AND (best = 1 OR context_key IN "
+                f"({placeholders}))",
+                (*best, record.lesson_id, *best),
+            )
+        else:
+            self.conn.execute(
+                "DELETE FROM lesson_context_rankings WHERE lesson_id = ?", (record.lesson_id,)
+            )
+            self.conn.executemany(
+                "INSERT INTO lesson_context_rankings (context_key, lesson_id, score, best) "
+                "VALUES (?, ?, ?, ?)",
+                [(key, record.lesson_id, score, int(key in best))
+                 for key, score in record.context_effectiveness.items()],
+            )
+        if commit:
+            self.conn.commit()
+
+    def rebuild(self, records: Iterable[LessonEffectivenessRecord]):
+        """Replace all effectiveness data with the given records (lesson metadata is kept)."""
+        records = list(records)
+        self.conn.execute("""
+            UPDATE lesson_rankings SET times_applied = 0, times_successful = 0,
+                success_rate = 0, avg_quality_impact = 50, quality_m2 = 0,
+                quality_variance = 0, avg_retention_impact = 0,
+                avg_engagement_impact = 0, last_applied = NULL,
+                scored = 0, static_score = 50
+        """)
+        self.conn.execute("DELETE FROM lesson_context_rankings")
+        self.conn.executemany(self._UPSERT_STATS, [self._stats_row(r) for r in records])
+        self.conn.executemany(
+            "INSERT INTO lesson_context_rankings (context_key, lesson_id, score, best) "
+            "VALUES (?, ?, ?, ?)",
+            [(key, r.lesson_id, score, int(key in r.best_contexts))
+             for r in records for key, score in r.context_effectiveness.items()],
+        )
+        self._set_meta('source', self.source_version())
+        self._set_meta('scoring', self._scoring_version())
+        self.conn.commit()
+
+    def rescore(self):
+        """Recompute every static score (after a weight or baseline change)."""
+        rows = self.conn.execute("SELECT * FROM lesson_rankings WHERE scored = 1").fetchall()
+        self.conn.executemany(
+            "UPDATE lesson_rankings SET static_score = ? WHERE lesson_id = ?",
+            [(self.engine.static_score(self._row_record(row)), row['lesson_id']) for row in rows],
+        )
+        self._set_meta('scoring', self._scoring_version())
+        self.conn.commit()
+
+    @staticmethod
+    def _lessons_version(lessons: List[Dict[str, Any]]) -> str:
+        import hashlib
+
+        digest = hashlib.blake2b(digest_size=16)
+        for lesson in lessons:
+            digest.update(
+                f"{lesson.get('id')}\0{lesson.get('category')}\0{lesson.get('confidence')}\n".encode()
+            )
+        return digest.hexdigest()
+
+    def sync_lessons(self, lessons: List[Dict[str, Any]], force: bool = False) -> bool:
+        """
+        Mirror the lessons list (membership, order, category, confidence).
+
+        Returns:
+            True if the table changed
+        """
+        version = self._lessons_version(lessons)
+        if not force and self._get_meta('lessons') == version:
+            return False
+
+        seen = {}
+        for position, lesson in enumerate(lessons):
+            lesson_id = lesson.get('id')
+            if lesson_id and lesson_id not in seen:
+                seen[lesson_id] = (position, lesson.get('category'), lesson.get('confidence'))
+
+        self.conn.execute("UPDATE lesson_rankings SET active = 0, position = NULL WHERE active = 1")
+        self.conn.executemany(
+            "INSERT INTO lesson_rankings (lesson_id, active, position, category, confidence) "
+            "VALUES (?, 1, ?, ?, ?) ON CONFLICT(lesson_id) DO UPDATE SET active = 1, "
+            "position = excluded.position, category = excluded.category, "
+            "confidence = excluded.confidence",
+            [(lesson_id, *meta) for lesson_id, meta in seen.items()],
+        )
+        self._set_meta('lessons', version)
+        self.conn.commit()
+        return True
+
+    # ==================== Lookups ====================
+
+    @staticmethod
+    def _row_record(row: sqlite3.Row) -> LessonEffectivenessRecord:
+        return LessonEffectivenessRecord(
+            lesson_id=row['lesson_id'],
+            times_applied=row['times_applied'],
+            times_successful=row['times_successful'],
+            success_rate=row['success_rate'],
+            avg_quality_impact=row['avg_quality_impact'],
+            avg_retention_impact=row['avg_retention_impact'],
+            avg_engagement_impact=row['avg_engagement_impact'],
+            quality_variance=row['quality_variance'],
+            _quality_m2=row['quality_m2'],
+            last_applied=_dt(row['last_applied']),
+        )
+
+    def _score_row(self, row: sqlite3.Row, now: datetime) -> float:
+        """Same value as EffectivenessEngine.score_record for the row's record."""
+        if not row['scored']:
+            return 50.0
+        recency = self.engine.recency_score(
+            LessonEffectivenessRecord(lesson_id=row['lesson_id'], last_applied=_dt(row['last_applied'])),
+            now,
+        )
+        return min(100, max(0, row['static_score'] + recency * self.engine.weights.recency))
+
+    def context_boosts(self, context_key: str) -> Dict[str, float]:
+        """
+        Non-zero context boosts (0-1) for a context bucket, by lesson ID.
+
+        Mirrors EffectivenessEngine.context_boost: exact best context 1.0,
+        else a similar best context 0.5, else the bucket's normalized EMA.
+        """
+        best_keys = [
+            row['context_key'] for row in self.conn.execute(
+                "SELECT DISTINCT context_key FROM lesson_context_rankings WHERE best = 1"
+            )
+        ]
+        similar = [
+            key for key in best_keys
+            if key != context_key and self.engine._contexts_similar(context_key, key)
+        ]
+        similar_lessons = set()
+        for chunk in _chunks(similar):
+            similar_lessons.update(
+                row['lesson_id'] for row in self.conn.execute(
+                    "SELECT lesson_id FROM lesson_context_rankings "
+                    f"WHERE best = 1 AND context_key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+            )
+
+        boosts = {lesson_id: 0.5 for lesson_id in similar_lessons}
+        for row in self.conn.execute(
+            "SELECT lesson_id, score, best FROM lesson_context_rankings WHERE context_key = ?",
+            (context_key,),
+        ):
+            if row['best']:
+                boosts[row['lesson_id']] = 1.0
+            elif row['lesson_id'] not in similar_lessons:
+                boost = max(0, (row['score'] - 50) / 50)
+                if boost > 0:
+                    boosts[row['lesson_id']] = boost
+        return boosts
+
+    def top_k(
+        self,
+        context_key: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: int = 20,
+        now: Optional[datetime] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Highest-ranked active lessons as (lesson_id, effectiveness_score).
+
+        Returns the same lessons, scores and order as
+        EffectivenessEngine.get_ranked_lessons over the synced lessons list.
+        """
+        if limit <= 0:
+            return []
+        now = now or datetime.now()
+        where = "active = 1" + (" AND category = ?" if category else "")
+        params: Tuple = (category,) if category else ()
+
+        # Min-heap of (score, -position, lesson_id): heap[0] is the current k-th best
+        top: List[Tuple[float, int, str]] = []
+
+        def offer(score: float, position: int, lesson_id: str):
+            entry = (round(score, 1), -position, lesson_id)
+            if len(top) < limit:
+                heapq.heappush(top, entry)
+            elif entry > top[0]:
+                heapq.heapreplace(top, entry)
+
+        boosts = self.context_boosts(context_key) if context_key else {}
+        boosted = list(boosts)
+        for chunk in _chunks(boosted, _IN_CHUNK - 1):
+            for row in self.conn.execute(
+                f"SELECT * FROM lesson_rankings WHERE {where} "
+                f"AND lesson_id IN ({','.join('?' * len(chunk))})",
+                (*params, *chunk),
+            ):
+                score = self._score_row(row, now) * (1 + 0.2 * boosts[row['lesson_id']])
+                offer(score, row['position'], row['lesson_id'])
+
+        # Unboosted lessons score at most static + full recency credit, so the
+        # scan can stop once that bound falls below the k-th best (the 0.05
+        # slack covers rounding to one decimal)
+        max_recency = 100 * self.engine.weights.recency
+        cursor = self.conn.execute(
+            f"SELECT lesson_id, position, scored, static_score, last_applied "
+            f"FROM lesson_rankings WHERE {where} ORDER BY static_score DESC",
+            params,
+        )
+        for row in cursor:
+            if len(top) == limit and min(100, row['static_score'] + max_recency) + 0.05 < top[0][0]:
+                break
+            if row['lesson_id'] in boosts:
+                continue
+            offer(self._score_row(row, now), row['position'], row['lesson_id'])
+        cursor.close()
+
+        ranked = sorted(top, reverse=True)
+        return [(lesson_id, score) for score, _, lesson_id in ranked]
+
+    # ==================== Consistency ====================
+
+    def check(
+        self,
+        lessons: List[Dict[str, Any]],
+        records: Optional[Dict[str, LessonEffectivenessRecord]] = None,
+        contexts: Optional[List[Dict[str, Any]]] = None,
+        limit: int = 20,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Compare the table against a full recomputation.
+
+        Checks every lesson's stored aggregates, static score and context rows
+        against its effectiveness record, then compares top-k rankings from
+        the table with EffectivenessEngine.get_ranked_lessons for each context
+        (plus no context) in every category (plus all categories).
+
+        Args:
+            lessons: The lessons list the table was synced with
+            records: Effectiveness records by lesson ID (default: load the feedback store)
+            contexts: Context dicts to rank for (default: none besides no context)
+            limit: Ranking depth to compare
+            now: Reference time for the recency term
+
+        Returns:
+            Dict with counts, the first mismatches found, and 'ok'
+        """
+        if records is None:
+            records = {
+                r.lesson_id: r for r in self.engine.feedback_store.get_all_effectiveness_records()
+            }
+        now = now or datetime.now()
+        row_mismatches: List[str] = []
+
+        rows = {row['lesson_id']: row for row in self.conn.execute("SELECT * FROM lesson_rankings")}
+        context_rows: Dict[str, Dict[str, Tuple[float, int]]] = {}
+        for row in self.conn.execute("SELECT * FROM lesson_context_rankings"):
+            context_rows.setdefault(row['lesson_id'], {})[row['context_key']] = (row['score'], row['best'])
+
+        for lesson_id, record in records.items():
+            row = rows.get(lesson_id)
+            if row is None:
+                row_mismatches.append(f"{lesson_id}: missing row")
+                continue
+            expected = self._stats_row(record)
+            stored = (
+                row['lesson_id'], row['times_applied'], row['times_successful'],
+                row['success_rate'], row['avg_quality_impact'], row['quality_m2'],
+                row['quality_variance'], row['avg_retention_impact'],
+                row['avg_engagement_impact'], row['last_applied'], row['scored'],
+                row['static_score'],
+            )
+            if stored != expected:
+                row_mismatches.append(f"{lesson_id}: aggregates differ")
+            expected_contexts = {
+                key: (score, int(key in record.best_contexts))
+                for key, score in record.context_effectiveness.items()
+            }
+            if context_rows.get(lesson_id, {}) != expected_contexts:
+                row_mismatches.append(f"{lesson_id}: context rows differ")
+
+        for lesson_id, row in rows.items():
+            if lesson_id not in records and row['times_applied']:
+                row_mismatches.append(f"{lesson_id}: row without effectiveness record")
+
+        active = {lesson_id for lesson_id, row in rows.items() if row['active']}
+        if active != {l.get('id') for l in lessons if l.get('id')}:
+            row_mismatches.append("active lessons differ from the lessons list")
+
+        ranking_mismatches: List[str] = []
+        categories = [None] + sorted({l.get('category') for l in lessons if l.get('category')})
+        queries = 0
+        for context in [None] + list(contexts or []):
+            context_key = self.engine._context_to_key(context) if context else None
+            for category in categories:
+                queries += 1
+                expected = [
+                    (l['id'], l['effectiveness_score'])
+                    for l in self.engine.get_ranked_lessons(
+                        lessons, category=category, context=context, limit=limit,
+                        records=records, now=now
+                    )
+                ]
+                actual = self.top_k(context_key, category, limit, now)
+                if actual != expected:
+                    ranking_mismatches.append(f"context={context_key} category={category}")
+
+        return {
+            'lessons': len(active),
+            'records': len(records),
+            'ranking_queries': queries,
+            'row_mismatches': row_mismatches[:20],
+            'row_mismatch_count': len(row_mismatches),
+            'ranking_mismatches': ranking_mismatches[:20],
+            'ranking_mismatch_count': len(ranking_mismatches),
+            'ok': not row_mismatches and not ranking_mismatches,
+        }
+
+
+# ==================== Benchmark ====================
+
+_CATEGORIES = ['audio', 'content', 'script', 'video', 'voice']
+_TOPIC_WORDS = [
+    'healing', 'forest', 'ocean', 'light', 'journey', 'sacred', 'garden', 'mountain',
+    'temple', 'river', 'crystal', 'dreams', 'stars', 'inner', 'child', 'ancient',
+    'wisdom', 'heart', 'shadow', 'golden', 'spiral', 'lunar', 'solar', 'cosmic',
+]
+_OUTCOMES = ['healing', 'confidence', 'relaxation', 'sleep', 'clarity', 'abundance']
+
+
+def _median_seconds(fn, repeat: int) -> Tuple[float, Any]:
+    timings, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def benchmark(lessons: int = 10_000, outcomes: int = 100_000, queries: int = 20,
+              seed: int = 7) -> Dict[str, Any]:
+    """
+    Compare full recomputation with table lookups on synthetic lessons.
+
+    Outcomes are spread over 120 days so recency varies, and topics are drawn
+    from a small vocabulary so context buckets and similar-context boosts
+    overlap. The full recomputation gets its records from memory, which
+    leaves out the per-lesson YAML reads of the live path.
+    """
+    rng = random.Random(seed)
+    now = datetime.now()
+    with tempfile.TemporaryDirectory(prefix="lesson_rankings_bench_") as tmp:
+        engine = EffectivenessEngine(FeedbackStore(Path(tmp) / 'feedback'))
+        lesson_list = [
+            {
+                'id': f"L{i:05d}",
+                'category': rng.choice(_CATEGORIES),
+                'confidence': rng.choice(['high', 'medium', 'medium', 'low']),
+                'finding': f"Synthetic lesson {i}",
+            }
+            for i in range(lessons)
+        ]
+        contexts = [
+            {
+                'topic': ' '.join(rng.sample(_TOPIC_WORDS, 3)),
+                'desired_outcome': rng.choice(_OUTCOMES),
+            }
+            for _ in range(300)
+        ]
+        context_keys = [engine._context_to_key(c) for c in contexts]
+        quality_bias = [rng.gauss(75, 10) for _ in range(lessons)]
+        success_bias = [rng.uniform(0.5, 0.98) for _ in range(lessons)]
+
+        records: Dict[str, LessonEffectivenessRecord] = {}
+        with LessonRankings(engine, Path(tmp) / 'rankings.db') as rankings:
+            rankings.rebuild([])
+            start = time.perf_counter()
+            rankings.sync_lessons(lesson_list)
+            sync_seconds = time.perf_counter() - start
+
+            first = now - timedelta(days=120)
+            step = timedelta(days=120) / max(1, outcomes)
+            update_seconds = 0.0
+            for k in range(outcomes):
+                # Skewed popularity: a few lessons get most applications
+                index = int(lessons * rng.random() ** 2)
+                lesson_id = lesson_list[index]['id']
+                context_key = rng.choice(context_keys)
+                outcome = OutcomeRecord(
+                    record_id=f"bench-{k}",
+                    session_name="bench",
+                    created_at=first + k * step,
+                    generation_success=rng.random() < success_bias[index],
+                    quality_score=max(0.0, min(100.0, rng.gauss(quality_bias[index], 12))),
+                )
+                record = records.setdefault(lesson_id, LessonEffectivenessRecord(lesson_id=lesson_id))
+                record.apply_outcome(outcome, context_key, now=outcome.created_at)
+                start = time.perf_counter()
+                rankings.update(record, context_key)
+                update_seconds += time.perf_counter() - start
+
+            sample = rng.sample(contexts, min(queries, len(contexts)))
+            categories = [None, 'audio']
+            full_timings, table_timings = [], []
+            for context in sample:
+                for category in categories:
+                    seconds, _ = _median_seconds(
+                        lambda: engine.get_ranked_lessons(
+                            lesson_list, category=category, context=context, limit=10, records=records
+                        ), 1)
+                    full_timings.append(seconds)
+                    seconds, _ = _median_seconds(
+                        lambda: rankings.top_k(engine._context_to_key(context), category, 10, now), 3)
+                    table_timings.append(seconds)
+
+            start = time.perf_counter()
+            report = rankings.check(lesson_list, records, contexts=sample[:10], limit=10, now=now)
+            check_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            rankings.rebuild(records.values())
+            rebuild_seconds = time.perf_counter() - start
+
+    full = statistics.median(full_timings)
+    table = statistics.median(table_timings)
+    return {
+        'lessons': lessons,
+        'outcomes': outcomes,
+        'lessons_with_records': len(records),
+        'ranking_queries': len(full_timings),
+        'full_recompute_seconds': round(full, 4),
+        'table_lookup_seconds': round(table, 5),
+        'speedup': round(full / table, 1) if table else None,
+        'update_mean_us': round(update_seconds / max(1, outcomes) * 1e6, 1),
+        'lesson_sync_seconds': round(sync_seconds, 3),
+        'rebuild_seconds': round(rebuild_seconds, 2),
+        'check_seconds': round(check_seconds, 2),
+        'check_queries': report['ranking_queries'],
+        'consistent': report['ok'],
+        'mismatches': report['row_mismatches'] + report['ranking_mismatches'],
+    }
+
+
+def format_benchmark(report: Dict[str, Any]) -> str:
+    lines = [
+        f"Lesson ranking benchmark: {report['lessons']:,} lessons, {report['outcomes']:,} outcomes "
+        f"({report['lessons_with_records']:,} lessons applied)",
+        "",
+        f"  Ranked lookup, full recompute (in-memory records): {report['full_recompute_seconds']:.4f}s",
+        f"  Ranked lookup, materialized table (top-k query):   {report['table_lookup_seconds']:.5f}s "
+        f"({report['speedup']}x, median of {report['ranking_queries']} queries)",
+        f"  record_outcome table update:                       {report['update_mean_us']:.1f} µs",
+        f"  Lessons list sync:                                 {report['lesson_sync_seconds']:.3f}s",
+        f"  Full rebuild from records:                         {report['rebuild_seconds']:.2f}s",
+        "",
+        f"  {'✓' if report['consistent'] else '✗'} Table matches full recomputation "
+        f"({report['check_queries']} ranking queries, {report['check_seconds']:.2f}s)",
+    ]
+    for mismatch in report['mismatches'][:10]:
+        lines.append(f"    - {mismatch}")
+    return "\n".join(lines)
+
+
+def main():
+    """CLI for the lesson ranking table"""
+    import argparse
+
+    from .lessons_manager import LessonsManager
+
+    parser = argparse.ArgumentParser(description="Materialized lesson-effectiveness rankings")
+    parser.add_argument("--db", help="Database path (default: knowledge/feedback/lesson_rankings.db)")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the table from knowledge/")
+    parser.add_argument("--check", action="store_true", help="Compare the table with a full recomputation")
+    parser.add_argument("--topic", help="Show the ranking for a topic")
+    parser.add_argument("--limit", type=int, default=10, help="Ranking depth (default: 10)")
+    parser.add_argument("--benchmark", action="store_true", help="Benchmark on synthetic lessons")
+    parser.add_argument("--lessons", type=int, default=10_000, help="Synthetic lessons (default: 10000)")
+    parser.add_argument("--outcomes", type=int, default=100_000, help="Synthetic outcomes (default: 100000)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        report = benchmark(args.lessons, args.outcomes)
+        print(json.dumps(report, indent=2) if args.json else format_benchmark(report))
+        return
+
+    engine = EffectivenessEngine(FeedbackStore(PROJECT_ROOT / 'knowledge' / 'feedback'))
+    lessons = LessonsManager(PROJECT_ROOT / 'knowledge').get_lessons()
+    with LessonRankings(engine, args.db) as rankings:
+        if args.rebuild:
+            rankings.rebuild(engine.feedback_store.get_all_effectiveness_records())
+            rankings.sync_lessons(lessons, force=True)
+            print(f"✓ Rebuilt {rankings.db_path} for {len(lessons)} lessons")
+        elif args.check:
+            rankings.ensure_fresh(lessons)
+            report = rankings.check(lessons, limit=args.limit)
+            if args.json:
+                print(json.dumps(report, indent=2))
+            else:
+                status = '✓' if report['ok'] else '✗'
+                print(f"{status} {report['lessons']} lessons, {report['records']} effectiveness records, "
+                      f"{report['ranking_queries']} ranking queries")
+                for mismatch in report['row_mismatches'] + report['ranking_mismatches']:
+                    print(f"  - {mismatch}")
+        elif args.topic is not None:
+            rankings.ensure_fresh(lessons)
+            context_key = engine._context_to_key({'topic': args.topic})
+            for lesson_id, score in rankings.top_k(context_key, limit=args.limit):
+                print(f"  {score:5.1f}  {lesson_id}")
+        else:
+            parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -13,23 +13,39 @@ Usage:
     # Incremental update (only changed pages)
     python3 -m scripts.ai.notion_embeddings_pipeline --update
 
+    # Indexing throughput on a synthetic corpus (tiny local model)
+    python3 -m scripts.ai.notion_embeddings_pipeline --benchmark --files 3000
+
     # Search the knowledge base
     python3 -m scripts.ai.notion_embeddings_pipeline --search "Navigator archetype shadow aspect"
 
+    # Hybrid (BM25 + vector) search restricted to a domain
+    python3 -m scripts.ai.notion_embeddings_pipeline --search "1921-D Morgan" --hybrid --domain coins
+
+    # Rebuild the BM25 index and backfill domain payloads from the collection
+    python3 -m scripts.ai.notion_embeddings_pipeline --rebuild-lexical
+
     # Show index statistics
     python3 -m scripts.ai.notion_embeddings_pipeline --stats
 """
 
 import os
 import sys
+import copy
 import json
+import queue
+import random
 import argparse
 import hashlib
+import tempfile
+import time
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 import re
+import sqlite3
 import threading
 
 # Try sentence-transformers first (FREE, local)
@@ -50,7 +66,8 @@ try:
     from qdrant_client import QdrantClient
     from qdrant_client.models import (
         Distance, VectorParams, PointStruct,
-        Filter, FieldCondition, MatchValue
+        Filter, FieldCondition, MatchValue, MatchAny, PayloadSchemaType,
+        HasIdCondition, PointIdsList
     )
     HAS_QDRANT = True
 except ImportError:
@@ -62,6 +79,13 @@ CONFIG_PATH = PROJECT_ROOT / "config" / "notion_config.yaml"
 VECTOR_DB_PATH = PROJECT_ROOT / "knowledge" / "vector_db"
 FILE_MANIFEST_PATH = VECTOR_DB_PATH / "file_manifest.json"
 
+# Indexing pipeline (overridable under embeddings.indexing in notion_config.yaml)
+INDEX_ENCODE_BATCH = 256       # Texts per encoder call, length-sorted
+INDEX_ENCODE_WINDOW = 8        # Encoder batches pooled across files before sorting
+INDEX_UPSERT_BATCH = 256       # Points per Qdrant upsert
+INDEX_POOL_MIN_FILES = 32      # Fewer changed files are chunked inline
+BENCHMARK_MODEL = "paraphrase-MiniLM-L3-v2"  # Tiny local model for --benchmark
+
 # Load .env automatically for local/IDE runs.
 try:
     from dotenv import load_dotenv  # type: ignore
@@ -92,6 +116,496 @@ def load_config() -> Dict[str, Any]:
     return resolve_env(config)
 
 
+# ========== Domains ==========
+
+# Word-bounded terms that mark a chunk as belonging to a domain. A chunk is
+# assigned the domain when its title or database name contains a term, or
+# its text contains one plus enough DOMAIN_CONTEXT_TERMS to reach
+# DOMAIN_MIN_TEXT_TERMS distinct terms.
+DOMAIN_TERMS = {
+    "coins": [
+        "coin", "coins", "numismatic", "numismatics", "bullion", "pcgs", "ngc",
+        "mintmark", "mintmarks", "morgan", "peace dollar", "walking liberty",
+        "standing liberty", "seated liberty", "half dollar", "trade dollar",
+        "junk silver", "uncirculated", "doubled die", "overdate", "repunched",
+        "philatelic",
+    ],
+}
+# Ambiguous words ("gold", "mint", "eagle", "proof", ...) that only add to
+# the text threshold of a chunk that already has a DOMAIN_TERMS hit.
+DOMAIN_CONTEXT_TERMS = {
+    "coins": [
+        "silver", "gold", "dime", "dimes", "quarter", "quarters", "cent", "cents",
+        "penny", "nickel", "mint", "melt", "spot price", "key date", "semi-key",
+        "circulated", "proof", "commemorative", "eagle", "maple leaf", "britannia",
+        "philharmonic", "mercury", "franklin", "kennedy", "barber", "troy",
+        "face value", "carson city", "vam", "stamp", "stamps", "libertad", "peso",
+        "stacking", "stackers",
+    ],
+}
+DEFAULT_DOMAIN = "general"
+DOMAIN_MIN_TEXT_TERMS = 2
+
+
+def _terms_pattern(terms: List[str]) -> re.Pattern:
+    return re.compile(r"\b(?:" + "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True)) + r")\b")
+
+
+_DOMAIN_PATTERNS = {domain: _terms_pattern(terms) for domain, terms in DOMAIN_TERMS.items()}
+_DOMAIN_CONTEXT_PATTERNS = {domain: _terms_pattern(terms) for domain, terms in DOMAIN_CONTEXT_TERMS.items()}
+
+
+def classify_domain(title: str, text: str, database: str = "") -> str:
+    """Assign a chunk to a retrieval domain (stored as the ``domain`` payload)."""
+    head = f"{title} {database}".lower()
+    body = text.lower()
+    for domain, pattern in _DOMAIN_PATTERNS.items():
+        if pattern.search(head):
+            return domain
+        strong = set(pattern.findall(body))
+        if not strong:
+            continue
+        context = _DOMAIN_CONTEXT_PATTERNS.get(domain)
+        weak = set(context.findall(body)) if context else set()
+        if len(strong | weak) >= DOMAIN_MIN_TEXT_TERMS:
+            return domain
+    return DEFAULT_DOMAIN
+
+
+# ========== Lexical (BM25) Index ==========
+
+_QUERY_TOKEN = re.compile(r"[a-z0-9]+(?:[-'.][a-z0-9]+)*")
+_QUERY_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how", "in",
+    "is", "it", "of", "on", "or", "the", "to", "what", "which", "with",
+}
+
+
+def fts_query(query: str) -> Optional[str]:
+    """
+    Build an FTS5 MATCH expression from free text.
+
+    Each term is quoted (so words like AND/NOT are literal); hyphenated
+    terms such as ``1921-D`` become the phrase ``"1921 d"`` so they only
+    match adjacent tokens. Terms are OR-ed and ranked by BM25.
+    """
+    terms = []
+    for token in _QUERY_TOKEN.findall(query.lower()):
+        if token in _QUERY_STOPWORDS:
+            continue
+        phrase = " ".join(re.split(r"[-'.]", token))
+        quoted = f'"{phrase}"'
+        if quoted not in terms:
+            terms.append(quoted)
+    return " OR ".join(terms) if terms else None
+
+
+def _lexical_rowid(point_id: Any) -> int:
+    """Stable FTS rowid for a point ID (hex or UUID form), for indexed lookups."""
+    return int(str(point_id).replace("-", "")[:15], 16)
+
+
+class LexicalIndex:
+    """
+    Persistent BM25 inverted index (SQLite FTS5) kept next to the Qdrant
+    collection. Rows mirror point payloads, so lexical hits can be returned
+    without a round trip to Qdrant. Row IDs derive from point IDs, so
+    replacing or deleting a point never scans the table.
+    """
+
+    # bm25() column weights: point_id, domain, type, title, text
+    BM25_WEIGHTS = (0.0, 0.0, 0.0, 2.0, 1.0)
+    SCHEMA_VERSION = 1
+    COLUMNS = "point_id, domain, type, title, text, database, url, chunk_index"
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS chunks USING fts5("
+            "point_id UNINDEXED, domain, type, title, text, "
+            "database UNINDEXED, url UNINDEXED, chunk_index UNINDEXED, "
+            "tokenize = 'unicode61 remove_diacritics 2')"
+        )
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < self.SCHEMA_VERSION:
+            self._rekey_rows()
+        self._conn.commit()
+
+    def _rekey_rows(self):
+        """Migrate rows written with automatic rowids to point-derived rowids."""
+        rows = {
+            _lexical_rowid(row[0]): row
+            for row in self._conn.execute(f"SELECT {self.COLUMNS} FROM chunks").fetchall()
+        }
+        self._conn.execute("DELETE FROM chunks")
+        self._conn.executemany(
+            f"INSERT INTO chunks(rowid, {self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(rowid, *row) for rowid, row in rows.items()]
+        )
+        self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def upsert(self, points: List[Any]):
+        """Insert or replace rows for points (anything with ``id`` and ``payload``)."""
+        rows = [
+            (
+                _lexical_rowid(p.id),
+                str(p.id),
+                p.payload.get("domain", DEFAULT_DOMAIN),
+                p.payload.get("type", ""),
+                p.payload.get("title", ""),
+                p.payload.get("chunk_text", ""),
+                p.payload.get("database", ""),
+                p.payload.get("url", ""),
+                p.payload.get("chunk_index", 0),
+            )
+            for p in points
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany("DELETE FROM chunks WHERE rowid = ?", [(r[0],) for r in rows])
+            self._conn.executemany(
+                f"INSERT INTO chunks(rowid, {self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._conn.commit()
+
+    def delete(self, point_ids: List[str]):
+        if not point_ids:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM chunks WHERE rowid = ?", [(_lexical_rowid(i),) for i in point_ids]
+            )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM chunks")
+            self._conn.commit()
+
+    def count(self, domain: Optional[str] = None) -> int:
+        with self._lock:
+            if domain:
+                row = self._conn.execute(
+                    "SELECT COUNT(*) FROM chunks WHERE chunks MATCH ?", (f'domain : "{domain}"',)
+                ).fetchone()
+            else:
+                row = self._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()
+        return row[0]
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        domain: Optional[str] = None,
+        content_type: Optional[str] = None
+    ) -> List[Dict]:
+        """BM25-ranked matches, best first, filtered by domain/type inside the index."""
+        terms = fts_query(query)
+        if not terms:
+            return []
+        # Scope the terms to the prose columns; domain/type are only filters
+        match = f"{{title text}} : ({terms})"
+        if content_type:
+            match = f'type : "{content_type}" AND ({match})'
+        if domain:
+            match = f'domain : "{domain}" AND ({match})'
+
+        weights = ", ".join(str(w) for w in self.BM25_WEIGHTS)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT point_id, title, type, database, text, chunk_index, url, domain, "
+                f"bm25(chunks, {weights}) AS rank "
+                f"FROM chunks WHERE chunks MATCH ? ORDER BY rank LIMIT ?",
+                (match, limit)
+            ).fetchall()
+
+        return [
+            {
+                "id": row[0],
+                "title": row[1],
+                "type": row[2],
+                "database": row[3],
+                "text": row[4],
+                "chunk_index": int(row[5] or 0),
+                "url": row[6],
+                "domain": row[7],
+                "bm25": -row[8],
+            }
+            for row in rows
+        ]
+
+
+def reciprocal_rank_fusion(rankings: List[List[Dict]], k: int = 60) -> List[Dict]:
+    """
+    Fuse ranked result lists by reciprocal rank: score = sum(1 / (k + rank)).
+
+    Results are matched on ``id``; the first list a result appears in
+    supplies its fields. Each result gets ``score`` (fused) and ``ranks``.
+    """
+    fused: Dict[str, Dict] = {}
+    for list_index, ranking in enumerate(rankings):
+        for rank, result in enumerate(ranking, 1):
+            entry = fused.get(result["id"])
+            if entry is None:
+                entry = fused[result["id"]] = dict(result, score=0.0, ranks={})
+            entry["score"] += 1.0 / (k + rank)
+            entry["ranks"][list_index] = rank
+    return sorted(fused.values(), key=lambda r: r["score"], reverse=True)
+
+
+# ========== Chunking ==========
+# Module-level so export files can be chunked in a process pool.
+
+def clean_markdown(text: str) -> str:
+    """Clean markdown for embedding."""
+    # Remove frontmatter
+    text = re.sub(r'^---\n.*?\n---\n', '', text, flags=re.DOTALL)
+
+    # Remove excessive whitespace
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = re.sub(r' {2,}', ' ', text)
+
+    return text.strip()
+
+
+def extract_page_metadata(content: str) -> Dict:
+    """Extract metadata from page markdown header."""
+    metadata = {
+        "title": "Untitled",
+        "url": "",
+        "type": "page"
+    }
+
+    # Extract title from first heading
+    title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
+    if title_match:
+        metadata["title"] = title_match.group(1)
+
+    # Extract URL
+    url_match = re.search(r'^Source: (.+)$', content, re.MULTILINE)
+    if url_match:
+        metadata["url"] = url_match.group(1)
+
+    return metadata
+
+
+def extract_entry_metadata(content: str) -> Dict:
+    """Extract metadata from database entry markdown."""
+    metadata = {
+        "title": "Untitled",
+        "url": "",
+        "type": "database_entry"
+    }
+
+    # Extract title
+    title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
+    if title_match:
+        metadata["title"] = title_match.group(1)
+
+    return metadata
+
+
+def chunk_content(
+    text: str,
+    title: str,
+    chunk_size: int,
+    overlap: int,
+    chunk_type: str = "page"
+) -> List[Dict]:
+    """
+    Split content into overlapping chunks.
+
+    Strategy:
+    - Preserve paragraph boundaries when possible
+    - Include title in each chunk for context
+    - Create overlap to maintain continuity
+    """
+    # Clean text
+    text = clean_markdown(text)
+
+    # For short content, return as single chunk
+    if len(text) <= chunk_size:
+        return [{
+            "text": f"Title: {title}\n\n{text}",
+            "chunk_index": 0,
+            "title": title,
+            "type": chunk_type
+        }]
+
+    chunks = []
+    start = 0
+    chunk_idx = 0
+
+    while start < len(text):
+        end = start + chunk_size
+
+        # Try to break at paragraph boundary
+        if end < len(text):
+            # Look for paragraph break near end
+            para_break = text.rfind("\n\n", start + chunk_size // 2, end + 100)
+            if para_break > start:
+                end = para_break
+
+        chunk_text = text[start:end].strip()
+
+        if len(chunk_text) > 50:  # Skip tiny chunks
+            chunks.append({
+                "text": f"Title: {title}\n\n{chunk_text}",
+                "chunk_index": chunk_idx,
+                "title": title,
+                "type": chunk_type
+            })
+            chunk_idx += 1
+
+        # Move start with overlap
+        start = end - overlap if end < len(text) else len(text)
+
+    return chunks
+
+
+def chunk_page(content: str, chunk_size: int, overlap: int) -> List[Dict]:
+    """Process a page markdown file into chunks."""
+    # Extract metadata from header
+    metadata = extract_page_metadata(content)
+
+    # Remove metadata section
+    content = re.sub(r'^#.*?\n---\n', '', content, flags=re.DOTALL)
+
+    # Chunk content
+    chunks = chunk_content(content, metadata["title"], chunk_size, overlap, chunk_type="page")
+
+    # Add metadata to each chunk
+    for chunk in chunks:
+        chunk.update(metadata)
+
+    return chunks
+
+
+def chunk_entry(content: str, database: str) -> List[Dict]:
+    """Process a database entry markdown file."""
+    # Extract metadata
+    metadata = extract_entry_metadata(content)
+    metadata["database"] = database
+    metadata["type"] = "database_entry"
+
+    # For database entries, keep as single chunk
+    # This preserves all properties together
+    return [{
+        "text": clean_markdown(content),
+        "chunk_index": 0,
+        **metadata
+    }]
+
+
+def point_id_for(chunk: Dict) -> str:
+    """Deterministic point ID for a chunk."""
+    return hashlib.md5(
+        f"{chunk.get('title', '')}_{chunk.get('chunk_index', 0)}_{chunk['text'][:100]}".encode()
+    ).hexdigest()
+
+
+def chunk_export_file(task: Tuple[str, str, int, int]) -> Dict[str, Any]:
+    """
+    Read, hash and chunk one export file (process-pool worker).
+
+    Args:
+        task: (path, path relative to the export dir, chunk_size, overlap)
+
+    Returns:
+        File record with chunks carrying ``id``, ``hash`` (of the chunk
+        text) and ``source_file``; or ``error`` if the file failed
+    """
+    path, rel_path, chunk_size, overlap = task
+    filepath = Path(path)
+    try:
+        raw = filepath.read_bytes()
+        content = raw.decode("utf-8")
+
+        # Entries live under databases/<database>/
+        if "databases" in Path(rel_path).parts[:-1]:
+            chunks = chunk_entry(content, database=filepath.parent.name)
+            kind = "entries"
+        else:
+            chunks = chunk_page(content, chunk_size, overlap)
+            kind = "pages"
+
+        for chunk in chunks:
+            chunk["id"] = point_id_for(chunk)
+            chunk["hash"] = hashlib.md5(chunk["text"].encode()).hexdigest()
+            chunk["source_file"] = rel_path
+
+        stat = filepath.stat()
+        return {
+            "rel_path": rel_path,
+            "kind": kind,
+            "hash": hashlib.md5(raw).hexdigest(),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "chunks": chunks,
+        }
+    except Exception as e:
+        return {"rel_path": rel_path, "error": str(e)}
+
+
+class _BatchUpserter:
+    """
+    Upserts points to Qdrant and the BM25 index on a background thread, so
+    encoding the next batch overlaps with writing the previous one.
+    """
+
+    def __init__(self, qdrant, collection_name: str, lexical: "LexicalIndex",
+                 batch_size: int = 256, max_pending: int = 4):
+        self.qdrant = qdrant
+        self.collection_name = collection_name
+        self.lexical = lexical
+        self.batch_size = batch_size
+        self.count = 0
+        self.error: Optional[Exception] = None
+        self._queue: "queue.Queue[Optional[List]]" = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def put(self, points: List[Any]):
+        if self.error:
+            raise self.error
+        for i in range(0, len(points), self.batch_size):
+            self._queue.put(points[i:i + self.batch_size])
+
+    def _run(self):
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+            if self.error:
+                continue  # Drain so producers never block on a dead writer
+            try:
+                self.qdrant.upsert(collection_name=self.collection_name, points=batch, wait=False)
+                self.lexical.upsert(batch)
+                self.count += len(batch)
+            except Exception as e:
+                self.error = e
+
+    def close(self):
+        """Flush pending batches; re-raise the first write error."""
+        self._queue.put(None)
+        self._thread.join()
+        if self.error:
+            raise self.error
+
+
+def _index_settings(config: Dict[str, Any]) -> Dict[str, int]:
+    indexing = config.get("embeddings", {}).get("indexing", {})
+    return {
+        "encode_batch_size": indexing.get("encode_batch_size", INDEX_ENCODE_BATCH),
+        "upsert_batch_size": indexing.get("upsert_batch_size", INDEX_UPSERT_BATCH),
+        "workers": indexing.get("workers") or min(4, os.cpu_count() or 1),
+    }
+
+
 class NotionEmbeddingsPipeline:
     """
     Pipeline for creating and querying embeddings from Notion content.
@@ -103,13 +617,24 @@ class NotionEmbeddingsPipeline:
     4. Store in Qdrant vector database
     5. Enable semantic search across all content
 
+    Indexing runs as a producer/consumer pipeline: files are chunked in a
+    process pool, chunks from all files are embedded in large length-sorted
+    batches, and points are upserted in batches on a background thread.
+
     Args:
         quiet: If True, suppress progress output (useful when called from watcher).
+        config: Configuration (default: config/notion_config.yaml). When given,
+            the file manifest lives in its vector_db path.
     """
 
-    def __init__(self, quiet: bool = False):
-        self.config = load_config()
+    def __init__(self, quiet: bool = False, config: Optional[Dict[str, Any]] = None):
+        self.config = config or load_config()
         self.quiet = quiet
+        self.manifest_path = (
+            FILE_MANIFEST_PATH if config is None
+            else Path(self.config["vector_db"]["path"]) / "file_manifest.json"
+        )
+        self.indexing = _index_settings(self.config)
         self._init_clients()
         self._init_collection()
 
@@ -141,6 +666,7 @@ class NotionEmbeddingsPipeline:
                 self._log(f"CPU threads limited to {max_threads}")
 
             self.sentence_model = SentenceTransformer(self.embedding_model)
+            self.embedding_dims = self.sentence_model.get_sentence_embedding_dimension() or self.embedding_dims
             self.use_local = True
             self._log(f"Using local embeddings: {self.embedding_model} (FREE)")
         elif HAS_OPENAI:
@@ -163,6 +689,9 @@ class NotionEmbeddingsPipeline:
 
         self.collection_name = self.config["vector_db"]["collection"]
 
+        # BM25 index stored next to the collection
+        self.lexical = LexicalIndex(db_path / f"{self.collection_name}_lexical.sqlite")
+
     def _init_collection(self):
         """Initialize or verify the Qdrant collection."""
         collections = self.qdrant.get_collections().collections
@@ -178,6 +707,18 @@ class NotionEmbeddingsPipeline:
                 )
             )
 
+        # Keyword indexes so domain filters are applied inside the search and
+        # file deletions can select points by source file
+        for field_name in ("domain", "source_file"):
+            try:
+                self.qdrant.create_payload_index(
+                    collection_name=self.collection_name,
+                    field_name=field_name,
+                    field_schema=PayloadSchemaType.KEYWORD
+                )
+            except Exception as e:
+                self._log(f"Warning: could not create {field_name} payload index: {e}")
+
     def index_all_content(self, export_dir: Optional[Path] = None) -> Dict[str, int]:
         """
         Full indexing of all Notion content.
@@ -199,63 +740,39 @@ class NotionEmbeddingsPipeline:
                 "Run: python3 -m scripts.ai.notion_knowledge_retriever --export knowledge/notion_export/"
             )
 
-        stats = {"pages": 0, "entries": 0, "chunks": 0, "vectors": 0}
-        all_points = []
-
-        # Index pages
-        pages_dir = export_dir / "pages"
-        if pages_dir.exists():
-            for md_file in pages_dir.glob("*.md"):
-                try:
-                    chunks = self._process_page_file(md_file)
-                    points = self._create_points(chunks)
-                    all_points.extend(points)
-                    stats["pages"] += 1
-                    stats["chunks"] += len(chunks)
-                except Exception as e:
-                    self._log(f"Error processing {md_file.name}: {e}")
-
-        # Index database entries
-        db_dir = export_dir / "databases"
-        if db_dir.exists():
-            for db_type_dir in db_dir.iterdir():
-                if db_type_dir.is_dir():
-                    for md_file in db_type_dir.glob("*.md"):
-                        try:
-                            chunks = self._process_entry_file(
-                                md_file,
-                                database=db_type_dir.name
-                            )
-                            points = self._create_points(chunks)
-                            all_points.extend(points)
-                            stats["entries"] += 1
-                            stats["chunks"] += len(chunks)
-                        except Exception as e:
-                            self._log(f"Error processing {md_file.name}: {e}")
-
-        # Batch upsert to Qdrant
-        if all_points:
-            # Process in batches of 100
-            batch_size = 100
-            for i in range(0, len(all_points), batch_size):
-                batch = all_points[i:i + batch_size]
-                self.qdrant.upsert(
-                    collection_name=self.collection_name,
-                    points=batch
-                )
-                stats["vectors"] += len(batch)
+        # Pages and database entries
+        files = sorted((export_dir / "pages").glob("*.md"))
+        files += sorted((export_dir / "databases").glob("*/*.md"))
+
+        # Fresh manifest: every chunk is embedded, then tracked for --update
+        manifest = {"files": {}, "statistics": {}}
+        stats = self._index_files(export_dir, files, manifest, reuse=False)
+        self.save_file_manifest(manifest)
 
         # Save index metadata
         self._save_index_metadata(stats, export_dir)
 
         return stats
 
+    def _build_filter(
+        self,
+        content_type: Optional[str] = None,
+        domain: Optional[str] = None
+    ) -> Optional["Filter"]:
+        conditions = []
+        if content_type:
+            conditions.append(FieldCondition(key="type", match=MatchValue(value=content_type)))
+        if domain:
+            conditions.append(FieldCondition(key="domain", match=MatchValue(value=domain)))
+        return Filter(must=conditions) if conditions else None
+
     def search(
         self,
         query: str,
         limit: int = 5,
         content_type: Optional[str] = None,
-        score_threshold: float = 0.0
+        score_threshold: float = 0.0,
+        domain: Optional[str] = None
     ) -> List[Dict]:
         """
         Semantic search across indexed content.
@@ -265,6 +782,7 @@ class NotionEmbeddingsPipeline:
             limit: Maximum results to return
             content_type: Filter by type (page, database_entry)
             score_threshold: Minimum relevance score (0-1)
+            domain: Filter by domain payload (e.g. "coins")
 
         Returns:
             List of relevant content chunks with metadata
@@ -272,23 +790,11 @@ class NotionEmbeddingsPipeline:
         # Generate query embedding
         query_embedding = self._generate_embeddings([query])[0]
 
-        # Build filter
-        filter_obj = None
-        if content_type:
-            filter_obj = Filter(
-                must=[
-                    FieldCondition(
-                        key="type",
-                        match=MatchValue(value=content_type)
-                    )
-                ]
-            )
-
         # Search using query_points (Qdrant 1.7+ API)
         results = self.qdrant.query_points(
             collection_name=self.collection_name,
             query=query_embedding,
-            query_filter=filter_obj,
+            query_filter=self._build_filter(content_type, domain),
             limit=limit,
             score_threshold=score_threshold,
             with_payload=True
@@ -296,21 +802,114 @@ class NotionEmbeddingsPipeline:
 
         return [
             {
+                "id": str(r.id),
                 "title": r.payload.get("title", ""),
                 "type": r.payload.get("type", ""),
                 "database": r.payload.get("database", ""),
                 "text": r.payload.get("chunk_text", ""),
                 "chunk_index": r.payload.get("chunk_index", 0),
                 "url": r.payload.get("url", ""),
+                "domain": r.payload.get("domain", ""),
                 "score": r.score,
             }
             for r in results.points
         ]
 
+    def hybrid_search(
+        self,
+        query: str,
+        limit: int = 5,
+        content_type: Optional[str] = None,
+        score_threshold: float = 0.0,
+        domain: Optional[str] = None,
+        candidates: Optional[int] = None,
+        rrf_k: int = 60
+    ) -> List[Dict]:
+        """
+        Hybrid search: BM25 (exact terms like "1921-D Morgan") fused with
+        dense similarity by reciprocal rank fusion.
+
+        Both retrievers apply the domain/type filter inside their index, so
+        no results are discarded after retrieval. ``score_threshold`` only
+        applies to the dense side; lexical hits are kept on term match.
+
+        Returns:
+            Results as in ``search`` with ``score`` the fused RRF score,
+            plus ``dense_score``, ``dense_rank`` and ``lexical_rank``.
+        """
+        depth = candidates or max(limit * 2, 10)
+
+        dense = self.search(
+            query,
+            limit=depth,
+            content_type=content_type,
+            score_threshold=score_threshold,
+            domain=domain
+        )
+        lexical = self.lexical.search(query, limit=depth, domain=domain, content_type=content_type)
+
+        fused = reciprocal_rank_fusion([dense, lexical], k=rrf_k)[:limit]
+        dense_scores = {r["id"]: r["score"] for r in dense}
+        for r in fused:
+            ranks = r.pop("ranks")
+            r["dense_rank"] = ranks.get(0)
+            r["lexical_rank"] = ranks.get(1)
+            r["dense_score"] = dense_scores.get(r["id"])
+            r.pop("bm25", None)
+        return fused
+
+    def rebuild_lexical_index(self, batch_size: int = 256) -> Dict[str, int]:
+        """
+        Rebuild the BM25 index from the Qdrant collection and backfill the
+        ``domain`` payload on points indexed before domains existed.
+        """
+        self.lexical.clear()
+        stats = {"points": 0, "domains_updated": 0}
+        offset = None
+
+        while True:
+            points, offset = self.qdrant.scroll(
+                collection_name=self.collection_name,
+                limit=batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=False
+            )
+            if not points:
+                break
+
+            by_domain: Dict[str, List] = {}
+            for point in points:
+                payload = point.payload
+                domain = classify_domain(
+                    payload.get("title", ""),
+                    payload.get("chunk_text", ""),
+                    payload.get("database", "")
+                )
+                if payload.get("domain") != domain:
+                    payload["domain"] = domain
+                    by_domain.setdefault(domain, []).append(point.id)
+
+            for domain, ids in by_domain.items():
+                self.qdrant.set_payload(
+                    collection_name=self.collection_name,
+                    payload={"domain": domain},
+                    points=ids
+                )
+                stats["domains_updated"] += len(ids)
+
+            self.lexical.upsert(points)
+            stats["points"] += len(points)
+            if offset is None:
+                break
+
+        return stats
+
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the vector index."""
         try:
             collection_info = self.qdrant.get_collection(self.collection_name)
+            lexical_count = self.lexical.count()
 
             # Qdrant 1.7+ API uses different attribute names
             points_count = getattr(collection_info, 'points_count', None)
@@ -324,6 +923,7 @@ class NotionEmbeddingsPipeline:
                 "status": str(status),
                 "embedding_model": self.embedding_model,
                 "embedding_dims": self.embedding_dims,
+                "lexical_chunks": lexical_count,
             }
         except Exception as e:
             return {"error": str(e)}
@@ -333,9 +933,10 @@ class NotionEmbeddingsPipeline:
         try:
             self.qdrant.delete_collection(self.collection_name)
             self._init_collection()
+            self.lexical.clear()
             # Also clear file manifest
-            if FILE_MANIFEST_PATH.exists():
-                FILE_MANIFEST_PATH.unlink()
+            if self.manifest_path.exists():
+                self.manifest_path.unlink()
             return True
         except Exception as e:
             self._log(f"Error clearing index: {e}")
@@ -345,9 +946,9 @@ class NotionEmbeddingsPipeline:
 
     def load_file_manifest(self) -> Dict[str, Any]:
         """Load the file manifest tracking individual file hashes and vector IDs."""
-        if FILE_MANIFEST_PATH.exists():
+        if self.manifest_path.exists():
             try:
-                return json.loads(FILE_MANIFEST_PATH.read_text())
+                return json.loads(self.manifest_path.read_text())
             except json.JSONDecodeError:
                 self._log("Warning: Failed to parse file manifest, starting fresh")
         return {"files": {}, "last_sync": None, "statistics": {}}
@@ -355,8 +956,13 @@ class NotionEmbeddingsPipeline:
     def save_file_manifest(self, manifest: Dict[str, Any]):
         """Save the file manifest."""
         manifest["last_sync"] = datetime.now().isoformat()
-        FILE_MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
-        FILE_MANIFEST_PATH.write_text(json.dumps(manifest, indent=2))
+        manifest["statistics"] = {
+            **manifest.get("statistics", {}),
+            "total_files": len(manifest["files"]),
+            "total_vectors": sum(len(f.get("vector_ids", [])) for f in manifest["files"].values())
+        }
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.write_text(json.dumps(manifest, indent=2))
 
     def get_file_hash(self, filepath: Path) -> str:
         """Calculate MD5 hash of a single file."""
@@ -372,14 +978,17 @@ class NotionEmbeddingsPipeline:
         manifest = self.load_file_manifest()
         old_files = manifest.get("files", {})
 
-        # Get current files
+        # Get current files; only hash files whose size or mtime changed
         current_files = {}
         for md_file in export_dir.glob("**/*.md"):
             rel_path = str(md_file.relative_to(export_dir))
+            stat = md_file.stat()
+            old = old_files.get(rel_path, {})
+            unchanged = old.get("size") == stat.st_size and old.get("mtime") == stat.st_mtime
             current_files[rel_path] = {
-                "hash": self.get_file_hash(md_file),
-                "size": md_file.stat().st_size,
-                "mtime": md_file.stat().st_mtime
+                "hash": old.get("hash") if unchanged else self.get_file_hash(md_file),
+                "size": stat.st_size,
+                "mtime": stat.st_mtime
             }
 
         changes = {
@@ -439,89 +1048,243 @@ class NotionEmbeddingsPipeline:
               f"~{len(changes['modified'])} modified, -{len(changes['deleted'])} deleted")
 
         manifest = self.load_file_manifest()
-        stats = {
+        result = self._index_files(
+            export_dir,
+            changes["added"] + changes["modified"],
+            manifest,
+            removed=changes["deleted"]
+        )
+        self.save_file_manifest(manifest)
+
+        return {
             "added": len(changes["added"]),
             "modified": len(changes["modified"]),
             "deleted": len(changes["deleted"]),
-            "vectors_added": 0,
-            "vectors_removed": 0
+            "vectors_added": result["vectors"],
+            "vectors_removed": result["vectors_removed"],
+            "vectors_unchanged": result["kept"],
+            "embedded": result["embedded"],
+            "seconds": result["seconds"],
+            "docs_per_sec": result["docs_per_sec"],
+            "chunks_per_sec": result["chunks_per_sec"],
         }
 
-        # 1. Delete vectors for modified files
-        for filepath in changes["modified"]:
-            rel_path = str(filepath.relative_to(export_dir))
-            if rel_path in manifest["files"]:
-                old_info = manifest["files"][rel_path]
-                vector_ids = old_info.get("vector_ids", [])
-                if vector_ids:
-                    self._delete_vectors_by_ids(vector_ids)
-                    stats["vectors_removed"] += len(vector_ids)
-
-        # Handle deleted files
-        for rel_path in changes["deleted"]:
-            if rel_path in manifest["files"]:
-                old_info = manifest["files"][rel_path]
-                vector_ids = old_info.get("vector_ids", [])
-                if vector_ids:
-                    self._delete_vectors_by_ids(vector_ids)
-                    stats["vectors_removed"] += len(vector_ids)
-                # Remove from manifest
-                del manifest["files"][rel_path]
-
-        # 2. Index added and modified files
-        files_to_index = changes["added"] + changes["modified"]
-        for filepath in files_to_index:
-            try:
-                rel_path = str(filepath.relative_to(export_dir))
+    def _chunk_pool(self, file_count: int):
+        """Process pool for chunking large batches of files (None: chunk inline)."""
+        workers = self.indexing["workers"]
+        if file_count < INDEX_POOL_MIN_FILES or workers <= 1:
+            return None
+        return ProcessPoolExecutor(max_workers=workers)
 
-                # Determine if page or database entry
-                if "databases" in str(filepath):
-                    db_name = filepath.parent.name
-                    chunks = self._process_entry_file(filepath, database=db_name)
-                else:
-                    chunks = self._process_page_file(filepath)
-
-                # Create and upsert points
-                points = self._create_points(chunks)
-                if points:
-                    self.qdrant.upsert(
-                        collection_name=self.collection_name,
-                        points=points
-                    )
-                    stats["vectors_added"] += len(points)
-
-                # Update manifest
-                manifest["files"][rel_path] = {
-                    "hash": self.get_file_hash(filepath),
-                    "size": filepath.stat().st_size,
-                    "chunks": len(chunks),
-                    "vector_ids": [p.id for p in points]
-                }
+    def _index_files(
+        self,
+        export_dir: Path,
+        files: List[Path],
+        manifest: Dict[str, Any],
+        removed: Optional[List[str]] = None,
+        reuse: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Index export files and update ``manifest["files"]`` in place.
 
-            except Exception as e:
-                self._log(f"Error processing {filepath.name}: {e}")
+        Producer: files are chunked in a process pool. Consumer: chunks from
+        all files are pooled and embedded in length-sorted batches, and points
+        are written by a background upserter while encoding continues.
 
-        # 3. Update statistics
-        manifest["statistics"] = {
-            "total_files": len(manifest["files"]),
-            "total_vectors": sum(len(f.get("vector_ids", [])) for f in manifest["files"].values())
+        With ``reuse``, a chunk whose content hash matches one indexed for the
+        same file keeps its vector: unchanged IDs are left alone, moved chunks
+        (new chunk_index) are copied to their new ID without re-embedding.
+
+        Stale points of re-indexed files and every point of ``removed`` files
+        are found in bulk afterwards through a ``source_file`` payload filter
+        (plus the manifest's IDs, for points indexed before that field) and
+        deleted by ID.
+        """
+        removed = removed or []
+        started = time.perf_counter()
+        chunk_size = self.config["embeddings"]["chunk_size"]
+        overlap = self.config["embeddings"]["chunk_overlap"]
+        tasks = [(str(f), str(f.relative_to(export_dir)), chunk_size, overlap) for f in files]
+
+        stats = {
+            "pages": 0, "entries": 0, "chunks": 0, "vectors": 0, "embedded": 0,
+            "kept": 0, "copied": 0, "vectors_removed": 0, "errors": 0
         }
+        window = self.indexing["encode_batch_size"] * INDEX_ENCODE_WINDOW
+        pending: List[Dict] = []
+        copies: List[Tuple[str, Dict]] = []
+        current_ids = set()
+        stale_ids = set()
+
+        # Submitting every task forks the pool before the upserter thread starts
+        pool = self._chunk_pool(len(tasks))
+        records = (
+            pool.map(chunk_export_file, tasks, chunksize=16) if pool
+            else map(chunk_export_file, tasks)
+        )
+        upserter = _BatchUpserter(
+            self.qdrant, self.collection_name, self.lexical, self.indexing["upsert_batch_size"]
+        )
+        try:
+            for record in records:
+                rel_path = record["rel_path"]
+                if "error" in record:
+                    self._log(f"Error processing {rel_path}: {record['error']}")
+                    stats["errors"] += 1
+                    continue
+
+                old = manifest["files"].get(rel_path, {})
+                old_ids = old.get("vector_ids", [])
+                previous = dict(zip(old.get("chunk_hashes", []), old_ids)) if reuse else {}
+
+                ids = []
+                for chunk in record["chunks"]:
+                    ids.append(chunk["id"])
+                    prior = previous.get(chunk["hash"])
+                    if prior == chunk["id"]:
+                        stats["kept"] += 1
+                    elif prior:
+                        copies.append((prior, chunk))
+                    else:
+                        pending.append(chunk)
+                current_ids.update(ids)
+                stale_ids.update(old_ids)
+
+                stats[record["kind"]] += 1
+                stats["chunks"] += len(ids)
+                manifest["files"][rel_path] = {
+                    "hash": record["hash"],
+                    "size": record["size"],
+                    "mtime": record["mtime"],
+                    "chunks": len(ids),
+                    "vector_ids": ids,
+                    "chunk_hashes": [c["hash"] for c in record["chunks"]]
+                }
 
-        # 4. Save updated manifest
-        self.save_file_manifest(manifest)
+                if len(pending) >= window:
+                    stats["embedded"] += self._embed_and_upsert(pending, upserter)
+                    pending = []
+
+            if pending:
+                stats["embedded"] += self._embed_and_upsert(pending, upserter)
+        finally:
+            if pool:
+                pool.shutdown(cancel_futures=True)
+            upserter.close()
+        stats["vectors"] = upserter.count
+
+        if copies:
+            stats["copied"], missing = self._copy_vectors(copies)
+            stats["vectors"] += stats["copied"]
+            if missing:
+                upserter = _BatchUpserter(self.qdrant, self.collection_name, self.lexical)
+                stats["embedded"] += self._embed_and_upsert(missing, upserter)
+                upserter.close()
+                stats["vectors"] += upserter.count
+
+        for rel_path in removed:
+            stale_ids.update(manifest["files"].pop(rel_path, {}).get("vector_ids", []))
+        stats["vectors_removed"] = self._delete_stale_points(
+            [t[1] for t in tasks] + removed if reuse else [],
+            current_ids,
+            stale_ids - current_ids
+        )
 
+        elapsed = time.perf_counter() - started
+        stats["seconds"] = round(elapsed, 2)
+        stats["docs_per_sec"] = round(len(tasks) / elapsed, 1) if elapsed else 0.0
+        stats["chunks_per_sec"] = round(stats["chunks"] / elapsed, 1) if elapsed else 0.0
         return stats
 
+    def _embed_and_upsert(self, chunks: List[Dict], upserter: _BatchUpserter) -> int:
+        """Embed chunks in length-sorted batches and hand points to the upserter."""
+        batch_size = self.indexing["encode_batch_size"]
+        chunks = sorted(chunks, key=lambda c: len(c["text"]), reverse=True)
+        for i in range(0, len(chunks), batch_size):
+            batch = chunks[i:i + batch_size]
+            vectors = self._generate_embeddings([c["text"] for c in batch], batch_size=batch_size)
+            upserter.put(self._create_points(batch, vectors))
+        return len(chunks)
+
+    def _copy_vectors(self, copies: List[Tuple[str, Dict]]) -> Tuple[int, List[Dict]]:
+        """
+        Re-upsert moved chunks under their new IDs with their existing vectors.
+
+        Returns:
+            (points written, chunks whose old vector was not found)
+        """
+        written = 0
+        missing = []
+        batch_size = self.indexing["upsert_batch_size"]
+        for i in range(0, len(copies), batch_size):
+            batch = copies[i:i + batch_size]
+            found = self.qdrant.retrieve(
+                collection_name=self.collection_name,
+                ids=[old_id for old_id, _ in batch],
+                with_vectors=True,
+                with_payload=False
+            )
+            vectors = {str(p.id).replace("-", ""): p.vector for p in found}
+            chunks, chunk_vectors = [], []
+            for old_id, chunk in batch:
+                vector = vectors.get(old_id.replace("-", ""))
+                if vector is None:
+                    missing.append(chunk)
+                else:
+                    chunks.append(chunk)
+                    chunk_vectors.append(vector)
+            points = self._create_points(chunks, chunk_vectors)
+            if points:
+                self.qdrant.upsert(collection_name=self.collection_name, points=points)
+                self.lexical.upsert(points)
+                written += len(points)
+        return written, missing
+
+    def _delete_stale_points(self, source_files: List[str], keep_ids: set, stale_ids: set) -> int:
+        """
+        Bulk-delete points of ``source_files`` not in ``keep_ids`` (found with
+        one payload filter for all files), plus ``stale_ids`` from the manifest.
+
+        Returns:
+            Number of points removed
+        """
+        removed = {str(i).replace("-", "") for i in stale_ids}
+        if source_files:
+            selector = Filter(
+                must=[FieldCondition(key="source_file", match=MatchAny(any=source_files))],
+                must_not=[HasIdCondition(has_id=list(keep_ids))] if keep_ids else None
+            )
+            removed.update(i.replace("-", "") for i in self._scroll_ids(selector))
+        if removed:
+            self._delete_vectors_by_ids(list(removed))
+        return len(removed)
+
+    def _scroll_ids(self, selector: "Filter") -> List[str]:
+        ids = []
+        offset = None
+        while True:
+            points, offset = self.qdrant.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=selector,
+                limit=1024,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False
+            )
+            ids.extend(str(p.id) for p in points)
+            if not points or offset is None:
+                return ids
+
     def _delete_vectors_by_ids(self, vector_ids: List[str]):
         """Delete specific vectors by their IDs."""
         if not vector_ids:
             return
         try:
-            from qdrant_client.models import PointIdsList
             self.qdrant.delete(
                 collection_name=self.collection_name,
                 points_selector=PointIdsList(points=vector_ids)
             )
+            self.lexical.delete(vector_ids)
         except Exception as e:
             self._log(f"Warning: Failed to delete vectors: {e}")
 
@@ -558,116 +1321,14 @@ class NotionEmbeddingsPipeline:
 
         return manifest
 
-    def _process_page_file(self, filepath: Path) -> List[Dict]:
-        """Process a page markdown file into chunks."""
-        with open(filepath) as f:
-            content = f.read()
-
-        # Extract metadata from header
-        metadata = self._extract_page_metadata(content)
-
-        # Remove metadata section
-        content = re.sub(r'^#.*?\n---\n', '', content, flags=re.DOTALL)
-
-        # Chunk content
-        chunks = self._chunk_content(
-            content,
-            metadata["title"],
-            chunk_type="page"
-        )
-
-        # Add metadata to each chunk
-        for chunk in chunks:
-            chunk.update(metadata)
-
-        return chunks
-
-    def _process_entry_file(self, filepath: Path, database: str) -> List[Dict]:
-        """Process a database entry markdown file."""
-        with open(filepath) as f:
-            content = f.read()
-
-        # Extract metadata
-        metadata = self._extract_entry_metadata(content)
-        metadata["database"] = database
-        metadata["type"] = "database_entry"
-
-        # For database entries, keep as single chunk
-        # This preserves all properties together
-        clean_content = self._clean_markdown(content)
-
-        return [{
-            "text": clean_content,
-            "chunk_index": 0,
-            **metadata
-        }]
-
-    def _chunk_content(
-        self,
-        text: str,
-        title: str,
-        chunk_type: str = "page"
-    ) -> List[Dict]:
-        """
-        Split content into overlapping chunks.
-
-        Strategy:
-        - Preserve paragraph boundaries when possible
-        - Include title in each chunk for context
-        - Create overlap to maintain continuity
-        """
-        chunk_size = self.config["embeddings"]["chunk_size"]
-        overlap = self.config["embeddings"]["chunk_overlap"]
-
-        # Clean text
-        text = self._clean_markdown(text)
-
-        # For short content, return as single chunk
-        if len(text) <= chunk_size:
-            return [{
-                "text": f"Title: {title}\n\n{text}",
-                "chunk_index": 0,
-                "title": title,
-                "type": chunk_type
-            }]
-
-        chunks = []
-        start = 0
-        chunk_idx = 0
-
-        while start < len(text):
-            end = start + chunk_size
-
-            # Try to break at paragraph boundary
-            if end < len(text):
-                # Look for paragraph break near end
-                para_break = text.rfind("\n\n", start + chunk_size // 2, end + 100)
-                if para_break > start:
-                    end = para_break
-
-            chunk_text = text[start:end].strip()
-
-            if len(chunk_text) > 50:  # Skip tiny chunks
-                chunks.append({
-                    "text": f"Title: {title}\n\n{chunk_text}",
-                    "chunk_index": chunk_idx,
-                    "title": title,
-                    "type": chunk_type
-                })
-                chunk_idx += 1
-
-            # Move start with overlap
-            start = end - overlap if end < len(text) else len(text)
-
-        return chunks
-
-    def _generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+    def _generate_embeddings(self, texts: List[str], batch_size: Optional[int] = None) -> List[List[float]]:
         """Generate embeddings using local model or OpenAI API."""
         if self.use_local:
             # Use sentence-transformers (FREE, local)
             # Show progress bar only if not in quiet mode and processing many texts
-            # Use configured batch_size for memory efficiency
-            batch_size = getattr(self, 'local_batch_size', 32)
+            # Use configured batch_size for memory efficiency unless the caller
+            # passes pre-sorted texts in larger batches
+            batch_size = batch_size or getattr(self, 'local_batch_size', 32)
             embeddings = self.sentence_model.encode(
                 texts,
                 show_progress_bar=not self.quiet and len(texts) > 10,
@@ -692,24 +1353,22 @@ class NotionEmbeddingsPipeline:
 
             return all_embeddings
 
-    def _create_points(self, chunks: List[Dict]) -> List[PointStruct]:
-        """Create Qdrant points from chunks with embeddings."""
+    def _create_points(
+        self,
+        chunks: List[Dict],
+        embeddings: Optional[List[List[float]]] = None
+    ) -> List[PointStruct]:
+        """Create Qdrant points from chunks (embedding them unless vectors are given)."""
         if not chunks:
             return []
 
-        # Generate embeddings for all chunks
-        texts = [c["text"] for c in chunks]
-        embeddings = self._generate_embeddings(texts)
+        if embeddings is None:
+            embeddings = self._generate_embeddings([c["text"] for c in chunks])
 
         points = []
         for chunk, embedding in zip(chunks, embeddings):
-            # Create deterministic ID from content
-            point_id = hashlib.md5(
-                f"{chunk.get('title', '')}_{chunk.get('chunk_index', 0)}_{chunk['text'][:100]}".encode()
-            ).hexdigest()
-
             points.append(PointStruct(
-                id=point_id,
+                id=chunk.get("id") or point_id_for(chunk),
                 vector=embedding,
                 payload={
                     "title": chunk.get("title", ""),
@@ -718,61 +1377,20 @@ class NotionEmbeddingsPipeline:
                     "chunk_text": chunk["text"],
                     "chunk_index": chunk.get("chunk_index", 0),
                     "url": chunk.get("url", ""),
+                    "domain": classify_domain(
+                        chunk.get("title", ""), chunk["text"], chunk.get("database", "")
+                    ),
+                    "source_file": chunk.get("source_file", ""),
+                    "chunk_hash": chunk.get("hash", ""),
                     "indexed_at": datetime.utcnow().isoformat()
                 }
             ))
 
         return points
 
-    def _extract_page_metadata(self, content: str) -> Dict:
-        """Extract metadata from page markdown header."""
-        metadata = {
-            "title": "Untitled",
-            "url": "",
-            "type": "page"
-        }
-
-        # Extract title from first heading
-        title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
-        if title_match:
-            metadata["title"] = title_match.group(1)
-
-        # Extract URL
-        url_match = re.search(r'^Source: (.+)$', content, re.MULTILINE)
-        if url_match:
-            metadata["url"] = url_match.group(1)
-
-        return metadata
-
-    def _extract_entry_metadata(self, content: str) -> Dict:
-        """Extract metadata from database entry markdown."""
-        metadata = {
-            "title": "Untitled",
-            "url": "",
-            "type": "database_entry"
-        }
-
-        # Extract title
-        title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
-        if title_match:
-            metadata["title"] = title_match.group(1)
-
-        return metadata
-
-    def _clean_markdown(self, text: str) -> str:
-        """Clean markdown for embedding."""
-        # Remove frontmatter
-        text = re.sub(r'^---\n.*?\n---\n', '', text, flags=re.DOTALL)
-
-        # Remove excessive whitespace
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r' {2,}', ' ', text)
-
-        return text.strip()
-
     def _save_index_metadata(self, stats: Dict, export_dir: Path):
         """Save metadata about the indexing run."""
-        metadata_path = VECTOR_DB_PATH / "index_metadata.json"
+        metadata_path = self.manifest_path.parent / "index_metadata.json"
 
         metadata = {
             "indexed_at": datetime.utcnow().isoformat(),
@@ -789,6 +1407,107 @@ class NotionEmbeddingsPipeline:
             json.dump(metadata, f, indent=2)
 
 
+# ========== Benchmark ==========
+
+_BENCH_WORDS = (
+    "theta delta alpha gamma breath descent ritual archetype guardian realm "
+    "forest river mountain ocean starlight ember crystal sanctuary threshold "
+    "journey healing anchor resonance frequency binaural chakra heart vision "
+    "shadow light spiral temple garden memory dream elder teacher oracle"
+).split()
+
+
+def _bench_paragraph(rng: random.Random) -> str:
+    return " ".join(rng.choice(_BENCH_WORDS) for _ in range(rng.randint(40, 160))).capitalize() + "."
+
+
+def _bench_page(i: int, rng: random.Random) -> str:
+    paragraphs = "\n\n".join(_bench_paragraph(rng) for _ in range(rng.randint(2, 10)))
+    return f"# Page {i:05d}\n\nSource: https://www.notion.so/page-{i:05d}\n---\n\n{paragraphs}\n"
+
+
+def _bench_entry(i: int, rng: random.Random) -> str:
+    props = "\n".join(f"**{k}**: {rng.choice(_BENCH_WORDS)}" for k in ("Type", "Element", "Realm"))
+    return f"# Entry {i:05d}\n\n{props}\n\n{_bench_paragraph(rng)}\n"
+
+
+def _write_bench_export(export_dir: Path, files: int, rng: random.Random, start: int = 0):
+    """Synthetic export: 70% pages, 30% entries across four databases."""
+    for i in range(start, start + files):
+        if i % 10 < 7:
+            path = export_dir / "pages" / f"page_{i:05d}.md"
+            content = _bench_page(i, rng)
+        else:
+            path = export_dir / "databases" / ("archetypes", "realms", "rituals", "frequencies")[i % 4] / f"entry_{i:05d}.md"
+            content = _bench_entry(i, rng)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+def _edit_bench_export(export_dir: Path, files: int, rng: random.Random,
+                       edit: float = 0.05, churn: float = 0.01) -> Dict[str, int]:
+    """Edit one paragraph in ``edit`` of the pages, delete and add ``churn`` files."""
+    pages = sorted((export_dir / "pages").glob("*.md"))
+    edited = rng.sample(pages, max(1, int(len(pages) * edit)))
+    for path in edited:
+        head, body = path.read_text().split("---\n", 1)
+        paragraphs = body.strip().split("\n\n")
+        paragraphs[rng.randrange(len(paragraphs))] = _bench_paragraph(rng)
+        path.write_text(head + "---\n\n" + "\n\n".join(paragraphs) + "\n")
+
+    count = max(1, int(files * churn))
+    candidates = sorted(set(export_dir.glob("**/*.md")) - set(edited))
+    for path in rng.sample(candidates, count):
+        path.unlink()
+    _write_bench_export(export_dir, count, rng, start=files)
+    return {"edited": len(edited), "deleted": count, "added": count}
+
+
+def benchmark(files: int = 3000, model: str = BENCHMARK_MODEL, seed: int = 7) -> Dict[str, Any]:
+    """
+    Index a synthetic export from scratch, then edit ~5% of pages and
+    churn 1% of files and run an incremental update. Uses a temporary
+    collection; the real index and manifest are untouched.
+    """
+    if not HAS_SENTENCE_TRANSFORMERS:
+        raise SystemExit("Benchmark needs a local model: pip install sentence-transformers")
+
+    rng = random.Random(seed)
+    config = copy.deepcopy(load_config())
+    with tempfile.TemporaryDirectory(prefix="embeddings_bench_") as tmp:
+        config["vector_db"]["path"] = str(Path(tmp) / "vector_db")
+        config["vector_db"]["collection"] = "benchmark"
+        config["embeddings"].setdefault("local", {})["model"] = model
+
+        export_dir = Path(tmp) / "export"
+        _write_bench_export(export_dir, files, rng)
+
+        pipeline = NotionEmbeddingsPipeline(quiet=True, config=config)
+        full = pipeline.index_all_content(export_dir)
+        edits = _edit_bench_export(export_dir, files, rng)
+        incremental = pipeline.index_incremental(export_dir)
+        points = pipeline.qdrant.count(pipeline.collection_name).count
+        pipeline.qdrant.close()
+
+    return {"files": files, "model": model, "full": full, "edits": edits,
+            "incremental": incremental, "points": points}
+
+
+def format_benchmark(report: Dict[str, Any]) -> str:
+    full, inc, edits = report["full"], report["incremental"], report["edits"]
+    return "\n".join([
+        f"Embedding index benchmark: {report['files']} files, model {report['model']}",
+        "",
+        f"Full index:   {full['seconds']:>7.2f}s  {full['docs_per_sec']:>7.1f} docs/s  "
+        f"{full['chunks_per_sec']:>7.1f} chunks/s  ({full['chunks']} chunks)",
+        f"Incremental:  {inc['seconds']:>7.2f}s  "
+        f"({edits['edited']} edited, {edits['deleted']} deleted, {edits['added']} added)",
+        f"  Embedded: {inc['embedded']}  unchanged: {inc['vectors_unchanged']}  "
+        f"written: {inc['vectors_added']}  removed: {inc['vectors_removed']}",
+        f"Points after update: {report['points']}",
+    ])
+
+
 def format_search_results(results: List[Dict], verbose: bool = False) -> str:
     """Format search results for display."""
     if not results:
@@ -826,6 +1545,27 @@ def main():
         action="store_true",
         help="Index all exported Notion content"
     )
+    parser.add_argument(
+        "--update", "-u",
+        action="store_true",
+        help="Incremental update (only re-embed changed files)"
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Measure full and incremental indexing on a synthetic export"
+    )
+    parser.add_argument(
+        "--files",
+        type=int,
+        default=3000,
+        help="Synthetic files for --benchmark (default: 3000)"
+    )
+    parser.add_argument(
+        "--model",
+        default=BENCHMARK_MODEL,
+        help=f"Local model for --benchmark (default: {BENCHMARK_MODEL})"
+    )
     parser.add_argument(
         "--export-dir",
         help="Directory containing Notion export (default: knowledge/notion_export/)"
@@ -845,6 +1585,20 @@ def main():
         choices=["page", "database_entry"],
         help="Filter by content type"
     )
+    parser.add_argument(
+        "--hybrid",
+        action="store_true",
+        help="Fuse BM25 and vector results (reciprocal rank fusion)"
+    )
+    parser.add_argument(
+        "--domain",
+        help="Filter by domain payload (e.g. coins)"
+    )
+    parser.add_argument(
+        "--rebuild-lexical",
+        action="store_true",
+        help="Rebuild the BM25 index and backfill domain payloads from the collection"
+    )
     parser.add_argument(
         "--stats",
         action="store_true",
@@ -873,6 +1627,11 @@ def main():
 
     args = parser.parse_args()
 
+    if args.benchmark:
+        report = benchmark(files=args.files, model=args.model)
+        print(json.dumps(report, indent=2) if args.json else format_benchmark(report))
+        return
+
     # Check dependencies
     if not HAS_SENTENCE_TRANSFORMERS and not HAS_OPENAI:
         print("Error: No embedding backend installed.")
@@ -904,12 +1663,31 @@ def main():
                 print(f"  Entries: {stats['entries']}")
                 print(f"  Chunks: {stats['chunks']}")
                 print(f"  Vectors: {stats['vectors']}")
+                print(f"  Throughput: {stats['docs_per_sec']} docs/s, {stats['chunks_per_sec']} chunks/s")
+
+        elif args.update:
+            export_dir = Path(args.export_dir) if args.export_dir else None
+            print("Updating index...")
+            stats = pipeline.index_incremental(export_dir)
+
+            if args.json:
+                print(json.dumps(stats, indent=2))
+            elif stats.get("status") == "no_changes":
+                print("✓ Index is up to date")
+            else:
+                print("\n✓ Update complete:")
+                print(f"  Files: +{stats['added']} ~{stats['modified']} -{stats['deleted']}")
+                print(f"  Vectors: +{stats['vectors_added']} -{stats['vectors_removed']} "
+                      f"({stats['vectors_unchanged']} unchanged, {stats['embedded']} embedded)")
+                print(f"  Time: {stats['seconds']}s")
 
         elif args.search:
-            results = pipeline.search(
+            search = pipeline.hybrid_search if args.hybrid else pipeline.search
+            results = search(
                 args.search,
                 limit=args.limit,
-                content_type=args.type
+                content_type=args.type,
+                domain=args.domain
             )
 
             if args.json:
@@ -936,6 +1714,15 @@ def main():
             else:
                 print("Cancelled.")
 
+        elif args.rebuild_lexical:
+            print("Rebuilding BM25 index from collection...")
+            stats = pipeline.rebuild_lexical_index()
+            if args.json:
+                print(json.dumps(stats, indent=2))
+            else:
+                print(f"  Points indexed: {stats['points']}")
+                print(f"  Domain payloads updated: {stats['domains_updated']}")
+
         elif args.rebuild_manifest:
             export_dir = Path(args.export_dir) if args.export_dir else None
             print("Rebuilding file manifest...")
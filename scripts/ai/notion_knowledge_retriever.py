@@ -106,10 +106,10 @@ class NotionKnowledgeRetriever:
     - Export content for embeddings pipeline
     """
 
-    def __init__(self):
-        self.client = get_notion_client()
-        self.config = load_config()
-        self.workspace_root = self.config["notion"]["workspace_root"]
+    def __init__(self, client: Optional["Client"] = None, config: Optional[Dict[str, Any]] = None):
+        self.client = client if client is not None else get_notion_client()
+        self.config = config if config is not None else load_config()
+        self.workspace_root = self.config.get("notion", {}).get("workspace_root")
 
     def search_workspace(self, query: str, limit: int = 10) -> List[Dict]:
         """
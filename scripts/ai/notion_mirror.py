@@ -0,0 +1,577 @@
+#!/usr/bin/env python3
+"""
+Local Notion Mirror for Dreamweaving
+
+SQLite copy of the canonical knowledge databases (archetypes, realms,
+frequencies, rituals, ...) so that knowledge_tools lookups do not need a
+live Notion API round trip per call.
+
+The sync job is incremental: each database remembers the newest
+``last_edited_time`` it has seen and only pages edited since then are
+re-fetched (properties plus their block tree). A ``--full`` sync re-reads
+everything and prunes pages that no longer exist, which is also how
+deletions/archivals are picked up.
+
+Usage:
+    # Incremental sync of every configured database
+    python3 -m scripts.ai.notion_mirror --sync
+
+    # Full re-sync of one database
+    python3 -m scripts.ai.notion_mirror --sync --full --db archetypes
+
+    # Inspect the mirror
+    python3 -m scripts.ai.notion_mirror --stats
+    python3 -m scripts.ai.notion_mirror --lookup archetypes Navigator
+
+    # Sync + lookup latency against a fixture served by a local stub client
+    python3 -m scripts.ai.notion_mirror --simulate
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_MIRROR_PATH = PROJECT_ROOT / "knowledge" / "notion_mirror.sqlite"
+DEFAULT_MAX_AGE_HOURS = 24.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id TEXT PRIMARY KEY,
+    database_key TEXT NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    url TEXT,
+    created_time TEXT,
+    last_edited_time TEXT,
+    properties TEXT NOT NULL,         -- parsed entry (NotionKnowledgeRetriever._parse_entry)
+    synced_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pages_db_title ON pages(database_key, title COLLATE NOCASE);
+
+CREATE TABLE IF NOT EXISTS blocks (
+    id TEXT PRIMARY KEY,
+    page_id TEXT NOT NULL,
+    parent_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    type TEXT,
+    block TEXT NOT NULL               -- raw block JSON without children
+);
+CREATE INDEX IF NOT EXISTS idx_blocks_parent ON blocks(parent_id, position);
+CREATE INDEX IF NOT EXISTS idx_blocks_page ON blocks(page_id);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    database_key TEXT PRIMARY KEY,
+    database_id TEXT NOT NULL,
+    last_edited_cursor TEXT,          -- newest last_edited_time seen
+    last_synced_at TEXT NOT NULL,
+    page_count INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _title_of(entry: Dict[str, Any]) -> str:
+    """Plain text of the page's title property, whatever it is called."""
+    for prop in entry.get("properties", {}).values():
+        if prop.get("type") == "title":
+            return "".join(item.get("plain_text", "") for item in prop.get("title", []))
+    return ""
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def load_mirror_config() -> Dict[str, Any]:
+    """``mirror`` section of notion_config.yaml (path, max_age_hours)."""
+    try:
+        from .notion_knowledge_retriever import load_config
+        return load_config().get("mirror", {}) or {}
+    except Exception:
+        return {}
+
+
+class NotionMirror:
+    """
+    SQLite mirror of Notion database pages, properties and blocks.
+
+    A connection is opened per thread; reads and writes are short
+    transactions, so a sync can run while other processes read.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        if db_path is None:
+            configured = load_mirror_config().get("path")
+            db_path = (PROJECT_ROOT / configured) if configured else DEFAULT_MIRROR_PATH
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self.conn.executescript(SCHEMA)
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    # ─── Reads ────────────────────────────────────────────────────
+
+    def lookup(self, database_key: str, name: str) -> Optional[Dict[str, Any]]:
+        """
+        First entry whose title contains ``name`` (case-insensitive), like
+        the live ``query_database(filter_name=...)``. Exact title matches
+        win, then the most recently edited page.
+        """
+        row = self.conn.execute(
+            """
+            SELECT properties FROM pages
+            WHERE database_key = ? AND title LIKE ? ESCAPE '\\'
+            ORDER BY lower(title) = lower(?) DESC, last_edited_time DESC
+            LIMIT 1
+            """,
+            (database_key, f"%{_escape_like(name)}%", name),
+        ).fetchone()
+        return json.loads(row["properties"]) if row else None
+
+    def entries(self, database_key: str) -> List[Dict[str, Any]]:
+        rows = self.conn.execute(
+            "SELECT properties FROM pages WHERE database_key = ? ORDER BY title", (database_key,)
+        ).fetchall()
+        return [json.loads(row["properties"]) for row in rows]
+
+    def page_blocks(self, page_id: str) -> List[Dict[str, Any]]:
+        """Block tree of a page, shaped like ``_get_all_blocks`` output."""
+        rows = self.conn.execute(
+            "SELECT id, parent_id, block FROM blocks WHERE page_id = ? ORDER BY position", (page_id,)
+        ).fetchall()
+        children: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            children.setdefault(row["parent_id"], []).append({**json.loads(row["block"]), "id": row["id"]})
+        for siblings in children.values():
+            for block in siblings:
+                if block["id"] in children:
+                    block["children"] = children[block["id"]]
+        return children.get(page_id, [])
+
+    def age_hours(self, database_key: str) -> Optional[float]:
+        """Hours since ``database_key`` was last synced, or None if never."""
+        row = self.conn.execute(
+            "SELECT last_synced_at FROM sync_state WHERE database_key = ?", (database_key,)
+        ).fetchone()
+        synced = _parse_time(row["last_synced_at"]) if row else None
+        if synced is None:
+            return None
+        return (_utcnow() - synced).total_seconds() / 3600
+
+    def is_fresh(self, database_key: str, max_age_hours: float = DEFAULT_MAX_AGE_HOURS) -> bool:
+        age = self.age_hours(database_key)
+        return age is not None and age <= max_age_hours
+
+    def stats(self) -> List[Dict[str, Any]]:
+        rows = self.conn.execute(
+            """
+            SELECT s.database_key, s.last_synced_at, s.last_edited_cursor,
+                   (SELECT COUNT(*) FROM pages p WHERE p.database_key = s.database_key) AS pages,
+                   (SELECT COUNT(*) FROM blocks b JOIN pages p ON b.page_id = p.id
+                    WHERE p.database_key = s.database_key) AS blocks
+            FROM sync_state s ORDER BY s.database_key
+            """
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    # ─── Sync ─────────────────────────────────────────────────────
+
+    def sync(
+        self,
+        retriever,
+        database_keys: Optional[Iterable[str]] = None,
+        full: bool = False,
+        include_blocks: bool = True,
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Pull changed pages from Notion into the mirror.
+
+        Args:
+            retriever: NotionKnowledgeRetriever (its client, config and parsers are reused)
+            database_keys: Config keys to sync (default: every database with an ID)
+            full: Re-read every page and prune pages not returned by Notion
+            include_blocks: Also mirror each changed page's block tree
+
+        Returns:
+            Per-database counts: {"fetched", "updated", "pruned"}
+        """
+        databases = retriever.config.get("databases", {})
+        keys = list(database_keys) if database_keys else [k for k, v in databases.items() if (v or {}).get("id")]
+        report = {}
+
+        for key in keys:
+            db_id = (databases.get(key) or {}).get("id")
+            if not db_id:
+                print(f"  ⚠ Skipping {key}: no database ID configured")
+                continue
+            report[key] = self._sync_database(retriever, key, db_id, full, include_blocks)
+
+        return report
+
+    def _sync_database(self, retriever, key: str, db_id: str, full: bool, include_blocks: bool) -> Dict[str, int]:
+        state = self.conn.execute(
+            "SELECT last_edited_cursor FROM sync_state WHERE database_key = ?", (key,)
+        ).fetchone()
+        cursor_time = None if full or not state else state["last_edited_cursor"]
+
+        query: Dict[str, Any] = {
+            "database_id": db_id,
+            "page_size": 100,
+            "sorts": [{"timestamp": "last_edited_time", "direction": "ascending"}],
+        }
+        if cursor_time:
+            # Notion timestamps are minute-granular, so re-read the boundary minute
+            query["filter"] = {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": cursor_time}}
+
+        fetched = updated = 0
+        newest = cursor_time
+        seen: set = set()
+        start_cursor = None
+
+        while True:
+            response = retriever.client.databases.query(**query, **({"start_cursor": start_cursor} if start_cursor else {}))
+            for entry in response.get("results", []):
+                fetched += 1
+                seen.add(entry["id"])
+                if entry.get("archived") or entry.get("in_trash"):
+                    self._delete_pages([entry["id"]])
+                    continue
+                if self._is_current(entry):
+                    continue
+                blocks = retriever._get_all_blocks(entry["id"]) if include_blocks else None
+                self._upsert_page(key, entry, retriever._parse_entry(entry), blocks)
+                updated += 1
+                edited = entry.get("last_edited_time")
+                if edited and (newest is None or edited > newest):
+                    newest = edited
+            if not response.get("has_more"):
+                break
+            start_cursor = response.get("next_cursor")
+
+        pruned = 0
+        if full:
+            existing = [row["id"] for row in self.conn.execute(
+                "SELECT id FROM pages WHERE database_key = ?", (key,)
+            )]
+            stale = [page_id for page_id in existing if page_id not in seen]
+            self._delete_pages(stale)
+            pruned = len(stale)
+
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO sync_state (database_key, database_id, last_edited_cursor, last_synced_at, page_count)
+                VALUES (?, ?, ?, ?, (SELECT COUNT(*) FROM pages WHERE database_key = ?))
+                ON CONFLICT(database_key) DO UPDATE SET
+                    database_id = excluded.database_id,
+                    last_edited_cursor = excluded.last_edited_cursor,
+                    last_synced_at = excluded.last_synced_at,
+                    page_count = excluded.page_count
+                """,
+                (key, db_id, newest, _utcnow().isoformat(), key),
+            )
+
+        return {"fetched": fetched, "updated": updated, "pruned": pruned}
+
+    def _is_current(self, entry: Dict[str, Any]) -> bool:
+        row = self.conn.execute(
+            "SELECT last_edited_time FROM pages WHERE id = ?", (entry["id"],)
+        ).fetchone()
+        return bool(row) and row["last_edited_time"] == entry.get("last_edited_time")
+
+    def _upsert_page(
+        self,
+        key: str,
+        entry: Dict[str, Any],
+        parsed: Dict[str, Any],
+        blocks: Optional[List[Dict[str, Any]]],
+    ) -> None:
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO pages
+                    (id, database_key, title, url, created_time, last_edited_time, properties, synced_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    entry["id"], key, _title_of(entry), entry.get("url", ""),
+                    entry.get("created_time"), entry.get("last_edited_time"),
+                    json.dumps(parsed, default=str), _utcnow().isoformat(),
+                ),
+            )
+            if blocks is not None:
+                self.conn.execute("DELETE FROM blocks WHERE page_id = ?", (entry["id"],))
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO blocks (id, page_id, parent_id, position, type, block) VALUES (?, ?, ?, ?, ?, ?)",
+                    list(self._flatten_blocks(entry["id"], entry["id"], blocks)),
+                )
+
+    def _flatten_blocks(self, page_id: str, parent_id: str, blocks: List[Dict[str, Any]], counter=None):
+        counter = counter if counter is not None else [0]
+        for block in blocks:
+            body = {k: v for k, v in block.items() if k != "children"}
+            counter[0] += 1
+            yield (block["id"], page_id, parent_id, counter[0], block.get("type"), json.dumps(body, default=str))
+            if block.get("children"):
+                yield from self._flatten_blocks(page_id, block["id"], block["children"], counter)
+
+    def _delete_pages(self, page_ids: List[str]) -> None:
+        if not page_ids:
+            return
+        with self.conn:
+            self.conn.executemany("DELETE FROM blocks WHERE page_id = ?", [(p,) for p in page_ids])
+            self.conn.executemany("DELETE FROM pages WHERE id = ?", [(p,) for p in page_ids])
+
+
+# =============================================================================
+# SIMULATION (recorded-style fixture served by a local stub client)
+# =============================================================================
+
+class FixtureNotionClient:
+    """
+    Minimal stand-in for ``notion_client.Client`` that serves Notion-shaped
+    JSON from a fixture, with an artificial per-request latency.
+
+    Fixture shape::
+
+        {"databases": {"<db_id>": [<page>, ...]},
+         "blocks": {"<block_id>": [<block>, ...]}}
+    """
+
+    def __init__(self, fixture: Dict[str, Any], latency_ms: float = 150.0):
+        self.fixture = fixture
+        self.latency = latency_ms / 1000
+        self.calls = 0
+        self.databases = _Endpoint(self._query)
+        self.blocks = type("Blocks", (), {})()
+        self.blocks.children = _Endpoint(self._children, name="list")
+
+    def _sleep(self):
+        self.calls += 1
+        time.sleep(self.latency)
+
+    def _query(self, database_id, filter=None, page_size=100, start_cursor=None, sorts=None):
+        self._sleep()
+        pages = list(self.fixture["databases"].get(database_id, []))
+        if filter and "title" in filter:
+            needle = filter["title"]["contains"].lower()
+            pages = [p for p in pages if needle in _title_of(p).lower()]
+        elif filter and filter.get("timestamp") == "last_edited_time":
+            after = filter["last_edited_time"]["on_or_after"]
+            pages = [p for p in pages if p["last_edited_time"] >= after]
+        if sorts:
+            pages.sort(key=lambda p: p["last_edited_time"])
+        offset = int(start_cursor or 0)
+        window = pages[offset:offset + page_size]
+        more = offset + page_size < len(pages)
+        return {"results": window, "has_more": more, "next_cursor": str(offset + page_size) if more else None}
+
+    def _children(self, block_id, start_cursor=None, page_size=100):
+        self._sleep()
+        return {"results": self.fixture["blocks"].get(block_id, []), "has_more": False, "next_cursor": None}
+
+
+class _Endpoint:
+    def __init__(self, fn, name: str = "query"):
+        setattr(self, name, fn)
+
+
+def _fixture_page(page_id: str, name: str, edited: str, extra: Dict[str, str]) -> Dict[str, Any]:
+    properties = {"Name": {"type": "title", "title": [{"plain_text": name}]}}
+    for prop, text in extra.items():
+        properties[prop] = {"type": "rich_text", "rich_text": [{"plain_text": text}]}
+    return {
+        "object": "page", "id": page_id, "url": f"https://www.notion.so/{page_id}",
+        "created_time": "2025-01-01T00:00:00.000Z", "last_edited_time": edited,
+        "archived": False, "properties": properties,
+    }
+
+
+def build_fixture(pages_per_db: int = 40) -> Dict[str, Any]:
+    """Synthetic Notion responses for the four canonical lookup databases."""
+    fixture: Dict[str, Any] = {"databases": {}, "blocks": {}}
+    names = {
+        "archetypes": ["Navigator", "Guardian", "Oracle", "Weaver", "Alchemist"],
+        "realms": ["Atlantean Crystal Spine", "Celtic Underworld", "Star Temple", "Desert of Echoes"],
+        "frequencies": ["Gamma Flash", "Theta Drop", "Alpha Bridge", "Delta Descent"],
+        "rituals": ["Dawn Awakening Activation", "Moon Gate Closing", "Heart Fire Ceremony"],
+    }
+    for key, base in names.items():
+        db_id = f"db-{key}"
+        pages = []
+        for i in range(pages_per_db):
+            name = base[i] if i < len(base) else f"{base[i % len(base)]} Variant {i}"
+            page_id = f"{key}-{i:03d}"
+            pages.append(_fixture_page(page_id, name, f"2025-06-01T00:{i % 60:02d}:00.000Z",
+                                       {"Description": f"{name} description", "Shadow Aspect": f"{name} shadow"}))
+            fixture["blocks"][page_id] = [
+                {"object": "block", "id": f"{page_id}-b1", "type": "paragraph", "has_children": True,
+                 "paragraph": {"rich_text": [{"plain_text": f"{name} overview"}]}},
+            ]
+            fixture["blocks"][f"{page_id}-b1"] = [
+                {"object": "block", "id": f"{page_id}-b2", "type": "bulleted_list_item", "has_children": False,
+                 "bulleted_list_item": {"rich_text": [{"plain_text": "detail"}]}},
+            ]
+        fixture["databases"][db_id] = pages
+    return fixture
+
+
+def simulate(latency_ms: float = 150.0, lookups: int = 2000) -> Dict[str, Any]:
+    """
+    Sync the fixture into a temporary mirror, edit one page and re-sync
+    incrementally, then compare live vs mirrored lookup latency.
+    """
+    import tempfile
+    from .notion_knowledge_retriever import NotionKnowledgeRetriever
+
+    fixture = build_fixture()
+    client = FixtureNotionClient(fixture, latency_ms=latency_ms)
+    config = {
+        "databases": {key: {"id": f"db-{key}"} for key in ("archetypes", "realms", "frequencies", "rituals")},
+        "extraction": {"max_depth": 10},
+    }
+    retriever = NotionKnowledgeRetriever(client=client, config=config)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        mirror = NotionMirror(Path(tmp) / "mirror.sqlite")
+
+        start, calls = time.perf_counter(), client.calls
+        full = mirror.sync(retriever)
+        full_stats = {"seconds": round(time.perf_counter() - start, 2), "api_calls": client.calls - calls}
+
+        edited = fixture["databases"]["db-archetypes"][0]
+        edited["last_edited_time"] = "2025-07-01T12:00:00.000Z"
+        edited["properties"]["Shadow Aspect"]["rich_text"][0]["plain_text"] = "Navigator shadow (revised)"
+
+        start, calls = time.perf_counter(), client.calls
+        incremental = mirror.sync(retriever)
+        incremental_stats = {"seconds": round(time.perf_counter() - start, 2), "api_calls": client.calls - calls}
+
+        start = time.perf_counter()
+        live = retriever.query_database("archetypes", filter_name="Navigator")[0]
+        live_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        cold = mirror.lookup("archetypes", "Navigator")
+        cold_us = (time.perf_counter() - start) * 1e6
+
+        # knowledge_tools.get_archetype against this mirror, after warm-up
+        from . import knowledge_tools
+        knowledge_tools._mirror = mirror
+        knowledge_tools.clear_lookup_cache()
+        warm_entry = knowledge_tools.get_archetype("Navigator")
+        start = time.perf_counter()
+        for _ in range(lookups):
+            knowledge_tools.get_archetype("Navigator")
+        warm_us = (time.perf_counter() - start) * 1e6 / lookups
+        knowledge_tools._mirror = None
+        knowledge_tools.clear_lookup_cache()
+
+        return {
+            "full_sync": {**full_stats, "databases": full},
+            "incremental_sync": {**incremental_stats, "databases": incremental},
+            "live_lookup_ms": round(live_ms, 1),
+            "mirror_lookup_us": round(cold_us, 1),
+            "warm_lookup_us": round(warm_us, 2),
+            "matches_live": cold == live == warm_entry,
+            "revised_value": cold.get("Shadow Aspect"),
+        }
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Local SQLite mirror of the Notion knowledge databases")
+    parser.add_argument("--sync", action="store_true", help="Sync changed pages from Notion")
+    parser.add_argument("--full", action="store_true", help="With --sync: re-read everything and prune deleted pages")
+    parser.add_argument("--db", action="append", help="Database key to sync (repeatable; default: all configured)")
+    parser.add_argument("--no-blocks", action="store_true", help="With --sync: mirror properties only")
+    parser.add_argument("--stats", action="store_true", help="Show mirror contents and sync ages")
+    parser.add_argument("--lookup", nargs=2, metavar=("DB", "NAME"), help="Look up an entry in the mirror")
+    parser.add_argument("--simulate", action="store_true", help="Sync and benchmark against a local fixture")
+    parser.add_argument("--latency-ms", type=float, default=150.0, help="Simulated Notion API latency (default: 150)")
+    parser.add_argument("--mirror", type=Path, help="Mirror database path")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    if args.simulate:
+        report = simulate(latency_ms=args.latency_ms)
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            full, inc = report["full_sync"], report["incremental_sync"]
+            print(f"Full sync:         {full['seconds']}s, {full['api_calls']} API calls")
+            print(f"Incremental sync:  {inc['seconds']}s, {inc['api_calls']} API calls "
+                  f"({sum(d['updated'] for d in inc['databases'].values())} page updated)")
+            print(f"Live lookup:       {report['live_lookup_ms']} ms")
+            print(f"Mirror lookup:     {report['mirror_lookup_us']} µs (SQLite)")
+            print(f"Warm lookup:       {report['warm_lookup_us']} µs (knowledge_tools.get_archetype)")
+            print(f"Matches live:      {report['matches_live']}")
+        return
+
+    mirror = NotionMirror(args.mirror)
+
+    if args.sync:
+        from .notion_knowledge_retriever import NotionKnowledgeRetriever
+        report = mirror.sync(NotionKnowledgeRetriever(), args.db, full=args.full,
+                             include_blocks=not args.no_blocks)
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            for key, counts in report.items():
+                print(f"  ✓ {key}: {counts['fetched']} fetched, {counts['updated']} updated, {counts['pruned']} pruned")
+
+    if args.stats:
+        stats = mirror.stats()
+        if args.json:
+            print(json.dumps(stats, indent=2))
+        elif not stats:
+            print("Mirror is empty. Run with --sync first.")
+        else:
+            for row in stats:
+                age = mirror.age_hours(row["database_key"])
+                print(f"  {row['database_key']:14} {row['pages']:>5} pages {row['blocks']:>6} blocks  "
+                      f"synced {age:.1f}h ago")
+
+    if args.lookup:
+        entry = mirror.lookup(*args.lookup)
+        if entry is None:
+            print(f"Not found in mirror: {args.lookup[1]}")
+            sys.exit(1)
+        print(json.dumps(entry, indent=2, default=str))
+
+    if not (args.sync or args.stats or args.lookup):
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,7 @@ import yaml
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utilities.estimate_duration import estimate_duration, compare_with_target, suggest_adjustments
+from utilities.knowledge_snapshot import load_knowledge
 
 
 def load_manifest(session_path: Path) -> Optional[Dict]:
@@ -54,8 +55,7 @@ def load_lessons_learned() -> Dict:
     """Load lessons from knowledge base."""
     lessons_path = Path('knowledge/lessons_learned.yaml')
     if lessons_path.exists():
-        with open(lessons_path, 'r') as f:
-            return yaml.safe_load(f) or {}
+        return load_knowledge(lessons_path.resolve()) or {}
     return {}
 
 
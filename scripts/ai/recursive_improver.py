@@ -35,6 +35,7 @@ import yaml
 from .learning.feedback_store import FeedbackStore, OutcomeRecord, generate_record_id
 from .learning.effectiveness_engine import EffectivenessEngine
 from .learning.lessons_manager import LessonsManager
+from .learning.lesson_rankings import LessonRankings
 
 
 @dataclass
@@ -117,6 +118,13 @@ class RecursiveImprover:
             self.project_root / 'knowledge'
         )
 
+        # Materialized ranking table, updated by every effectiveness write
+        self.rankings = LessonRankings(
+            self.effectiveness_engine,
+            self.project_root / 'knowledge' / 'feedback' / 'lesson_rankings.db'
+        )
+        self.feedback_store.rankings = self.rankings
+
         # Track current improvement cycle
         self.current_cycle: Optional[ImprovementCycle] = None
 
@@ -161,14 +169,23 @@ class RecursiveImprover:
         # Get all lessons
         all_lessons = self.lessons_manager.get_lessons()
 
-        # Get ranked lessons from effectiveness engine
-        ranked = self.effectiveness_engine.get_ranked_lessons(
-            lessons=all_lessons,
+        # Top-k query against the ranking table (rebuilt first if the
+        # feedback YAML was changed by another process)
+        self.rankings.ensure_fresh(all_lessons)
+        top = self.rankings.top_k(
+            context_key=self.effectiveness_engine._context_to_key(context),
             category=category,
-            context=context,
             limit=limit * 2  # Get more to filter
         )
 
+        by_id = {}
+        for lesson in all_lessons:
+            by_id.setdefault(lesson.get('id'), lesson)
+        ranked = [
+            {**by_id[lesson_id], 'effectiveness_score': score}
+            for lesson_id, score in top
+        ]
+
         # Filter by confidence (only apply high/medium confidence)
         filtered = [
             l for l in ranked
@@ -3,11 +3,18 @@
 VTT Subtitle Generator for Dreamweaving
 
 Generates properly-timed WebVTT subtitles from SSML scripts.
-Scales timing to match actual audio duration.
+
+When the voice track has a timing sidecar (output/voice.timing.json, written
+by generate_audio_chunked.py) cues come from the recorded chunk and break
+offsets, optionally refined to speech onsets. Otherwise timing is estimated
+from word counts and scaled to the actual audio duration.
 
 Usage:
     python3 scripts/ai/vtt_generator.py sessions/{session}
     python3 scripts/ai/vtt_generator.py sessions/{session} --audio output/final.mp3
+    python3 scripts/ai/vtt_generator.py sessions/{session} --refine      # onset-refined cues
+    python3 scripts/ai/vtt_generator.py sessions/{session} --estimate    # ignore sidecar
+    python3 scripts/ai/vtt_generator.py --simulate                       # timing accuracy check
 """
 
 import re
@@ -19,6 +26,10 @@ from typing import List, Dict, Optional
 import subprocess
 import json
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
 
 def parse_time_string(time_str: str) -> float:
     """Parse SSML time string like '1.5s' or '1200ms' to seconds."""
@@ -176,6 +187,66 @@ def merge_short_segments(segments: List[Dict], min_duration: float = 2.0, max_ch
     return merged
 
 
+def split_phrase_cues(words: List, max_chars: int = 80) -> List[Dict]:
+    """Split a phrase's timed words into cues at sentence ends or ``max_chars``."""
+    cues = []
+    current = []
+
+    def flush():
+        if current:
+            cues.append({
+                'start': current[0][1],
+                'end': current[-1][2],
+                'text': ' '.join(w for w, _, _ in current),
+            })
+            current.clear()
+
+    for word, start, end in words:
+        if current and len(' '.join(w for w, _, _ in current)) + 1 + len(word) > max_chars:
+            flush()
+        current.append((word, start, end))
+        if word.endswith(('.', '!', '?')) and len(' '.join(w for w, _, _ in current)) >= max_chars // 2:
+            flush()
+    flush()
+    return cues
+
+
+def timing_segments(
+    timing: Dict,
+    audio_path: Optional[str] = None,
+    refine: bool = False,
+    max_chars: int = 80
+) -> List[Dict]:
+    """Build segments from a timing sidecar.
+
+    Args:
+        timing: Loaded sidecar (see scripts/core/speech_timing.py)
+        audio_path: Voice audio the sidecar describes (needed for refine)
+        refine: Snap cue edges to speech onsets and split long phrases by
+            estimated word boundaries (energy-based, no ASR)
+        max_chars: Longest refined cue
+
+    Returns:
+        Segments with start/end/text, on the voice track timeline
+    """
+    from scripts.core.speech_timing import load_audio_samples, refine_phrase, sidecar_segments
+
+    if not refine or not audio_path:
+        return sidecar_segments(timing)
+
+    rate = int(timing['sample_rate'])
+    samples = load_audio_samples(Path(audio_path), rate)
+    segments = []
+    for chunk in timing['chunks']:
+        for phrase in chunk['phrases']:
+            refined = refine_phrase(samples, rate, phrase['start_sample'], phrase['end_sample'], phrase['text'])
+            if refined['words']:
+                segments.extend(split_phrase_cues(refined['words'], max_chars))
+            else:
+                segments.append({'start': refined['start'], 'end': refined['end'], 'text': phrase['text']})
+    return segments
+
+
 def generate_vtt(segments: List[Dict]) -> str:
     """Generate VTT content from segments."""
     vtt_lines = ["WEBVTT", "Kind: captions", "Language: en", ""]
@@ -191,13 +262,162 @@ def generate_vtt(segments: List[Dict]) -> str:
     return '\n'.join(vtt_lines)
 
 
+def _write_outputs(session_path: Path, output: Optional[str], segments: List[Dict]):
+    """Write the VTT (and the youtube_package copy if that folder exists)."""
+    # Generate VTT
+    vtt_content = generate_vtt(segments)
+
+    # Determine output path
+    if output:
+        vtt_path = Path(output)
+    else:
+        vtt_path = session_path / 'output' / 'subtitles.vtt'
+
+    # Ensure output directory exists
+    vtt_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Save VTT
+    with open(vtt_path, 'w') as f:
+        f.write(vtt_content)
+
+    print(f"\n✓ Saved: {vtt_path}")
+    print(f"  Total captions: {len(segments)}")
+
+    # Also save to youtube_package if it exists
+    youtube_path = session_path / 'output' / 'youtube_package' / 'subtitles.vtt'
+    if youtube_path.parent.exists():
+        with open(youtube_path, 'w') as f:
+            f.write(vtt_content)
+        print(f"  Also saved: {youtube_path}")
+
+
+
+def _speech_fixture(rng, chunks: int, sample_rate: int):
+    """Synthetic speech-like chunks with known phrase onsets.
+
+    Words are noise bursts with a 10 ms attack and syllable-rate modulation,
+    separated by short gaps; sentences end with natural pauses and phrases
+    with SSML breaks (silence). Each chunk gets its own speaking rate so
+    word-count estimates drift the way real sections do.
+    """
+    import numpy as np
+
+    def silence(seconds):
+        return rng.normal(0, 1e-4, int(seconds * sample_rate)).astype(np.float32)
+
+    def word_audio(chars, rate):
+        n = int((0.055 * chars + 0.06) * rate * sample_rate)
+        t = np.arange(n) / sample_rate
+        attack = min(n, int(0.01 * sample_rate))
+        env = np.ones(n)
+        env[:attack] = 0.5 - 0.5 * np.cos(np.pi * np.arange(attack) / attack)
+        env[-attack:] = np.minimum(env[-attack:], env[:attack][::-1])
+        env *= 0.6 + 0.4 * np.sin(2 * np.pi * 4 * t) ** 2
+        noise = np.convolve(rng.normal(0, 1, n), np.ones(4) / 4, mode='same')
+        return (0.3 * env * noise).astype(np.float32)
+
+    vocab = ['breathe', 'light', 'deeper', 'soft', 'becoming', 'sacred', 'calm', 'you', 'notice',
+             'gently', 'the', 'warm', 'river', 'of', 'stillness', 'opening', 'now', 'and', 'feel']
+    chunk_ssml, chunk_audio, chunk_starts, phrase_onsets = [], [], [], []
+    offset = 0
+    for _ in range(chunks):
+        rate = rng.uniform(0.8, 1.3)
+        lines, parts = [], [silence(rng.uniform(0.03, 0.12))]
+        for _ in range(int(rng.integers(4, 9))):
+            position = sum(len(p) for p in parts)
+            sentences = []
+            for sentence_index in range(int(rng.integers(1, 4))):
+                words = list(rng.choice(vocab, int(rng.integers(5, 13))))
+                for w, word in enumerate(words):
+                    if w == 0 and sentence_index == 0:
+                        phrase_onsets.append(offset + position)
+                    parts.append(word_audio(len(word), rate))
+                    parts.append(silence(rng.uniform(0.02, 0.07)))
+                    position = sum(len(p) for p in parts)
+                parts.append(silence(rng.uniform(0.25, 0.5)))
+                sentences.append(' '.join(words).capitalize() + '.')
+            pause = float(rng.choice([1.0, 1.5, 2.0, 3.0]))
+            parts.append(silence(pause + rng.uniform(0, 0.12)))
+            lines.append(f'{" ".join(sentences)} <break time="{pause}s"/>')
+        parts.append(silence(rng.uniform(0.1, 0.25)))
+        audio = np.concatenate(parts)
+        chunk_ssml.append('<speak><prosody rate="0.85">\n' + '\n'.join(lines) + '\n</prosody></speak>')
+        chunk_audio.append(audio)
+        chunk_starts.append(offset)
+        offset += len(audio)
+    return chunk_ssml, chunk_audio, chunk_starts, phrase_onsets
+
+
+def simulate(chunks: int = 12, seed: int = 7, sample_rate: int = 24000) -> Dict:
+    """Compare sidecar, refined and estimated cue timing on synthetic speech."""
+    import numpy as np
+    from scripts.core.speech_timing import (
+        ANALYSIS_HOP_SECONDS, build_timing_sidecar, refine_phrase, sidecar_segments,
+    )
+
+    rng = np.random.default_rng(seed)
+    chunk_ssml, chunk_audio, chunk_starts, onsets = _speech_fixture(rng, chunks, sample_rate)
+    timing = build_timing_sidecar(chunk_ssml, chunk_audio, sample_rate, 'fixture.wav')
+    samples = np.concatenate(chunk_audio)
+    frame = ANALYSIS_HOP_SECONDS
+
+    # Chunk offsets recorded in the sidecar vs. where the chunks were concatenated
+    chunk_errors = [c['start_sample'] - t for c, t in zip(timing['chunks'], chunk_starts)]
+
+    phrases = [p for c in timing['chunks'] for p in c['phrases']]
+    refined_starts = np.array([
+        refine_phrase(samples, sample_rate, p['start_sample'], p['end_sample'], p['text'])['start']
+        for p in phrases
+    ])
+    truth = np.array(onsets) / sample_rate
+    refined_error = np.abs(refined_starts - truth)
+    first_in_chunk = np.cumsum([0] + [len(c['phrases']) for c in timing['chunks']])[:-1]
+
+    # Legacy path: word-count estimate over the whole script, scaled to duration
+    body = '\n'.join(re.search(r'<prosody[^>]*>(.*)</prosody>', c, re.DOTALL).group(1) for c in chunk_ssml)
+    legacy = parse_ssml_to_segments('<speak>\n<prosody rate="0.85">' + body + '</prosody>\n</speak>')
+    scale = (len(samples) / sample_rate) / legacy[-1]['end']
+    legacy_error = np.abs(np.array([seg['start'] * scale for seg in legacy]) - truth)
+
+    breaks = [b for c in timing['chunks'] for b in c['breaks']]
+    sidecar_starts = np.array([seg['start'] for seg in sidecar_segments(timing)])
+    return {
+        'chunks': chunks,
+        'phrases': len(phrases),
+        'duration_seconds': round(len(samples) / sample_rate, 1),
+        'frame_ms': frame * 1000,
+        'breaks_located': f"{sum(b['detected'] for b in breaks)}/{len(breaks)}",
+        'chunk_offset_error_samples': int(np.max(np.abs(chunk_errors))),
+        'refined_chunk_boundary_error_ms': round(float(refined_error[first_in_chunk].max()) * 1000, 2),
+        'refined_max_error_ms': round(float(refined_error.max()) * 1000, 2),
+        'refined_within_one_frame': f"{int((refined_error <= frame).sum())}/{len(phrases)}",
+        'sidecar_cue_lead_ms_max': round(float((truth - sidecar_starts).max()) * 1000, 1),
+        'estimate_max_error_s': round(float(legacy_error.max()), 2),
+        'estimate_chunk_boundary_error_s': round(float(legacy_error[first_in_chunk].max()), 2),
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(description='Generate VTT subtitles from SSML')
-    parser.add_argument('session_path', help='Path to session directory')
+    parser.add_argument('session_path', nargs='?', help='Path to session directory')
     parser.add_argument('--audio', help='Path to audio file for duration scaling')
     parser.add_argument('--output', help='Output VTT path (default: output/subtitles.vtt)')
+    parser.add_argument('--timing', help='Timing sidecar (default: output/voice.timing.json if present)')
+    parser.add_argument('--estimate', action='store_true', help='Ignore the timing sidecar; estimate from word counts')
+    parser.add_argument('--refine', action='store_true', help='Refine sidecar cues to speech onsets (decodes the voice track)')
+    parser.add_argument('--simulate', action='store_true', help='Check cue timing accuracy on synthetic speech')
     args = parser.parse_args()
 
+    if args.simulate:
+        report = simulate()
+        print("Cue timing on synthetic speech fixtures")
+        for key, value in report.items():
+            print(f"  {key:34} {value}")
+        return
+
+    if not args.session_path:
+        parser.error('session_path is required')
+
     session_path = Path(args.session_path)
 
     # Find SSML file
@@ -222,6 +442,21 @@ def main():
     with open(ssml_path, 'r') as f:
         ssml_content = f.read()
 
+    # Exact timing from the TTS sidecar when available
+    timing_path = Path(args.timing) if args.timing else session_path / 'output' / 'voice.timing.json'
+    if not args.estimate and timing_path.exists():
+        from scripts.core.speech_timing import load_timing_sidecar
+
+        timing = load_timing_sidecar(timing_path)
+        # Refinement analyses the voice track itself, not the mixed final audio
+        voice_path = str(timing_path.with_name(timing.get('audio') or 'voice.mp3'))
+        segments = timing_segments(timing, voice_path, refine=args.refine)
+        print(f"  Timing sidecar: {timing_path} ({len(segments)} {'refined ' if args.refine else ''}segments)")
+        segments = merge_short_segments(segments)
+        print(f"  Merged to {len(segments)} display segments")
+        _write_outputs(session_path, args.output, segments)
+        return
+
     # Parse to segments
     segments = parse_ssml_to_segments(ssml_content)
     print(f"  Parsed {len(segments)} raw segments")
@@ -258,31 +493,8 @@ def main():
                 seg['start'] *= scale
                 seg['end'] *= scale
 
-    # Generate VTT
-    vtt_content = generate_vtt(segments)
-
-    # Determine output path
-    if args.output:
-        vtt_path = Path(args.output)
-    else:
-        vtt_path = session_path / 'output' / 'subtitles.vtt'
-
-    # Ensure output directory exists
-    vtt_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Save VTT
-    with open(vtt_path, 'w') as f:
-        f.write(vtt_content)
+    _write_outputs(session_path, args.output, segments)
 
-    print(f"\n✓ Saved: {vtt_path}")
-    print(f"  Total captions: {len(segments)}")
-
-    # Also save to youtube_package if it exists
-    youtube_path = session_path / 'output' / 'youtube_package' / 'subtitles.vtt'
-    if youtube_path.parent.exists():
-        with open(youtube_path, 'w') as f:
-            f.write(vtt_content)
-        print(f"  Also saved: {youtube_path}")
 
 
 if __name__ == "__main__":
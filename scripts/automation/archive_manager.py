@@ -2,9 +2,14 @@
 """
 Archive Manager
 
-Moves uploaded sessions to archive folder to save disk space.
+Archives uploaded sessions to save disk space.
 
-Sessions are archived after successful YouTube upload.
+Sessions are archived after successful YouTube upload, in the tiered
+format of scripts/automation/session_archive.py: regenerable intermediates
+are dropped, WAV stems are stored as FLAC and everything else goes into a
+seekable zstd tar. Single files can be restored without unpacking the rest.
+Without zstandard installed (or with ``archive.tiered: false``) session
+folders are moved as before; both kinds of archive can be restored.
 
 Usage:
     # Archive all uploaded sessions
@@ -18,6 +23,13 @@ Usage:
 
     # Show sessions pending archive
     python -m scripts.automation.archive_manager --pending
+
+    # Restore a whole session, or only some of its files
+    python -m scripts.automation.archive_manager --restore my-session
+    python -m scripts.automation.archive_manager --restore my-session --files output/final_master.mp3
+
+    # List an archived session's files
+    python -m scripts.automation.archive_manager --list my-session
 """
 
 import argparse
@@ -27,6 +39,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from scripts.automation import session_archive
+from scripts.automation.session_archive import SessionArchive, write_archive
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,6 +63,14 @@ class ArchiveManager:
 
         self.sessions_dir = Path(__file__).parent.parent.parent / 'sessions'
 
+        archive_config = config['archive']
+        self.tiered = archive_config.get('tiered', True)
+        if self.tiered and not session_archive.HAS_ZSTD:
+            logger.warning("zstandard not installed; archiving by moving session folders")
+            self.tiered = False
+        self.drop_intermediates = archive_config.get('drop_intermediates', True)
+        self.workers = archive_config.get('workers')
+
     def archive_session(
         self,
         session_name: str,
@@ -55,7 +78,8 @@ class ArchiveManager:
     ) -> bool:
         """Archive a single session.
 
-        Moves session folder from sessions/ to archive/.
+        Writes a tiered archive to archive/ and removes the session folder
+        (or moves the folder when tiered archiving is off).
 
         Args:
             session_name: Session identifier
@@ -81,12 +105,33 @@ class ArchiveManager:
         logger.info(f"  To: {archive_path}")
 
         if dry_run:
-            logger.info("  [DRY RUN] Would move session")
+            if self.tiered:
+                plan = session_archive.plan_archive(session_path, drop_intermediates=self.drop_intermediates)
+                logger.info(
+                    f"  [DRY RUN] Would archive {len(plan.flac)} stems as FLAC, pack {len(plan.pack)} files, "
+                    f"drop {len(plan.dropped)} intermediates"
+                )
+            else:
+                logger.info("  [DRY RUN] Would move session")
             return True
 
         try:
-            # Move entire folder
-            shutil.move(str(session_path), str(archive_path))
+            if self.tiered:
+                stats = write_archive(
+                    session_path,
+                    archive_path,
+                    workers=self.workers,
+                    drop_intermediates=self.drop_intermediates,
+                )
+                logger.info(
+                    f"  {stats['source_bytes'] / (1024**2):.0f} MB -> {stats['stored_bytes'] / (1024**2):.0f} MB "
+                    f"({stats['ratio']:.1f}x, {stats['flac']} FLAC, {stats['dropped']} dropped) "
+                    f"in {stats['seconds']:.1f}s"
+                )
+                shutil.rmtree(session_path)
+            else:
+                # Move entire folder
+                shutil.move(str(session_path), str(archive_path))
 
             # Update database
             self.db.mark_archived(session_name, str(archive_path))
@@ -149,12 +194,22 @@ class ArchiveManager:
         # Count archived sessions
         archived_count = len(list(self.archive_dir.iterdir())) if self.archive_dir.exists() else 0
 
-        # Calculate archive size
+        # Calculate archive size, and what tiered archives held before archiving
         archive_size = 0
+        source_size = 0
         if self.archive_dir.exists():
             for path in self.archive_dir.rglob('*'):
                 if path.is_file():
                     archive_size += path.stat().st_size
+            for index_path in self.archive_dir.glob(f"*/{session_archive.INDEX_NAME}"):
+                try:
+                    archive = SessionArchive(index_path.parent)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Unreadable archive index {index_path}: {e}")
+                    continue
+                stored = sum(p.stat().st_size for p in index_path.parent.rglob('*') if p.is_file())
+                source_size += sum(entry['size'] for entry in archive.files.values()) - stored
+        source_size += archive_size
 
         # Count active sessions
         active_count = len(list(self.sessions_dir.iterdir())) if self.sessions_dir.exists() else 0
@@ -169,6 +224,7 @@ class ArchiveManager:
         return {
             'archived_sessions': archived_count,
             'archive_size_gb': round(archive_size / (1024**3), 2),
+            'archive_source_gb': round(source_size / (1024**3), 2),
             'active_sessions': active_count,
             'active_size_gb': round(active_size / (1024**3), 2),
             'archive_dir': str(self.archive_dir),
@@ -177,24 +233,34 @@ class ArchiveManager:
     def restore_session(
         self,
         session_name: str,
-        dry_run: bool = False
+        dry_run: bool = False,
+        files: Optional[List[str]] = None
     ) -> bool:
         """Restore an archived session back to active.
 
+        With ``files``, only those files (paths relative to the session,
+        e.g. 'output/final_master.mp3') are extracted into the session
+        folder and the archive stays as it is.
+
         Args:
             session_name: Session identifier
             dry_run: If True, don't actually move files
+            files: Restore only these files from a tiered archive
 
         Returns:
             True on success
         """
         archive_path = self.archive_dir / session_name
         session_path = self.sessions_dir / session_name
+        tiered = SessionArchive.is_archive(archive_path)
 
         if not archive_path.exists():
             logger.error(f"Archived session not found: {archive_path}")
             return False
 
+        if files:
+            return self._restore_files(session_name, archive_path, session_path, files, dry_run)
+
         if session_path.exists():
             logger.error(f"Active session already exists: {session_path}")
             return False
@@ -206,7 +272,18 @@ class ArchiveManager:
             return True
 
         try:
-            shutil.move(str(archive_path), str(session_path))
+            if tiered:
+                staging = session_path.with_name(f".{session_name}.restoring")
+                if staging.exists():
+                    shutil.rmtree(staging)
+                stats = SessionArchive(archive_path).extract_all(staging, workers=self.workers)
+                staging.rename(session_path)
+                shutil.rmtree(archive_path)
+                logger.info(f"  Restored {stats['files']} files in {stats['seconds']:.1f}s")
+                for stage, dropped in stats['dropped'].items():
+                    logger.info(f"  Not archived (regenerate with the '{stage}' stage): {', '.join(dropped)}")
+            else:
+                shutil.move(str(archive_path), str(session_path))
 
             # Update database
             self.db.update(
@@ -224,6 +301,53 @@ class ArchiveManager:
             logger.error(f"  Failed to restore: {e}")
             return False
 
+    def _restore_files(
+        self,
+        session_name: str,
+        archive_path: Path,
+        session_path: Path,
+        files: List[str],
+        dry_run: bool
+    ) -> bool:
+        """Extract selected files of an archived session, leaving the archive in place."""
+        if not SessionArchive.is_archive(archive_path):
+            logger.error(f"Not a tiered archive (restore the whole session instead): {archive_path}")
+            return False
+
+        archive = SessionArchive(archive_path)
+        missing = [rel for rel in files if rel not in archive.files]
+        if missing:
+            logger.error(f"Not in archive {session_name}: {', '.join(missing)}")
+            return False
+
+        logger.info(f"Restoring {len(files)} file(s) from: {session_name}")
+        if dry_run:
+            logger.info("  [DRY RUN] Would restore files")
+            return True
+
+        try:
+            for rel in files:
+                archive.extract(rel, session_path / rel)
+                logger.info(f"  {rel}")
+            return True
+        except Exception as e:
+            logger.error(f"  Failed to restore: {e}")
+            return False
+
+    def list_archive(self, session_name: str) -> Dict[str, Dict[str, Any]]:
+        """Get the index entries of an archived session.
+
+        Args:
+            session_name: Session identifier
+
+        Returns:
+            Dict of relative path -> entry (tier, size, ...); empty if not a tiered archive
+        """
+        archive_path = self.archive_dir / session_name
+        if not SessionArchive.is_archive(archive_path):
+            return {}
+        return SessionArchive(archive_path).files
+
     def cleanup_incomplete(self, dry_run: bool = False) -> int:
         """Clean up incomplete/failed sessions from active directory.
 
@@ -287,6 +411,9 @@ def main():
     parser.add_argument('--pending', action='store_true', help='Show pending archives')
     parser.add_argument('--stats', action='store_true', help='Show archive stats')
     parser.add_argument('--restore', type=str, help='Restore archived session')
+    parser.add_argument('--files', nargs='+', metavar='PATH',
+                        help='With --restore: only these files (relative to the session)')
+    parser.add_argument('--list', type=str, metavar='SESSION', help="List an archived session's files")
     parser.add_argument('--cleanup', action='store_true', help='Clean up failed sessions')
     parser.add_argument('--config', type=str, help='Config file path')
 
@@ -305,7 +432,7 @@ def main():
         stats = manager.get_archive_stats()
         print(f"Archive directory: {stats['archive_dir']}")
         print(f"Archived sessions: {stats['archived_sessions']}")
-        print(f"Archive size: {stats['archive_size_gb']} GB")
+        print(f"Archive size: {stats['archive_size_gb']} GB (from {stats['archive_source_gb']} GB)")
         print(f"Active sessions: {stats['active_sessions']}")
         print(f"Active size: {stats['active_size_gb']} GB")
 
@@ -319,8 +446,16 @@ def main():
                 print(f"  - {session['session_name']}")
             print(f"\nTotal: {len(pending)}")
 
+    elif args.list:
+        entries = manager.list_archive(args.list)
+        if not entries:
+            print(f"No tiered archive for: {args.list}")
+        for rel, entry in entries.items():
+            note = f"  (regenerate: {entry['stage']})" if entry['tier'] == 'dropped' else ""
+            print(f"  {entry['tier']:<8} {entry['size'] / (1024**2):>9.1f} MB  {rel}{note}")
+
     elif args.restore:
-        success = manager.restore_session(args.restore, args.dry_run)
+        success = manager.restore_session(args.restore, args.dry_run, files=args.files)
         if success:
             print(f"Restored: {args.restore}")
         else:
@@ -6,12 +6,19 @@ ML-based content tagging for Dreamweaving sessions.
 
 import yaml
 import re
+import sys
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Set, Tuple
+from typing import Optional, List, Dict, Any, Set, Tuple, Sequence
 from collections import Counter
 import math
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.core.categorization.model import KeywordModel, load_model
+
 
 @dataclass
 class TagSuggestion:
@@ -117,6 +124,19 @@ class AutoTagger:
         self.project_root = project_root or Path(__file__).parents[2]
         self.sessions_path = self.project_root / 'sessions'
         self.knowledge_path = self.project_root / 'knowledge'
+        self.model_path = self.project_root / 'data' / 'categorization' / 'tags.npz'
+        self._model: Optional[KeywordModel] = None
+
+    @property
+    def keyword_model(self) -> KeywordModel:
+        """TAG_CATEGORIES compiled for batch tagging (loaded or rebuilt on first use)."""
+        if self._model is None:
+            vocabulary = {
+                category: {'keywords': list(keywords)}
+                for category, keywords in self.TAG_CATEGORIES.items()
+            }
+            self._model = load_model(self.model_path, vocabulary, mode='prefix')
+        return self._model
 
     def _load_session_manifest(self, session_name: str) -> Optional[Dict[str, Any]]:
         """Load manifest from session directory."""
@@ -126,13 +146,18 @@ class AutoTagger:
         with open(manifest_path, 'r') as f:
             return yaml.safe_load(f)
 
-    def _extract_text_content(self, session_name: str) -> str:
+    def _extract_text_content(
+        self,
+        session_name: str,
+        manifest: Optional[Dict[str, Any]] = None
+    ) -> str:
         """Extract all text content from session for analysis."""
         text_parts = []
         session_dir = self.sessions_path / session_name
 
         # Manifest
-        manifest = self._load_session_manifest(session_name)
+        if manifest is None:
+            manifest = self._load_session_manifest(session_name)
         if manifest:
             session = manifest.get('session', {})
             text_parts.extend([
@@ -208,18 +233,61 @@ class AutoTagger:
         """
         manifest = self._load_session_manifest(session_name)
         if not manifest:
-            return TaggingResult(
-                session_name=session_name,
-                suggested_tags=[],
-                category_tags=[],
-                theme_tags=[],
-                technique_tags=[],
-                duration_tag='',
-                depth_tag='',
-            )
+            return self._empty_result(session_name)
+
+        text_content = self._extract_text_content(session_name, manifest)
+        keyword_hits = {
+            category: self._calculate_keyword_score(keywords, text_content)[1]
+            for category, keywords in self.TAG_CATEGORIES.items()
+        }
+        return self._build_result(session_name, manifest, text_content, keyword_hits)
+
+    def auto_tag_batch(self, session_names: Sequence[str]) -> Dict[str, TaggingResult]:
+        """
+        Auto-tag many sessions at once.
+
+        Gives the same results as auto_tag() on each session. Each session's
+        text is tokenized once, and keyword hits for every tag category
+        come from one sparse product through the compiled keyword model.
+        """
+        manifests = {name: self._load_session_manifest(name) for name in session_names}
+        tagged = [name for name, manifest in manifests.items() if manifest]
+        texts = [self._extract_text_content(name, manifests[name]) for name in tagged]
+
+        model = self.keyword_model
+        counts = model.group(model.match_counts(model.vectorize(texts)), 'keywords') if texts else []
+        model.flush()
+
+        results = {name: self._empty_result(name) for name in manifests}
+        for i, name in enumerate(tagged):
+            keyword_hits = {
+                category: int(counts[i, model.label_index[category]])
+                for category in self.TAG_CATEGORIES
+            }
+            results[name] = self._build_result(name, manifests[name], texts[i], keyword_hits)
+        return results
+
+    @staticmethod
+    def _empty_result(session_name: str) -> TaggingResult:
+        return TaggingResult(
+            session_name=session_name,
+            suggested_tags=[],
+            category_tags=[],
+            theme_tags=[],
+            technique_tags=[],
+            duration_tag='',
+            depth_tag='',
+        )
 
+    def _build_result(
+        self,
+        session_name: str,
+        manifest: Dict[str, Any],
+        text_content: str,
+        keyword_hits: Dict[str, int]
+    ) -> TaggingResult:
+        """Assemble tags from keyword hit counts per tag category, patterns and the manifest."""
         session = manifest.get('session', {})
-        text_content = self._extract_text_content(session_name)
 
         all_suggestions = []
         category_tags = []
@@ -227,8 +295,9 @@ class AutoTagger:
         technique_tags = []
 
         # Category-based tagging
-        for category, keywords in self.TAG_CATEGORIES.items():
-            score, hits = self._calculate_keyword_score(keywords, text_content)
+        for category in self.TAG_CATEGORIES:
+            hits = keyword_hits[category]
+            score = min(hits / 10, 1.0)
             if score > 0.2:  # Threshold for inclusion
                 suggestion = TagSuggestion(
                     tag=category,
@@ -354,22 +423,24 @@ class AutoTagger:
     ) -> List[Dict[str, Any]]:
         """Tag all sessions in the project."""
         results = []
+        tagged = self.auto_tag_batch(self._session_names())
 
-        for session_dir in self.sessions_path.iterdir():
-            if not session_dir.is_dir():
-                continue
-            if session_dir.name.startswith(('_', '.', 'shorts')):
-                continue
-
-            result = self.auto_tag(session_dir.name)
+        for session_name, result in tagged.items():
             results.append({
-                'session': session_dir.name,
+                'session': session_name,
                 'tags': [s.tag for s in result.suggested_tags if s.confidence >= min_confidence],
                 'top_category': result.category_tags[0] if result.category_tags else None,
             })
 
         return results
 
+    def _session_names(self) -> List[str]:
+        """Session directories to tag, in directory order."""
+        return [
+            session_dir.name for session_dir in self.sessions_path.iterdir()
+            if session_dir.is_dir() and not session_dir.name.startswith(('_', '.', 'shorts'))
+        ]
+
     def suggest_missing_tags(self, session_name: str) -> List[TagSuggestion]:
         """
         Suggest tags that might be missing from a session.
@@ -396,26 +467,19 @@ class AutoTagger:
         min_overlap: int = 3
     ) -> List[Dict[str, Any]]:
         """Find sessions with similar tags."""
-        target_result = self.auto_tag(session_name)
-        target_tags = set(s.tag for s in target_result.suggested_tags)
+        others = [name for name in self._session_names() if name != session_name]
+        tagged = self.auto_tag_batch([session_name] + others)
+        target_tags = set(s.tag for s in tagged[session_name].suggested_tags)
 
         similar = []
 
-        for session_dir in self.sessions_path.iterdir():
-            if not session_dir.is_dir():
-                continue
-            if session_dir.name == session_name:
-                continue
-            if session_dir.name.startswith(('_', '.', 'shorts')):
-                continue
-
-            other_result = self.auto_tag(session_dir.name)
-            other_tags = set(s.tag for s in other_result.suggested_tags)
+        for other in others:
+            other_tags = set(s.tag for s in tagged[other].suggested_tags)
 
             overlap = target_tags & other_tags
             if len(overlap) >= min_overlap:
                 similar.append({
-                    'session': session_dir.name,
+                    'session': other,
                     'overlap_count': len(overlap),
                     'shared_tags': list(overlap),
                 })
@@ -3,10 +3,12 @@
 Blessing Clip Pipeline
 
 Fully automates:
-1) Audio extraction and Whisper transcription
+1) Audio extraction and Whisper transcription (cached by audio content hash)
 2) Segment detection (keywords + pause gaps)
-3) Clip slicing with ffmpeg
-4) Per-clip subtitles and optional burn-in/overlay
+3) Per-clip subtitles
+4) Rendering: trim, subtitle burn-in and overlay in one ffmpeg filter graph
+   per clip; dense segment runs share a single decode fanned out to several
+   outputs, and independent renders run on a bounded worker pool
 
 Usage:
     python -m scripts.automation.blessing_clip_pipeline \
@@ -18,16 +20,24 @@ Usage:
         --config config/blessing_clip_config.yaml \
         --transcript work/transcripts/dreamweaving.srt \
         --skip-transcription
+
+    # Compare legacy three-pass rendering with the fused renderer
+    python -m scripts.automation.blessing_clip_pipeline --benchmark
 """
 
 from __future__ import annotations
 
 import argparse
 import csv
+import hashlib
 import json
 import logging
+import os
 import shutil
 import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import timedelta
 from pathlib import Path
@@ -58,6 +68,15 @@ DEFAULT_CONFIG: Dict = {
     "overlay_enabled": True,
     "overlay": {"brightness": 0.05, "saturation": 1.1, "fade_duration": 0.4},
     "fallback_reencode": True,
+    "keep_raw_clips": True,
+    "render": {
+        "workers": None,
+        "preset": "veryfast",
+        "crf": 20,
+        "fanout_min_segments": 4,
+        "fanout_max_outputs": 8,
+        "fanout_max_gap_seconds": 30.0,
+    },
 }
 
 
@@ -85,6 +104,28 @@ class ClipArtifacts:
     final_overlay_path: Optional[Path] = None
 
 
+@dataclass
+class RenderJob:
+    """One output file cut from the source video.
+
+    A job without subtitles or overlay is a plain stream-copy slice; anything
+    else is rendered in a single filter graph.
+    """
+
+    segment: Segment
+    output_path: Path
+    srt_path: Optional[Path] = None
+    overlay: Optional[Dict] = None
+
+    @property
+    def duration(self) -> float:
+        return max(0.1, self.segment.end - self.segment.start)
+
+    @property
+    def is_copy(self) -> bool:
+        return self.srt_path is None and self.overlay is None
+
+
 def deep_merge(base: Dict, override: Dict) -> Dict:
     result = dict(base)
     for key, value in override.items():
@@ -141,6 +182,10 @@ def extract_audio(input_video: Path, audio_path: Path) -> None:
         "1",
         "-ar",
         "16000",
+        # Keep the WAV byte-identical across runs so it can key the transcript cache
+        "-map_metadata",
+        "-1",
+        "-bitexact",
         str(audio_path),
     ]
     run_cmd(cmd, "Audio extraction")
@@ -167,12 +212,50 @@ def run_whisper(audio_path: Path, transcript_dir: Path, model: str, language: st
 
     run_cmd(cmd, "Whisper transcription")
 
+    expected = transcript_dir / f"{audio_path.stem}.srt"
+    if expected.exists():
+        return expected
     srt_files = sorted(transcript_dir.glob("*.srt"))
     if not srt_files:
         raise RuntimeError("Whisper transcription completed but no SRT found")
     return srt_files[0]
 
 
+def transcript_cache_key(audio_path: Path, model: str, language: str) -> str:
+    """Content hash of the audio plus the ASR settings that shape the transcript."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(audio_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    digest.update(f"\0{model}\0{language or ''}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def transcribe_cached(audio_path: Path, transcript_dir: Path, model: str, language: str) -> Path:
+    """Run Whisper only when this audio/model/language has not been transcribed.
+
+    Transcripts are stored as ``transcript_dir/.cache/<key>.srt`` and mirrored to
+    ``transcript_dir/<audio stem>.srt`` (where Whisper itself would write), so
+    reruns over the same source skip ASR entirely.
+    """
+    cache_dir = transcript_dir / ".cache"
+    ensure_paths([cache_dir])
+    key = transcript_cache_key(audio_path, model, language)
+    cached = cache_dir / f"{key}.srt"
+
+    if cached.exists():
+        logging.info("Transcript cache hit (%s); skipping Whisper", key[:12])
+    else:
+        logging.info("Running Whisper transcription with model=%s...", model)
+        with tempfile.TemporaryDirectory(dir=transcript_dir, prefix=".whisper-") as tmp:
+            produced = run_whisper(audio_path, Path(tmp), model, language)
+            os.replace(produced, cached)
+
+    mirror = transcript_dir / f"{audio_path.stem}.srt"
+    shutil.copyfile(cached, mirror)
+    return mirror
+
+
 def parse_srt_file(path: Path) -> List[Caption]:
     with open(path, "r", encoding="utf-8") as f:
         content = f.read()
@@ -289,6 +372,30 @@ def ffprobe_duration(path: Path) -> Optional[float]:
         return None
 
 
+def has_audio_stream(path: Path) -> bool:
+    probe_bin = shutil.which("ffprobe")
+    if probe_bin is None:
+        # Assume the common case; a missing stream surfaces as an ffmpeg error
+        return True
+    cmd = [
+        probe_bin,
+        "-v",
+        "error",
+        "-select_streams",
+        "a",
+        "-show_entries",
+        "stream=codec_type",
+        "-of",
+        "default=noprint_wrappers=1:nokey=1",
+        str(path),
+    ]
+    try:
+        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        return bool(result.stdout.strip())
+    except Exception:
+        return True
+
+
 def clip_media(
     video_path: Path,
     segment: Segment,
@@ -382,6 +489,20 @@ def burn_subtitles(input_clip: Path, srt_path: Path, output_clip: Path) -> None:
     run_cmd(cmd, "Subtitle burn-in")
 
 
+def overlay_filters(
+    brightness: float,
+    saturation: float,
+    fade_duration: float,
+    clip_duration: float,
+) -> List[str]:
+    fade_out_start = max(0.0, clip_duration - fade_duration)
+    return [
+        f"eq=brightness={brightness}:saturation={saturation}",
+        f"fade=t=in:st=0:d={fade_duration}",
+        f"fade=t=out:st={fade_out_start}:d={fade_duration}",
+    ]
+
+
 def apply_overlay(
     input_clip: Path,
     output_clip: Path,
@@ -390,12 +511,7 @@ def apply_overlay(
     fade_duration: float,
     clip_duration: float,
 ) -> None:
-    fade_out_start = max(0.0, clip_duration - fade_duration)
-    filter_chain = (
-        f"eq=brightness={brightness}:saturation={saturation},"
-        f"fade=t=in:st=0:d={fade_duration},"
-        f"fade=t=out:st={fade_out_start}:d={fade_duration}"
-    )
+    filter_chain = ",".join(overlay_filters(brightness, saturation, fade_duration, clip_duration))
     cmd = [
         "ffmpeg",
         "-y",
@@ -410,6 +526,250 @@ def apply_overlay(
     run_cmd(cmd, "Visual overlay")
 
 
+def clip_filters(job: RenderJob) -> List[str]:
+    """Subtitle burn-in and overlay filters for one clip, in render order."""
+    filters: List[str] = []
+    if job.srt_path is not None:
+        filters.append(f"subtitles={escape_ffmpeg_path(job.srt_path)}")
+    if job.overlay is not None:
+        filters.extend(
+            overlay_filters(
+                brightness=job.overlay.get("brightness", 0.05),
+                saturation=job.overlay.get("saturation", 1.1),
+                fade_duration=job.overlay.get("fade_duration", 0.4),
+                clip_duration=job.duration,
+            )
+        )
+    return filters
+
+
+def encode_args(render_cfg: Dict, threads: int = 0) -> List[str]:
+    args = [
+        "-c:v",
+        "libx264",
+        "-preset",
+        str(render_cfg.get("preset", "veryfast")),
+        "-crf",
+        str(render_cfg.get("crf", 20)),
+        "-c:a",
+        "aac",
+        "-movflags",
+        "+faststart",
+    ]
+    if threads:
+        args.extend(["-threads", str(threads)])
+    return args
+
+
+def render_clip(video_path: Path, job: RenderJob, render_cfg: Dict, threads: int = 0) -> None:
+    """Trim, burn subtitles and apply the overlay in one decode/encode pass."""
+    ensure_paths([job.output_path.parent])
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-ss",
+        f"{job.segment.start:.3f}",
+        "-t",
+        f"{job.duration:.3f}",
+        "-i",
+        str(video_path),
+    ]
+    filters = clip_filters(job)
+    if filters:
+        cmd.extend(["-vf", ",".join(filters)])
+    cmd.extend(encode_args(render_cfg, threads))
+    cmd.append(str(job.output_path))
+    run_cmd(cmd, f"Clip render ({job.output_path.name})")
+
+
+def render_fanout(
+    video_path: Path,
+    jobs: Sequence[RenderJob],
+    render_cfg: Dict,
+    has_audio: bool = True,
+    threads: int = 0,
+) -> None:
+    """Decode the span covering ``jobs`` once and split it into one output per job."""
+    span_start = min(job.segment.start for job in jobs)
+    span_end = max(job.segment.start + job.duration for job in jobs)
+    count = len(jobs)
+
+    graph = [f"[0:v]split={count}" + "".join(f"[v{i}]" for i in range(count))]
+    if has_audio:
+        graph.append(f"[0:a]asplit={count}" + "".join(f"[a{i}]" for i in range(count)))
+    for i, job in enumerate(jobs):
+        offset = job.segment.start - span_start
+        window = f"start={offset:.3f}:duration={job.duration:.3f}"
+        chain = [f"trim={window}", "setpts=PTS-STARTPTS", *clip_filters(job)]
+        graph.append(f"[v{i}]{','.join(chain)}[vo{i}]")
+        if has_audio:
+            graph.append(f"[a{i}]atrim={window},asetpts=PTS-STARTPTS[ao{i}]")
+
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-ss",
+        f"{span_start:.3f}",
+        "-t",
+        f"{span_end - span_start:.3f}",
+        "-i",
+        str(video_path),
+        "-filter_complex",
+        ";".join(graph),
+    ]
+    for i, job in enumerate(jobs):
+        ensure_paths([job.output_path.parent])
+        cmd.extend(["-map", f"[vo{i}]"])
+        if has_audio:
+            cmd.extend(["-map", f"[ao{i}]"])
+        cmd.extend(encode_args(render_cfg, threads))
+        cmd.append(str(job.output_path))
+    run_cmd(cmd, f"Fan-out render ({count} clips from {span_start:.1f}-{span_end:.1f}s)")
+
+
+def plan_render_groups(jobs: Sequence[RenderJob], render_cfg: Dict) -> List[List[RenderJob]]:
+    """Group jobs into ffmpeg invocations.
+
+    Stream-copy jobs always run alone. When there are at least
+    ``fanout_min_segments`` rendered jobs, neighbours whose gap is within
+    ``fanout_max_gap_seconds`` share one decode (up to ``fanout_max_outputs``
+    per group); everything else renders as a single-clip graph.
+    """
+    groups: List[List[RenderJob]] = [[job] for job in jobs if job.is_copy]
+    rendered = sorted((job for job in jobs if not job.is_copy), key=lambda j: j.segment.start)
+
+    if len(rendered) < int(render_cfg.get("fanout_min_segments", 4)):
+        return groups + [[job] for job in rendered]
+
+    max_outputs = max(1, int(render_cfg.get("fanout_max_outputs", 8)))
+    max_gap = float(render_cfg.get("fanout_max_gap_seconds", 30.0))
+    current: List[RenderJob] = []
+    current_end = 0.0
+    for job in rendered:
+        job_end = job.segment.start + job.duration
+        if current and (len(current) >= max_outputs or job.segment.start - current_end > max_gap):
+            groups.append(current)
+            current = []
+        current_end = max(current_end, job_end) if current else job_end
+        current.append(job)
+    if current:
+        groups.append(current)
+    return groups
+
+
+def render_workers(render_cfg: Dict) -> int:
+    workers = render_cfg.get("workers")
+    if workers:
+        return max(1, int(workers))
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+def render_clips(
+    video_path: Path,
+    jobs: Sequence[RenderJob],
+    render_cfg: Dict,
+    reencode_fallback: bool = True,
+) -> None:
+    """Render every job, fanning out dense runs and pooling the rest.
+
+    Args:
+        video_path: Source video.
+        jobs: Outputs to produce; copy-only jobs are stream-copied.
+        render_cfg: The ``render`` config section (workers, encoder, fan-out).
+        reencode_fallback: Passed to ``clip_media`` for copy-only jobs.
+    """
+    groups = plan_render_groups(jobs, render_cfg)
+    if not groups:
+        return
+
+    workers = min(render_workers(render_cfg), len(groups))
+    # Split the cores between concurrent encoders instead of oversubscribing
+    threads = max(1, (os.cpu_count() or 1) // workers) if workers > 1 else 0
+    has_audio = has_audio_stream(video_path) if any(len(g) > 1 for g in groups) else True
+    fanouts = sum(1 for g in groups if len(g) > 1)
+    logging.info(
+        "Rendering %d outputs in %d ffmpeg runs (%d fan-out) with %d worker(s)",
+        len(jobs),
+        len(groups),
+        fanouts,
+        workers,
+    )
+
+    def run_group(group: List[RenderJob]) -> None:
+        if len(group) > 1:
+            try:
+                render_fanout(video_path, group, render_cfg, has_audio=has_audio, threads=threads)
+                return
+            except subprocess.CalledProcessError:
+                logging.warning("Fan-out render failed; rendering %d clips individually", len(group))
+        for job in group:
+            if job.is_copy:
+                clip_media(video_path, job.segment, job.output_path, reencode_fallback)
+            else:
+                render_clip(video_path, job, render_cfg, threads=threads)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_group, group) for group in groups]
+        for future in as_completed(futures):
+            future.result()
+
+
+def build_render_jobs(
+    segments: Sequence[Segment],
+    captions: List[Caption],
+    raw_dir: Path,
+    sub_dir: Path,
+    final_dir: Path,
+    burn: bool,
+    overlay: Optional[Dict],
+    keep_raw: bool,
+) -> Tuple[List[RenderJob], List[ClipArtifacts]]:
+    """Write per-clip SRTs and describe the outputs each segment should produce.
+
+    Each clip renders straight to its deepest enabled stage: ``clips_final/`` when
+    the overlay is on, ``clips_sub/`` for burn-in only, otherwise ``clips_raw/``.
+    Intermediate stages are no longer materialized; ``keep_raw`` adds a cheap
+    stream-copy slice to ``clips_raw/`` alongside the rendered clip.
+    """
+    jobs: List[RenderJob] = []
+    artifacts: List[ClipArtifacts] = []
+    for idx, seg in enumerate(segments, start=1):
+        clip_name = f"clip_{idx:03d}.mp4"
+        raw_path = raw_dir / clip_name
+        srt_path = raw_dir / clip_name.replace(".mp4", ".srt")
+
+        if captions:
+            clip_subtitles(captions, seg, srt_path)
+        burn_srt = srt_path if burn and captions and srt_path.exists() else None
+
+        burned_path = None
+        final_overlay_path = None
+        if overlay is not None:
+            final_overlay_path = final_dir / clip_name.replace(".mp4", "_final.mp4")
+            output_path = final_overlay_path
+        elif burn_srt is not None:
+            burned_path = sub_dir / clip_name.replace(".mp4", "_sub.mp4")
+            output_path = burned_path
+        else:
+            output_path = raw_path
+
+        job = RenderJob(segment=seg, output_path=output_path, srt_path=burn_srt, overlay=overlay)
+        jobs.append(job)
+        if keep_raw and not job.is_copy:
+            jobs.append(RenderJob(segment=seg, output_path=raw_path))
+
+        artifacts.append(
+            ClipArtifacts(
+                segment=seg,
+                raw_path=raw_path,
+                srt_path=srt_path,
+                burned_path=burned_path,
+                final_overlay_path=final_overlay_path,
+            )
+        )
+    return jobs, artifacts
+
+
 def write_segments_json(path: Path, segments: List[Segment]) -> None:
     ensure_paths([path.parent])
     with open(path, "w", encoding="utf-8") as f:
@@ -451,14 +811,240 @@ def write_index_csv(path: Path, artifacts: List[ClipArtifacts]) -> None:
                     f"{art.segment.start:.2f}",
                     f"{art.segment.end:.2f}",
                     art.segment.reason,
-                    str(art.raw_path),
-                    str(art.srt_path),
+                    str(art.raw_path) if art.raw_path.exists() else "",
+                    str(art.srt_path) if art.srt_path.exists() else "",
                     str(art.burned_path) if art.burned_path else "",
                     str(art.final_overlay_path) if art.final_overlay_path else "",
                 ]
             )
 
 
+def stream_duration(path: Path, stream: str) -> Optional[float]:
+    probe_bin = shutil.which("ffprobe")
+    if probe_bin is None:
+        return None
+    cmd = [
+        probe_bin,
+        "-v",
+        "error",
+        "-select_streams",
+        f"{stream}:0",
+        "-show_entries",
+        "stream=duration",
+        "-of",
+        "default=noprint_wrappers=1:nokey=1",
+        str(path),
+    ]
+    try:
+        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        return float(result.stdout.strip())
+    except Exception:
+        return None
+
+
+def _synthetic_source(path: Path, duration: float, size: str, fps: int) -> None:
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-f",
+        "lavfi",
+        "-i",
+        f"testsrc2=size={size}:rate={fps}:duration={duration}",
+        "-f",
+        "lavfi",
+        "-i",
+        f"sine=frequency=220:sample_rate=48000:duration={duration}",
+        "-c:v",
+        "libx264",
+        "-preset",
+        "veryfast",
+        "-pix_fmt",
+        "yuv420p",
+        "-g",
+        str(fps * 2),
+        "-c:a",
+        "aac",
+        "-shortest",
+        str(path),
+    ]
+    run_cmd(cmd, "Synthetic source")
+
+
+def benchmark(
+    clips: int = 8,
+    spacing: float = 16.0,
+    size: str = "1280x720",
+    fps: int = 30,
+    render_cfg: Optional[Dict] = None,
+    overlay: Optional[Dict] = None,
+    workdir: Optional[Path] = None,
+) -> Dict:
+    """Render the same segments with the legacy three-pass path and the fused renderer.
+
+    A synthetic testsrc2 + sine video and a hand-written SRT stand in for a real
+    session and Whisper, so the run is deterministic and needs only ffmpeg.
+
+    Args:
+        clips: Keyword captions in the SRT (roughly one segment each).
+        spacing: Seconds between captions; smaller values make segments denser.
+        size: Source frame size.
+        fps: Source frame rate (keyframes every two seconds).
+        render_cfg: ``render`` config section for the fused paths.
+        overlay: Overlay settings shared by both paths.
+        workdir: Keep outputs here instead of a temporary directory.
+
+    Returns:
+        Timings for legacy / pooled / fan-out rendering and the worst clip
+        duration error (video and audio) of each path against its segment.
+    """
+    if shutil.which("ffmpeg") is None:
+        raise RuntimeError("ffmpeg is required but not found on PATH")
+    render_cfg = dict(DEFAULT_CONFIG["render"], **(render_cfg or {}))
+    overlay = dict(DEFAULT_CONFIG["overlay"], **(overlay or {}))
+
+    tmp = None
+    if workdir is None:
+        tmp = tempfile.TemporaryDirectory(prefix="blessing-bench-")
+        workdir = Path(tmp.name)
+    ensure_paths([workdir])
+    try:
+        source_seconds = 4.0 + clips * spacing + DEFAULT_CONFIG["max_len_seconds"]
+        video = workdir / "source.mp4"
+        _synthetic_source(video, source_seconds, size, fps)
+
+        # Continuous narration (no pause windows) with one keyword line per
+        # ``spacing`` seconds; fractional times keep cuts off the keyframe grid
+        captions = []
+        start = 0.37
+        while start + 2.0 < 4.0 + clips * spacing:
+            k = int((start - 4.0) // spacing) if start >= 4.0 else -1
+            keyword = k >= 0 and start - 4.0 - k * spacing < 2.5
+            text = f"Let the light of peace rest in your heart ({k + 1})" if keyword else "Breathe slowly"
+            captions.append(
+                srt.Subtitle(
+                    index=len(captions) + 1,
+                    start=timedelta(seconds=start),
+                    end=timedelta(seconds=start + 2.0),
+                    content=text,
+                )
+            )
+            start += 2.5
+        transcript = workdir / "transcript.srt"
+        transcript.write_text(srt.compose(captions), encoding="utf-8")
+        parsed = parse_srt_file(transcript)
+        segments = detect_segments(
+            captions=parsed,
+            keywords=DEFAULT_CONFIG["keywords"],
+            pause_gap=DEFAULT_CONFIG["pause_gap_seconds"],
+            pad_pre=DEFAULT_CONFIG["pad_pre_seconds"],
+            pad_post=DEFAULT_CONFIG["pad_post_seconds"],
+            min_len=DEFAULT_CONFIG["min_len_seconds"],
+            max_len=DEFAULT_CONFIG["max_len_seconds"],
+            max_clips=clips,
+            total_duration=source_seconds,
+        )
+
+        def max_error(paths: List[Path]) -> Tuple[float, float]:
+            video_err = audio_err = 0.0
+            for seg, path in zip(segments, paths):
+                expected = max(0.1, seg.end - seg.start)
+                v = stream_duration(path, "v")
+                a = stream_duration(path, "a")
+                video_err = max(video_err, abs((v if v is not None else 0.0) - expected))
+                audio_err = max(audio_err, abs((a if a is not None else 0.0) - expected))
+            return video_err, audio_err
+
+        # Legacy: stream-copy slice, then burn-in pass, then overlay pass
+        legacy_dir = workdir / "legacy"
+        legacy_paths = []
+        t0 = time.perf_counter()
+        for idx, seg in enumerate(segments, start=1):
+            raw_path = legacy_dir / f"clip_{idx:03d}.mp4"
+            srt_path = legacy_dir / f"clip_{idx:03d}.srt"
+            burned_path = legacy_dir / f"clip_{idx:03d}_sub.mp4"
+            final_path = legacy_dir / f"clip_{idx:03d}_final.mp4"
+            clip_media(video, seg, raw_path, reencode_fallback=True)
+            clip_subtitles(parsed, seg, srt_path)
+            burn_subtitles(raw_path, srt_path, burned_path)
+            apply_overlay(
+                burned_path,
+                final_path,
+                brightness=overlay["brightness"],
+                saturation=overlay["saturation"],
+                fade_duration=overlay["fade_duration"],
+                clip_duration=max(0.1, seg.end - seg.start),
+            )
+            legacy_paths.append(final_path)
+        legacy_seconds = time.perf_counter() - t0
+
+        results: Dict = {
+            "clips": len(segments),
+            "source_seconds": source_seconds,
+            "frame_size": size,
+            "workers": render_workers(render_cfg),
+            "legacy_seconds": legacy_seconds,
+            "legacy_error": max_error(legacy_paths),
+        }
+
+        modes = {
+            "pooled": dict(render_cfg, fanout_min_segments=len(segments) + 1),
+            "fanout": dict(render_cfg, fanout_min_segments=2),
+        }
+        for mode, cfg in modes.items():
+            root = workdir / mode
+            jobs, artifacts = build_render_jobs(
+                segments,
+                parsed,
+                raw_dir=root / "clips_raw",
+                sub_dir=root / "clips_sub",
+                final_dir=root / "clips_final",
+                burn=True,
+                overlay=overlay,
+                keep_raw=False,
+            )
+            t0 = time.perf_counter()
+            render_clips(video, jobs, cfg)
+            results[f"{mode}_seconds"] = time.perf_counter() - t0
+            results[f"{mode}_runs"] = len(plan_render_groups(jobs, cfg))
+            results[f"{mode}_error"] = max_error([art.final_overlay_path for art in artifacts])
+
+        # One frame of video plus one AAC frame of audio
+        tolerance = 1.0 / fps + 1024 / 48000
+        results["tolerance"] = tolerance
+        results["boundaries_ok"] = all(
+            max(results[f"{mode}_error"]) <= tolerance for mode in modes
+        )
+        return results
+    finally:
+        if tmp is not None:
+            tmp.cleanup()
+
+
+def format_benchmark(results: Dict) -> str:
+    legacy = results["legacy_seconds"]
+    lines = [
+        f"🎬 Blessing clip render benchmark: {results['clips']} clips from a "
+        f"{results['source_seconds']:.0f}s {results['frame_size']} synthetic source",
+        f"   Workers: {results['workers']}",
+        f"   Legacy 3-pass:  {legacy:7.2f}s  ({results['clips'] * 3} ffmpeg runs)",
+    ]
+    for mode, label in (("pooled", "Fused, pooled:"), ("fanout", "Fused, fan-out:")):
+        seconds = results[f"{mode}_seconds"]
+        lines.append(
+            f"   {label:<15} {seconds:7.2f}s  ({results[f'{mode}_runs']} ffmpeg runs, "
+            f"{legacy / seconds:.2f}x vs legacy)"
+        )
+    lines.append("   Max clip duration error (video / audio):")
+    for mode in ("legacy", "pooled", "fanout"):
+        video_err, audio_err = results[f"{mode}_error"]
+        lines.append(f"     {mode:<7} {video_err * 1000:7.1f} ms / {audio_err * 1000:7.1f} ms")
+    status = "✓" if results["boundaries_ok"] else "✗"
+    lines.append(
+        f"   {status} Fused clip boundaries within {results['tolerance'] * 1000:.0f} ms of their segments"
+    )
+    return "\n".join(lines)
+
+
 def build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Automate blessing clip generation")
     parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG_PATH, help="Path to YAML config")
@@ -470,6 +1056,9 @@ def build_arg_parser() -> argparse.ArgumentParser:
     parser.add_argument("--max-clips", type=int, help="Limit number of clips")
     parser.add_argument("--no-burn", action="store_true", help="Disable subtitle burn-in")
     parser.add_argument("--no-overlay", action="store_true", help="Disable visual overlay")
+    parser.add_argument("--workers", type=int, help="Parallel ffmpeg renders (default: render.workers)")
+    parser.add_argument("--benchmark", action="store_true", help="Compare legacy and fused rendering on a synthetic video")
+    parser.add_argument("--bench-clips", type=int, default=8, help="Segments in the benchmark transcript")
     parser.add_argument("--verbose", action="store_true", help="Enable debug logging")
     return parser
 
@@ -483,6 +1072,13 @@ def main() -> None:
 
     cfg = load_config(args.config)
 
+    if args.benchmark:
+        render_cfg = dict(cfg.get("render", {}))
+        if args.workers:
+            render_cfg["workers"] = args.workers
+        print(format_benchmark(benchmark(clips=args.bench_clips, render_cfg=render_cfg, overlay=cfg.get("overlay"))))
+        return
+
     input_video = args.input_video or Path(cfg["input_video"])
     input_audio = args.input_audio or (Path(cfg["input_audio"]) if cfg.get("input_audio") else None)
     work_dir = Path(cfg["work_dir"])
@@ -514,8 +1110,7 @@ def main() -> None:
     if args.transcript:
         transcript_path = args.transcript
     else:
-        logging.info("Running Whisper transcription with model=%s...", model)
-        transcript_path = run_whisper(audio_path, transcript_dir, model, cfg.get("language", ""))
+        transcript_path = transcribe_cached(audio_path, transcript_dir, model, cfg.get("language", ""))
 
     logging.info("Parsing transcript: %s", transcript_path)
     captions = parse_srt_file(transcript_path)
@@ -542,47 +1137,21 @@ def main() -> None:
     write_segments_json(segments_json, segments)
     logging.info("Detected %d segments -> %s", len(segments), segments_json)
 
-    artifacts: List[ClipArtifacts] = []
-    for idx, seg in enumerate(segments, start=1):
-        clip_name = f"clip_{idx:03d}.mp4"
-        srt_name = f"clip_{idx:03d}.srt"
-        raw_path = raw_dir / clip_name
-        srt_path = raw_dir / srt_name
-
-        logging.info("Cutting clip %s (%.1f-%.1f) %s", clip_name, seg.start, seg.end, seg.reason)
-        clip_media(input_video, seg, raw_path, cfg["fallback_reencode"])
-        clip_subtitles(captions, seg, srt_path)
-
-        burned_path = None
-        if not args.no_burn and cfg.get("burn_subtitles", True) and srt_path.exists():
-            burned_path = sub_dir / clip_name.replace(".mp4", "_sub.mp4")
-            burn_subtitles(raw_path, srt_path, burned_path)
-
-        final_overlay_path = None
-        overlay_enabled = cfg.get("overlay_enabled", True) and not args.no_overlay
-        overlay_cfg = cfg.get("overlay", {})
-        input_for_overlay = burned_path or raw_path
-        if overlay_enabled:
-            final_overlay_path = final_dir / clip_name.replace(".mp4", "_final.mp4")
-            clip_duration = max(0.1, seg.end - seg.start)
-            apply_overlay(
-                input_for_overlay,
-                final_overlay_path,
-                brightness=overlay_cfg.get("brightness", 0.05),
-                saturation=overlay_cfg.get("saturation", 1.1),
-                fade_duration=overlay_cfg.get("fade_duration", 0.4),
-                clip_duration=clip_duration,
-            )
-
-        artifacts.append(
-            ClipArtifacts(
-                segment=seg,
-                raw_path=raw_path,
-                srt_path=srt_path,
-                burned_path=burned_path,
-                final_overlay_path=final_overlay_path,
-            )
-        )
+    overlay_enabled = cfg.get("overlay_enabled", True) and not args.no_overlay
+    jobs, artifacts = build_render_jobs(
+        segments,
+        captions,
+        raw_dir=raw_dir,
+        sub_dir=sub_dir,
+        final_dir=final_dir,
+        burn=not args.no_burn and cfg.get("burn_subtitles", True),
+        overlay=cfg.get("overlay", {}) if overlay_enabled else None,
+        keep_raw=cfg.get("keep_raw_clips", True),
+    )
+    render_cfg = dict(cfg.get("render", {}))
+    if args.workers:
+        render_cfg["workers"] = args.workers
+    render_clips(input_video, jobs, render_cfg, reencode_fallback=cfg["fallback_reencode"])
 
     index_csv = output_root / "index.csv"
     write_index_csv(index_csv, artifacts)
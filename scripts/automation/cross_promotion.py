@@ -2,16 +2,37 @@
 Cross-Promotion Engine.
 
 Suggests related content links for discovery and engagement.
+
+Related-session lookups are served from a neighbor table (top related
+sessions per session) kept in sessions/_cross_promotion_neighbors.json.
+The table is built with batched sparse scoring and patched incrementally:
+when a manifest is added or changed, only that session's row and column
+are recomputed.
 """
 
 import yaml
 import re
+import hashlib
+import json
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Set, Tuple
+from typing import Optional, List, Dict, Any, Set, Tuple, Sequence
 from collections import defaultdict
 import math
 
+import numpy as np
+from scipy import sparse
+
+# Neighbors kept per session; find_related_sessions serves up to this many from the table
+NEIGHBOR_K = 20
+NEIGHBOR_TABLE = '_cross_promotion_neighbors.json'
+NEIGHBOR_TABLE_VERSION = 1
+# Rows scored per batch (a 512 x n float64 block)
+SCORE_BLOCK_ROWS = 512
+
+STOPWORDS = ('the', 'a', 'an', 'and', 'or', 'of', 'to', 'in')
+WORD_RE = re.compile(r'\w+')
+
 
 @dataclass
 class ContentLink:
@@ -33,6 +54,295 @@ class PromotionSuggestions:
     journey_progression: List[ContentLink]
 
 
+def session_fingerprint(session: Dict[str, Any]) -> str:
+    """Stable hash of a session's manifest data, used to spot changed sessions."""
+    payload = json.dumps(session, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _category(value: Any) -> Any:
+    """Dict key for a categorical field value (unhashable values compare by repr)."""
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+class SimilarityIndex:
+    """
+    Sparse feature encoding of sessions for batched similarity scoring.
+
+    Each session is encoded once into category codes (journey family,
+    outcome, depth), a duration, and 0/1 sparse rows over archetypes and
+    title/description words. A block of sessions is then scored against
+    all others with array comparisons and two sparse products. Terms are
+    added in the same order with the same weights as
+    CrossPromotionEngine._calculate_similarity, so scores are identical.
+    """
+
+    CATEGORIES = ('journey_family', 'desired_outcome', 'depth_level')
+
+    def __init__(self):
+        self._category_codes: Dict[str, Dict[Any, int]] = {key: {} for key in self.CATEGORIES}
+        self._archetype_ids: Dict[Any, int] = {}
+        # Stopwords take the first word ids so they can be split off as columns
+        self._word_ids: Dict[str, int] = {word: i for i, word in enumerate(STOPWORDS)}
+        self._encoded: Dict[str, Tuple] = {}
+        self._arrays: Optional[Dict[str, Any]] = None
+
+    def __len__(self) -> int:
+        return len(self._encoded)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._encoded
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._encoded)
+
+    def set(self, name: str, session: Dict[str, Any]):
+        """Encode (or re-encode) one session."""
+        codes = tuple(
+            self._category_codes[key].setdefault(
+                _category(session.get(key)), len(self._category_codes[key])
+            )
+            for key in self.CATEGORIES
+        )
+
+        try:
+            duration = float(session.get('duration', 25))
+        except (TypeError, ValueError):
+            duration = math.nan
+
+        archetypes = sorted({
+            self._archetype_ids.setdefault(a, len(self._archetype_ids))
+            for a in set(session.get('archetypes') or [])
+        })
+
+        text = f"{session.get('title', '')} {session.get('description', '')}".lower()
+        words = sorted({
+            self._word_ids.setdefault(w, len(self._word_ids))
+            for w in set(WORD_RE.findall(text))
+        })
+
+        self._encoded[name] = (codes, duration, archetypes, words)
+        self._arrays = None
+
+    def remove(self, name: str):
+        if self._encoded.pop(name, None) is not None:
+            self._arrays = None
+
+    @staticmethod
+    def _rows_matrix(rows: List[List[int]], width: int) -> sparse.csr_matrix:
+        """0/1 CSR matrix from per-row column ids."""
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(r) for r in rows], out=indptr[1:])
+        indices = np.fromiter((c for r in rows for c in r), dtype=np.int64, count=int(indptr[-1]))
+        data = np.ones(len(indices))
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), max(width, 1)))
+
+    def _build(self) -> Dict[str, Any]:
+        if self._arrays is not None:
+            return self._arrays
+
+        names = list(self._encoded)
+        encoded = list(self._encoded.values())
+        rank = np.empty(len(names), dtype=np.int64)
+        rank[np.argsort(np.array(names, dtype=str), kind='stable')] = np.arange(len(names))
+
+        archetypes = self._rows_matrix([e[2] for e in encoded], len(self._archetype_ids))
+        words = self._rows_matrix([e[3] for e in encoded], len(self._word_ids))
+        n_stop = len(STOPWORDS)
+
+        self._arrays = {
+            'names': names,
+            'position': {name: i for i, name in enumerate(names)},
+            'rank': rank,
+            'codes': np.array([e[0] for e in encoded], dtype=np.int64).reshape(len(names), 3),
+            'duration': np.array([e[1] for e in encoded], dtype=np.float64),
+            'archetypes': archetypes,
+            'archetype_count': np.diff(archetypes.indptr),
+            'words': words[:, n_stop:].tocsr(),
+            'stopwords': words[:, :n_stop].toarray(),
+            'word_count': np.diff(words.indptr),
+        }
+        return self._arrays
+
+    def position(self, name: str) -> int:
+        return self._build()['position'][name]
+
+    def scores(self, rows: Sequence[int]) -> np.ndarray:
+        """
+        Similarity of each given session to every session.
+
+        Args:
+            rows: Session positions (see position())
+
+        Returns:
+            (len(rows), len(self)) float64 scores in [0, 1]
+        """
+        arr = self._build()
+        rows = np.asarray(rows, dtype=np.int64)
+        codes = arr['codes']
+
+        # Same journey family, outcome, depth level
+        score = 0.3 * (codes[rows, 0:1] == codes[:, 0])
+        score += 0.25 * (codes[rows, 1:2] == codes[:, 1])
+        score += 0.1 * (codes[rows, 2:3] == codes[:, 2])
+
+        # Shared archetypes (Jaccard); pairs sharing none add 0
+        shared = (arr['archetypes'][rows] @ arr['archetypes'].T).toarray()
+        counts = arr['archetype_count']
+        total = counts[rows, None] + counts - shared
+        score += 0.2 * np.divide(shared, total, out=np.zeros_like(shared), where=shared > 0)
+
+        # Similar duration (within 10 minutes)
+        score += 0.1 * (np.abs(arr['duration'][rows, None] - arr['duration']) <= 10)
+
+        # Theme similarity: shared non-stopwords over all words of either session
+        common = (arr['words'][rows] @ arr['words'].T).toarray()
+        stop = arr['stopwords']
+        counts = arr['word_count']
+        union = counts[rows, None] + counts - (common + stop[rows] @ stop.T)
+        score += 0.15 * np.divide(common, union, out=np.zeros_like(common), where=common > 0)
+
+        return np.minimum(score, 1.0)
+
+    def top_neighbors(
+        self,
+        rows: Sequence[int],
+        k: int,
+    ) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        The k most similar other sessions for each given session.
+
+        Ties are broken by session name, so results do not depend on load order.
+
+        Returns:
+            {session_name: [(other_name, score), ...]} best first
+        """
+        arr = self._build()
+        names, rank = arr['names'], arr['rank']
+        rows = list(rows)
+        result: Dict[str, List[Tuple[str, float]]] = {}
+
+        for start in range(0, len(rows), SCORE_BLOCK_ROWS):
+            block = rows[start:start + SCORE_BLOCK_ROWS]
+            scores = self.scores(block)
+            scores[np.arange(len(block)), block] = -np.inf  # Not its own neighbor
+
+            keep = min(k, len(names) - 1)
+            for row, row_scores in zip(block, scores):
+                if keep <= 0:
+                    result[names[row]] = []
+                    continue
+                threshold = np.partition(row_scores, -keep)[-keep]
+                candidates = np.flatnonzero(row_scores >= threshold)
+                order = candidates[np.lexsort((rank[candidates], -row_scores[candidates]))][:keep]
+                result[names[row]] = [(names[j], float(row_scores[j])) for j in order]
+
+        return result
+
+
+@dataclass
+class NeighborTable:
+    """Top related sessions per session, with the fingerprints they were built from."""
+    k: int = NEIGHBOR_K
+    fingerprints: Dict[str, str] = field(default_factory=dict)
+    neighbors: Dict[str, List[Tuple[str, float]]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path, k: int = NEIGHBOR_K) -> 'NeighborTable':
+        """Read a saved table; a missing, unreadable or differently sized one loads empty."""
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') != NEIGHBOR_TABLE_VERSION or data.get('k') != k:
+                return cls(k=k)
+            return cls(
+                k=k,
+                fingerprints=data['fingerprints'],
+                neighbors={
+                    name: [(other, score) for other, score in links]
+                    for name, links in data['neighbors'].items()
+                },
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return cls(k=k)
+
+    def save(self, path: Path):
+        """Write the table (it is a cache, so a failed write is ignored)."""
+        try:
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                f.write(json.dumps({
+                    'version': NEIGHBOR_TABLE_VERSION,
+                    'k': self.k,
+                    'fingerprints': self.fingerprints,
+                    'neighbors': self.neighbors,
+                }))
+            tmp_path.replace(path)
+        except OSError:
+            pass
+
+    def update(self, index: SimilarityIndex, fingerprints: Dict[str, str]) -> bool:
+        """
+        Bring the table in line with the current sessions.
+
+        Added and changed sessions get their rows recomputed and their new
+        scores merged into everyone else's lists (similarity is symmetric).
+        Only lists that were full and lost a changed or removed session need
+        a full recompute. Large changes rebuild the whole table.
+
+        Returns:
+            True if the table changed
+        """
+        changed = [name for name, fp in fingerprints.items() if self.fingerprints.get(name) != fp]
+        removed = [name for name in self.fingerprints if name not in fingerprints]
+        if not changed and not removed:
+            return False
+
+        if not self.neighbors or len(changed) + len(removed) > len(fingerprints) // 4:
+            self.neighbors = index.top_neighbors(range(len(index)), self.k)
+        else:
+            self._patch(index, changed, removed)
+
+        self.fingerprints = dict(fingerprints)
+        return True
+
+    def _patch(self, index: SimilarityIndex, changed: List[str], removed: List[str]):
+        stale = set(changed) | set(removed)
+        for name in removed:
+            self.neighbors.pop(name, None)
+
+        # Drop stale links; a full list that loses one no longer knows its k-th best
+        dirty = set(changed)
+        for name, links in self.neighbors.items():
+            if name in dirty:
+                continue
+            kept = [link for link in links if link[0] not in stale]
+            if len(kept) < len(links) and len(links) >= self.k:
+                dirty.add(name)
+            self.neighbors[name] = kept
+
+        # Merge each changed session's column into the remaining lists
+        others = [(name, index.position(name)) for name in self.neighbors if name not in dirty]
+        for start in range(0, len(changed), SCORE_BLOCK_ROWS):
+            block = changed[start:start + SCORE_BLOCK_ROWS]
+            scores = index.scores([index.position(name) for name in block])
+            for name, row_scores in zip(block, scores):
+                for other, pos in others:
+                    links = self.neighbors[other]
+                    score = float(row_scores[pos])
+                    if len(links) < self.k or (-score, name) < (-links[-1][1], links[-1][0]):
+                        links.append((name, score))
+                        links.sort(key=lambda link: (-link[1], link[0]))
+                        del links[self.k:]
+
+        self.neighbors.update(index.top_neighbors([index.position(name) for name in dirty], self.k))
+
+
 class CrossPromotionEngine:
     """
     Cross-Promotion Engine.
@@ -96,6 +406,10 @@ class CrossPromotionEngine:
 
         # Cache session data
         self._session_cache: Dict[str, Dict] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._index = SimilarityIndex()
+        self._table: Optional[NeighborTable] = None
+        self._table_stale = True
         self._load_all_sessions()
 
     def _load_all_sessions(self):
@@ -111,10 +425,19 @@ class CrossPromotionEngine:
                 try:
                     with open(manifest_path, 'r') as f:
                         data = yaml.safe_load(f) or {}
-                        self._session_cache[session_dir.name] = data.get('session', {})
+                        self._cache_session(session_dir.name, data.get('session', {}))
                 except Exception:
                     continue
 
+    def _cache_session(self, session_name: str, session: Dict[str, Any]):
+        """Cache a session and encode it for similarity scoring."""
+        self._session_cache[session_name] = session
+        fingerprint = session_fingerprint(session)
+        if self._fingerprints.get(session_name) != fingerprint:
+            self._fingerprints[session_name] = fingerprint
+            self._index.set(session_name, session)
+            self._table_stale = True
+
     def _get_session(self, session_name: str) -> Optional[Dict[str, Any]]:
         """Get cached session data."""
         if session_name not in self._session_cache:
@@ -122,9 +445,43 @@ class CrossPromotionEngine:
             if manifest_path.exists():
                 with open(manifest_path, 'r') as f:
                     data = yaml.safe_load(f) or {}
-                    self._session_cache[session_name] = data.get('session', {})
+                    self._cache_session(session_name, data.get('session', {}))
         return self._session_cache.get(session_name)
 
+    def update_session(self, session_name: str, session: Optional[Dict[str, Any]] = None):
+        """
+        Refresh one session after its manifest was added, edited or deleted.
+
+        Only that session's row and column of the neighbor table are
+        recomputed on the next lookup.
+
+        Args:
+            session_name: Session directory name
+            session: New session data; re-read from the manifest if omitted
+        """
+        if session is None:
+            manifest_path = self.sessions_path / session_name / 'manifest.yaml'
+            if not manifest_path.exists():
+                self._session_cache.pop(session_name, None)
+                self._fingerprints.pop(session_name, None)
+                self._index.remove(session_name)
+                self._table_stale = True
+                return
+            with open(manifest_path, 'r') as f:
+                session = (yaml.safe_load(f) or {}).get('session', {})
+        self._cache_session(session_name, session)
+
+    def _neighbor_table(self) -> NeighborTable:
+        """Neighbor table for the cached sessions, loaded and patched as needed."""
+        path = self.sessions_path / NEIGHBOR_TABLE
+        if self._table is None:
+            self._table = NeighborTable.load(path)
+        if self._table_stale:
+            if self._table.update(self._index, self._fingerprints):
+                self._table.save(path)
+            self._table_stale = False
+        return self._table
+
     def _calculate_similarity(
         self,
         session_a: Dict[str, Any],
@@ -176,30 +533,29 @@ class CrossPromotionEngine:
         min_similarity: float = 0.3,
         max_results: int = 5
     ) -> List[ContentLink]:
-        """Find sessions related by content similarity."""
+        """Find sessions related by content similarity (ties in name order)."""
         source = self._get_session(session_name)
         if not source:
             return []
 
-        results = []
+        if max_results <= NEIGHBOR_K:
+            ranked = self._neighbor_table().neighbors.get(session_name, [])
+        else:
+            ranked = self._index.top_neighbors([self._index.position(session_name)], max_results)[session_name]
 
-        for other_name, other_data in self._session_cache.items():
-            if other_name == session_name:
-                continue
-
-            similarity = self._calculate_similarity(source, other_data)
-
-            if similarity >= min_similarity:
-                results.append(ContentLink(
-                    session_name=other_name,
-                    title=other_data.get('title', other_name),
-                    relevance_score=similarity,
-                    link_type='related',
-                    explanation=self._explain_relationship(source, other_data),
-                ))
-
-        results.sort(key=lambda x: x.relevance_score, reverse=True)
-        return results[:max_results]
+        results = []
+        for other_name, similarity in ranked[:max_results]:
+            if similarity < min_similarity:
+                break
+            other_data = self._session_cache[other_name]
+            results.append(ContentLink(
+                session_name=other_name,
+                title=other_data.get('title', other_name),
+                relevance_score=similarity,
+                link_type='related',
+                explanation=self._explain_relationship(source, other_data),
+            ))
+        return results
 
     def _explain_relationship(
         self,
@@ -479,9 +835,7 @@ class CrossPromotionEngine:
         # Build edges based on relationships
         processed = set()
         for session_name in self._session_cache:
-            suggestions = self.get_all_suggestions(session_name)
-
-            for link in suggestions.related_sessions:
+            for link in self.find_related_sessions(session_name):
                 edge_key = tuple(sorted([session_name, link.session_name]))
                 if edge_key not in processed:
                     processed.add(edge_key)
@@ -503,18 +857,134 @@ class CrossPromotionEngine:
         }
 
 
+def _synthetic_sessions(count: int, seed: int = 0) -> Dict[str, Dict[str, Any]]:
+    """Manifest-like session dicts with realistic overlap for benchmarking."""
+    import random
+
+    rng = random.Random(seed)
+    families = list(CrossPromotionEngine.JOURNEY_PROGRESSIONS) + ['forest_path', 'mountain_summit']
+    outcomes = list(CrossPromotionEngine.COMPLEMENTARY_OUTCOMES)
+    depths = list(CrossPromotionEngine.DEPTH_PROGRESSIONS)
+    archetypes = [f"archetype_{i}" for i in range(40)]
+    vocabulary = [f"word{i}" for i in range(600)] + list(STOPWORDS)
+
+    sessions = {}
+    for i in range(count):
+        sessions[f"session-{i:05d}"] = {
+            'title': ' '.join(rng.choices(vocabulary, k=rng.randint(3, 7))).title(),
+            'description': ' '.join(rng.choices(vocabulary, k=rng.randint(15, 40))),
+            'journey_family': rng.choice(families),
+            'desired_outcome': rng.choice(outcomes),
+            'depth_level': rng.choice(depths),
+            'archetypes': rng.sample(archetypes, rng.randint(0, 4)),
+            'duration': rng.choice([15, 20, 25, 30, 35, 45, 60]),
+        }
+    return sessions
+
+
+def benchmark(sessions: int = 5000, legacy_rows: int = 50, seed: int = 0) -> Dict[str, Any]:
+    """
+    Time the neighbor table against pairwise scoring on synthetic sessions.
+
+    Runs in a temporary sessions directory. The pairwise cost is measured on
+    ``legacy_rows`` sources and extrapolated to all sessions; the same rows
+    are used to check that batched scores equal _calculate_similarity exactly.
+
+    Returns:
+        Dict of timings (seconds) and checks
+    """
+    import tempfile
+    import time
+
+    data = _synthetic_sessions(sessions, seed)
+    names = list(data)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        (Path(tmp) / 'sessions').mkdir()
+        engine = CrossPromotionEngine(project_root=Path(tmp))
+
+        t0 = time.perf_counter()
+        for name, session in data.items():
+            engine._cache_session(name, session)
+        encode_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        graph = engine.build_content_graph()
+        graph_s = time.perf_counter() - t0
+
+        # Pairwise reference on a sample of rows
+        sample = names[::max(1, sessions // legacy_rows)][:legacy_rows]
+        t0 = time.perf_counter()
+        legacy = [[engine._calculate_similarity(data[a], data[b]) for b in names] for a in sample]
+        legacy_s = (time.perf_counter() - t0) * sessions / len(sample)
+        batched = engine._index.scores([engine._index.position(a) for a in sample])
+        exact = bool(np.array_equal(np.array(legacy), batched))
+
+        # Edit one session: only its row and column are recomputed
+        edited = dict(data[names[0]], title='Garden Of Light Part 2', journey_family='ocean_depths')
+        t0 = time.perf_counter()
+        engine.update_session(names[0], edited)
+        engine.find_related_sessions(names[1])
+        update_s = time.perf_counter() - t0
+        full = engine._index.top_neighbors(range(len(engine._index)), NEIGHBOR_K)
+        incremental_matches = full == engine._neighbor_table().neighbors
+
+        # A fresh engine over unchanged sessions reuses the saved table
+        reloaded = CrossPromotionEngine(project_root=Path(tmp))
+        for name, session in data.items():
+            reloaded._cache_session(name, edited if name == names[0] else session)
+        t0 = time.perf_counter()
+        reloaded.find_related_sessions(names[1])
+        reload_s = time.perf_counter() - t0
+
+    return {
+        'sessions': sessions,
+        'encode_s': encode_s,
+        'graph_s': graph_s,
+        'edges': graph['stats']['total_connections'],
+        'legacy_s': legacy_s,
+        'legacy_rows': len(sample),
+        'exact': exact,
+        'update_s': update_s,
+        'incremental_matches': incremental_matches,
+        'reload_s': reload_s,
+    }
+
+
+def format_benchmark(results: Dict[str, Any]) -> str:
+    """Human-readable benchmark summary."""
+    return "\n".join([
+        f"Sessions:                  {results['sessions']:,}",
+        f"Encode features:           {results['encode_s']:.2f}s",
+        f"Content graph (batched):   {results['graph_s']:.2f}s, {results['edges']:,} edges",
+        f"Pairwise similarity only:  {results['legacy_s']:.1f}s "
+        f"(extrapolated from {results['legacy_rows']} rows)",
+        f"Speedup:                   {results['legacy_s'] / results['graph_s']:.0f}x",
+        f"Edit one session + query:  {results['update_s'] * 1000:.0f}ms",
+        f"Reload saved table:        {results['reload_s'] * 1000:.0f}ms",
+        f"Scores match exactly:      {'✓' if results['exact'] else '✗'}",
+        f"Patched table == rebuild:  {'✓' if results['incremental_matches'] else '✗'}",
+    ])
+
+
 # CLI interface
 if __name__ == '__main__':
     import argparse
-    import json
 
     parser = argparse.ArgumentParser(description='Cross-Promotion Engine')
-    parser.add_argument('action', choices=['suggest', 'endscreen', 'description', 'graph'],
+    parser.add_argument('action', choices=['suggest', 'endscreen', 'description', 'graph', 'benchmark'],
                        help='Action to perform')
     parser.add_argument('--session', help='Session name')
+    parser.add_argument('--sessions', type=int, default=5000,
+                       help='Synthetic session count for benchmark (default: 5000)')
 
     args = parser.parse_args()
 
+    if args.action == 'benchmark':
+        results = benchmark(args.sessions)
+        print(format_benchmark(results))
+        raise SystemExit(0 if results['exact'] and results['incremental_matches'] else 1)
+
     engine = CrossPromotionEngine()
 
     if args.action == 'suggest' and args.session:
@@ -19,17 +19,15 @@ from __future__ import annotations
 import argparse
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import List
 
 from scripts.automation.blessing_clip_pipeline import (
-    ClipArtifacts,
+    DEFAULT_CONFIG,
     Segment,
-    apply_overlay,
-    burn_subtitles,
-    clip_media,
-    clip_subtitles,
+    build_render_jobs,
     ffprobe_duration,
     parse_srt_file,
+    render_clips,
     write_index_csv,
 )
 
@@ -70,6 +68,7 @@ def main() -> None:
     parser.add_argument("--brightness", type=float, default=0.05, help="Overlay brightness lift")
     parser.add_argument("--saturation", type=float, default=1.1, help="Overlay saturation")
     parser.add_argument("--fade", type=float, default=0.4, help="Fade duration seconds for in/out")
+    parser.add_argument("--workers", type=int, help="Parallel ffmpeg renders (default: up to 4)")
     parser.add_argument("--verbose", action="store_true", help="Enable debug logging")
     args = parser.parse_args()
 
@@ -95,44 +94,23 @@ def main() -> None:
         captions = parse_srt_file(args.transcript)
         logging.info("Loaded transcript with %d captions", len(captions))
 
-    artifacts: List[ClipArtifacts] = []
-    for idx, seg in enumerate(segments, start=1):
-        clip_name = f"clip_{idx:03d}.mp4"
-        raw_path = raw_dir / clip_name
-        srt_path = raw_dir / clip_name.replace(".mp4", ".srt")
-
-        logging.info("Cutting %s (%.1f–%.1f)", clip_name, seg.start, seg.end)
-        clip_media(args.input_video, seg, raw_path, reencode_fallback=True)
-
-        if captions:
-            clip_subtitles(captions, seg, srt_path)
-
-        burned_path: Optional[Path] = None
-        if args.burn and captions and srt_path.exists():
-            burned_path = sub_dir / clip_name.replace(".mp4", "_sub.mp4")
-            burn_subtitles(raw_path, srt_path, burned_path)
-
-        final_overlay_path: Optional[Path] = None
-        if args.overlay:
-            final_overlay_path = final_dir / clip_name.replace(".mp4", "_final.mp4")
-            apply_overlay(
-                burned_path or raw_path,
-                final_overlay_path,
-                brightness=args.brightness,
-                saturation=args.saturation,
-                fade_duration=args.fade,
-                clip_duration=max(0.1, seg.end - seg.start),
-            )
-
-        artifacts.append(
-            ClipArtifacts(
-                segment=seg,
-                raw_path=raw_path,
-                srt_path=srt_path,
-                burned_path=burned_path,
-                final_overlay_path=final_overlay_path,
-            )
-        )
+    overlay = None
+    if args.overlay:
+        overlay = {"brightness": args.brightness, "saturation": args.saturation, "fade_duration": args.fade}
+    jobs, artifacts = build_render_jobs(
+        segments,
+        captions,
+        raw_dir=raw_dir,
+        sub_dir=sub_dir,
+        final_dir=final_dir,
+        burn=args.burn,
+        overlay=overlay,
+        keep_raw=True,
+    )
+    render_cfg = dict(DEFAULT_CONFIG["render"])
+    if args.workers:
+        render_cfg["workers"] = args.workers
+    render_clips(args.input_video, jobs, render_cfg)
 
     index_csv = args.output_root / "index.csv"
     write_index_csv(index_csv, artifacts)
@@ -48,6 +48,7 @@ from scripts.automation.state_db import StateDatabase
 from scripts.automation.quality_scorer import compute_quality_score
 from scripts.automation.topic_validator import validate_topic, TopicValidation
 from scripts.automation.topic_enhancer import enhance_topic, TopicEnhancement
+from scripts.utilities.tracing import span, trace
 
 logger = logging.getLogger(__name__)
 
@@ -282,145 +283,153 @@ class NightlyBuilder:
             logger.info(f"Session {session_num}/{count}")
             logger.info(f"{'='*60}")
 
-            try:
-                # Get topic
-                if topics and i < len(topics):
-                    topic_title = topics[i]
-                    topic_data = {
-                        'title': topic_title,
-                        'id': None,
-                        'is_manual': True,
-                        'source_file': source_file  # Include source file for tracking
-                    }
-                else:
-                    # Fetch and validate topic from Notion
-                    topic_data = self._fetch_validated_topic()
-                    if topic_data is None:
-                        logger.error("Could not find a valid dreamweaving topic")
+            with trace("nightly", db=self.db, save=not dry_run) as build:
+                try:
+                    # Get topic
+                    if topics and i < len(topics):
+                        topic_title = topics[i]
+                        topic_data = {
+                            'title': topic_title,
+                            'id': None,
+                            'is_manual': True,
+                            'source_file': source_file  # Include source file for tracking
+                        }
+                    else:
+                        # Fetch and validate topic from Notion
+                        with span("fetch_topic"):
+                            topic_data = self._fetch_validated_topic()
+                        if topic_data is None:
+                            logger.error("Could not find a valid dreamweaving topic")
+                            build.fail('No valid topics available')
+                            results.append({
+                                'session': None,
+                                'status': 'skipped',
+                                'error': 'No valid topics available',
+                            })
+                            continue
+                        topic_title = topic_data['title']
+
+                    # Enhance topic if it's generic or needs improvement
+                    with span("enhance_topic"):
+                        enhancement = enhance_topic(topic_title, use_llm=True)
+                    if enhancement.was_enhanced:
+                        logger.info(f"Topic enhanced: '{topic_title}' → '{enhancement.enhanced_title}'")
+                        topic_title = enhancement.enhanced_title
+                        # Store original for reference
+                        topic_data['original_title'] = topic_data.get('title', '')
+                        topic_data['title'] = topic_title
+                        topic_data['seo_title'] = enhancement.seo_title
+                        topic_data['theme_category'] = enhancement.theme_category
+                        topic_data['suggested_tags'] = enhancement.suggested_tags
+
+                    session_name = slugify(topic_title)
+
+                    # Check if already exists
+                    if self.db.session_exists(session_name):
+                        # Add timestamp suffix
+                        session_name = f"{session_name}-{datetime.now().strftime('%H%M')}"
+
+                    build.session_name = session_name
+                    logger.info(f"Topic: {topic_title}")
+                    logger.info(f"Session name: {session_name}")
+
+                    if dry_run:
+                        logger.info("[DRY RUN] Would generate session")
                         results.append({
-                            'session': None,
-                            'status': 'skipped',
-                            'error': 'No valid topics available',
+                            'session': session_name,
+                            'topic': topic_title,
+                            'status': 'dry_run',
                         })
                         continue
-                    topic_title = topic_data['title']
-
-                # Enhance topic if it's generic or needs improvement
-                enhancement = enhance_topic(topic_title, use_llm=True)
-                if enhancement.was_enhanced:
-                    logger.info(f"Topic enhanced: '{topic_title}' → '{enhancement.enhanced_title}'")
-                    topic_title = enhancement.enhanced_title
-                    # Store original for reference
-                    topic_data['original_title'] = topic_data.get('title', '')
-                    topic_data['title'] = topic_title
-                    topic_data['seo_title'] = enhancement.seo_title
-                    topic_data['theme_category'] = enhancement.theme_category
-                    topic_data['suggested_tags'] = enhancement.suggested_tags
-
-                session_name = slugify(topic_title)
-
-                # Check if already exists
-                if self.db.session_exists(session_name):
-                    # Add timestamp suffix
-                    session_name = f"{session_name}-{datetime.now().strftime('%H%M')}"
-
-                logger.info(f"Topic: {topic_title}")
-                logger.info(f"Session name: {session_name}")
-
-                if dry_run:
-                    logger.info("[DRY RUN] Would generate session")
-                    results.append({
-                        'session': session_name,
-                        'topic': topic_title,
-                        'status': 'dry_run',
-                    })
-                    continue
-
-                # Create DB record
-                self.db.create_session(
-                    session_name=session_name,
-                    topic=topic_title,
-                    notion_topic_id=topic_data.get('id')
-                )
 
-                # Generate session
-                result = self._generate_session(session_name, topic_title)
-
-                if result['success']:
-                    # Mark Notion topic as used (if from Notion)
-                    if not topic_data.get('is_manual') and topic_data.get('id'):
-                        try:
-                            self._mark_topic_used_with_retry(topic_data)
-                            logger.info("Marked Notion topic as used")
-                        except Exception as e:
-                            logger.warning(f"Failed to mark topic as used: {e}")
-                    
-                    # Mark file topic as used (if from topics file)
-                    if topic_data.get('is_manual') and topics:
-                        try:
-                            # Get the topics file path from args - we need it in scope
-                            # Store it in topic_data when we select it from file
-                            source_file = topic_data.get('source_file')
-                            if source_file:
-                                self.db.mark_topic_used(topic_title, source_file, session_name)
-                                logger.info(f"Marked file topic as used: {topic_title}")
-                        except Exception as e:
-                            logger.warning(f"Failed to mark file topic as used: {e}")
-
-                    # Compute quality score
-                    session_path = PROJECT_ROOT / 'sessions' / session_name
-                    quality_score = compute_quality_score(session_path)
-                    logger.info(f"Quality score: {quality_score}")
-
-                    # Update DB
-                    self.db.mark_complete(
+                    # Create DB record
+                    self.db.create_session(
                         session_name=session_name,
-                        session_path=str(session_path),
-                        video_path=str(session_path / 'output' / 'youtube_package' / 'final_video.mp4'),
-                        quality_score=quality_score,
-                        duration_seconds=result.get('duration_seconds'),
+                        topic=topic_title,
+                        notion_topic_id=topic_data.get('id')
                     )
 
-                    # Only mark as uploaded if we can verify the upload succeeded
-                    # Check auto_generate report for upload_website in stages_completed
-                    report_path = session_path / 'working_files' / 'auto_generate_report.yaml'
-                    if report_path.exists():
-                        import yaml
-                        with open(report_path) as f:
-                            report = yaml.safe_load(f)
-                        if 'upload_website' in report.get('stages', {}).get('completed', []):
-                            website_url = f"https://www.salars.net/dreamweavings/{session_name}"
-                            self.db.mark_website_uploaded(session_name, website_url)
-                            logger.info(f"Verified website upload: {website_url}")
+                    # Generate session
+                    result = self._generate_session(session_name, topic_title)
+
+                    if result['success']:
+                        # Mark Notion topic as used (if from Notion)
+                        if not topic_data.get('is_manual') and topic_data.get('id'):
+                            try:
+                                self._mark_topic_used_with_retry(topic_data)
+                                logger.info("Marked Notion topic as used")
+                            except Exception as e:
+                                logger.warning(f"Failed to mark topic as used: {e}")
+                    
+                        # Mark file topic as used (if from topics file)
+                        if topic_data.get('is_manual') and topics:
+                            try:
+                                # Get the topics file path from args - we need it in scope
+                                # Store it in topic_data when we select it from file
+                                source_file = topic_data.get('source_file')
+                                if source_file:
+                                    self.db.mark_topic_used(topic_title, source_file, session_name)
+                                    logger.info(f"Marked file topic as used: {topic_title}")
+                            except Exception as e:
+                                logger.warning(f"Failed to mark file topic as used: {e}")
+
+                        # Compute quality score
+                        session_path = PROJECT_ROOT / 'sessions' / session_name
+                        with span("quality_score"):
+                            quality_score = compute_quality_score(session_path)
+                        logger.info(f"Quality score: {quality_score}")
+
+                        # Update DB
+                        self.db.mark_complete(
+                            session_name=session_name,
+                            session_path=str(session_path),
+                            video_path=str(session_path / 'output' / 'youtube_package' / 'final_video.mp4'),
+                            quality_score=quality_score,
+                            duration_seconds=result.get('duration_seconds'),
+                        )
+
+                        # Only mark as uploaded if we can verify the upload succeeded
+                        # Check auto_generate report for upload_website in stages_completed
+                        report_path = session_path / 'working_files' / 'auto_generate_report.yaml'
+                        if report_path.exists():
+                            import yaml
+                            with open(report_path) as f:
+                                report = yaml.safe_load(f)
+                            if 'upload_website' in report.get('stages', {}).get('completed', []):
+                                website_url = f"https://www.salars.net/dreamweavings/{session_name}"
+                                self.db.mark_website_uploaded(session_name, website_url)
+                                logger.info(f"Verified website upload: {website_url}")
+                            else:
+                                logger.warning(f"Website upload not in completed stages for {session_name}")
                         else:
-                            logger.warning(f"Website upload not in completed stages for {session_name}")
+                            logger.warning(f"No auto_generate report found for {session_name} - cannot verify upload")
+
+                        results.append({
+                            'session': session_name,
+                            'topic': topic_title,
+                            'status': 'success',
+                            'quality_score': quality_score,
+                            'duration_seconds': result.get('duration_seconds'),
+                        })
                     else:
-                        logger.warning(f"No auto_generate report found for {session_name} - cannot verify upload")
+                        build.fail(result.get('error', 'Unknown error'))
+                        self.db.mark_failed(session_name, result.get('error', 'Unknown error'))
+                        results.append({
+                            'session': session_name,
+                            'topic': topic_title,
+                            'status': 'failed',
+                            'error': result.get('error'),
+                        })
 
+                except Exception as e:
+                    logger.error(f"Failed to process session {session_num}: {e}")
+                    build.fail(e)
                     results.append({
-                        'session': session_name,
-                        'topic': topic_title,
-                        'status': 'success',
-                        'quality_score': quality_score,
-                        'duration_seconds': result.get('duration_seconds'),
-                    })
-                else:
-                    self.db.mark_failed(session_name, result.get('error', 'Unknown error'))
-                    results.append({
-                        'session': session_name,
-                        'topic': topic_title,
-                        'status': 'failed',
-                        'error': result.get('error'),
+                        'session': None,
+                        'status': 'error',
+                        'error': str(e),
                     })
 
-            except Exception as e:
-                logger.error(f"Failed to process session {session_num}: {e}")
-                results.append({
-                    'session': None,
-                    'status': 'error',
-                    'error': str(e),
-                })
-
         # Summary
         elapsed = (datetime.now() - start_time).total_seconds()
         success_count = sum(1 for r in results if r.get('status') == 'success')
@@ -498,7 +507,8 @@ class NightlyBuilder:
         self.db.update_status(session_name, 'planning')
         logger.info(f"Creating execution plan for: {topic}")
 
-        plan_result = self._create_session_plan(topic, session_name)
+        with span("plan"):
+            plan_result = self._create_session_plan(topic, session_name)
 
         if plan_result.get('has_blockers'):
             blockers = plan_result.get('blockers', ['Unknown blocker'])
@@ -536,13 +546,15 @@ class NightlyBuilder:
         logger.info(f"Running: {' '.join(cmd)}")
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=str(PROJECT_ROOT),
-                timeout=7200,  # 2 hour timeout (SD can be slow)
-            )
+            # The child records its own per-stage trace (pipeline auto_generate)
+            with span("auto_generate"):
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    cwd=str(PROJECT_ROOT),
+                    timeout=7200,  # 2 hour timeout (SD can be slow)
+                )
 
             duration = time.time() - start_time
             logger.info(f"Generation completed in {duration/60:.1f} minutes")
@@ -22,19 +22,33 @@ Usage:
         'manifest': {...}
     }
     result = classifier.get_playlists_for_session(session_data)
+
+    # Many sessions at once (keywords scored through a compiled keyword model)
+    results = classifier.get_playlists_batch([session_data, ...])
+
+    python -m scripts.automation.playlist_classifier --all
 """
 
 import logging
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import yaml
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.core.categorization.model import DEFAULT_MODEL_DIR, KeywordModel, load_model
+
 logger = logging.getLogger(__name__)
 
 # Default config path
 DEFAULT_CONFIG_PATH = Path(__file__).parent.parent.parent / 'config' / 'youtube_playlists.yaml'
+DEFAULT_MODEL_PATH = DEFAULT_MODEL_DIR / 'playlists.npz'
 
 
 @dataclass
@@ -56,16 +70,21 @@ class PlaylistClassifier:
     Analyzes session metadata and routes to appropriate YouTube playlists.
     """
 
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None,
+                 model_path: Optional[Path] = DEFAULT_MODEL_PATH):
         """Initialize with playlist configuration.
 
         Args:
             config_path: Path to youtube_playlists.yaml. Uses default if not provided.
+            model_path: Where the compiled keyword model for batch classification
+                is persisted (None keeps it in memory only).
         """
         if config_path is None:
             config_path = DEFAULT_CONFIG_PATH
 
         self.config_path = Path(config_path)
+        self.model_path = model_path
+        self._model: Optional[KeywordModel] = None
         self.config = self._load_config()
         self.playlists = self._build_playlist_registry()
         self.weights = self.config.get('classification', {}).get('weights', {
@@ -101,7 +120,11 @@ class PlaylistClassifier:
 
         return registry
 
-    def classify(self, session_data: Dict[str, Any]) -> List[PlaylistMatch]:
+    def classify(
+        self,
+        session_data: Dict[str, Any],
+        keyword_scores: Optional[Dict[str, List[float]]] = None
+    ) -> List[PlaylistMatch]:
         """
         Classify session and return ranked playlist matches.
 
@@ -113,6 +136,8 @@ class PlaylistClassifier:
                 - duration_minutes: Session duration
                 - manifest: Full manifest data (optional)
                 - archetypes: List of archetype dicts (optional)
+            keyword_scores: Keyword scores for this session from classify_batch()
+                (text field -> score per model label); matched per keyword if omitted
 
         Returns:
             List of PlaylistMatch objects sorted by confidence (highest first)
@@ -122,7 +147,7 @@ class PlaylistClassifier:
         # Score content-based and format-based playlists
         for slug, playlist in self.playlists.items():
             if playlist['type'] in ['content', 'format']:
-                score, signals = self._score_content_match(session_data, playlist)
+                score, signals = self._score_content_match(session_data, playlist, keyword_scores)
                 if score > 0:
                     matches.append(PlaylistMatch(
                         playlist_id=playlist.get('youtube_id', ''),
@@ -136,7 +161,7 @@ class PlaylistClassifier:
 
             elif playlist['type'] == 'series':
                 # Series playlists use keywords but flag for manual review
-                score, signals = self._score_content_match(session_data, playlist)
+                score, signals = self._score_content_match(session_data, playlist, keyword_scores)
                 if score > 0.3:  # Lower threshold for series suggestions
                     matches.append(PlaylistMatch(
                         playlist_id=playlist.get('youtube_id', ''),
@@ -149,7 +174,7 @@ class PlaylistClassifier:
                     ))
 
         # Check duration-based playlists
-        duration_matches = self._check_duration_playlists(session_data)
+        duration_matches = self._check_duration_playlists(session_data, keyword_scores)
         matches.extend(duration_matches)
 
         # Sort by confidence (highest first)
@@ -157,16 +182,101 @@ class PlaylistClassifier:
 
         return matches
 
+    # Text fields scored against playlist keywords by classify_batch()
+    KEYWORD_FIELDS = ('title', 'description', 'tags', 'archetypes', 'combined')
+
+    def _keyword_texts(self, session_data: Dict[str, Any]) -> Dict[str, str]:
+        """Lower-cased text of each KEYWORD_FIELDS entry, as _score_content_match reads them."""
+        tags = session_data.get('tags', [])
+        if isinstance(tags, str):
+            tags = [t.strip() for t in tags.split(',')]
+        return {
+            'title': session_data.get('title', '').lower(),
+            'description': session_data.get('description', '').lower(),
+            'tags': ' '.join(str(t) for t in tags).lower(),
+            'archetypes': ' '.join(self._extract_archetypes(session_data)).lower(),
+            'combined': self._get_combined_text(session_data).lower(),
+        }
+
+    @property
+    def keyword_model(self) -> KeywordModel:
+        """Playlist keywords compiled for batch scoring (loaded or rebuilt on first use)."""
+        if self._model is None:
+            vocabulary = {}
+            for slug, playlist in self.playlists.items():
+                if playlist['type'] not in ('content', 'format', 'series'):
+                    continue
+                keywords = playlist.get('keywords', {})
+                vocabulary[slug] = {
+                    'primary': [kw.lower() for kw in keywords.get('primary', [])],
+                    'secondary': [kw.lower() for kw in keywords.get('secondary', [])],
+                    'deprioritize': [
+                        kw.lower() for kw in playlist.get('deprioritize_if', {}).get('keywords', [])
+                    ],
+                }
+            for slug, playlist in self.config.get('duration_playlists', {}).items():
+                keywords = playlist.get('keywords', {})
+                vocabulary[f'duration/{slug}'] = {
+                    'primary': [kw.lower() for kw in keywords.get('primary', [])],
+                    'secondary': [kw.lower() for kw in keywords.get('secondary', [])],
+                }
+            self._model = load_model(self.model_path, vocabulary, mode='substring')
+        return self._model
+
+    def classify_batch(self, sessions: Sequence[Dict[str, Any]]) -> List[List[PlaylistMatch]]:
+        """
+        Classify many sessions at once.
+
+        Returns the same matches as classify() on each session. Every text
+        field of every session is tokenized once and matched against all
+        playlist keywords with sparse matrix products.
+        """
+        if not sessions:
+            return []
+
+        model = self.keyword_model
+        width = len(self.KEYWORD_FIELDS)
+        texts = [
+            text
+            for session_data in sessions
+            for text in self._keyword_texts(session_data).values()
+        ]
+        counts = model.match_counts(model.vectorize(texts))
+        model.flush()
+
+        # _keyword_score of every (primary, secondary) pair, computed once per
+        # distinct pair: texts x labels
+        primary = model.group(counts, 'primary').astype(np.int64)
+        secondary = model.group(counts, 'secondary').astype(np.int64)
+        base = int(secondary.max(initial=0)) + 1
+        unique, inverse = np.unique(primary * base + secondary, return_inverse=True)
+        scores = np.array([self._keyword_score(*divmod(int(pair), base)) for pair in unique])
+        scores = scores[inverse.reshape(-1)].reshape(primary.shape)
+        deprioritized = model.group(counts, 'deprioritize') > 0
+
+        results = []
+        for i, session_data in enumerate(sessions):
+            keyword_scores = {
+                field: scores[i * width + k].tolist() for k, field in enumerate(self.KEYWORD_FIELDS)
+            }
+            keyword_scores['deprioritize'] = deprioritized[i * width + width - 1].tolist()
+            results.append(self.classify(session_data, keyword_scores=keyword_scores))
+        return results
+
     def _score_content_match(
         self,
         session_data: Dict[str, Any],
-        playlist: dict
+        playlist: dict,
+        keyword_scores: Optional[Dict[str, List[float]]] = None
     ) -> Tuple[float, Dict[str, float]]:
         """
         Score how well session matches a content playlist.
 
         Returns (total_score, signal_breakdown).
         """
+        if keyword_scores is not None:
+            return self._score_counted_match(session_data, playlist, keyword_scores)
+
         signals = {
             'title': 0.0,
             'description': 0.0,
@@ -230,6 +340,36 @@ class PlaylistClassifier:
 
         return min(total, 1.0), signals
 
+    def _score_counted_match(
+        self,
+        session_data: Dict[str, Any],
+        playlist: dict,
+        keyword_scores: Dict[str, List[float]]
+    ) -> Tuple[float, Dict[str, float]]:
+        """_score_content_match from batch keyword scores."""
+        label = self._model.label_index[playlist['slug']]
+        signals = {
+            'title': keyword_scores['title'][label],
+            'description': keyword_scores['description'][label],
+            'tags': keyword_scores['tags'][label],
+            'manifest_outcome': self._match_manifest_fields(
+                session_data.get('manifest', {}), playlist.get('manifest_fields', {})
+            ),
+            'archetypes': keyword_scores['archetypes'][label],
+        }
+        deprioritized = keyword_scores['deprioritize'][label]
+
+        total = (
+            signals['title'] * self.weights.get('title', 0.35) +
+            signals['description'] * self.weights.get('description', 0.25) +
+            signals['tags'] * self.weights.get('tags', 0.15) +
+            signals['manifest_outcome'] * self.weights.get('manifest_outcome', 0.15) +
+            signals['archetypes'] * self.weights.get('archetypes', 0.10)
+        )
+        total *= 0.5 if deprioritized else 1.0
+
+        return min(total, 1.0), signals
+
     def _match_keywords(
         self,
         text: str,
@@ -248,12 +388,14 @@ class PlaylistClassifier:
         primary_matches = sum(1 for kw in primary if kw.lower() in text)
         secondary_matches = sum(1 for kw in secondary if kw.lower() in text)
 
+        return self._keyword_score(primary_matches, secondary_matches)
+
+    @staticmethod
+    def _keyword_score(primary_matches: int, secondary_matches: int) -> float:
+        """Score keyword match counts (shared by the per-session and batch paths)."""
         # Weighted score
         score = (primary_matches * 1.0 + secondary_matches * 0.5)
 
-        if not primary and not secondary:
-            return 0.0
-
         # Normalize with diminishing returns
         # Scoring: 1 primary = 0.5, 1 secondary = 0.35
         # Additional matches add less (diminishing returns)
@@ -334,7 +476,11 @@ class PlaylistClassifier:
 
         return current
 
-    def _check_duration_playlists(self, session_data: Dict[str, Any]) -> List[PlaylistMatch]:
+    def _check_duration_playlists(
+        self,
+        session_data: Dict[str, Any],
+        keyword_scores: Optional[Dict[str, List[float]]] = None
+    ) -> List[PlaylistMatch]:
         """Check if session matches any duration-based playlists."""
         matches = []
         duration = session_data.get('duration_minutes', 0)
@@ -368,8 +514,12 @@ class PlaylistClassifier:
                 primary = keywords.get('primary', [])
                 secondary = keywords.get('secondary', [])
 
-                combined_text = self._get_combined_text(session_data).lower()
-                keyword_boost = self._match_keywords(combined_text, primary, secondary) * 0.1
+                if keyword_scores is not None:
+                    label = self._model.label_index[f'duration/{slug}']
+                    keyword_boost = keyword_scores['combined'][label] * 0.1
+                else:
+                    combined_text = self._get_combined_text(session_data).lower()
+                    keyword_boost = self._match_keywords(combined_text, primary, secondary) * 0.1
 
                 matches.append(PlaylistMatch(
                     playlist_id=playlist.get('youtube_id', ''),
@@ -442,7 +592,14 @@ class PlaylistClassifier:
                 - needs_review: Whether manual review is suggested
                 - details: Full match details for logging
         """
-        matches = self.classify(session_data)
+        return self._select_playlists(self.classify(session_data))
+
+    def get_playlists_batch(self, sessions: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """get_playlists_for_session() for many sessions, classified with classify_batch()."""
+        return [self._select_playlists(matches) for matches in self.classify_batch(sessions)]
+
+    def _select_playlists(self, matches: List[PlaylistMatch]) -> Dict[str, Any]:
+        """Apply thresholds and the multi-match strategy to ranked matches."""
         config = self.config.get('classification', {})
 
         min_confidence = config.get('min_confidence', 0.4)
@@ -517,15 +674,15 @@ class PlaylistClassifier:
 # Utility Functions
 # ============================================================================
 
-def classify_session(session_path: Path) -> Dict[str, Any]:
+def load_session_data(session_path: Path) -> Dict[str, Any]:
     """
-    Convenience function to classify a session from its path.
+    Build classifier input from a session's manifest.
 
     Args:
         session_path: Path to session directory
 
     Returns:
-        Playlist assignment result
+        Session data dict for PlaylistClassifier
     """
     session_path = Path(session_path)
 
@@ -553,7 +710,7 @@ def classify_session(session_path: Path) -> Dict[str, Any]:
         duration = int(duration) // 60
 
     # Build session data dict
-    session_data = {
+    return {
         'title': (
             youtube_info.get('optimized_title') or
             youtube_info.get('title') or
@@ -570,8 +727,19 @@ def classify_session(session_path: Path) -> Dict[str, Any]:
         'manifest': manifest
     }
 
+
+def classify_session(session_path: Path) -> Dict[str, Any]:
+    """
+    Convenience function to classify a session from its path.
+
+    Args:
+        session_path: Path to session directory
+
+    Returns:
+        Playlist assignment result
+    """
     classifier = PlaylistClassifier()
-    return classifier.get_playlists_for_session(session_data)
+    return classifier.get_playlists_for_session(load_session_data(session_path))
 
 
 def classify_all_sessions(sessions_dir: Path = None) -> Dict[str, Dict]:
@@ -588,6 +756,7 @@ def classify_all_sessions(sessions_dir: Path = None) -> Dict[str, Dict]:
         sessions_dir = Path(__file__).parent.parent.parent / 'sessions'
 
     results = {}
+    loaded: Dict[str, Dict[str, Any]] = {}
 
     for session_path in sessions_dir.iterdir():
         if not session_path.is_dir():
@@ -600,12 +769,26 @@ def classify_all_sessions(sessions_dir: Path = None) -> Dict[str, Dict]:
             continue
 
         try:
-            result = classify_session(session_path)
-            results[session_path.name] = result
+            loaded[session_path.name] = load_session_data(session_path)
+            results[session_path.name] = None  # keep directory order
         except Exception as e:
             logger.warning(f"Failed to classify {session_path.name}: {e}")
             results[session_path.name] = {'error': str(e)}
 
+    # One classifier and one batch for the whole catalog
+    classifier = PlaylistClassifier()
+    try:
+        batch = classifier.get_playlists_batch(list(loaded.values()))
+        results.update(zip(loaded, batch))
+    except Exception:
+        # Fall back to one session at a time so a bad manifest only fails itself
+        for name, session_data in loaded.items():
+            try:
+                results[name] = classifier.get_playlists_for_session(session_data)
+            except Exception as e:
+                logger.warning(f"Failed to classify {name}: {e}")
+                results[name] = {'error': str(e)}
+
     return results
 
 
@@ -0,0 +1,695 @@
+#!/usr/bin/env python3
+"""
+Tiered Session Archive Format
+
+Packs a session directory into three tiers instead of keeping it full size:
+
+1. Dropped - intermediates that a pipeline stage can regenerate (see
+   STAGE_OUTPUTS) are left out; the index records which stage rebuilds them
+2. FLAC    - integer PCM WAV stems are transcoded losslessly to FLAC in a
+   process pool; each stem's decoded PCM is hashed and checked before the
+   original is given up
+3. Pack    - everything else goes into ``pack.tar.zst``, a tar stream cut
+   into independent zstd frames. ``index.json`` records the frame each
+   member starts in, so one file can be read back without decompressing
+   the rest. The pack is still an ordinary .tar.zst (``zstd -d | tar x``)
+
+Layout of an archived session:
+
+    archive/<session>/
+        index.json
+        pack.tar.zst
+        stems/output/voice.wav.flac
+
+Restored WAVs are sample-identical to the originals (same rate, channels
+and bit depth); extra WAV header chunks are not kept.
+
+Usage:
+    from scripts.automation.session_archive import write_archive, SessionArchive
+
+    stats = write_archive(Path('sessions/my-session'), Path('archive/my-session'))
+    archive = SessionArchive(Path('archive/my-session'))
+    archive.extract('output/final_master.mp3', Path('/tmp/final_master.mp3'))
+    archive.extract_all(Path('sessions/my-session'))
+
+CLI:
+    python -m scripts.automation.session_archive benchmark [--minutes 30] [--stems 4]
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tarfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    zstandard = None
+    HAS_ZSTD = False
+
+try:
+    import soundfile as sf
+    HAS_SOUNDFILE = True
+except ImportError:
+    sf = None
+    HAS_SOUNDFILE = False
+
+FORMAT_VERSION = 1
+INDEX_NAME = 'index.json'
+PACK_NAME = 'pack.tar.zst'
+STEMS_DIR = 'stems'
+
+FRAME_BYTES = 4 << 20  # Uncompressed bytes per zstd frame (seek granularity)
+ZSTD_LEVEL = 6
+PRECOMPRESSED_LEVEL = 1  # Already-compressed media barely shrinks; don't spend CPU on it
+PRECOMPRESSED = {'.mp3', '.mp4', '.m4a', '.aac', '.ogg', '.flac', '.png', '.jpg', '.jpeg', '.webp', '.zip', '.gz'}
+
+# WAV subtypes FLAC stores bit-exactly; other WAVs (float, 32-bit) go in the pack
+FLAC_SUBTYPES = {'PCM_U8': 'PCM_S8', 'PCM_S8': 'PCM_S8', 'PCM_16': 'PCM_16', 'PCM_24': 'PCM_24'}
+PCM_BLOCK_FRAMES = 1 << 18
+COPY_CHUNK = 1 << 20
+
+
+@dataclass(frozen=True)
+class StageOutput:
+    """A session file a pipeline stage writes and can write again."""
+    pattern: str  # Glob relative to the session directory
+    stage: str  # Stage that regenerates it
+    requires: Tuple[str, ...] = ('manifest.yaml',)  # Globs that must survive archiving
+    keep: Tuple[str, ...] = ()  # Globs matching the pattern that are deliverables, never dropped
+
+    def matches(self, rel: str) -> bool:
+        return (fnmatch.fnmatchcase(rel, self.pattern)
+                and not any(fnmatch.fnmatchcase(rel, k) for k in self.keep))
+
+
+# Intermediates that are not archived. Everything else is kept.
+STAGE_OUTPUTS: Tuple[StageOutput, ...] = (
+    StageOutput('output/*_temp.wav', 'audio'),
+    StageOutput('output/*_cleanup.wav', 'audio'),
+    StageOutput('output/_temp_load.wav', 'audio'),
+    StageOutput('output/binaural.wav', 'binaural'),
+    StageOutput('output/binaural_dynamic.wav', 'binaural'),
+    StageOutput('output/sfx.wav', 'sfx'),
+    StageOutput('output/voice_enhanced.wav', 'voice_post', ('manifest.yaml', 'output/voice.*')),
+    StageOutput('output/voice_enhanced.mp3', 'voice_post', ('manifest.yaml', 'output/voice.*')),
+    StageOutput('output/session_mixed.wav', 'mix', ('manifest.yaml', 'output/voice.*')),
+    # The mix the video stage needs is rebuilt from the voice, so the voice must be kept;
+    # session_final.mp4 is the delivered video and is always archived
+    StageOutput('output/video/*', 'video', ('manifest.yaml', 'images/*', 'output/voice.*'),
+                keep=('output/video/session_final.mp4',)),
+)
+
+
+@dataclass
+class ArchivePlan:
+    """Which tier each file of a session goes to."""
+    dropped: Dict[str, str] = field(default_factory=dict)  # relpath -> stage
+    flac: List[str] = field(default_factory=list)
+    pack: List[str] = field(default_factory=list)
+
+
+def _session_files(session_path: Path) -> List[str]:
+    """Relative paths of all regular files (symlinks followed), sorted."""
+    files = []
+    for root, dirs, names in os.walk(session_path, followlinks=False):
+        dirs.sort()
+        for name in sorted(names):
+            path = Path(root) / name
+            if path.is_file():
+                files.append(path.relative_to(session_path).as_posix())
+    return files
+
+
+def plan_archive(
+    session_path: Path,
+    stage_outputs: Sequence[StageOutput] = STAGE_OUTPUTS,
+    drop_intermediates: bool = True,
+) -> ArchivePlan:
+    """
+    Sort a session's files into the dropped, FLAC and pack tiers.
+
+    An intermediate is only dropped when every file its stage needs to
+    rebuild it is kept.
+
+    Args:
+        session_path: Session directory
+        stage_outputs: Regenerable outputs to drop
+        drop_intermediates: Keep everything when False
+
+    Returns:
+        ArchivePlan
+    """
+    files = _session_files(session_path)
+    plan = ArchivePlan()
+
+    candidates: Dict[str, StageOutput] = {}
+    if drop_intermediates:
+        for rel in files:
+            for output in stage_outputs:
+                if output.matches(rel):
+                    candidates[rel] = output
+                    break
+    kept = [rel for rel in files if rel not in candidates]
+    for rel, output in candidates.items():
+        if all(any(fnmatch.fnmatchcase(k, req) for k in kept) for req in output.requires):
+            plan.dropped[rel] = output.stage
+        else:
+            kept.append(rel)
+    kept.sort()
+
+    for rel in kept:
+        if rel.lower().endswith('.wav') and _flac_subtype(session_path / rel):
+            plan.flac.append(rel)
+        else:
+            plan.pack.append(rel)
+    return plan
+
+
+def _flac_subtype(path: Path) -> Optional[str]:
+    """FLAC subtype a WAV can be stored as losslessly, or None."""
+    if not HAS_SOUNDFILE:
+        return None
+    try:
+        info = sf.info(str(path))
+    except Exception:
+        return None
+    return FLAC_SUBTYPES.get(info.subtype)
+
+
+# ==================== FLAC Tier ====================
+
+def _pcm_blocks(path: Path):
+    """Integer PCM of an audio file in blocks (int32 keeps 8/16/24-bit samples exact)."""
+    with sf.SoundFile(str(path)) as f:
+        while True:
+            block = f.read(PCM_BLOCK_FRAMES, dtype='int32', always_2d=True)
+            if not len(block):
+                return
+            yield block
+
+
+def encode_flac(src: str, dst: str) -> Dict[str, Any]:
+    """
+    Transcode a WAV to FLAC and check the round trip (process pool worker).
+
+    Returns:
+        Stream info and the PCM digest to store in the index
+
+    Raises:
+        ValueError: If the FLAC does not decode to the same samples
+    """
+    with sf.SoundFile(src) as f:
+        samplerate, channels, subtype = f.samplerate, f.channels, f.subtype
+
+    digest = hashlib.blake2b(digest_size=32)
+    frames = 0
+    Path(dst).parent.mkdir(parents=True, exist_ok=True)
+    with sf.SoundFile(dst, 'w', samplerate=samplerate, channels=channels,
+                      format='FLAC', subtype=FLAC_SUBTYPES[subtype]) as out:
+        for block in _pcm_blocks(Path(src)):
+            out.write(block)
+            digest.update(block)
+            frames += len(block)
+
+    check = hashlib.blake2b(digest_size=32)
+    for block in _pcm_blocks(Path(dst)):
+        check.update(block)
+    if check.hexdigest() != digest.hexdigest():
+        raise ValueError(f"FLAC round trip changed samples: {src}")
+
+    return {
+        'samplerate': samplerate,
+        'channels': channels,
+        'subtype': subtype,
+        'frames': frames,
+        'pcm_blake2b': digest.hexdigest(),
+        'stored': os.path.getsize(dst),
+    }
+
+
+def decode_flac(src: str, dst: str, info: Dict[str, Any]) -> None:
+    """Write a FLAC stem back as WAV with its original subtype and verify the samples."""
+    digest = hashlib.blake2b(digest_size=32)
+    Path(dst).parent.mkdir(parents=True, exist_ok=True)
+    with sf.SoundFile(dst, 'w', samplerate=info['samplerate'], channels=info['channels'],
+                      format='WAV', subtype=info['subtype']) as out:
+        for block in _pcm_blocks(Path(src)):
+            out.write(block)
+            digest.update(block)
+    if digest.hexdigest() != info['pcm_blake2b']:
+        raise ValueError(f"Restored samples do not match the archive: {dst}")
+
+
+# ==================== Pack Tier ====================
+
+class _PackWriter:
+    """Tar stream written as independent zstd frames, recording where each member starts."""
+
+    def __init__(self, path: Path, level: int = ZSTD_LEVEL):
+        self._file = open(path, 'wb')
+        self._compressors = {
+            level: zstandard.ZstdCompressor(level=level),
+            PRECOMPRESSED_LEVEL: zstandard.ZstdCompressor(level=PRECOMPRESSED_LEVEL),
+        }
+        self._level = level
+        self._buffer = bytearray()
+        self._offset = 0  # Compressed bytes written so far
+
+    def add(self, path: Path, rel: str) -> Dict[str, Any]:
+        st = path.stat()
+        info = tarfile.TarInfo(rel)
+        info.size = st.st_size
+        info.mtime = int(st.st_mtime)
+        info.mode = st.st_mode & 0o7777
+        header = info.tobuf(format=tarfile.PAX_FORMAT)
+
+        level = PRECOMPRESSED_LEVEL if path.suffix.lower() in PRECOMPRESSED else self._level
+        entry = {
+            'tier': 'pack',
+            'size': st.st_size,
+            'mtime': st.st_mtime,
+            'mode': info.mode,
+            'frame': self._offset,  # Frame holding the start of this member...
+            'skip': len(self._buffer),  # ...and where in its decompressed bytes
+            'header': len(header),
+        }
+
+        digest = hashlib.blake2b(digest_size=32)
+        self._write(header, level)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(COPY_CHUNK), b''):
+                digest.update(chunk)
+                self._write(chunk, level)
+        self._write(b'\0' * (-st.st_size % tarfile.BLOCKSIZE), level)
+        entry['blake2b'] = digest.hexdigest()
+        return entry
+
+    def _write(self, data: bytes, level: int):
+        self._buffer += data
+        while len(self._buffer) >= FRAME_BYTES:
+            self._flush(level, FRAME_BYTES)
+
+    def _flush(self, level: int, size: Optional[int] = None):
+        chunk = bytes(self._buffer[:size]) if size else bytes(self._buffer)
+        del self._buffer[:len(chunk)]
+        if chunk:
+            frame = self._compressors[level].compress(chunk)
+            self._file.write(frame)
+            self._offset += len(frame)
+
+    def close(self):
+        self._buffer += b'\0' * (2 * tarfile.BLOCKSIZE)  # End-of-archive marker
+        self._flush(self._level)
+        self._file.close()
+
+
+# ==================== Writing ====================
+
+def write_archive(
+    session_path: Path,
+    dest: Path,
+    workers: Optional[int] = None,
+    level: int = ZSTD_LEVEL,
+    drop_intermediates: bool = True,
+    stage_outputs: Sequence[StageOutput] = STAGE_OUTPUTS,
+) -> Dict[str, Any]:
+    """
+    Archive a session directory into ``dest`` (which must not exist).
+
+    The archive is built in a sibling temp directory and renamed into place
+    once complete; the session directory itself is not modified.
+
+    Args:
+        session_path: Session directory
+        dest: Archive directory to create
+        workers: FLAC encoder processes (default: CPU count)
+        level: zstd level for the pack
+        drop_intermediates: Leave out regenerable stage outputs
+        stage_outputs: Regenerable outputs to drop
+
+    Returns:
+        Stats: source/stored bytes, per-tier counts and timings
+    """
+    if not HAS_ZSTD:
+        raise ImportError("Tiered archives need zstandard (pip install zstandard)")
+
+    session_path, dest = Path(session_path), Path(dest)
+    if dest.exists():
+        raise FileExistsError(f"Archive already exists: {dest}")
+
+    t0 = time.perf_counter()
+    plan = plan_archive(session_path, stage_outputs, drop_intermediates)
+    staging = dest.with_name(f".{dest.name}.partial")
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir(parents=True)
+
+    files: Dict[str, Dict[str, Any]] = {}
+    try:
+        for rel, stage in plan.dropped.items():
+            files[rel] = {'tier': 'dropped', 'size': (session_path / rel).stat().st_size, 'stage': stage}
+
+        # FLAC stems encode in worker processes while the pack is written here
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            jobs = {
+                rel: pool.submit(encode_flac, str(session_path / rel),
+                                 str(staging / STEMS_DIR / f"{rel}.flac"))
+                for rel in plan.flac
+            }
+
+            pack = _PackWriter(staging / PACK_NAME, level)
+            try:
+                for rel in plan.pack:
+                    files[rel] = pack.add(session_path / rel, rel)
+            finally:
+                pack.close()
+
+            for rel, job in jobs.items():
+                st = (session_path / rel).stat()
+                files[rel] = {
+                    'tier': 'flac',
+                    'size': st.st_size,
+                    'mtime': st.st_mtime,
+                    'mode': st.st_mode & 0o7777,
+                    'path': f"{STEMS_DIR}/{rel}.flac",
+                    **job.result(),
+                }
+
+        index = {
+            'version': FORMAT_VERSION,
+            'session': session_path.name,
+            'created_at': datetime.now().isoformat(),
+            'files': dict(sorted(files.items())),
+        }
+        with open(staging / INDEX_NAME, 'w') as f:
+            json.dump(index, f, indent=1)
+        os.replace(staging, dest)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    source_bytes = sum(entry['size'] for entry in files.values())
+    stored_bytes = sum(p.stat().st_size for p in dest.rglob('*') if p.is_file())
+    return {
+        'files': len(files),
+        'dropped': len(plan.dropped),
+        'flac': len(plan.flac),
+        'packed': len(plan.pack),
+        'source_bytes': source_bytes,
+        'dropped_bytes': sum(e['size'] for e in files.values() if e['tier'] == 'dropped'),
+        'stored_bytes': stored_bytes,
+        'ratio': source_bytes / stored_bytes if stored_bytes else 0.0,
+        'seconds': time.perf_counter() - t0,
+    }
+
+
+# ==================== Reading ====================
+
+class SessionArchive:
+    """Read access to a tiered session archive."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path / INDEX_NAME) as f:
+            self.index = json.load(f)
+        if self.index.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported archive version {self.index.get('version')} in {self.path}")
+
+    @staticmethod
+    def is_archive(path: Path) -> bool:
+        """Whether a directory holds a tiered archive (as opposed to a moved session)."""
+        return (Path(path) / INDEX_NAME).exists()
+
+    @property
+    def files(self) -> Dict[str, Dict[str, Any]]:
+        return self.index['files']
+
+    def stored_files(self) -> List[str]:
+        """Relative paths that can be restored (everything not dropped)."""
+        return [rel for rel, entry in self.files.items() if entry['tier'] != 'dropped']
+
+    def extract(self, rel: str, dest: Path) -> Path:
+        """
+        Restore one file without unpacking anything else.
+
+        Args:
+            rel: Path relative to the session directory (e.g. 'output/final_master.mp3')
+            dest: Where to write it
+
+        Returns:
+            dest
+
+        Raises:
+            KeyError: If the archive has no such file
+            FileNotFoundError: If the file was dropped as a regenerable intermediate
+        """
+        entry = self.files.get(rel)
+        if entry is None:
+            raise KeyError(f"Not in archive: {rel}")
+        if entry['tier'] == 'dropped':
+            raise FileNotFoundError(f"{rel} was not archived; regenerate it with the '{entry['stage']}' stage")
+
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        partial = dest.with_name(f".{dest.name}.partial")
+        try:
+            if entry['tier'] == 'flac':
+                if not HAS_SOUNDFILE:
+                    raise ImportError("Restoring FLAC stems needs soundfile (pip install soundfile)")
+                decode_flac(str(self.path / entry['path']), str(partial), entry)
+            else:
+                self._extract_packed(entry, partial)
+            os.chmod(partial, entry['mode'])
+            os.utime(partial, (entry['mtime'], entry['mtime']))
+            os.replace(partial, dest)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+        return dest
+
+    def _extract_packed(self, entry: Dict[str, Any], dest: Path) -> None:
+        if not HAS_ZSTD:
+            raise ImportError("Reading archives needs zstandard (pip install zstandard)")
+        digest = hashlib.blake2b(digest_size=32)
+        with open(self.path / PACK_NAME, 'rb') as f:
+            f.seek(entry['frame'])
+            reader = zstandard.ZstdDecompressor().stream_reader(f, read_across_frames=True)
+            _read_exact(reader, entry['skip'] + entry['header'])
+            remaining = entry['size']
+            with open(dest, 'wb') as out:
+                while remaining:
+                    chunk = reader.read(min(COPY_CHUNK, remaining))
+                    if not chunk:
+                        raise ValueError(f"Archive pack truncated in {dest.name}")
+                    digest.update(chunk)
+                    out.write(chunk)
+                    remaining -= len(chunk)
+        if digest.hexdigest() != entry['blake2b']:
+            raise ValueError(f"Checksum mismatch restoring {dest.name}")
+
+    def extract_all(self, dest_dir: Path, workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Restore every stored file under ``dest_dir``.
+
+        FLAC stems decode in a process pool while packed files are read.
+
+        Returns:
+            Stats: restored file count and bytes, dropped intermediates by stage, seconds
+        """
+        t0 = time.perf_counter()
+        dest_dir = Path(dest_dir)
+        flac = [rel for rel, e in self.files.items() if e['tier'] == 'flac']
+        packed = [rel for rel, e in self.files.items() if e['tier'] == 'pack']
+
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            jobs = [pool.submit(_extract_worker, str(self.path), rel, str(dest_dir / rel)) for rel in flac]
+            # Members are stored in order, so one sequential pass reads the pack once
+            for rel in sorted(packed, key=lambda r: (self.files[r]['frame'], self.files[r]['skip'])):
+                self.extract(rel, dest_dir / rel)
+            for job in jobs:
+                job.result()
+
+        dropped: Dict[str, List[str]] = {}
+        for rel, entry in self.files.items():
+            if entry['tier'] == 'dropped':
+                dropped.setdefault(entry['stage'], []).append(rel)
+        return {
+            'files': len(flac) + len(packed),
+            'bytes': sum(self.files[rel]['size'] for rel in flac + packed),
+            'dropped': dropped,
+            'seconds': time.perf_counter() - t0,
+        }
+
+
+def _extract_worker(archive_path: str, rel: str, dest: str) -> None:
+    SessionArchive(Path(archive_path)).extract(rel, Path(dest))
+
+
+def _read_exact(reader, n: int) -> None:
+    """Skip ``n`` decompressed bytes."""
+    while n:
+        chunk = reader.read(min(COPY_CHUNK, n))
+        if not chunk:
+            raise ValueError("Archive pack truncated")
+        n -= len(chunk)
+
+
+# ==================== Benchmark ====================
+
+def _synthetic_session(path: Path, minutes: float, stems: int, seed: int = 0) -> None:
+    """A session directory shaped like a real build: stems, mixes, media and working files."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    sr = 48000
+    n = int(minutes * 60 * sr)
+    t = np.arange(n) / sr
+    output = path / 'output'
+    output.mkdir(parents=True)
+
+    def write_wav(name: str, audio, subtype: str = 'PCM_24'):
+        sf.write(str(output / name), np.clip(audio, -1, 1).astype(np.float32), sr, subtype=subtype)
+
+    # Kept stems: voice-like bursts over silence, and a musical pad
+    envelope = (np.sin(2 * np.pi * 0.2 * t) > 0.3).astype(np.float32)
+    voice = envelope * 0.3 * np.sin(2 * np.pi * 180 * t) * (1 + 0.3 * np.sin(2 * np.pi * 3 * t))
+    voice += envelope * 0.01 * rng.standard_normal(n)
+    write_wav('voice.wav', np.stack([voice, voice], axis=1))
+    for k in range(stems - 1):
+        pad = 0.2 * np.sin(2 * np.pi * (110 * (k + 2)) * t)[:, None] * np.array([[1.0, 0.9]])
+        pad += 0.002 * rng.standard_normal((n, 2))
+        write_wav(f'stem_{k + 1}.wav', pad)
+
+    # Regenerable intermediates
+    binaural = 0.1 * np.stack([np.sin(2 * np.pi * 200 * t), np.sin(2 * np.pi * 207 * t)], axis=1)
+    write_wav('binaural.wav', binaural)
+    write_wav('session_mixed.wav', binaural + 0.5 * np.stack([voice, voice], axis=1))
+
+    # Deliverables: compressed media is incompressible noise to zstd
+    (output / 'final_master.mp3').write_bytes(rng.bytes(int(minutes * 60 * 320_000 / 8)))
+    (output / 'youtube_package').mkdir()
+    (output / 'youtube_package' / 'final_video.mp4').write_bytes(rng.bytes(int(minutes * 60 * 2_000_000 / 8)))
+    images = path / 'images' / 'uploaded'
+    images.mkdir(parents=True)
+    for i in range(1, 6):
+        (images / f'scene_{i:02d}.png').write_bytes(rng.bytes(2_000_000))
+
+    working = path / 'working_files'
+    working.mkdir()
+    script = '\n'.join(f'<prosody rate="slow">Breathe in, and let line {i} settle.</prosody>' for i in range(4000))
+    (working / 'script.ssml').write_text(f'<speak>{script}</speak>')
+    (path / 'manifest.yaml').write_text('session:\n  name: benchmark\n  duration: %d\n' % int(minutes * 60))
+
+
+def benchmark(minutes: float = 30.0, stems: int = 4, workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Archive and restore a synthetic session and time each step.
+
+    Returns:
+        Dict of sizes (bytes), timings (seconds) and checks
+    """
+    import tempfile
+
+    if not (HAS_ZSTD and HAS_SOUNDFILE):
+        raise ImportError("The archive benchmark needs zstandard and soundfile")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        session = tmp / 'sessions' / 'benchmark-session'
+        _synthetic_session(session, minutes, stems)
+        session_bytes = sum(p.stat().st_size for p in session.rglob('*') if p.is_file())
+
+        t0 = time.perf_counter()
+        shutil.copytree(session, tmp / 'moved')
+        move_copy_s = time.perf_counter() - t0
+
+        stats = write_archive(session, tmp / 'archive' / 'benchmark-session', workers=workers)
+        archive = SessionArchive(tmp / 'archive' / 'benchmark-session')
+
+        t0 = time.perf_counter()
+        archive.extract('output/final_master.mp3', tmp / 'single' / 'final_master.mp3')
+        single_s = time.perf_counter() - t0
+        single_ok = (tmp / 'single' / 'final_master.mp3').read_bytes() == \
+            (session / 'output' / 'final_master.mp3').read_bytes()
+
+        t0 = time.perf_counter()
+        archive.extract('working_files/script.ssml', tmp / 'single' / 'script.ssml')
+        single_small_s = time.perf_counter() - t0
+
+        restored = archive.extract_all(tmp / 'restored', workers=workers)
+
+        samples_ok = True
+        for rel in archive.files:
+            entry = archive.files[rel]
+            if entry['tier'] == 'flac':
+                a, _ = sf.read(str(session / rel), dtype='int32')
+                b, _ = sf.read(str(tmp / 'restored' / rel), dtype='int32')
+                samples_ok &= a.shape == b.shape and bool((a == b).all())
+            elif entry['tier'] == 'pack':
+                samples_ok &= (session / rel).read_bytes() == (tmp / 'restored' / rel).read_bytes()
+
+    return {
+        'minutes': minutes,
+        'stems': stems,
+        'session_bytes': session_bytes,
+        'copy_s': move_copy_s,
+        **{f'archive_{k}': v for k, v in stats.items()},
+        'restore_s': restored['seconds'],
+        'restore_bytes': restored['bytes'],
+        'single_s': single_s,
+        'single_small_s': single_small_s,
+        'single_ok': single_ok,
+        'lossless': samples_ok,
+    }
+
+
+def format_benchmark(results: Dict[str, Any]) -> str:
+    """Human-readable benchmark summary."""
+    mb = 1024 * 1024
+    return "\n".join([
+        f"Synthetic session:         {results['minutes']:.0f} min, {results['stems']} stems, "
+        f"{results['session_bytes'] / mb:,.0f} MB",
+        f"Files:                     {results['archive_flac']} FLAC, {results['archive_packed']} packed, "
+        f"{results['archive_dropped']} dropped ({results['archive_dropped_bytes'] / mb:,.0f} MB)",
+        f"Archive:                   {results['archive_seconds']:.1f}s "
+        f"({results['session_bytes'] / mb / results['archive_seconds']:,.0f} MB/s)",
+        f"Stored:                    {results['archive_stored_bytes'] / mb:,.0f} MB "
+        f"(ratio {results['archive_ratio']:.2f}x, plain copy took {results['copy_s']:.1f}s)",
+        f"Full restore:              {results['restore_s']:.1f}s "
+        f"({results['restore_bytes'] / mb / results['restore_s']:,.0f} MB/s)",
+        f"Restore final_master.mp3:  {results['single_s'] * 1000:.0f}ms",
+        f"Restore script.ssml:       {results['single_small_s'] * 1000:.0f}ms",
+        f"Single file identical:     {'✓' if results['single_ok'] else '✗'}",
+        f"Restored files lossless:   {'✓' if results['lossless'] else '✗'}",
+    ])
+
+
+def main():
+    """CLI interface."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Tiered session archive format')
+    parser.add_argument('command', choices=['benchmark'], help='Command to execute')
+    parser.add_argument('--minutes', type=float, default=30.0, help='Synthetic session length (default: 30)')
+    parser.add_argument('--stems', type=int, default=4, help='WAV stems kept in the session (default: 4)')
+    parser.add_argument('--workers', type=int, help='Encoder processes (default: CPU count)')
+    args = parser.parse_args()
+
+    if args.command == 'benchmark':
+        print(format_benchmark(benchmark(args.minutes, args.stems, args.workers)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -19,15 +19,21 @@ Usage:
 
     # Dry run
     python -m scripts.automation.shorts_generator --dry-run
+
+    # Compare single-pass vs three-step rendering on a synthetic source
+    python -m scripts.automation.shorts_generator --benchmark
 """
 
 import argparse
 import json
 import logging
+import math
 import re
 import shutil
 import subprocess
 import tempfile
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -45,6 +51,139 @@ MEDIUM_ENGAGEMENT_WORDS = [
     'calm', 'safe', 'comfortable', 'warm', 'floating',
 ]
 
+# Render settings
+FONT_FILE = '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf'
+AUDIO_FADE_IN_SECONDS = 0.5
+AUDIO_FADE_OUT_SECONDS = 1.0
+# Clips whose source ranges overlap or sit within this gap share one decode
+# pass; further apart, decoding the gap costs more than a second seek
+SHARED_DECODE_MAX_GAP_SECONDS = 10
+ENCODE_ARGS = ['-c:v', 'libx264', '-preset', 'medium', '-c:a', 'aac', '-b:a', '192k']
+
+
+@dataclass
+class ShortClip:
+    """One short to cut from a source video."""
+    start: float
+    duration: float
+    output_path: Path
+    website_url: str
+
+
+def cta_filter(cta_start: float, website_url: str, draw_text: bool = True) -> str:
+    """Drawtext chain showing the CTA from ``cta_start`` (clip-relative seconds)."""
+    if not draw_text:
+        return 'null'
+    # Clean URL for display; a quote would end the quoted drawtext value
+    display_url = website_url.replace('https://', '').replace('http://', '').replace("'", "\u2019")
+    return (
+        f"drawtext=text='Full Journey':"
+        f"fontfile={FONT_FILE}:"
+        f"fontsize=48:fontcolor=white:borderw=3:bordercolor=black:"
+        f"x=(w-text_w)/2:y=h*0.70:"
+        f"enable='gte(t,{cta_start:.3f})',"
+
+        f"drawtext=text='{display_url}':expansion=none:"
+        f"fontfile={FONT_FILE}:"
+        f"fontsize=36:fontcolor=yellow:borderw=2:bordercolor=black:"
+        f"x=(w-text_w)/2:y=h*0.78:"
+        f"enable='gte(t,{cta_start:.3f})'"
+    )
+
+
+def vertical_filter(in_label: str, out_label: str, tag: str) -> str:
+    """9:16 blurred-background composite from ``in_label`` to ``out_label``."""
+    return (
+        f"[{in_label}]split[{tag}o][{tag}c];"
+        f"[{tag}c]scale=1080:1920:force_original_aspect_ratio=increase,"
+        f"crop=1080:1920,boxblur=25:5[{tag}b];"
+        f"[{tag}o]scale=1080:-1[{tag}s];"
+        f"[{tag}b][{tag}s]overlay=(W-w)/2:(H-h)/2[{out_label}]"
+    )
+
+
+def build_shorts_filter_graph(
+    clips: List[ShortClip],
+    seek: float,
+    cta_duration: float,
+    has_audio: bool = True,
+    draw_text: bool = True
+) -> Tuple[str, List[Tuple[str, Optional[str]]]]:
+    """Build one filter graph rendering every clip from a single decoded input.
+
+    The input is expected to be opened with ``-ss seek``, so clip ranges are
+    trimmed relative to it. Video and audio are fanned out with
+    ``split``/``asplit`` and each branch is trimmed, made vertical, given the
+    CTA overlay and audio fades.
+
+    Args:
+        clips: Clips cut from the same source
+        seek: Input-side seek position in seconds
+        cta_duration: Seconds of CTA overlay at the end of each clip
+        has_audio: Whether the source has an audio stream
+        draw_text: Render CTA text (disable when ffmpeg lacks drawtext)
+
+    Returns:
+        (filter graph, [(video label, audio label or None) per clip])
+    """
+    count = len(clips)
+    parts = []
+    outputs = []
+
+    video_inputs = [f"v{i}in" for i in range(count)]
+    if count == 1:
+        parts.append(f"[0:v]null[{video_inputs[0]}]")
+    else:
+        parts.append(f"[0:v]split={count}" + ''.join(f"[{label}]" for label in video_inputs))
+
+    if has_audio:
+        audio_inputs = [f"a{i}in" for i in range(count)]
+        if count == 1:
+            parts.append(f"[0:a]anull[{audio_inputs[0]}]")
+        else:
+            parts.append(f"[0:a]asplit={count}" + ''.join(f"[{label}]" for label in audio_inputs))
+
+    for i, clip in enumerate(clips):
+        offset = max(0.0, clip.start - seek)
+        cta_start = max(0.0, clip.duration - cta_duration)
+        parts.append(
+            f"[{video_inputs[i]}]trim=start={offset:.3f}:duration={clip.duration:.3f},"
+            f"setpts=PTS-STARTPTS[v{i}t]"
+        )
+        parts.append(vertical_filter(f"v{i}t", f"v{i}v", f"v{i}"))
+        parts.append(f"[v{i}v]{cta_filter(cta_start, clip.website_url, draw_text)}[v{i}]")
+
+        audio_label = None
+        if has_audio:
+            fade_out_start = max(0.0, clip.duration - AUDIO_FADE_OUT_SECONDS)
+            parts.append(
+                f"[{audio_inputs[i]}]atrim=start={offset:.3f}:duration={clip.duration:.3f},"
+                f"asetpts=PTS-STARTPTS,"
+                f"afade=t=in:st=0:d={AUDIO_FADE_IN_SECONDS},"
+                f"afade=t=out:st={fade_out_start:.3f}:d={AUDIO_FADE_OUT_SECONDS}[a{i}]"
+            )
+            audio_label = f"a{i}"
+        outputs.append((f"v{i}", audio_label))
+
+    return ';'.join(parts), outputs
+
+
+def group_clips_for_decode(
+    clips: List[ShortClip],
+    max_gap: float = SHARED_DECODE_MAX_GAP_SECONDS
+) -> List[List[ShortClip]]:
+    """Group clips whose source ranges are close enough to share a decode pass."""
+    groups: List[List[ShortClip]] = []
+    group_end = None
+    for clip in sorted(clips, key=lambda c: c.start):
+        if groups and clip.start - group_end <= max_gap:
+            groups[-1].append(clip)
+            group_end = max(group_end, clip.start + clip.duration)
+        else:
+            groups.append([clip])
+            group_end = clip.start + clip.duration
+    return groups
+
 
 class ShortsGenerator:
     """Generates and uploads YouTube Shorts."""
@@ -64,6 +203,7 @@ class ShortsGenerator:
         self.duration = config['shorts']['duration_seconds']
         self.cta_duration = config['shorts']['cta_duration_seconds']
         self.clip_duration = self.duration - self.cta_duration
+        self.draw_text = True
 
     def select_source_session(self) -> Optional[Dict[str, Any]]:
         """Find session eligible for shorts creation.
@@ -121,29 +261,12 @@ class ShortsGenerator:
         best_segment = self._find_best_segment(vtt_path, video_path)
         logger.info(f"Best segment: {best_segment['start']:.1f}s - {best_segment['end']:.1f}s")
 
-        # Create temp directory for intermediate files
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Step 1: Extract clip
-            clip_path = temp_path / 'clip.mp4'
-            if not self._extract_clip(video_path, clip_path, best_segment['start'], self.clip_duration):
-                return None
-
-            # Step 2: Convert to vertical (9:16)
-            vertical_path = temp_path / 'vertical.mp4'
-            if not self._convert_to_vertical(clip_path, vertical_path):
-                return None
-
-            # Step 3: Add CTA overlay
-            website_url = session.get('website_url') or f"salars.net/dreamweavings/{session_name}"
-            final_path = temp_path / 'final_short.mp4'
-            if not self._add_cta_overlay(vertical_path, final_path, website_url):
-                return None
-
-            # Move to output directory
-            output_path = output_dir / 'short_video.mp4'
-            shutil.move(str(final_path), str(output_path))
+        # Seek, trim, vertical, CTA and audio fades in one ffmpeg pass
+        website_url = session.get('website_url') or f"salars.net/dreamweavings/{session_name}"
+        output_path = output_dir / 'short_video.mp4'
+        clip = ShortClip(best_segment['start'], self.clip_duration, output_path, website_url)
+        if not self.render_shorts(video_path, [clip]):
+            return None
 
         logger.info(f"Short generated: {output_path}")
 
@@ -269,6 +392,80 @@ class ShortsGenerator:
 
         return segments
 
+    def render_shorts(self, video_path: Path, clips: List[ShortClip]) -> bool:
+        """Render clips with one ffmpeg invocation per decode group.
+
+        Clips close together in the source share one input-side seek and
+        decode, fanned out to one output file per clip. Outputs are written
+        next to their final path and renamed on success so a failed render
+        never leaves a partial short behind.
+
+        Args:
+            video_path: Source video path
+            clips: Clips to render
+
+        Returns:
+            True if every clip rendered
+        """
+        has_audio = self._has_audio_stream(video_path)
+        for group in group_clips_for_decode(clips):
+            seek = group[0].start
+            span = max(c.start + c.duration for c in group) - seek
+            graph, labels = build_shorts_filter_graph(
+                group, seek, self.cta_duration, has_audio, self.draw_text
+            )
+
+            cmd = [
+                'ffmpeg', '-y',
+                '-ss', f"{seek:.3f}", '-t', f"{span:.3f}",
+                '-i', str(video_path),
+                '-filter_complex', graph,
+            ]
+            partials = []
+            for clip, (video_label, audio_label) in zip(group, labels):
+                partial = clip.output_path.with_name(f".{clip.output_path.stem}.partial.mp4")
+                partials.append((partial, clip.output_path))
+                # setpts drops the stream frame rate; keep source timestamps as-is
+                cmd += ['-map', f'[{video_label}]', '-fps_mode', 'passthrough']
+                if audio_label:
+                    cmd += ['-map', f'[{audio_label}]']
+                cmd += ENCODE_ARGS + [str(partial)]
+
+            try:
+                subprocess.run(cmd, check=True, capture_output=True)
+            except subprocess.CalledProcessError as e:
+                logger.error(f"Failed to render shorts: {e.stderr.decode()[-2000:]}")
+                for partial, _ in partials:
+                    partial.unlink(missing_ok=True)
+                return False
+
+            for partial, final in partials:
+                partial.replace(final)
+        return True
+
+    def render_three_step(self, video_path: Path, clip: ShortClip) -> bool:
+        """Legacy render: extract, convert to vertical, overlay CTA (three encodes).
+
+        Kept for comparison with ``render_shorts`` (see ``--benchmark``).
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+
+            clip_path = temp_path / 'clip.mp4'
+            if not self._extract_clip(video_path, clip_path, clip.start, clip.duration):
+                return False
+
+            vertical_path = temp_path / 'vertical.mp4'
+            if not self._convert_to_vertical(clip_path, vertical_path):
+                return False
+
+            final_path = temp_path / 'final_short.mp4'
+            if not self._add_cta_overlay(vertical_path, final_path, clip.website_url):
+                return False
+
+            shutil.move(str(final_path), str(clip.output_path))
+        return True
+
     def _extract_clip(
         self,
         input_path: Path,
@@ -362,23 +559,8 @@ class ShortsGenerator:
 
             cta_start = max(0, duration - self.cta_duration)
 
-            # Clean URL for display (remove https://)
-            display_url = website_url.replace('https://', '').replace('http://', '')
-
             # FFmpeg drawtext filter
-            filter_text = (
-                f"drawtext=text='Full Journey':"
-                f"fontfile=/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf:"
-                f"fontsize=48:fontcolor=white:borderw=3:bordercolor=black:"
-                f"x=(w-text_w)/2:y=h*0.70:"
-                f"enable='gte(t,{cta_start})',"
-
-                f"drawtext=text='{display_url}':"
-                f"fontfile=/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf:"
-                f"fontsize=36:fontcolor=yellow:borderw=2:bordercolor=black:"
-                f"x=(w-text_w)/2:y=h*0.78:"
-                f"enable='gte(t,{cta_start})'"
-            )
+            filter_text = cta_filter(cta_start, website_url, self.draw_text)
 
             subprocess.run([
                 'ffmpeg', '-y',
@@ -413,6 +595,19 @@ class ShortsGenerator:
         except Exception:
             return None
 
+    def _has_audio_stream(self, video_path: Path) -> bool:
+        """Check whether video has an audio stream (assumes yes if ffprobe fails)."""
+        try:
+            result = subprocess.run([
+                'ffprobe', '-v', 'quiet',
+                '-print_format', 'json',
+                '-show_streams', '-select_streams', 'a',
+                str(video_path)
+            ], capture_output=True, text=True)
+            return bool(json.loads(result.stdout).get('streams'))
+        except Exception:
+            return True
+
     def upload_short(
         self,
         session: Dict[str, Any],
@@ -547,15 +742,143 @@ class ShortsGenerator:
         return self.upload_short(session, shorts_path, privacy_status, dry_run)
 
 
+def _ffmpeg_has_filter(name: str) -> bool:
+    result = subprocess.run(['ffmpeg', '-hide_banner', '-filters'], capture_output=True, text=True)
+    return any(line.split()[1:2] == [name] for line in result.stdout.splitlines())
+
+
+def _count_frames(video_path: Path) -> int:
+    """Count decoded video frames (framemd5 writes one line per frame)."""
+    result = subprocess.run([
+        'ffmpeg', '-v', 'error', '-i', str(video_path),
+        '-map', '0:v:0', '-f', 'framemd5', '-'
+    ], capture_output=True, text=True, check=True)
+    return sum(1 for line in result.stdout.splitlines() if line and not line.startswith('#'))
+
+
+def _first_frame_psnr(output_path: Path, source_path: Path, frame: int, fps: float) -> float:
+    """PSNR between a short's first frame and vertical source frame number ``frame``."""
+    graph = (
+        "[0:v]trim=end_frame=1,setpts=PTS-STARTPTS[out];"
+        "[1:v]trim=end_frame=1,setpts=PTS-STARTPTS[src];"
+        + vertical_filter('src', 'ref', 'r') + ";"
+        "[out][ref]psnr"
+    )
+    result = subprocess.run([
+        'ffmpeg', '-hide_banner', '-i', str(output_path),
+        # Seeking half a frame early makes ``frame`` the first one decoded
+        '-ss', f"{(frame - 0.5) / fps:.4f}", '-i', str(source_path),
+        '-filter_complex', graph, '-f', 'null', '-'
+    ], capture_output=True, text=True)
+    match = re.search(r'average:(\S+)', result.stderr)
+    return float(match.group(1)) if match else 0.0
+
+
+def _boundary_offset(output_path: Path, source_path: Path, start: float, fps: float) -> int:
+    """Frame offset (-1, 0, +1) of the source frame that best matches the short's first frame."""
+    first = math.ceil(start * fps - 1e-6)  # First source frame at or after start
+    scores = {k: _first_frame_psnr(output_path, source_path, first + k, fps) for k in (-1, 0, 1)}
+    return max(scores, key=scores.get)
+
+
+def benchmark(
+    source_seconds: int = 120,
+    clip_count: int = 3,
+    clip_seconds: float = 12,
+    config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Compare single-pass and three-step rendering on a synthetic source.
+
+    Generates a 1080p testsrc2 + sine source, then times:
+    - one short: three-step path vs single-pass filter graph
+    - ``clip_count`` overlapping shorts (candidate windows from the same
+      passage): one single-pass run per clip vs one shared decode
+
+    and checks each output's frame count and first-frame boundary against
+    the source (PSNR match of the first frame against source frames -1/0/+1).
+    """
+    fps = 30
+    config = config or {'shorts': {'duration_seconds': 40, 'cta_duration_seconds': 8}}
+    generator = ShortsGenerator(config, db=None, youtube_client=None)
+    generator.draw_text = _ffmpeg_has_filter('drawtext')
+    if not generator.draw_text:
+        print("⚠ ffmpeg built without drawtext - rendering without CTA text")
+
+    # Short benchmark clips keep the run quick; boundaries are what matter
+    duration = min(generator.clip_duration, clip_seconds)
+    expected_frames = round(duration * fps)
+    report: Dict[str, Any] = {'draw_text': generator.draw_text, 'clip_seconds': duration, 'runs': []}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        source = temp_path / 'source.mp4'
+        subprocess.run([
+            'ffmpeg', '-y', '-v', 'error',
+            '-f', 'lavfi', '-i', f'testsrc2=size=1920x1080:rate={fps}:duration={source_seconds}',
+            '-f', 'lavfi', '-i', f'sine=frequency=440:sample_rate=48000:duration={source_seconds}',
+            '-c:v', 'libx264', '-preset', 'ultrafast', '-g', str(fps * 2),
+            '-c:a', 'aac', '-shortest', str(source)
+        ], check=True)
+
+        # Odd start times land between keyframes and off frame boundaries;
+        # windows overlap by half a clip
+        starts = [round(7.31 + i * duration / 2, 3) for i in range(clip_count)]
+
+        def timed(name, clips, fn):
+            started = time.perf_counter()
+            ok = fn()
+            elapsed = time.perf_counter() - started
+            checks = []
+            for clip in clips:
+                frames = _count_frames(clip.output_path) if ok else 0
+                offset = _boundary_offset(clip.output_path, source, clip.start, fps) if ok else None
+                checks.append({'start': clip.start, 'frames': frames, 'first_frame_offset': offset})
+            report['runs'].append({
+                'name': name, 'ok': ok, 'seconds': round(elapsed, 2),
+                'expected_frames': expected_frames, 'clips': checks,
+            })
+
+        def clip_at(start, name):
+            return ShortClip(start, duration, temp_path / f'{name}.mp4', 'salars.net/dreamweavings/benchmark')
+
+        legacy = clip_at(starts[0], 'legacy')
+        timed('three-step (1 short)', [legacy], lambda: generator.render_three_step(source, legacy))
+        single = clip_at(starts[0], 'single')
+        timed('single-pass (1 short)', [single], lambda: generator.render_shorts(source, [single]))
+
+        separate = [clip_at(start, f'separate_{i}') for i, start in enumerate(starts)]
+        timed(f'single-pass x{clip_count} (separate decodes)', separate,
+              lambda: all(generator.render_shorts(source, [clip]) for clip in separate))
+        shared = [clip_at(start, f'shared_{i}') for i, start in enumerate(starts)]
+        timed(f'single-pass x{clip_count} (shared decode)', shared,
+              lambda: generator.render_shorts(source, shared))
+
+    return report
+
+
+def format_benchmark(report: Dict[str, Any]) -> str:
+    lines = [
+        f"Shorts render benchmark ({report['clip_seconds']}s clips, "
+        f"CTA text {'on' if report['draw_text'] else 'off'})",
+        f"{'path':40} {'seconds':>8}  {'frames':>14}  {'boundary':>8}",
+        "-" * 76,
+    ]
+    for run in report['runs']:
+        frames = ','.join(str(c['frames']) for c in run['clips'])
+        offsets = ','.join(str(c['first_frame_offset']) for c in run['clips'])
+        lines.append(
+            f"{run['name']:40} {run['seconds']:>8.2f}  "
+            f"{frames + '/' + str(run['expected_frames']):>14}  {offsets:>8}"
+        )
+    lines.append("(boundary = frame offset of best-matching source frame; 0 is frame-accurate)")
+    return "\n".join(lines)
+
+
 def main():
     """Main entry point."""
     import sys
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-    from scripts.automation.config_loader import load_config, setup_logging
-    from scripts.automation.state_db import StateDatabase
-    from scripts.automation.youtube_client import YouTubeClient
-
     parser = argparse.ArgumentParser(description='Shorts Generator')
     parser.add_argument('--session', type=str, help='Specific session to use')
     parser.add_argument('--privacy', type=str, default='public',
@@ -565,9 +888,25 @@ def main():
                        help='Generate only, do not upload')
     parser.add_argument('--dry-run', action='store_true', help='Dry run')
     parser.add_argument('--config', type=str, help='Config file path')
+    parser.add_argument('--benchmark', action='store_true',
+                       help='Compare single-pass vs three-step rendering on a synthetic source')
+    parser.add_argument('--clips', type=int, default=3,
+                       help='Shorts cut per source in --benchmark (default: 3)')
+    parser.add_argument('--clip-seconds', type=float, default=12,
+                       help='Clip length in --benchmark (default: 12)')
+    parser.add_argument('--json', action='store_true', help='Output benchmark as JSON')
 
     args = parser.parse_args()
 
+    if args.benchmark:
+        report = benchmark(clip_count=args.clips, clip_seconds=args.clip_seconds)
+        print(json.dumps(report, indent=2) if args.json else format_benchmark(report))
+        return
+
+    from scripts.automation.config_loader import load_config, setup_logging
+    from scripts.automation.state_db import StateDatabase
+    from scripts.automation.youtube_client import YouTubeClient
+
     config = load_config(Path(args.config) if args.config else None)
     setup_logging(config)
 
@@ -7,6 +7,9 @@ SQLite database for tracking:
 - Upload history (YouTube, website)
 - Analytics cache for optimal timing
 - Quality scores
+- Per-stage build timings (see scripts/utilities/tracing.py)
+- Asset store objects and their refcounts (see scripts/utilities/asset_store.py)
+- TTS synthesis runs for the duration-fitting rate model (see scripts/core/duration_fit.py)
 
 Usage:
     from scripts.automation.state_db import StateDatabase
@@ -27,6 +30,7 @@ Usage:
 
 import logging
 import sqlite3
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -179,6 +183,15 @@ class StateDatabase:
             )
         """)
 
+        # Refresh locks - single-flight background refreshes across processes
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS refresh_locks (
+                name TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+
         # Multiplier history - track changes to pricing multiplier
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS multiplier_history (
@@ -189,6 +202,15 @@ class StateDatabase:
             )
         """)
 
+        # Stage timings - one row per traced span
+        self._create_stage_timings(cursor)
+
+        # Asset store - content-addressed objects and the session files placed from them
+        self._create_asset_tables(cursor)
+
+        # TTS runs - rate/duration history for duration fitting
+        self._create_tts_runs(cursor)
+
         # Create indexes for common queries
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_sessions_status
@@ -778,6 +800,45 @@ class StateDatabase:
         if deleted > 0:
             logger.info(f"Cleaned up {deleted} old spot price records")
 
+    # ==================== Refresh Locks ====================
+
+    def acquire_refresh_lock(self, name: str, owner: str, ttl_seconds: float) -> bool:
+        """Take a named lock row unless another owner holds an unexpired one.
+
+        The upsert is a single statement, so exactly one process wins when
+        several race for an expired or missing lock.
+
+        Args:
+            name: Lock name (e.g. 'spot_prices')
+            owner: Unique owner token (e.g. 'host:pid:thread')
+            ttl_seconds: Lock lifetime; an expired lock can be taken over
+
+        Returns:
+            True if this owner now holds the lock
+        """
+        now = time.time()
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT INTO refresh_locks (name, owner, expires_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET
+                owner = excluded.owner,
+                expires_at = excluded.expires_at
+            WHERE refresh_locks.expires_at < ? OR refresh_locks.owner = excluded.owner
+        """, (name, owner, now + ttl_seconds, now))
+        acquired = cursor.rowcount == 1
+        self.conn.commit()
+        return acquired
+
+    def release_refresh_lock(self, name: str, owner: str):
+        """Release a lock row if this owner still holds it."""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "DELETE FROM refresh_locks WHERE name = ? AND owner = ?",
+            (name, owner)
+        )
+        self.conn.commit()
+
     # ==================== Multiplier History ====================
 
     def save_multiplier(self, multiplier: float, reason: Optional[str] = None):
@@ -829,6 +890,380 @@ class StateDatabase:
         """, (limit,))
         return [dict(row) for row in cursor.fetchall()]
 
+    # ==================== Stage Timings ====================
+
+    def _create_stage_timings(self, cursor):
+        """Create the stage_timings table and its indexes if missing."""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS stage_timings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                trace_id TEXT NOT NULL,
+                pipeline TEXT NOT NULL,
+                session_name TEXT,
+                stage TEXT NOT NULL,
+                parent TEXT,
+                depth INTEGER NOT NULL DEFAULT 0,
+                started_at REAL NOT NULL,
+                wall_s REAL NOT NULL,
+                cpu_s REAL,
+                child_cpu_s REAL,
+                peak_rss_mb REAL,
+                child_peak_rss_mb REAL,
+                status TEXT NOT NULL DEFAULT 'ok',
+                error TEXT
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_stage_timings_builds
+            ON stage_timings(stage, pipeline, started_at DESC)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_stage_timings_trace
+            ON stage_timings(trace_id)
+        """)
+
+    def record_stage_timings(self, rows: List[Dict[str, Any]]) -> int:
+        """Save the spans of one finished trace.
+
+        Args:
+            rows: Span dicts from tracing.Trace.rows()
+
+        Returns:
+            Number of rows written
+        """
+        cursor = self.conn.cursor()
+        self._create_stage_timings(cursor)
+        cursor.executemany("""
+            INSERT INTO stage_timings (
+                trace_id, pipeline, session_name, stage, parent, depth,
+                started_at, wall_s, cpu_s, child_cpu_s, peak_rss_mb,
+                child_peak_rss_mb, status, error
+            ) VALUES (
+                :trace_id, :pipeline, :session_name, :stage, :parent, :depth,
+                :started_at, :wall_s, :cpu_s, :child_cpu_s, :peak_rss_mb,
+                :child_peak_rss_mb, :status, :error
+            )
+        """, rows)
+        self.conn.commit()
+        return len(rows)
+
+    def get_stage_timings(
+        self,
+        pipeline: Optional[str] = None,
+        builds: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Get the spans of the most recent builds of each pipeline.
+
+        A build is one trace; its 'total' span marks when it started.
+
+        Args:
+            pipeline: Only this pipeline (default: all)
+            builds: Number of most recent builds per pipeline
+
+        Returns:
+            Span dicts with a build_rank column (1 = newest build)
+        """
+        cursor = self.conn.cursor()
+        self._create_stage_timings(cursor)
+        where = "AND pipeline = ?" if pipeline else ""
+        params = ((pipeline,) if pipeline else ()) + (builds,)
+        cursor.execute(f"""
+            WITH recent AS (
+                SELECT trace_id,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY pipeline ORDER BY started_at DESC
+                       ) AS build_rank
+                FROM stage_timings
+                WHERE stage = 'total' {where}
+            )
+            SELECT st.*, recent.build_rank
+            FROM stage_timings st
+            JOIN recent ON recent.trace_id = st.trace_id
+            WHERE recent.build_rank <= ?
+            ORDER BY st.pipeline, recent.build_rank, st.started_at
+        """, params)
+        return [dict(row) for row in cursor.fetchall()]
+
+    # ==================== TTS Runs ====================
+
+    def _create_tts_runs(self, cursor):
+        """Create the tts_runs table and its index if missing."""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS tts_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                provider TEXT NOT NULL,
+                voice TEXT NOT NULL,
+                speaking_rate REAL NOT NULL,
+                spoken_chars INTEGER NOT NULL,
+                break_seconds REAL NOT NULL,
+                duration_seconds REAL NOT NULL,
+                session_name TEXT,
+                recorded_at REAL NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tts_runs_voice
+            ON tts_runs(provider, voice, recorded_at DESC)
+        """)
+
+    def record_tts_run(
+        self,
+        provider: str,
+        voice: str,
+        speaking_rate: float,
+        spoken_chars: int,
+        break_seconds: float,
+        duration_seconds: float,
+        session_name: Optional[str] = None
+    ) -> int:
+        """Record one voice synthesis (see scripts/core/duration_fit.py).
+
+        Returns:
+            Row id
+        """
+        cursor = self.conn.cursor()
+        self._create_tts_runs(cursor)
+        cursor.execute("""
+            INSERT INTO tts_runs (
+                provider, voice, speaking_rate, spoken_chars, break_seconds,
+                duration_seconds, session_name, recorded_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (provider, voice, speaking_rate, spoken_chars, break_seconds,
+              duration_seconds, session_name, time.time()))
+        self.conn.commit()
+        return cursor.lastrowid
+
+    def get_tts_runs(self, provider: str, voice: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """Most recent synthesis runs of one provider and voice, newest first."""
+        cursor = self.conn.cursor()
+        self._create_tts_runs(cursor)
+        cursor.execute("""
+            SELECT * FROM tts_runs
+            WHERE provider = ? AND voice = ?
+            ORDER BY recorded_at DESC, id DESC
+            LIMIT ?
+        """, (provider, voice, limit))
+        return [dict(row) for row in cursor.fetchall()]
+
+    # ==================== Asset Store ====================
+
+    def _create_asset_tables(self, cursor):
+        """Create the content-addressed asset tables if missing."""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS asset_objects (
+                digest TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                refcount INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                released_at REAL
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS asset_refs (
+                path TEXT PRIMARY KEY,
+                digest TEXT NOT NULL REFERENCES asset_objects(digest),
+                session_name TEXT,
+                method TEXT NOT NULL,
+                inode INTEGER,
+                size INTEGER,
+                mtime_ns INTEGER,
+                created_at REAL NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_asset_refs_digest
+            ON asset_refs(digest)
+        """)
+
+    def register_asset_object(self, digest: str, size: int):
+        """Record a stored object; touching an unreferenced one restarts its GC grace period.
+
+        Args:
+            digest: Content digest (hex)
+            size: Size in bytes
+        """
+        now = time.time()
+        cursor = self.conn.cursor()
+        self._create_asset_tables(cursor)
+        cursor.execute("""
+            INSERT INTO asset_objects (digest, size, created_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(digest) DO UPDATE SET
+                released_at = CASE WHEN refcount > 0 THEN NULL ELSE ? END
+        """, (digest, size, now, now))
+        self.conn.commit()
+
+    def add_asset_ref(
+        self,
+        path: str,
+        digest: str,
+        method: str,
+        session_name: Optional[str] = None,
+        inode: Optional[int] = None,
+        size: Optional[int] = None,
+        mtime_ns: Optional[int] = None,
+    ) -> Optional[str]:
+        """Point a placed file at an object, moving the refcount in one transaction.
+
+        Args:
+            path: Absolute path of the placed file
+            digest: Object digest it holds
+            method: How it was placed (reflink, hardlink, symlink, copy)
+            session_name: Owning session, if any
+            inode, size, mtime_ns: File stats at placement, to spot later edits
+
+        Returns:
+            Digest the path referenced before, if any
+        """
+        now = time.time()
+        cursor = self.conn.cursor()
+        self._create_asset_tables(cursor)
+        cursor.execute("SELECT digest FROM asset_refs WHERE path = ?", (path,))
+        row = cursor.fetchone()
+        previous = row['digest'] if row else None
+
+        cursor.execute("""
+            INSERT INTO asset_refs (path, digest, session_name, method, inode, size, mtime_ns, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(path) DO UPDATE SET
+                digest = excluded.digest,
+                session_name = excluded.session_name,
+                method = excluded.method,
+                inode = excluded.inode,
+                size = excluded.size,
+                mtime_ns = excluded.mtime_ns,
+                created_at = excluded.created_at
+        """, (path, digest, session_name, method, inode, size, mtime_ns, now))
+        if previous != digest:
+            cursor.execute("""
+                UPDATE asset_objects SET refcount = refcount + 1, released_at = NULL
+                WHERE digest = ?
+            """, (digest,))
+            if previous is not None:
+                self._release_asset_object(cursor, previous, now)
+        self.conn.commit()
+        return previous
+
+    def remove_asset_ref(self, path: str) -> Optional[str]:
+        """Forget a placed file (the file itself is left alone).
+
+        Returns:
+            Digest it referenced, or None if it was not tracked
+        """
+        cursor = self.conn.cursor()
+        self._create_asset_tables(cursor)
+        cursor.execute("SELECT digest FROM asset_refs WHERE path = ?", (path,))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        cursor.execute("DELETE FROM asset_refs WHERE path = ?", (path,))
+        self._release_asset_object(cursor, row['digest'], time.time())
+        self.conn.commit()
+        return row['digest']
+
+    def _release_asset_object(self, cursor, digest: str, now: float):
+        cursor.execute("""
+            UPDATE asset_objects
+            SET refcount = MAX(refcount - 1, 0),
+                released_at = CASE WHEN refcount <= 1 THEN ? ELSE released_at END
+            WHERE digest = ?
+        """, (now, digest))
+
+    def get_asset_refs(
+        self,
+        digest: Optional[str] = None,
+        session_name: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get placed files, optionally for one object or one session."""
+        cursor = self.conn.cursor()
+        self._create_asset_tables(cursor)
+        clauses, params = [], []
+        if digest:
+            clauses.append("digest = ?")
+            params.append(digest)
+        if session_name:
+            clauses.append("session_name = ?")
+            params.append(session_name)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        cursor.execute(f"SELECT * FROM asset_refs {where} ORDER BY path", params)
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_asset_ref(self, path: str) -> Optional[Dict[str, Any]]:
+        """Get the ref row for one placed file."""
+        cursor = self.conn.cursor()
+        self._create_asset_tables(cursor)
+        cursor.execute("SELECT * FROM asset_refs WHERE path = ?", (path,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+    def get_asset_objects(self) -> List[Dict[str, Any]]:
+        """Get all stored objects' rows."""
+        cursor = self.conn.cursor()
+        self._create_asset_tables(cursor)
+        cursor.execute("SELECT * FROM asset_objects ORDER BY digest")
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_asset_object(self, digest: str) -> Optional[Dict[str, Any]]:
+        """Get one stored object's row."""
+        cursor = self.conn.cursor()
+        self._create_asset_tables(cursor)
+        cursor.execute("SELECT * FROM asset_objects WHERE digest = ?", (digest,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+    def get_unreferenced_assets(self, released_before: float) -> List[Dict[str, Any]]:
+        """Objects with no references since before the given time (GC candidates)."""
+        cursor = self.conn.cursor()
+        self._create_asset_tables(cursor)
+        cursor.execute("""
+            SELECT * FROM asset_objects
+            WHERE refcount <= 0 AND COALESCE(released_at, created_at) < ?
+            ORDER BY digest
+        """, (released_before,))
+        return [dict(row) for row in cursor.fetchall()]
+
+    def delete_asset_object(self, digest: str, released_before: float) -> bool:
+        """Delete an object row if it is still unreferenced and past its grace period.
+
+        The check and delete are one statement, so a concurrent placement
+        that re-references the object wins.
+
+        Returns:
+            True if the row was deleted (the caller then removes the file)
+        """
+        cursor = self.conn.cursor()
+        self._create_asset_tables(cursor)
+        cursor.execute("""
+            DELETE FROM asset_objects
+            WHERE digest = ? AND refcount <= 0
+              AND COALESCE(released_at, created_at) < ?
+              AND NOT EXISTS (SELECT 1 FROM asset_refs WHERE asset_refs.digest = ?)
+        """, (digest, released_before, digest))
+        deleted = cursor.rowcount == 1
+        self.conn.commit()
+        return deleted
+
+    def get_asset_store_stats(self) -> Dict[str, Any]:
+        """Object count, stored bytes, placement count and the bytes they would take as copies."""
+        cursor = self.conn.cursor()
+        self._create_asset_tables(cursor)
+        cursor.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM asset_objects")
+        objects, stored_bytes = cursor.fetchone()
+        cursor.execute("""
+            SELECT COUNT(*), COALESCE(SUM(o.size), 0)
+            FROM asset_refs r JOIN asset_objects o ON o.digest = r.digest
+        """)
+        refs, logical_bytes = cursor.fetchone()
+        cursor.execute("SELECT method, COUNT(*) AS n FROM asset_refs GROUP BY method")
+        by_method = {row['method']: row['n'] for row in cursor.fetchall()}
+        return {
+            'objects': objects,
+            'stored_bytes': stored_bytes,
+            'refs': refs,
+            'logical_bytes': logical_bytes,
+            'by_method': by_method,
+        }
+
     # ==================== Utility Methods ====================
 
     def update(self, session_name: str, **kwargs):
@@ -24,10 +24,15 @@ Usage:
 
 import os
 import re
+import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import yaml
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.utilities.knowledge_snapshot import load_knowledge
 
 # Type aliases for clarity
 PresetDict = Dict[str, Any]
@@ -73,9 +78,7 @@ def _load_yaml_data() -> Dict[str, Any]:
     """Load and cache the YAML data."""
     global _cached_data
     if _cached_data is None:
-        presets_path = _get_presets_path()
-        with open(presets_path, 'r', encoding='utf-8') as f:
-            _cached_data = yaml.safe_load(f)
+        _cached_data = load_knowledge(_get_presets_path())
     return _cached_data
 
 
@@ -4,21 +4,105 @@ Nature Sounds Generator
 Universal module for Dreamweaving project
 Generates procedural nature sounds: rain, stream, forest ambience
 Provides grounding and natural soundscape for meditation
+
+Each texture is rendered as a texture engine rather than at full length:
+- a short, seamlessly loopable tile of band-limited noise per texture
+  (causal filters, equal-power crossfade closing the loop)
+- the bed is streamed in blocks by tiling that loop, with slow swells
+  (stream flow, ocean waves) applied on the global timeline
+- one-shot events (raindrops, burbles, bird chirps, splashes) come from a
+  precomputed grain bank and are placed per block with batched np.add.at
+
+Rendering is deterministic for a given seed and independent of block size.
+
+Usage:
+    python3 scripts/core/audio/nature.py                      # 30s test file per texture
+    python3 scripts/core/audio/nature.py --benchmark          # 60-minute beds, timed
 """
 
+from __future__ import annotations
+
+import argparse
+import os
+import time
+import wave
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
 import numpy as np
+from numpy.typing import NDArray
+from scipy import signal
 from scipy.io import wavfile
-import os
+
+# Type aliases
+StereoAudio = NDArray[np.float32]  # Shape: (samples, 2)
+
+TILE_SEC = 30.0           # Loop length of the continuous bed
+LOOP_XFADE_SEC = 2.0      # Equal-power crossfade that closes the loop
+FILTER_WARMUP_SEC = 1.0   # Discarded so the tile starts past the filter transient
+BLOCK_SEC = 10.0          # Streaming block length
+GRAINS_PER_KIND = 16      # Variants per one-shot event type
+
+# Pink-ish recursion y[n] = 0.99886 y[n-1] - 0.0555179 y[n-2] + x[n]
+PINK_DENOMINATOR = [1.0, -0.99886, 0.0555179]
+
+
+@dataclass(frozen=True)
+class EventLayer:
+    """One-shot events scattered over a texture."""
+    grain: str                        # Grain bank kind
+    per_sec: float = 0.0              # Random events per second at variation 1.0
+    period_sec: float = 0.0           # Or one event per period (ocean swells)
+    phase: float = 0.0                # Position within the period (0-1)
+    gain: float = 1.0
+    gain_scales_with_variation: bool = True
+    random_pan: bool = True           # Linear pan; False = full level both sides
+    min_variation: float = 0.3        # Layer is off at or below this variation
+
+
+@dataclass(frozen=True)
+class Texture:
+    """Continuous bed plus event layers for one sound type."""
+    low_hz: float
+    high_hz: float
+    bed_gain: float = 1.0
+    swell_center: float = 1.0         # Bed gain = center + depth * sin(2π·swell_hz·t)
+    swell_depth: float = 0.0
+    swell_depth_per_variation: float = 0.0
+    swell_hz: float = 0.1
+    events: Tuple[EventLayer, ...] = ()
+
+
+TEXTURES: Dict[str, Texture] = {
+    # Rain = continuous pink noise + individual raindrop impacts (~5 drops/sec)
+    'rain': Texture(200, 8000, events=(
+        EventLayer('raindrop', per_sec=5.0),
+    )),
+    # Stream = water-range noise with slow flow variation + occasional burbles
+    'stream': Texture(100, 6000, swell_depth_per_variation=0.2, events=(
+        EventLayer('burble', per_sec=2.0, gain_scales_with_variation=False, min_variation=0.4),
+    )),
+    # Forest = very gentle wind through trees + sparse bird-like chirps
+    'forest': Texture(50, 2000, bed_gain=0.3, events=(
+        EventLayer('bird', per_sec=0.5, gain=0.5),
+    )),
+    # Ocean = low rumble with ~10 second wave swells and foam near each peak
+    'ocean': Texture(20, 1000, swell_center=0.65, swell_depth=0.35, events=(
+        EventLayer('splash', period_sec=10.0, phase=0.7, gain=0.4, random_pan=False),
+    )),
+}
+
 
 def generate(
-    sound_type,
-    duration_sec,
-    sample_rate=48000,
-    amplitude=0.15,
-    variation=0.5,
-    fade_in_sec=10.0,
-    fade_out_sec=10.0
-):
+    sound_type: str,
+    duration_sec: float,
+    sample_rate: int = 48000,
+    amplitude: float = 0.15,
+    variation: float = 0.5,
+    fade_in_sec: float = 10.0,
+    fade_out_sec: float = 10.0,
+    seed: Optional[int] = None
+) -> StereoAudio:
     """
     Generate nature sounds audio
 
@@ -30,6 +114,7 @@ def generate(
         variation: Amount of variation/randomness (0.0-1.0)
         fade_in_sec: Fade in duration (seconds)
         fade_out_sec: Fade out duration (seconds)
+        seed: Random seed; the same seed renders the same audio
 
     Returns:
         numpy array of stereo audio samples (float32)
@@ -37,223 +122,179 @@ def generate(
 
     print(f"Generating nature sounds: {sound_type}, {duration_sec/60:.1f} min")
 
-    total_samples = int(sample_rate * duration_sec)
-
-    # Generate based on sound type
-    if sound_type == 'rain':
-        stereo_audio = _generate_rain(total_samples, sample_rate, variation)
-    elif sound_type == 'stream':
-        stereo_audio = _generate_stream(total_samples, sample_rate, variation)
-    elif sound_type == 'forest':
-        stereo_audio = _generate_forest(total_samples, sample_rate, variation)
-    elif sound_type == 'ocean':
-        stereo_audio = _generate_ocean(total_samples, sample_rate, variation)
-    else:
-        raise ValueError(f"Unknown sound type: {sound_type}")
-
-    # Apply amplitude
-    stereo_audio = stereo_audio * amplitude
-
-    # Apply fade in/out (longer fades for nature sounds)
-    if fade_in_sec > 0:
-        fade_in_samples = int(fade_in_sec * sample_rate)
-        fade_in_curve = np.linspace(0, 1, fade_in_samples)
-        stereo_audio[:fade_in_samples, 0] *= fade_in_curve
-        stereo_audio[:fade_in_samples, 1] *= fade_in_curve
-
-    if fade_out_sec > 0:
-        fade_out_samples = int(fade_out_sec * sample_rate)
-        fade_out_curve = np.linspace(1, 0, fade_out_samples)
-        stereo_audio[-fade_out_samples:, 0] *= fade_out_curve
-        stereo_audio[-fade_out_samples:, 1] *= fade_out_curve
+    stereo_audio = np.empty((int(sample_rate * duration_sec), 2), dtype=np.float32)
+    position = 0
+    for block in stream(sound_type, duration_sec, sample_rate, amplitude, variation,
+                        fade_in_sec, fade_out_sec, seed):
+        stereo_audio[position:position + len(block)] = block
+        position += len(block)
 
     print(f"✓ Nature sounds generated: {len(stereo_audio)/sample_rate/60:.1f} min")
 
     return stereo_audio
 
 
-def _generate_rain(total_samples, sample_rate, variation):
+def stream(
+    sound_type: str,
+    duration_sec: float,
+    sample_rate: int = 48000,
+    amplitude: float = 0.15,
+    variation: float = 0.5,
+    fade_in_sec: float = 10.0,
+    fade_out_sec: float = 10.0,
+    seed: Optional[int] = None,
+    block_sec: float = BLOCK_SEC
+) -> Iterator[StereoAudio]:
     """
-    Generate rain sound using filtered noise with random droplets
+    Render nature sounds block by block, so a full session bed never has
+    to be held in memory.
 
-    Rain = continuous pink noise + individual raindrop impacts
+    Same arguments as generate(), plus block_sec. Yields float32 stereo
+    blocks of block_sec (the last one shorter).
     """
-    # Base: filtered pink noise for continuous rain
-    left_base = _generate_filtered_noise(total_samples, sample_rate, 'pink', 200, 8000)
-    right_base = _generate_filtered_noise(total_samples, sample_rate, 'pink', 200, 8000)
-
-    stereo = np.stack([left_base, right_base], axis=1).astype(np.float32)
-
-    # Add random raindrops
-    if variation > 0.3:
-        num_drops = int(total_samples / sample_rate * 5 * variation)  # ~5 drops/sec with variation
-        for _ in range(num_drops):
-            position = np.random.randint(0, total_samples - 2000)
-            drop = _generate_raindrop(sample_rate)
-            pan = np.random.rand()  # Random stereo position
-
-            # Add drop to track
-            end_pos = min(position + len(drop), total_samples)
-            drop_length = end_pos - position
-            stereo[position:end_pos, 0] += drop[:drop_length] * (1 - pan) * variation
-            stereo[position:end_pos, 1] += drop[:drop_length] * pan * variation
-
-    return stereo
+    if sound_type not in TEXTURES:
+        raise ValueError(f"Unknown sound type: {sound_type}")
+    texture = TEXTURES[sound_type]
 
+    total_samples = int(sample_rate * duration_sec)
+    tile_rng, grain_rng, event_rng = (
+        np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(3)
+    )
 
-def _generate_stream(total_samples, sample_rate, variation):
+    tile = render_tile(texture, sample_rate, tile_rng)
+    layers = [
+        _schedule_events(layer, total_samples, sample_rate, variation,
+                         build_grain_bank(layer.grain, sample_rate, grain_rng), event_rng)
+        for layer in texture.events
+        if variation > layer.min_variation
+    ]
+    swell_depth = texture.swell_depth + texture.swell_depth_per_variation * variation
+    swell = None
+    if swell_depth or texture.swell_center != 1.0:
+        # One period as a lookup table; the swell is far too slow for rounding to matter
+        period = int(round(sample_rate / texture.swell_hz))
+        swell = (texture.swell_center + swell_depth * np.sin(
+            2 * np.pi * np.arange(period) / period)).astype(np.float32)
+    fade_in_samples = int(fade_in_sec * sample_rate)
+    fade_out_samples = int(fade_out_sec * sample_rate)
+
+    block_samples = max(1, int(block_sec * sample_rate))
+    for start in range(0, total_samples, block_samples):
+        n = min(block_samples, total_samples - start)
+        index = np.arange(start, start + n)
+
+        # Continuous bed: the loop tile, wrapped onto the global timeline
+        block = np.take(tile, index % len(tile), axis=0)
+        if swell is not None:
+            block *= np.take(swell, index % len(swell))[:, None]
+
+        for layer in layers:
+            _place_events(block, start, *layer)
+
+        block *= amplitude
+
+        # Fades (longer fades for nature sounds)
+        if fade_in_samples > 0 and start < fade_in_samples:
+            k = min(n, fade_in_samples - start)
+            block[:k] *= (index[:k] / max(fade_in_samples - 1, 1))[:, None]
+        fade_out_start = total_samples - fade_out_samples
+        if fade_out_samples > 0 and start + n > fade_out_start:
+            k = max(0, fade_out_start - start)
+            block[k:] *= ((total_samples - 1 - index[k:]) / max(fade_out_samples - 1, 1))[:, None]
+
+        yield block
+
+
+def render_tile(
+    texture: Texture,
+    sample_rate: int,
+    rng: np.random.Generator,
+    tile_sec: float = TILE_SEC,
+    xfade_sec: float = LOOP_XFADE_SEC
+) -> StereoAudio:
     """
-    Generate stream/water sound using filtered noise with gentle modulation
-    """
-    # Base: filtered noise in water frequency range
-    left_base = _generate_filtered_noise(total_samples, sample_rate, 'pink', 100, 6000)
-    right_base = _generate_filtered_noise(total_samples, sample_rate, 'pink', 100, 6000)
-
-    # Add gentle modulation (water flow variation)
-    t = np.linspace(0, total_samples / sample_rate, total_samples, False)
-    modulation = 1.0 + 0.2 * variation * np.sin(2 * np.pi * 0.1 * t)  # Slow 0.1 Hz modulation
-
-    left_base = left_base * modulation
-    right_base = right_base * modulation
-
-    # Add occasional burbles (higher frequency events)
-    if variation > 0.4:
-        num_burbles = int(total_samples / sample_rate * 2 * variation)
-        for _ in range(num_burbles):
-            position = np.random.randint(0, total_samples - 5000)
-            burble = _generate_filtered_noise(5000, sample_rate, 'white', 2000, 8000)
-            envelope = np.exp(-np.linspace(0, 5, 5000))
-            burble = burble * envelope * 0.3
-
-            pan = np.random.rand()
-            end_pos = min(position + len(burble), total_samples)
-            burble_length = end_pos - position
-            left_base[position:end_pos] += burble[:burble_length] * (1 - pan)
-            right_base[position:end_pos] += burble[:burble_length] * pan
-
-    stereo = np.stack([left_base, right_base], axis=1).astype(np.float32)
-    return stereo
+    Render a seamlessly loopable stereo tile of the texture's bed.
 
+    The noise is rendered xfade samples past the tile end; that overrun is
+    the signal's natural continuation past the loop point, so crossfading
+    it (equal power, since the two are uncorrelated) into the tile's head
+    makes the last sample flow into the first.
 
-def _generate_forest(total_samples, sample_rate, variation):
-    """
-    Generate forest ambience using very low-level filtered noise + occasional bird-like sounds
+    Args:
+        texture: Texture to render
+        sample_rate: Sample rate in Hz
+        rng: Random generator
+        tile_sec: Loop length (seconds)
+        xfade_sec: Loop crossfade length (seconds)
+
+    Returns:
+        float32 stereo tile, peak-normalized per channel and scaled by bed_gain
     """
-    # Very gentle background (wind through trees)
-    left_base = _generate_filtered_noise(total_samples, sample_rate, 'pink', 50, 2000) * 0.3
-    right_base = _generate_filtered_noise(total_samples, sample_rate, 'pink', 50, 2000) * 0.3
-
-    # Add occasional bird-like chirps
-    if variation > 0.3:
-        num_birds = int(total_samples / sample_rate * 0.5 * variation)  # Sparse
-        for _ in range(num_birds):
-            position = np.random.randint(0, total_samples - 10000)
-            bird = _generate_bird_chirp(sample_rate)
-            pan = np.random.rand()
-
-            end_pos = min(position + len(bird), total_samples)
-            bird_length = end_pos - position
-            left_base[position:end_pos] += bird[:bird_length] * (1 - pan) * variation * 0.5
-            right_base[position:end_pos] += bird[:bird_length] * pan * variation * 0.5
-
-    stereo = np.stack([left_base, right_base], axis=1).astype(np.float32)
-    return stereo
+    tile_samples = int(tile_sec * sample_rate)
+    xfade = min(int(xfade_sec * sample_rate), tile_samples)
+    warmup = int(FILTER_WARMUP_SEC * sample_rate)
 
+    noise = _band_noise(warmup + tile_samples + xfade, sample_rate, 'pink',
+                        texture.low_hz, texture.high_hz, rng, channels=2)[warmup:]
 
-def _generate_ocean(total_samples, sample_rate, variation):
-    """
-    Generate ocean waves using low-frequency noise with rhythmic swells
-    """
-    # Base: very low frequency noise (wave rumble)
-    left_base = _generate_filtered_noise(total_samples, sample_rate, 'pink', 20, 1000)
-    right_base = _generate_filtered_noise(total_samples, sample_rate, 'pink', 20, 1000)
-
-    # Add wave rhythm (0.1 Hz = ~10 second waves)
-    t = np.linspace(0, total_samples / sample_rate, total_samples, False)
-    wave_rhythm = 0.3 + 0.7 * (1 + np.sin(2 * np.pi * 0.1 * t)) / 2
-
-    left_base = left_base * wave_rhythm
-    right_base = right_base * wave_rhythm
-
-    # Add foam/splash on wave peaks
-    if variation > 0.3:
-        wave_period_samples = int(sample_rate * 10)  # 10 second waves
-        num_waves = total_samples // wave_period_samples
-
-        for i in range(num_waves):
-            position = int(i * wave_period_samples + wave_period_samples * 0.7)  # Near peak
-            if position < total_samples - 10000:
-                splash = _generate_filtered_noise(10000, sample_rate, 'white', 1000, 12000)
-                envelope = np.exp(-np.linspace(0, 8, 10000))
-                splash = splash * envelope * variation * 0.4
-
-                end_pos = min(position + len(splash), total_samples)
-                splash_length = end_pos - position
-                left_base[position:end_pos] += splash[:splash_length]
-                right_base[position:end_pos] += splash[:splash_length]
-
-    stereo = np.stack([left_base, right_base], axis=1).astype(np.float32)
-    return stereo
+    tile = noise[:tile_samples].copy()
+    theta = np.linspace(0, np.pi / 2, xfade)[:, None]
+    tile[:xfade] = noise[:xfade] * np.sin(theta) + noise[tile_samples:] * np.cos(theta)
+
+    peak = np.max(np.abs(tile), axis=0)
+    tile /= np.where(peak > 0, peak, 1.0)
+    return (tile * texture.bed_gain).astype(np.float32)
 
 
-def _generate_filtered_noise(num_samples, sample_rate, noise_type, low_cutoff, high_cutoff):
-    """Generate filtered noise (pink or white) in specified frequency range"""
+def _band_noise(num_samples, sample_rate, noise_type, low_cutoff, high_cutoff, rng, channels=1):
+    """Pink or white noise band-limited with a causal 4th-order Butterworth (one pass)."""
+    shape = (num_samples, channels) if channels > 1 else (num_samples,)
+    noise = rng.standard_normal(shape)
     if noise_type == 'pink':
-        # Simple pink noise approximation
-        white = np.random.randn(num_samples)
-        # Apply simple IIR filter for pink-ish spectrum
-        pink = np.zeros(num_samples)
-        b0, b1, b2 = 0.99886, 0.0555179, 0.0750759
-        pink[0] = white[0]
-        pink[1] = b0 * pink[0] + white[1]
-        for i in range(2, num_samples):
-            pink[i] = b0 * pink[i-1] - b1 * pink[i-2] + white[i]
-        noise = pink
-    else:  # white
-        noise = np.random.randn(num_samples)
+        noise = signal.lfilter([1.0], PINK_DENOMINATOR, noise, axis=0)
 
-    # Apply simple frequency filtering (butterworth-like)
-    # This is a simplified version - proper filtering would use scipy.signal
-    from scipy import signal
     nyquist = sample_rate / 2
-    low = low_cutoff / nyquist
-    high = high_cutoff / nyquist
-    b, a = signal.butter(4, [low, high], btype='band')
-    filtered = signal.filtfilt(b, a, noise)
+    sos = signal.butter(4, [low_cutoff / nyquist, min(high_cutoff / nyquist, 0.95)],
+                        btype='band', output='sos')
+    return signal.sosfilt(sos, noise, axis=0)
 
-    # Normalize
-    if np.max(np.abs(filtered)) > 0:
-        filtered = filtered / np.max(np.abs(filtered))
 
-    return filtered
+# ==================== Grain bank ====================
 
+def build_grain_bank(kind: str, sample_rate: int, rng: np.random.Generator,
+                     count: int = GRAINS_PER_KIND) -> NDArray[np.float32]:
+    """
+    Precompute `count` variants of a one-shot event.
+
+    Returns:
+        float32 array of shape (count, grain_samples)
+    """
+    builder = _GRAIN_BUILDERS[kind]
+    return np.stack([builder(sample_rate, rng) for _ in range(count)]).astype(np.float32)
 
-def _generate_raindrop(sample_rate):
-    """Generate single raindrop impact sound"""
-    duration = 0.05  # 50ms
-    samples = int(sample_rate * duration)
-    t = np.linspace(0, duration, samples, False)
 
-    # Short burst of filtered noise
-    noise = np.random.randn(samples)
+def _raindrop(sample_rate, rng):
+    """Single raindrop impact: 50ms noise burst, sharp attack, quick decay"""
+    samples = int(sample_rate * 0.05)
+    t = np.arange(samples) / sample_rate
+    return rng.standard_normal(samples) * np.exp(-t * 50)
 
-    # Sharp attack, quick decay
-    envelope = np.exp(-t * 50)
 
-    drop = noise * envelope
-    return drop
+def _burble(sample_rate, rng):
+    """Short high-frequency water burble"""
+    samples = int(sample_rate * 5000 / 48000)
+    burble = _band_noise(samples, sample_rate, 'white', 2000, 8000, rng)
+    burble /= max(np.max(np.abs(burble)), 1e-12)
+    return burble * np.exp(-np.linspace(0, 5, samples)) * 0.3
 
 
-def _generate_bird_chirp(sample_rate):
-    """Generate simple bird-like chirp"""
-    duration = 0.3  # 300ms chirp
-    samples = int(sample_rate * duration)
-    t = np.linspace(0, duration, samples, False)
+def _bird_chirp(sample_rate, rng):
+    """Simple bird-like chirp: 300ms upward sweep"""
+    samples = int(sample_rate * 0.3)
 
     # Frequency sweep (bird-like)
-    freq_start = 2000 + np.random.rand() * 2000  # 2-4 kHz
-    freq_end = freq_start + 500 + np.random.rand() * 1000  # Upward sweep
-
+    freq_start = 2000 + rng.random() * 2000  # 2-4 kHz
+    freq_end = freq_start + 500 + rng.random() * 1000  # Upward sweep
     freq = np.linspace(freq_start, freq_end, samples)
     chirp = np.sin(2 * np.pi * np.cumsum(freq) / sample_rate)
 
@@ -264,11 +305,75 @@ def _generate_bird_chirp(sample_rate):
     envelope[:attack] = np.linspace(0, 1, attack)
     envelope[-release:] = np.linspace(1, 0, release)
 
-    chirp = chirp * envelope * 0.3
-    return chirp
+    return chirp * envelope * 0.3
+
+
+def _splash(sample_rate, rng):
+    """Foam/splash on a wave peak"""
+    samples = int(sample_rate * 10000 / 48000)
+    splash = _band_noise(samples, sample_rate, 'white', 1000, 12000, rng)
+    splash /= max(np.max(np.abs(splash)), 1e-12)
+    return splash * np.exp(-np.linspace(0, 8, samples))
+
+
+_GRAIN_BUILDERS = {
+    'raindrop': _raindrop,
+    'burble': _burble,
+    'bird': _bird_chirp,
+    'splash': _splash,
+}
+
+
+# ==================== Event scattering ====================
+
+def _schedule_events(layer, total_samples, sample_rate, variation, bank, rng):
+    """
+    Fix every event of a layer up front: start sample, grain variant and
+    per-channel gain, sorted by start so blocks can slice their events out.
+    """
+    grain_samples = bank.shape[1]
+    last_start = total_samples - grain_samples
+    if last_start <= 0:
+        return bank, np.empty(0, np.int64), np.empty(0, np.int64), np.empty((0, 2), np.float32)
+
+    if layer.period_sec:
+        period = int(layer.period_sec * sample_rate)
+        starts = np.arange(total_samples // period) * period + int(period * layer.phase)
+        starts = starts[starts < last_start]
+    else:
+        count = int(total_samples / sample_rate * layer.per_sec * variation)
+        starts = np.sort(rng.integers(0, last_start, count))
+
+    grains = rng.integers(0, len(bank), len(starts))
+    gain = layer.gain * (variation if layer.gain_scales_with_variation else 1.0)
+    if layer.random_pan:
+        pan = rng.random(len(starts))
+        gains = np.stack([1 - pan, pan], axis=1) * gain
+    else:
+        gains = np.full((len(starts), 2), gain)
+    return bank, starts.astype(np.int64), grains, gains.astype(np.float32)
+
+
+def _place_events(block, block_start, bank, starts, grains, gains):
+    """Add every event overlapping this block in one np.add.at per channel."""
+    grain_samples = bank.shape[1]
+    n = len(block)
+    lo = np.searchsorted(starts, block_start - grain_samples + 1)
+    hi = np.searchsorted(starts, block_start + n)
+    if lo == hi:
+        return
 
+    offsets = (starts[lo:hi] - block_start)[:, None] + np.arange(grain_samples)
+    inside = (offsets >= 0) & (offsets < n)
+    targets = offsets[inside]
+    waves = bank[grains[lo:hi]]
+    for channel in range(2):
+        np.add.at(block[:, channel], targets, (waves * gains[lo:hi, channel, None])[inside])
 
-def save_stem(audio, path, sample_rate=48000):
+
+# ==================== Output ====================
+
+def save_stem(audio: StereoAudio, path: Union[str, os.PathLike], sample_rate: int = 48000) -> None:
     """
     Save nature sounds as WAV file
 
@@ -278,10 +383,10 @@ def save_stem(audio, path, sample_rate=48000):
         sample_rate: Sample rate in Hz
     """
     # Ensure directory exists
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
 
     # Convert to 16-bit PCM
-    audio_int = (audio * 32767).astype(np.int16)
+    audio_int = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
 
     # Save
     wavfile.write(path, sample_rate, audio_int)
@@ -290,6 +395,41 @@ def save_stem(audio, path, sample_rate=48000):
     print(f"✓ Saved nature sounds stem: {path} ({file_size:.1f} MB)")
 
 
+def render_stem(
+    path: Union[str, os.PathLike],
+    sound_type: str,
+    duration_sec: float,
+    sample_rate: int = 48000,
+    **kwargs: Any
+) -> str:
+    """
+    Stream nature sounds straight into a 16-bit WAV file, block by block.
+
+    Args:
+        path: Output file path
+        sound_type: 'rain', 'stream', 'forest', or 'ocean'
+        duration_sec: Total duration in seconds
+        sample_rate: Sample rate in Hz
+        **kwargs: Other stream() arguments (amplitude, variation, fades, seed)
+
+    Returns:
+        Path to the written file
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    print(f"Generating nature sounds: {sound_type}, {duration_sec/60:.1f} min")
+
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        for block in stream(sound_type, duration_sec, sample_rate, **kwargs):
+            wav.writeframes((np.clip(block, -1.0, 1.0) * 32767).astype('<i2').tobytes())
+
+    file_size = os.path.getsize(path) / (1024 * 1024)
+    print(f"✓ Saved nature sounds stem: {path} ({file_size:.1f} MB)")
+    return str(path)
+
+
 def generate_from_manifest(manifest, session_dir):
     """
     Generate nature sounds from session manifest
@@ -307,49 +447,126 @@ def generate_from_manifest(manifest, session_dir):
 
     nature_config = manifest['sound_bed']['nature']
 
-    # Generate
-    duration = manifest['session']['duration']
-    sound_type = nature_config.get('type', 'rain')
-    variation = nature_config.get('variation', 0.5)
-
-    audio = generate(
-        sound_type=sound_type,
-        duration_sec=duration,
-        variation=variation
+    # Generate straight to disk
+    stem_path = os.path.join(session_dir, "working_files/stems/nature.wav")
+    return render_stem(
+        stem_path,
+        sound_type=nature_config.get('type', 'rain'),
+        duration_sec=manifest['session']['duration'],
+        variation=nature_config.get('variation', 0.5),
+        seed=nature_config.get('seed'),
     )
 
-    # Save
-    stem_path = os.path.join(session_dir, "working_files/stems/nature.wav")
-    save_stem(audio, stem_path)
 
-    return stem_path
+# ==================== Benchmark ====================
 
+def _legacy_rain(total_samples, sample_rate, variation, rng):
+    """
+    The pre-tile rain bed: per-sample pink recursion and zero-phase filtfilt
+    over the whole buffer for each channel, one loop iteration per drop.
+    Kept for comparison in --benchmark only.
+    """
+    def filtered_pink():
+        white = rng.standard_normal(total_samples)
+        pink = np.zeros(total_samples)
+        b0, b1 = 0.99886, 0.0555179
+        pink[0] = white[0]
+        pink[1] = b0 * pink[0] + white[1]
+        for i in range(2, total_samples):
+            pink[i] = b0 * pink[i-1] - b1 * pink[i-2] + white[i]
+        b, a = signal.butter(4, [200 / (sample_rate / 2), 8000 / (sample_rate / 2)], btype='band')
+        filtered = signal.filtfilt(b, a, pink)
+        return filtered / np.max(np.abs(filtered))
+
+    stereo = np.stack([filtered_pink(), filtered_pink()], axis=1).astype(np.float32)
+    for _ in range(int(total_samples / sample_rate * 5 * variation)):
+        position = rng.integers(0, total_samples - 2000)
+        drop = _raindrop(sample_rate, rng)
+        pan = rng.random()
+        end_pos = min(position + len(drop), total_samples)
+        stereo[position:end_pos, 0] += drop[:end_pos - position] * (1 - pan) * variation
+        stereo[position:end_pos, 1] += drop[:end_pos - position] * pan * variation
+    return stereo
 
-# Example usage for testing
-if __name__ == '__main__':
-    print("Testing nature sounds generation...")
 
-    duration = 30  # 30 seconds each
+def benchmark(minutes: float = 60.0, legacy_sec: float = 20.0, sample_rate: int = 48000) -> Dict[str, Any]:
+    """
+    Time a full-length bed per texture (streamed, nothing kept), check that
+    a seed renders identically at different block sizes, and time the old
+    full-buffer rain on a short excerpt, extrapolated to the same length.
+    """
+    textures = {}
+    for sound_type in TEXTURES:
+        start = time.perf_counter()
+        samples = 0
+        for block in stream(sound_type, minutes * 60, sample_rate, variation=0.7, seed=7):
+            samples += len(block)
+        textures[sound_type] = round(time.perf_counter() - start, 2)
+
+    def digest(block_sec):
+        return b"".join(
+            b.tobytes() for b in stream('rain', 45, sample_rate, variation=0.7, seed=11, block_sec=block_sec)
+        )
+    deterministic = digest(10.0) == digest(3.7) == digest(10.0)
+
+    start = time.perf_counter()
+    _legacy_rain(int(legacy_sec * sample_rate), sample_rate, 0.7, np.random.default_rng(7))
+    legacy_seconds = (time.perf_counter() - start) * (minutes * 60 / legacy_sec)
+
+    return {
+        "minutes": minutes,
+        "sample_rate": sample_rate,
+        "textures_seconds": textures,
+        "legacy_rain_seconds_estimated": round(legacy_seconds, 1),
+        "legacy_excerpt_seconds": legacy_sec,
+        "deterministic": deterministic,
+    }
+
+
+def format_benchmark(report: Dict[str, Any]) -> str:
+    lines = [f"Nature texture benchmark: {report['minutes']:.0f}-minute beds at {report['sample_rate']} Hz", ""]
+    for sound_type, seconds in report["textures_seconds"].items():
+        lines.append(f"  {sound_type:8} {seconds:6.2f}s")
+    rain = report["textures_seconds"].get("rain")
+    lines += [
+        "",
+        f"  Old rain generator (extrapolated from a {report['legacy_excerpt_seconds']:.0f}s excerpt): "
+        f"{report['legacy_rain_seconds_estimated']:.0f}s"
+        + (f" ({report['legacy_rain_seconds_estimated'] / rain:.0f}x)" if rain else ""),
+        f"  {'✓' if report['deterministic'] else '✗'} Same seed renders identically across block sizes",
+    ]
+    return "\n".join(lines)
+
 
-    print("\n1. Rain:")
-    audio_rain = generate('rain', duration_sec=duration, variation=0.7)
-    save_stem(audio_rain, "test_nature_rain.wav")
+# Example usage for testing
+def main():
+    parser = argparse.ArgumentParser(description="Procedural nature sound beds")
+    parser.add_argument('--benchmark', action='store_true', help='Time full-length beds for every texture')
+    parser.add_argument('--minutes', type=float, default=60.0, help='Bed length in --benchmark (default: 60)')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for the test files')
+    args = parser.parse_args()
 
-    print("\n2. Stream:")
-    audio_stream = generate('stream', duration_sec=duration, variation=0.6)
-    save_stem(audio_stream, "test_nature_stream.wav")
+    if args.benchmark:
+        print(format_benchmark(benchmark(minutes=args.minutes)))
+        return
 
-    print("\n3. Forest:")
-    audio_forest = generate('forest', duration_sec=duration, variation=0.5)
-    save_stem(audio_forest, "test_nature_forest.wav")
+    print("Testing nature sounds generation...")
 
-    print("\n4. Ocean:")
-    audio_ocean = generate('ocean', duration_sec=duration, variation=0.6)
-    save_stem(audio_ocean, "test_nature_ocean.wav")
+    duration = 30  # 30 seconds each
+    tests = [('rain', 0.7), ('stream', 0.6), ('forest', 0.5), ('ocean', 0.6)]
+    generated: List[str] = []
+    for number, (sound_type, variation) in enumerate(tests, 1):
+        print(f"\n{number}. {sound_type.title()}:")
+        audio = generate(sound_type, duration_sec=duration, variation=variation, seed=args.seed)
+        path = f"test_nature_{sound_type}.wav"
+        save_stem(audio, path)
+        generated.append(path)
 
     print("\n✓ All tests complete!")
     print("\nGenerated files:")
-    print("  - test_nature_rain.wav")
-    print("  - test_nature_stream.wav")
-    print("  - test_nature_forest.wav")
-    print("  - test_nature_ocean.wav")
+    for path in generated:
+        print(f"  - {path}")
+
+
+if __name__ == '__main__':
+    main()
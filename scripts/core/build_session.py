@@ -55,6 +55,13 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# Import stage tracing (timings land in stage_timings; see scripts/automation/perf.py)
+try:
+    from utilities.tracing import trace, span
+except ImportError:
+    from contextlib import nullcontext
+    trace = span = lambda *args, **kwargs: nullcontext()
+
 # Import validation utilities
 try:
     script_dir = Path(__file__).parent.parent
@@ -212,7 +219,7 @@ def main():
     build_start = time.time()
 
     # Start audit context for correlated logging
-    with AuditContext("build"):
+    with AuditContext("build"), trace("build_session", session_name=session_name):
         logger.info(f"Starting session build: {session_name}")
         log_event("session_build_started", session_name, {
             "ssml_path": str(ssml_path),
@@ -243,7 +250,8 @@ def main():
         # Run audio with manifest data for beat schedule
         logger.info("Starting audio generation...")
         try:
-            run_audio(args, manifest_data)
+            with span("audio"):
+                run_audio(args, manifest_data)
             log_event("audio_generated", session_name, {"mix_name": args.mix_name})
         except Exception as e:
             log_error(session_name, e, {"stage": "audio_generation"})
@@ -266,7 +274,8 @@ def main():
         # Run video assembly
         logger.info("Starting video assembly...")
         try:
-            run_video(args, session_dir, audio_path)
+            with span("video"):
+                run_video(args, session_dir, audio_path)
             log_event("video_assembled", session_name, {"audio_path": str(audio_path)})
         except Exception as e:
             log_error(session_name, e, {"stage": "video_assembly"})
@@ -280,11 +289,12 @@ def main():
             logger.info("Auto-packaging for YouTube...")
             try:
                 import subprocess
-                subprocess.run([
-                    "python3", "scripts/core/package_youtube.py",
-                    "--session", str(session_dir),
-                    "--audio", str(audio_path)
-                ], check=True)
+                with span("package_youtube"):
+                    subprocess.run([
+                        "python3", "scripts/core/package_youtube.py",
+                        "--session", str(session_dir),
+                        "--audio", str(audio_path)
+                    ], check=True)
                 logger.info("YouTube package created")
                 log_event("youtube_packaged", session_name, {"audio_path": str(audio_path)})
             except Exception as e:
@@ -294,10 +304,11 @@ def main():
             # Run cleanup
             logger.info("Running cleanup...")
             try:
-                subprocess.run([
-                    "bash", "scripts/core/cleanup_session_assets.sh",
-                    str(session_dir)
-                ], check=True)
+                with span("cleanup"):
+                    subprocess.run([
+                        "bash", "scripts/core/cleanup_session_assets.sh",
+                        str(session_dir)
+                    ], check=True)
                 logger.info("Cleanup complete")
                 log_event("cleanup_performed", session_name, {})
             except Exception as e:
@@ -7,6 +7,7 @@ based on multiple content signals.
 
 from .analyzer import ContentAnalyzer, CategoryMatch, categorize_session, get_available_categories
 from .keywords import CATEGORY_KEYWORDS, ARCHETYPE_CATEGORIES, FREQUENCY_CATEGORIES
+from .model import KeywordModel, load_model
 
 __all__ = [
     'ContentAnalyzer',
@@ -16,4 +17,6 @@ __all__ = [
     'CATEGORY_KEYWORDS',
     'ARCHETYPE_CATEGORIES',
     'FREQUENCY_CATEGORIES',
+    'KeywordModel',
+    'load_model',
 ]
@@ -5,10 +5,21 @@ Uses weighted multi-signal approach to match session content to categories.
 """
 
 import re
+import sys
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.utilities.text_scanner import get_scanner
 
 from .keywords import CATEGORY_KEYWORDS, ARCHETYPE_CATEGORIES, FREQUENCY_CATEGORIES
+from .model import DEFAULT_MODEL_DIR, KeywordModel, load_model
 
 
 @dataclass
@@ -46,7 +57,15 @@ class ContentAnalyzer:
     HIGH_CONFIDENCE = 0.7
     MEDIUM_CONFIDENCE = 0.4
 
-    def __init__(self):
+    # Text signals: (signal name, weight multiplier passed to _match_text)
+    TEXT_SIGNALS = (("title", 1.5), ("description", 1.0), ("theme", 1.2))
+
+    def __init__(self, model_path: Optional[Path] = DEFAULT_MODEL_DIR / "categories.npz"):
+        """
+        Args:
+            model_path: Where the compiled keyword model for analyze_batch() is
+                persisted (None keeps it in memory only)
+        """
         self.category_keywords = CATEGORY_KEYWORDS
         self.archetype_categories = ARCHETYPE_CATEGORIES
         self.frequency_categories = FREQUENCY_CATEGORIES
@@ -54,6 +73,17 @@ class ContentAnalyzer:
         # Build category name mapping
         self.category_names = self._build_category_names()
 
+        # One scanner for every category keyword (text is lower-cased first)
+        literals, regexes = [], []
+        for keywords in self.category_keywords.values():
+            for keyword in keywords.get("primary", []) + keywords.get("secondary", []):
+                pattern = self._keyword_pattern(keyword.lower())
+                (literals if " " in keyword else regexes).append(pattern)
+        self._keyword_scanner = get_scanner(literals=literals, regexes=regexes)
+
+        self.model_path = model_path
+        self._model: Optional[KeywordModel] = None
+
     def _build_category_names(self) -> Dict[str, str]:
         """Build slug to display name mapping."""
         names = {}
@@ -84,40 +114,17 @@ class ContentAnalyzer:
             for slug in self.category_keywords
         }
 
-        # Signal 1: Title keywords
-        title = session_data.get("title", "")
-        title_scores = self._match_text(title, weight_multiplier=1.5)
-        for slug, score in title_scores.items():
-            scores[slug]["title"] = score
-
-        # Signal 2: Description/topic
-        description = session_data.get("description", "")
-        topic = session_data.get("topic", "")
-        combined_text = f"{description} {topic}"
-        desc_scores = self._match_text(combined_text, weight_multiplier=1.0)
-        for slug, score in desc_scores.items():
-            scores[slug]["description"] = score
+        # Signals 1, 2, 4: Title keywords, description/topic, theme metadata
+        for (signal, multiplier), text in zip(self.TEXT_SIGNALS, self._signal_texts(session_data)):
+            text_scores = self._match_text(text, weight_multiplier=multiplier)
+            for slug, score in text_scores.items():
+                scores[slug][signal] = score
 
         # Signal 3: Archetypes
-        archetypes = session_data.get("archetypes", [])
-        if isinstance(archetypes, str):
-            archetypes = [archetypes]
-        arch_scores = self._match_archetypes(archetypes)
+        arch_scores = self._match_archetypes(self._session_archetypes(session_data))
         for slug, score in arch_scores.items():
             scores[slug]["archetypes"] = score
 
-        # Signal 4: Theme metadata
-        theme = session_data.get("theme", "")
-        if isinstance(theme, list):
-            theme = " ".join(theme)
-        tags = session_data.get("tags", [])
-        if isinstance(tags, str):
-            tags = [t.strip() for t in tags.split(",")]
-        theme_text = f"{theme} {' '.join(tags)}"
-        theme_scores = self._match_text(theme_text, weight_multiplier=1.2)
-        for slug, score in theme_scores.items():
-            scores[slug]["theme"] = score
-
         # Signal 5: Binaural frequency
         frequency = session_data.get("binaural_frequency", None)
         freq_scores = self._match_frequency(frequency)
@@ -148,6 +155,160 @@ class ContentAnalyzer:
 
         return matches
 
+    @staticmethod
+    def _signal_texts(session_data: Dict) -> Tuple[str, str, str]:
+        """Title, description/topic and theme/tags text, in TEXT_SIGNALS order."""
+        title = session_data.get("title", "")
+
+        description = session_data.get("description", "")
+        topic = session_data.get("topic", "")
+        combined_text = f"{description} {topic}"
+
+        theme = session_data.get("theme", "")
+        if isinstance(theme, list):
+            theme = " ".join(theme)
+        tags = session_data.get("tags", [])
+        if isinstance(tags, str):
+            tags = [t.strip() for t in tags.split(",")]
+        theme_text = f"{theme} {' '.join(tags)}"
+
+        return title, combined_text, theme_text
+
+    @staticmethod
+    def _session_archetypes(session_data: Dict) -> List[str]:
+        archetypes = session_data.get("archetypes", [])
+        if isinstance(archetypes, str):
+            archetypes = [archetypes]
+        return archetypes
+
+    @property
+    def keyword_model(self) -> KeywordModel:
+        """Category keywords compiled for batch scoring (loaded or rebuilt on first use)."""
+        if self._model is None:
+            vocabulary = {
+                slug: {
+                    "primary": [k.lower() for k in keywords.get("primary", [])],
+                    "secondary": [k.lower() for k in keywords.get("secondary", [])],
+                }
+                for slug, keywords in self.category_keywords.items()
+            }
+            self._model = load_model(self.model_path, vocabulary, mode="word")
+        return self._model
+
+    def analyze_batch(self, sessions: Sequence[Dict]) -> List[List[CategoryMatch]]:
+        """
+        Analyze many sessions at once.
+
+        Returns the same matches, scores and order as calling analyze() on
+        each session, but the text signals of the whole batch are scored
+        with two sparse matrix products through the compiled keyword model.
+        """
+        if not sessions:
+            return []
+
+        model = self.keyword_model
+        texts = [
+            (text or "").lower()
+            for session_data in sessions
+            for text in self._signal_texts(session_data)
+        ]
+        counts = model.match_counts(model.vectorize(texts))
+        model.flush()
+
+        # (sessions x categories) per signal, in the order of category_keywords
+        width = len(self.TEXT_SIGNALS)
+        signals: Dict[str, np.ndarray] = {
+            signal: self._batch_text_scores(
+                model.group(counts, "primary")[k::width],
+                model.group(counts, "secondary")[k::width],
+                multiplier,
+            )
+            for k, (signal, multiplier) in enumerate(self.TEXT_SIGNALS)
+        }
+        column = {slug: j for j, slug in enumerate(model.labels)}
+        signals["archetypes"] = np.zeros((len(sessions), len(column)))
+        signals["frequency"] = np.zeros((len(sessions), len(column)))
+        # Sessions share archetype lists and frequencies, so match each once
+        archetype_scores: Dict[tuple, Dict[str, float]] = {}
+        frequency_scores: Dict[object, Dict[str, float]] = {}
+        for i, session_data in enumerate(sessions):
+            archetypes = tuple(self._session_archetypes(session_data))
+            if archetypes not in archetype_scores:
+                archetype_scores[archetypes] = self._match_archetypes(list(archetypes))
+            for slug, score in archetype_scores[archetypes].items():
+                signals["archetypes"][i, column[slug]] = score
+
+            frequency = session_data.get("binaural_frequency", None)
+            if isinstance(frequency, (int, float, str, type(None))):
+                if frequency not in frequency_scores:
+                    frequency_scores[frequency] = self._match_frequency(frequency)
+                matched = frequency_scores[frequency]
+            else:
+                matched = self._match_frequency(frequency)
+            for slug, score in matched.items():
+                signals["frequency"][i, column[slug]] = score
+
+        totals = (
+            signals["title"] * self.WEIGHT_TITLE +
+            signals["description"] * self.WEIGHT_DESCRIPTION +
+            signals["archetypes"] * self.WEIGHT_ARCHETYPES +
+            signals["theme"] * self.WEIGHT_THEME +
+            signals["frequency"] * self.WEIGHT_FREQUENCY
+        )
+
+        results = []
+        names = ("title", "description", "archetypes", "theme", "frequency")
+        for i in range(len(sessions)):
+            matches = []
+            columns = np.flatnonzero(totals[i] > 0)
+            rows = {name: signals[name][i, columns].tolist() for name in names}
+            for n, (j, total) in enumerate(zip(columns.tolist(), totals[i, columns].tolist())):
+                slug = model.labels[j]
+                # Unmatched signals stay int 0, as in analyze()
+                signal_scores = {name: rows[name][n] or 0 for name in names}
+                matches.append(CategoryMatch(
+                    slug=slug,
+                    name=self.category_names.get(slug, slug),
+                    confidence=min(total, 1.0),
+                    signals=signal_scores
+                ))
+            matches.sort(key=lambda m: m.confidence, reverse=True)
+            results.append(matches)
+
+        return results
+
+    def _batch_text_scores(self, primary: np.ndarray, secondary: np.ndarray,
+                           weight_multiplier: float) -> np.ndarray:
+        """
+        _match_text for a batch, from per-category keyword match counts.
+
+        The raw score is accumulated one keyword at a time as in _match_text,
+        so results are bit-identical.
+        """
+        raw = np.zeros(primary.shape)
+        sums: Dict[Tuple[int, int], float] = {}
+        for i, j in zip(*np.nonzero(primary + secondary)):
+            key = (int(primary[i, j]), int(secondary[i, j]))
+            if key not in sums:
+                score = 0.0
+                for _ in range(key[0]):
+                    score += 1.0 * weight_multiplier
+                for _ in range(key[1]):
+                    score += 0.5 * weight_multiplier
+                sums[key] = score
+            raw[i, j] = sums[key]
+
+        totals, bonuses = [], []
+        for keywords in self.category_keywords.values():
+            totals.append(len(keywords.get("primary", [])) + len(keywords.get("secondary", [])) * 0.5)
+            bonuses.append(1.0 + (100 - min(keywords.get("priority", 100), 100)) / 500)
+        totals = np.array(totals)
+        scored = (raw > 0) & (totals > 0)
+        normalized = np.minimum(
+            np.divide(raw, totals * 0.3, out=np.zeros_like(raw), where=scored), 1.0
+        )
+        return np.where(scored, normalized * np.array(bonuses), 0.0)
+
     def _match_text(self, text: str, weight_multiplier: float = 1.0) -> Dict[str, float]:
         """
         Match text against category keywords.
@@ -157,7 +318,7 @@ class ContentAnalyzer:
         if not text:
             return {}
 
-        text_lower = text.lower()
+        scan = self._keyword_scanner.scan(text.lower())
         scores = {}
 
         for slug, keywords in self.category_keywords.items():
@@ -171,13 +332,13 @@ class ContentAnalyzer:
 
             # Check primary keywords (weight: 1.0)
             for keyword in primary:
-                if self._keyword_in_text(keyword.lower(), text_lower):
+                if scan.found(self._keyword_pattern(keyword.lower())):
                     primary_matches += 1
                     score += 1.0 * weight_multiplier
 
             # Check secondary keywords (weight: 0.5)
             for keyword in secondary:
-                if self._keyword_in_text(keyword.lower(), text_lower):
+                if scan.found(self._keyword_pattern(keyword.lower())):
                     secondary_matches += 1
                     score += 0.5 * weight_multiplier
 
@@ -193,6 +354,13 @@ class ContentAnalyzer:
 
         return scores
 
+    @staticmethod
+    def _keyword_pattern(keyword: str) -> str:
+        """Scanner pattern for a keyword: exact phrase, or word-bounded single word."""
+        if " " in keyword:
+            return keyword
+        return r'\b' + re.escape(keyword) + r'\b'
+
     def _keyword_in_text(self, keyword: str, text: str) -> bool:
         """Check if keyword appears in text with word boundary awareness."""
         # For multi-word keywords, check exact phrase
@@ -200,8 +368,7 @@ class ContentAnalyzer:
             return keyword in text
 
         # For single words, use word boundaries
-        pattern = r'\b' + re.escape(keyword) + r'\b'
-        return bool(re.search(pattern, text))
+        return bool(re.search(self._keyword_pattern(keyword), text))
 
     def _match_archetypes(self, archetypes: List[str]) -> Dict[str, float]:
         """
@@ -285,8 +452,14 @@ class ContentAnalyzer:
             - review_suggested: Whether manual review is recommended
             - needs_review: Whether categorization failed and needs manual assignment
         """
-        matches = self.analyze(session_data)
+        return self._select_category(self.analyze(session_data))
+
+    def categorize_batch(self, sessions: Sequence[Dict]) -> List[Dict]:
+        """categorize_with_fallback() for many sessions, scored with analyze_batch()."""
+        return [self._select_category(matches) for matches in self.analyze_batch(sessions)]
 
+    def _select_category(self, matches: List[CategoryMatch]) -> Dict:
+        """Pick the category (or fallback) from ranked matches."""
         if not matches:
             # No matches at all - use safe default
             return {
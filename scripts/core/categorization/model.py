@@ -0,0 +1,627 @@
+"""
+Compiled keyword model for batch categorization.
+
+ContentAnalyzer, PlaylistClassifier and AutoTagger all score text against
+keyword vocabularies: label -> {group -> [keywords]}. Matching each keyword
+separately against each field of each session repeats the same work for
+every session in the catalog. A ``KeywordModel`` compiles one vocabulary
+into a lexicon once and then scores many texts at a time:
+
+1. Each text is tokenized once (``\\w+`` runs) into a row of token counts.
+2. A cached token -> term matrix maps tokens to the single-word keywords they
+   match, so the term counts of a whole batch are one sparse product.
+   Keywords spanning several tokens ("inner eye", "self-compassion") are
+   few, and are counted by one regex search each over the joined batch.
+3. A term -> (label, group) weight matrix holds how often each keyword is
+   listed, so per-label match counts for the batch are one more product.
+
+Three matching modes cover the existing matchers, each identical to the
+original per-keyword check:
+
+- ``word``: ``\\bkeyword\\b``, or a plain substring for keywords with spaces
+  (ContentAnalyzer); counts whether a keyword is present
+- ``substring``: ``keyword in text`` (PlaylistClassifier)
+- ``prefix``: occurrences of ``\\bkeyword\\w*`` (AutoTagger)
+
+Models are persisted as ``.npz`` files with the token cache, and are
+rebuilt when the vocabulary (keywords.py, a playlist YAML) changes.
+
+Usage:
+    from scripts.core.categorization.model import KeywordModel, load_model
+
+    model = load_model(path, vocabulary, mode='word')
+    counts = model.match_counts(model.vectorize(texts))  # (texts, labels, groups)
+
+    python scripts/core/categorization/model.py --benchmark --sessions 10000
+    python scripts/core/categorization/model.py --check
+"""
+
+import hashlib
+import json
+import re
+import sys
+from bisect import bisect_right
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# Bump when the lexicon layout or matching rules change
+MODEL_VERSION = 1
+MODES = ('word', 'substring', 'prefix')
+DEFAULT_MODEL_DIR = PROJECT_ROOT / 'data' / 'categorization'
+
+WORD_RE = re.compile(r'\w+')
+# Joins a batch of texts so each pattern is searched once
+SEPARATOR = '\x00'
+
+# label -> group -> keywords
+Vocabulary = Dict[str, Dict[str, List[str]]]
+
+
+def vocabulary_fingerprint(vocabulary: Vocabulary, mode: str) -> str:
+    """Hash of the keywords a model is compiled from."""
+    payload = json.dumps([MODEL_VERSION, mode, vocabulary], sort_keys=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class KeywordModel:
+    """
+    One keyword vocabulary compiled for batch scoring.
+
+    Args:
+        vocabulary: label -> group -> keywords. Keywords are used as given
+            (callers lower-case them when their matcher did)
+        mode: 'word', 'substring' or 'prefix' (see module docstring)
+    """
+
+    def __init__(self, vocabulary: Vocabulary, mode: str = 'word'):
+        if mode not in MODES:
+            raise ValueError(f"Unknown match mode: {mode} (expected one of {MODES})")
+        self.mode = mode
+        self.vocabulary = vocabulary
+        self.fingerprint = vocabulary_fingerprint(vocabulary, mode)
+
+        self.labels = list(vocabulary)
+        self.groups: List[str] = []
+        for groups in vocabulary.values():
+            for group in groups:
+                if group not in self.groups:
+                    self.groups.append(group)
+        self.label_index = {label: i for i, label in enumerate(self.labels)}
+        self.group_index = {group: i for i, group in enumerate(self.groups)}
+
+        # Lexicon: single-token terms matched through the token cache, and
+        # multi-token patterns searched over the joined batch
+        self.terms: List[str] = []
+        self.patterns: List[str] = []
+        self._literals = set()
+        term_ids: Dict[str, int] = {}
+        pattern_ids: Dict[str, int] = {}
+        rows, cols, vals = [], [], []
+        width = len(self.groups)
+        for li, (label, groups) in enumerate(vocabulary.items()):
+            for group, keywords in groups.items():
+                column = li * width + self.group_index[group]
+                for keyword in keywords:
+                    if WORD_RE.fullmatch(keyword):
+                        ids, store, key = term_ids, self.terms, keyword
+                    else:
+                        ids, store, key = pattern_ids, self.patterns, self._pattern(keyword)
+                    if key not in ids:
+                        ids[key] = len(store)
+                        store.append(key)
+                    rows.append(('t', ids[key]) if ids is term_ids else ('p', ids[key]))
+                    cols.append(column)
+                    vals.append(1.0)
+
+        self._term_ids = term_ids
+        self._term_lengths = sorted({len(t) for t in self.terms})
+        self.n_features = len(self.terms) + len(self.patterns)
+        feature_rows = [i if kind == 't' else len(self.terms) + i for kind, i in rows]
+        # Duplicate (feature, column) entries are summed: a keyword listed
+        # twice counts twice, as in the per-keyword loops
+        self.weights = sparse.csr_matrix(
+            (vals, (feature_rows, cols)),
+            shape=(self.n_features, len(self.labels) * width),
+        )
+
+        # One search per pattern over the whole batch: for a few dozen
+        # patterns this beats a single multi-pattern pass per text
+        self._compiled = [
+            re.compile(re.escape(p) if p in self._literals else p) for p in self.patterns
+        ]
+
+        # Token cache: token -> row of the token -> term matrix
+        self.vocab: Dict[str, int] = {}
+        self._token_terms: List[List[int]] = []
+        self._token_matrix: Optional[sparse.csr_matrix] = None
+
+        # Where load_model() persists this model, and the cache size last saved
+        self.path: Optional[Path] = None
+        self._saved_tokens = 0
+
+    def _pattern(self, keyword: str) -> str:
+        """Regex (or literal) for a keyword that spans several tokens."""
+        if self.mode == 'substring' or (self.mode == 'word' and ' ' in keyword):
+            self._literals.add(keyword)
+            return keyword
+        if self.mode == 'word':
+            return r'\b' + re.escape(keyword) + r'\b'
+        return r'\b' + re.escape(keyword) + r'\w*'
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    # ==================== Token cache ====================
+
+    def _match_token(self, token: str) -> List[int]:
+        """Term IDs a token matches under this model's mode."""
+        ids = self._term_ids
+        if self.mode == 'word':
+            term = ids.get(token)
+            return [] if term is None else [term]
+        if self.mode == 'prefix':
+            return [ids[token[:n]] for n in self._term_lengths
+                    if n <= len(token) and token[:n] in ids]
+        found = set()
+        for n in self._term_lengths:
+            for start in range(len(token) - n + 1):
+                term = ids.get(token[start:start + n])
+                if term is not None:
+                    found.add(term)
+        return sorted(found)
+
+    def _token_index(self, token: str) -> int:
+        index = self.vocab.get(token)
+        if index is None:
+            index = self.vocab[token] = len(self._token_terms)
+            self._token_terms.append(self._match_token(token))
+            self._token_matrix = None
+        return index
+
+    def _tokens_to_terms(self) -> sparse.csr_matrix:
+        if self._token_matrix is None:
+            indptr = np.zeros(len(self._token_terms) + 1, dtype=np.int64)
+            indptr[1:] = np.cumsum([len(t) for t in self._token_terms])
+            indices = np.fromiter(
+                (term for terms in self._token_terms for term in terms),
+                dtype=np.int64, count=int(indptr[-1]),
+            )
+            self._token_matrix = sparse.csr_matrix(
+                (np.ones(len(indices)), indices, indptr),
+                shape=(len(self._token_terms), self.n_features),
+            )
+        return self._token_matrix
+
+    # ==================== Scoring ====================
+
+    def vectorize(self, texts: Sequence[str]) -> sparse.csr_matrix:
+        """
+        Term counts for each text (texts x features).
+
+        Single-token terms count matching tokens (for ``prefix``, the number
+        of ``\\bkeyword\\w*`` matches); patterns count their matches.
+        """
+        indptr = [0]
+        indices: List[int] = []
+        counts: List[int] = []
+        vocab = self.vocab
+
+        for text in texts:
+            if text:
+                for token, n in Counter(WORD_RE.findall(text)).items():
+                    index = vocab.get(token)
+                    indices.append(self._token_index(token) if index is None else index)
+                    counts.append(n)
+            indptr.append(len(indices))
+
+        token_counts = sparse.csr_matrix(
+            (np.array(counts, dtype=np.float64), np.array(indices, dtype=np.int64), np.array(indptr)),
+            shape=(len(texts), len(self._token_terms)),
+        )
+        features = token_counts @ self._tokens_to_terms()
+        if self.patterns:
+            features = features + self._pattern_counts(texts)
+        return features.tocsr()
+
+    def _pattern_counts(self, texts: Sequence[str]) -> sparse.csr_matrix:
+        """Non-overlapping matches of the multi-token patterns, searched over the joined batch."""
+        # The separator is a non-word character no keyword contains, so no
+        # match spans two texts and \b behaves as at the ends of each text
+        starts = []
+        position = 0
+        for text in texts:
+            starts.append(position)
+            position += len(text or "") + 1
+        joined = SEPARATOR.join(text or "" for text in texts)
+
+        offset = len(self.terms)
+        entries: Dict[Tuple[int, int], int] = {}
+        for i, compiled in enumerate(self._compiled):
+            column = offset + i
+            for match in compiled.finditer(joined):
+                key = (bisect_right(starts, match.start()) - 1, column)
+                entries[key] = entries.get(key, 0) + 1
+
+        rows = [row for row, _ in entries]
+        columns = [column for _, column in entries]
+        return sparse.csr_matrix(
+            (np.array(list(entries.values()), dtype=np.float64), (rows, columns)),
+            shape=(len(texts), self.n_features),
+        )
+
+    def match_counts(self, features: sparse.csr_matrix, presence: Optional[bool] = None) -> np.ndarray:
+        """
+        Keyword match counts per text, label and group.
+
+        Args:
+            features: Output of vectorize()
+            presence: Count each keyword once if it occurs at all (default:
+                True for 'word' and 'substring', False for 'prefix')
+
+        Returns:
+            Array of shape (texts, labels, groups); entries are exact integers
+        """
+        if presence is None:
+            presence = self.mode != 'prefix'
+        if presence:
+            features = features.copy()
+            features.data = (features.data > 0).astype(np.float64)
+        counts = (features @ self.weights).toarray()
+        return counts.reshape(features.shape[0], len(self.labels), len(self.groups))
+
+    def group(self, counts: np.ndarray, name: str) -> np.ndarray:
+        """Slice one keyword group out of match_counts() output (texts x labels)."""
+        if name not in self.group_index:
+            return np.zeros(counts.shape[:2])
+        return counts[:, :, self.group_index[name]]
+
+    # ==================== Persistence ====================
+
+    def save(self, path: Path):
+        """Write the model (fingerprint and token cache) to an .npz file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        matrix = self._tokens_to_terms()
+        tmp = path.with_suffix('.tmp.npz')
+        np.savez_compressed(
+            tmp,
+            fingerprint=np.array(self.fingerprint),
+            tokens=np.array(list(self.vocab), dtype=str),
+            indptr=matrix.indptr,
+            indices=matrix.indices,
+        )
+        tmp.replace(path)
+        self._saved_tokens = len(self.vocab)
+
+    def flush(self):
+        """Persist the token cache if vectorize() has added tokens since the last save."""
+        if self.path is not None and len(self.vocab) != self._saved_tokens:
+            self.save(self.path)
+
+    @classmethod
+    def load(cls, path: Path, vocabulary: Vocabulary, mode: str = 'word') -> Optional['KeywordModel']:
+        """Load a saved model, or None if it is missing or was built from other keywords."""
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if str(data['fingerprint']) != vocabulary_fingerprint(vocabulary, mode):
+                    return None
+                tokens = data['tokens'].tolist()
+                indptr, indices = data['indptr'], data['indices'].tolist()
+        except (OSError, KeyError, ValueError):
+            return None
+
+        model = cls(vocabulary, mode)
+        model.vocab = {token: i for i, token in enumerate(tokens)}
+        model._token_terms = [indices[indptr[i]:indptr[i + 1]] for i in range(len(tokens))]
+        model._saved_tokens = len(tokens)
+        return model
+
+
+def load_model(path: Optional[Path], vocabulary: Vocabulary, mode: str = 'word') -> KeywordModel:
+    """
+    Load the persisted model for a vocabulary, rebuilding it if the keywords changed.
+
+    Args:
+        path: .npz file, or None to build without persisting
+        vocabulary: label -> group -> keywords
+        mode: Match mode
+    """
+    model = KeywordModel.load(path, vocabulary, mode) if path else None
+    if model is None:
+        model = KeywordModel(vocabulary, mode)
+        if path:
+            model.save(path)
+    model.path = Path(path) if path else None
+    return model
+
+
+# ==================== Benchmark ====================
+
+def _synthetic_sessions(count: int, seed: int = 0) -> List[Dict]:
+    """Session dicts whose text mixes category, playlist and tag keywords with filler."""
+    import random
+
+    from scripts.automation.auto_tagger import AutoTagger
+    from scripts.core.categorization.keywords import ARCHETYPE_CATEGORIES, CATEGORY_KEYWORDS
+
+    rng = random.Random(seed)
+    keywords = sorted({
+        kw for spec in CATEGORY_KEYWORDS.values()
+        for kw in spec.get("primary", []) + spec.get("secondary", [])
+    } | {kw for kws in AutoTagger.TAG_CATEGORIES.values() for kw in kws})
+    filler = [f"word{i}" for i in range(400)] + ["the", "a", "into", "with", "of", "your"]
+    suffixes = ["", "", "", "ing", "s", "ed", "-light", "ful"]
+    archetypes = list(ARCHETYPE_CATEGORIES)
+    bands = ["delta", "theta", "alpha", "beta", "gamma", 2.5, 6, 10, 40, None]
+    outcomes = ["healing", "relaxation", "confidence", "transformation", "sleep", "clarity"]
+
+    def phrase(n: int, density: float) -> str:
+        words = []
+        for _ in range(n):
+            if rng.random() < density:
+                word = rng.choice(keywords) + rng.choice(suffixes)
+            else:
+                word = rng.choice(filler)
+            words.append(word.title() if rng.random() < 0.2 else word)
+        return " ".join(words)
+
+    sessions = []
+    for _ in range(count):
+        sessions.append({
+            "title": phrase(rng.randint(3, 8), 0.4),
+            "description": phrase(rng.randint(20, 60), 0.15) + ".",
+            "topic": phrase(rng.randint(2, 6), 0.3),
+            "theme": phrase(rng.randint(1, 4), 0.5),
+            "tags": [phrase(rng.randint(1, 2), 0.6) for _ in range(rng.randint(0, 8))],
+            "archetypes": rng.sample(archetypes, rng.randint(0, 3)),
+            "binaural_frequency": rng.choice(bands),
+            "duration_minutes": rng.choice([10, 20, 25, 30, 45, 60, 90]),
+            "manifest": {"session": {"desired_outcome": rng.choice(outcomes)}},
+        })
+    return sessions
+
+
+def _write_tagger_sessions(root: Path, sessions: List[Dict]) -> List[str]:
+    """Write synthetic sessions as manifest + script directories for AutoTagger."""
+    import yaml
+
+    names = []
+    for i, data in enumerate(sessions):
+        name = f"session-{i:05d}"
+        session_dir = root / "sessions" / name
+        (session_dir / "working_files").mkdir(parents=True)
+        manifest = {"session": {
+            "title": data["title"],
+            "description": data["description"],
+            "theme": data["theme"],
+            "archetypes": data["archetypes"],
+            "desired_outcome": data["manifest"]["session"]["desired_outcome"],
+            "duration": data["duration_minutes"],
+        }}
+        (session_dir / "manifest.yaml").write_text(yaml.safe_dump(manifest))
+        script = " ".join(f'<prosody rate="0.9">{t}</prosody>' for t in data["tags"])
+        (session_dir / "working_files" / "script.ssml").write_text(
+            f"<speak>{data['description']} {script}</speak>"
+        )
+        names.append(name)
+    return names
+
+
+def _category_key(matches) -> List:
+    return [(m.slug, m.confidence, m.signals) for m in matches]
+
+
+def _playlist_key(matches) -> List:
+    return [(m.slug, m.confidence, m.signals, m.playlist_type, m.requires_manual_review)
+            for m in matches]
+
+
+def _tagging_key(result) -> Tuple:
+    return (
+        [(s.tag, s.confidence, s.source, s.explanation) for s in result.suggested_tags],
+        sorted(result.category_tags), sorted(result.theme_tags), sorted(result.technique_tags),
+        result.duration_tag, result.depth_tag,
+    )
+
+
+def _analyzer_input(session_data: Dict) -> Dict:
+    """ContentAnalyzer input from PlaylistClassifier session data (archetype dicts -> names)."""
+    manifest = session_data.get("manifest", {})
+    session = manifest.get("session", {}) or {}
+    theme = session.get("theme", "")
+    return {
+        "title": session_data.get("title", ""),
+        "description": session_data.get("description", ""),
+        "topic": session.get("topic", ""),
+        "theme": theme.get("primary", "") if isinstance(theme, dict) else theme,
+        "tags": session_data.get("tags", []),
+        "archetypes": [
+            a.get("name", "") if isinstance(a, dict) else a
+            for a in session_data.get("archetypes", []) or []
+        ],
+        "binaural_frequency": (manifest.get("binaural", {}) or {}).get("beat_frequency"),
+    }
+
+
+def check_existing_sessions(project_root: Path = PROJECT_ROOT) -> Dict[str, object]:
+    """
+    Compare batch and per-session results on the sessions in sessions/.
+
+    Returns:
+        Dict with the session count and, per matcher, whether results are identical
+    """
+    import tempfile
+
+    from scripts.automation.auto_tagger import AutoTagger
+    from scripts.automation.playlist_classifier import PlaylistClassifier, load_session_data
+    from scripts.core.categorization.analyzer import ContentAnalyzer
+
+    sessions_dir = project_root / "sessions"
+    paths = sorted(
+        p for p in sessions_dir.iterdir()
+        if p.is_dir() and not p.name.startswith(("_", ".")) and (p / "manifest.yaml").exists()
+    )
+    data = [load_session_data(p) for p in paths]
+    with tempfile.TemporaryDirectory() as tmp:
+        analyzer = ContentAnalyzer(model_path=Path(tmp) / "categories.npz")
+        analyzer_data = [_analyzer_input(d) for d in data]
+        categories = (
+            [_category_key(analyzer.analyze(d)) for d in analyzer_data] ==
+            [_category_key(m) for m in analyzer.analyze_batch(analyzer_data)]
+        )
+        classifier = PlaylistClassifier(model_path=Path(tmp) / "playlists.npz")
+        playlists = (
+            [_playlist_key(classifier.classify(d)) for d in data] ==
+            [_playlist_key(m) for m in classifier.classify_batch(data)]
+        )
+        tagger = AutoTagger(project_root)
+        tagger.model_path = Path(tmp) / "tags.npz"
+        names = tagger._session_names()
+        batch = tagger.auto_tag_batch(names)
+        tags = all(_tagging_key(tagger.auto_tag(n)) == _tagging_key(batch[n]) for n in names)
+    return {"sessions": len(paths), "categories": categories, "playlists": playlists, "tags": tags}
+
+
+def benchmark(sessions: int = 10_000, tag_sessions: int = 2_000, seed: int = 0) -> Dict[str, object]:
+    """
+    Time per-session keyword matching against the batch model on synthetic sessions.
+
+    ContentAnalyzer and PlaylistClassifier run on ``sessions`` in-memory
+    session dicts; AutoTagger reads manifests and scripts from disk, so it
+    runs on ``tag_sessions`` written to a temporary sessions directory.
+    Every batch result is compared with the per-session result.
+    """
+    import tempfile
+    import time
+
+    from scripts.automation.auto_tagger import AutoTagger
+    from scripts.automation.playlist_classifier import PlaylistClassifier
+    from scripts.core.categorization.analyzer import ContentAnalyzer
+
+    data = _synthetic_sessions(sessions, seed)
+    results: Dict[str, object] = {"sessions": sessions, "tag_sessions": min(tag_sessions, sessions)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        analyzer = ContentAnalyzer(model_path=tmp / "categories.npz")
+        t0 = time.perf_counter()
+        single = [analyzer.analyze(d) for d in data]
+        results["categories_single_s"] = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        batch = analyzer.analyze_batch(data)
+        results["categories_batch_cold_s"] = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        ContentAnalyzer(model_path=tmp / "categories.npz").analyze_batch(data)
+        results["categories_batch_s"] = time.perf_counter() - t0
+        results["categories_identical"] = (
+            [_category_key(m) for m in single] == [_category_key(m) for m in batch]
+        )
+
+        classifier = PlaylistClassifier(model_path=tmp / "playlists.npz")
+        t0 = time.perf_counter()
+        single = [classifier.classify(d) for d in data]
+        results["playlists_single_s"] = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        batch = classifier.classify_batch(data)
+        results["playlists_batch_cold_s"] = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        PlaylistClassifier(model_path=tmp / "playlists.npz").classify_batch(data)
+        results["playlists_batch_s"] = time.perf_counter() - t0
+        results["playlists_identical"] = (
+            [_playlist_key(m) for m in single] == [_playlist_key(m) for m in batch]
+        )
+
+        names = _write_tagger_sessions(tmp, data[:tag_sessions])
+        tagger = AutoTagger(tmp)
+        t0 = time.perf_counter()
+        single = {n: tagger.auto_tag(n) for n in names}
+        results["tags_single_s"] = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        batch = AutoTagger(tmp).auto_tag_batch(names)
+        results["tags_batch_s"] = time.perf_counter() - t0
+        results["tags_identical"] = all(
+            _tagging_key(single[n]) == _tagging_key(batch[n]) for n in names
+        )
+        t0 = time.perf_counter()
+        AutoTagger(tmp).find_similar_by_tags(names[0])
+        results["similar_batch_s"] = time.perf_counter() - t0
+
+        # Editing the vocabulary invalidates the persisted model
+        vocabulary = dict(analyzer.keyword_model.vocabulary)
+        vocabulary["new-category"] = {"primary": ["novel"], "secondary": []}
+        results["invalidated_on_change"] = (
+            KeywordModel.load(tmp / "categories.npz", vocabulary, "word") is None and
+            KeywordModel.load(tmp / "categories.npz", analyzer.keyword_model.vocabulary, "word")
+            is not None
+        )
+
+    results["existing"] = check_existing_sessions()
+    return results
+
+
+def format_benchmark(results: Dict[str, object]) -> str:
+    """Human-readable benchmark summary."""
+    def row(label: str, single: float, batch: float, cold: Optional[float] = None) -> str:
+        cold_text = f", first run {cold:.2f}s" if cold is not None else ""
+        return (f"  {label:<22} per-session {single:7.2f}s   batch {batch:6.2f}s "
+                f"({single / batch:5.1f}x{cold_text})")
+
+    existing = results["existing"]
+    checks = [
+        ("Categories identical to ContentAnalyzer.analyze", results["categories_identical"]),
+        ("Playlists identical to PlaylistClassifier.classify", results["playlists_identical"]),
+        ("Tags identical to AutoTagger.auto_tag", results["tags_identical"]),
+        ("Persisted model rebuilt when keywords change", results["invalidated_on_change"]),
+        (f"Existing sessions identical ({existing['sessions']}: categories, playlists, tags)",
+         existing["categories"] and existing["playlists"] and existing["tags"]),
+    ]
+    lines = [
+        f"Synthetic sessions: {results['sessions']:,} "
+        f"(AutoTagger on {results['tag_sessions']:,} written to disk)",
+        row("ContentAnalyzer", results["categories_single_s"], results["categories_batch_s"],
+            results["categories_batch_cold_s"]),
+        row("PlaylistClassifier", results["playlists_single_s"], results["playlists_batch_s"],
+            results["playlists_batch_cold_s"]),
+        row("AutoTagger", results["tags_single_s"], results["tags_batch_s"]),
+        f"  find_similar_by_tags (batch, all sessions): {results['similar_batch_s']:.2f}s",
+        "",
+    ]
+    lines.extend(f"  {'✓' if ok else '✗'} {label}" for label, ok in checks)
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compiled keyword model for batch categorization")
+    parser.add_argument("--benchmark", action="store_true", help="Benchmark on synthetic sessions")
+    parser.add_argument("--check", action="store_true",
+                        help="Compare batch and per-session results on sessions/")
+    parser.add_argument("--sessions", type=int, default=10_000, help="Synthetic sessions (default: 10000)")
+    parser.add_argument("--tag-sessions", type=int, default=2_000,
+                        help="Synthetic sessions written to disk for AutoTagger (default: 2000)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        report = benchmark(args.sessions, args.tag_sessions)
+        print(json.dumps(report, indent=2) if args.json else format_benchmark(report))
+    elif args.check:
+        report = check_existing_sessions()
+        print(json.dumps(report, indent=2) if args.json else
+              "\n".join(f"{'✓' if report[k] else '✗'} {k}: {report['sessions']} sessions"
+                        for k in ("categories", "playlists", "tags")))
+    else:
+        parser.print_help()
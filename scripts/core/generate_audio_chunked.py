@@ -10,6 +10,9 @@ Requirements:
 
 Usage:
     python3 generate_audio_chunked.py input.ssml output.mp3 --voice en-US-Neural2-A
+
+Alongside the audio it writes ``<output>.timing.json`` with the exact sample
+offset of every chunk, phrase and SSML break (see scripts/core/speech_timing.py).
 """
 
 import os
@@ -23,6 +26,12 @@ from google.cloud import texttospeech
 from pydub import AudioSegment
 from pydub.exceptions import CouldntDecodeError
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.core.speech_timing import build_timing_sidecar, to_mono_float, write_timing_sidecar
+
 
 def sanitize_ssml_for_neural2(ssml_content):
     """
@@ -251,9 +260,14 @@ def synthesize_chunk(client, ssml_text, voice_name, chunk_num, total_chunks, spe
     
     return response.audio_content
 
-def concatenate_audio_chunks(chunk_files, output_file):
+def concatenate_audio_chunks(chunk_files, output_file, decoded=None):
     """Concatenate multiple MP3 files into one.
 
+    Args:
+        chunk_files: Chunk MP3 paths in order
+        output_file: Output MP3 path
+        decoded: Already decoded AudioSegments for chunk_files (optional)
+
     Note: Temp file cleanup is handled by tempfile.TemporaryDirectory context manager.
     """
     print(f"\n🔗 Concatenating {len(chunk_files)} audio chunks...")
@@ -262,7 +276,7 @@ def concatenate_audio_chunks(chunk_files, output_file):
 
     for i, chunk_file in enumerate(chunk_files, 1):
         print(f"   Adding chunk {i}/{len(chunk_files)}...")
-        audio = AudioSegment.from_mp3(chunk_file)
+        audio = decoded[i - 1] if decoded else AudioSegment.from_mp3(chunk_file)
         combined += audio
 
     # Export final file
@@ -271,6 +285,25 @@ def concatenate_audio_chunks(chunk_files, output_file):
 
     return combined
 
+def write_chunk_timing(chunks, decoded, output_filepath):
+    """Write the timing sidecar for chunks concatenated into output_filepath.
+
+    Chunk offsets are the decoded frame counts as concatenated, so they are
+    exact; breaks are located inside each chunk by silence alignment.
+    """
+    sample_rate = decoded[0].frame_rate
+    chunk_audio = [
+        to_mono_float(audio.set_frame_rate(sample_rate).get_array_of_samples(), audio.channels)
+        for audio in decoded
+    ]
+    timing = build_timing_sidecar(chunks, chunk_audio, sample_rate, Path(output_filepath).name)
+    path = write_timing_sidecar(timing, Path(output_filepath))
+
+    breaks = [b for chunk in timing['chunks'] for b in chunk['breaks']]
+    detected = sum(1 for b in breaks if b['detected'])
+    print(f"⏱️  Timing sidecar: {path} ({len(timing['chunks'])} chunks, {detected}/{len(breaks)} breaks located)")
+    return path
+
 def synthesize_ssml_file_chunked(
     ssml_filepath,
     output_filepath,
@@ -366,13 +399,22 @@ def synthesize_ssml_file_chunked(
             # Temp directory is auto-cleaned by context manager
             sys.exit(1)
 
+        # Decode once for both concatenation and the timing sidecar
+        decoded = [AudioSegment.from_mp3(chunk_file) for chunk_file in chunk_files]
+
         # Concatenate all chunks if more than one
         if len(chunk_files) == 1:
             # Copy single file (can't rename across filesystems)
             shutil.copy2(chunk_files[0], output_filepath)
         else:
             # Concatenate multiple files
-            concatenate_audio_chunks(chunk_files, output_filepath)
+            concatenate_audio_chunks(chunk_files, output_filepath, decoded)
+
+        try:
+            write_chunk_timing(chunks, decoded, output_filepath)
+        except Exception as e:
+            # Subtitles fall back to estimated timing without the sidecar
+            print(f"   ⚠️  Could not write timing sidecar: {e}")
     
     # Calculate file size and duration
     file_size_mb = os.path.getsize(output_filepath) / (1024 * 1024)
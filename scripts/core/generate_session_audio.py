@@ -4,7 +4,10 @@ Universal session audio generator.
 
 Given an SSML script, this tool will:
 1) Synthesize the voice track (chunked, to avoid provider limits)
-2) Optionally adjust speaking rate toward a target duration
+2) Optionally fit the voice to a target duration: the first-pass speaking
+   rate is predicted from past runs, then pauses are resized (with a small
+   WSOLA stretch if needed) instead of re-synthesizing
+   (see scripts/core/duration_fit.py)
 3) Generate a simple binaural bed that matches the desired length
 4) Mix voice + binaural into a final MP3 (optional)
 
@@ -31,6 +34,13 @@ from pydub import AudioSegment
 # Local imports
 from audio.binaural import generate as generate_binaural, save_stem
 from tts_provider import get_tts_provider
+from duration_fit import (
+    FIT_TOLERANCE_SECONDS,
+    fit_voice_file,
+    load_rate_model,
+    record_tts_run,
+    script_stats,
+)
 
 # Import validation utilities
 try:
@@ -91,45 +101,6 @@ def _audio_stats(path: Path):
     }
 
 
-def _extend_voice_with_silence(voice_path: Path, target_seconds: float, split_fraction: float = 0.75):
-    """
-    DEPRECATED: This function was used to work around Edge TTS ignoring SSML breaks.
-    Google Cloud TTS respects SSML breaks, so this is no longer needed.
-    Kept for backward compatibility only.
-
-    Args:
-        voice_path: Path to voice audio file
-        target_seconds: Target duration in seconds
-        split_fraction: Where to insert silence (0.75 = 75% through)
-
-    Returns:
-        New duration in seconds
-    """
-    voice = AudioSegment.from_file(voice_path)
-    current_duration = len(voice) / 1000.0
-
-    if current_duration >= target_seconds:
-        return current_duration
-
-    needed_silence_ms = int((target_seconds - current_duration) * 1000)
-    split_point_ms = int(len(voice) * split_fraction)
-
-    part1 = voice[:split_point_ms]
-    part2 = voice[split_point_ms:]
-    silence = AudioSegment.silent(duration=needed_silence_ms)
-
-    extended = part1 + silence + part2
-
-    print(f"   Extending voice: {current_duration:.1f}s → {target_seconds:.1f}s")
-    print(f"   Inserting {needed_silence_ms/1000:.1f}s silence at {split_point_ms/1000:.1f}s mark")
-
-    # Export with same format
-    fmt = voice_path.suffix.lstrip(".")
-    extended.export(voice_path, format=fmt, bitrate="320k" if fmt == "mp3" else None)
-
-    return len(extended) / 1000.0
-
-
 def _maybe_adjust_rate(current_rate: float, current_dur: float, target_dur: float):
     """
     Calculate an adjusted speaking rate to hit a target duration.
@@ -270,21 +241,49 @@ def main():
             sample_rate_hz=args.sample_rate,
         )
 
-    synthesize_current(speaking_rate)
-    voice_duration = _audio_duration_seconds(voice_out)
-
-    # Optional: adjust speaking rate toward target duration
-    if args.target_minutes and args.match_mode == "voice_to_target":
-        target_seconds = args.target_minutes * 60
+    fit_to_target = bool(args.target_minutes and args.match_mode == "voice_to_target")
+    target_seconds = args.target_minutes * 60 if fit_to_target else None
+    stats = script_stats(ssml_path.read_text(encoding="utf-8"))
+
+    # First-pass rate from this voice's past runs, so one synthesis lands close
+    if fit_to_target:
+        rate_model = load_rate_model(args.tts_provider, args.voice)
+        if rate_model:
+            speaking_rate = rate_model.rate_for(stats, target_seconds)
+            logger.info(
+                f"Predicted speaking rate {speaking_rate:.3f} for {args.target_minutes} min "
+                f"({rate_model.runs} past runs of {args.voice})"
+            )
 
-        # Google Cloud TTS respects SSML breaks, so we can adjust speaking rate
-        adjusted_rate, changed = _maybe_adjust_rate(speaking_rate, voice_duration, target_seconds)
-        if changed:
-            logger.info(f"Re-synthesizing voice to better match target length ({args.target_minutes} min)")
-            logger.info(f"Current duration: {voice_duration/60:.2f} min; new speaking rate: {adjusted_rate:.3f}")
-            speaking_rate = adjusted_rate
-            synthesize_current(speaking_rate)
-            voice_duration = _audio_duration_seconds(voice_out)
+    def synthesize_and_record(rate: float) -> float:
+        synthesize_current(rate)
+        duration = _audio_duration_seconds(voice_out)
+        record_tts_run(args.tts_provider, args.voice, rate, stats, duration, ssml_path.parent.name)
+        return duration
+
+    voice_duration = synthesize_and_record(speaking_rate)
+    tts_passes = 1
+    duration_fit = None
+
+    # Optional: fit the voice to the target duration by resizing pauses
+    if fit_to_target:
+        fit = fit_voice_file(voice_out, target_seconds)
+        if abs(fit.error_seconds) > FIT_TOLERANCE_SECONDS:
+            # Beyond what pauses and stretching absorb: one re-synthesis at an adjusted rate
+            adjusted_rate, changed = _maybe_adjust_rate(speaking_rate, voice_duration, target_seconds)
+            if changed:
+                logger.info(f"Re-synthesizing voice to better match target length ({args.target_minutes} min)")
+                logger.info(f"Current duration: {voice_duration/60:.2f} min; new speaking rate: {adjusted_rate:.3f}")
+                speaking_rate = adjusted_rate
+                voice_duration = synthesize_and_record(speaking_rate)
+                tts_passes += 1
+                fit = fit_voice_file(voice_out, target_seconds)
+        logger.info(
+            f"Fitted voice {fit.source_seconds/60:.2f} → {fit.fitted_seconds/60:.2f} min "
+            f"(stretch {fit.stretch:.3f}, {fit.pauses} pauses, error {fit.error_seconds:+.2f}s)"
+        )
+        duration_fit = fit.summary()
+        voice_duration = _audio_duration_seconds(voice_out)
 
     # Step 2: Build binaural bed to match desired length
     logger.info("-" * 70)
@@ -455,6 +454,8 @@ def main():
         "voice": str(voice_out),
         "voice_duration_min": round(voice_duration / 60, 3),
         "speaking_rate": round(speaking_rate, 3),
+        "tts_passes": tts_passes,
+        "duration_fit": duration_fit,
         "voice_pitch_semitones": args.pitch,
         "tts_provider": args.tts_provider,
         "bed": str(bed_out),
@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""
+Speech Timing Sidecar for Dreamweaving
+
+Records where every TTS chunk, SSML phrase and <break> actually lands in the
+synthesized voice track, so subtitles and downstream tools (shorts segment
+selection, clip pipelines) can use real timings instead of word-count
+estimates.
+
+Chunk offsets are exact: they are the decoded sample counts of each chunk as
+concatenated. Breaks inside a chunk are located by aligning the expected
+break durations (in SSML order) to silences found in the chunk's energy
+envelope, so no ASR model is needed. Breaks that cannot be matched are
+interpolated between their neighbours and flagged ``detected: false``.
+
+The sidecar is written next to the audio as ``<name>.timing.json``:
+
+    {
+      "version": 1,
+      "sample_rate": 24000,
+      "total_samples": 43200000,
+      "chunks": [
+        {"index": 1, "start_sample": 0, "num_samples": 2880000,
+         "phrases": [{"text": "...", "start_sample": 0, "end_sample": 91200}],
+         "breaks": [{"time": "2s", "start_sample": 91200,
+                     "end_sample": 141600, "detected": true}]}
+      ]
+    }
+
+Usage:
+    from scripts.core.speech_timing import (
+        build_timing_sidecar,
+        write_timing_sidecar,
+        load_timing_sidecar,
+        sidecar_segments,
+    )
+"""
+
+import json
+import re
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+TIMING_VERSION = 1
+
+# Energy analysis
+ANALYSIS_HOP_SECONDS = 0.01        # One analysis frame
+BREAK_SILENCE_DB = -40.0           # Below chunk peak: silence for break detection
+SPEECH_GAP_DB = -35.0              # Below phrase peak: inter-word gap for onsets
+MIN_BREAK_SILENCE_SECONDS = 0.15   # Shortest silence considered a break candidate
+MIN_WORD_GAP_SECONDS = 0.05        # Shortest gap between words
+
+# Break alignment
+UNMATCHED_BREAK_COST = 3.0
+POSITION_WEIGHT = 2.0
+
+# SSML strength → seconds, for <break strength="..."/> without a time
+BREAK_STRENGTH_SECONDS = {
+    'none': 0.0, 'x-weak': 0.1, 'weak': 0.25,
+    'medium': 0.5, 'strong': 0.75, 'x-strong': 1.25,
+}
+
+BREAK_PATTERN = re.compile(r'(<break\b[^>]*/>)')
+
+
+@dataclass
+class PhraseSpec:
+    """Text spoken between two breaks (or chunk edges)."""
+    text: str
+    chars_before: int              # Spoken characters before this phrase in the chunk
+
+
+@dataclass
+class BreakSpec:
+    """An SSML break inside a chunk."""
+    time: str
+    seconds: float
+    chars_before: int
+
+
+# =============================================================================
+# SSML PARSING
+# =============================================================================
+
+def ssml_to_text(ssml: str) -> str:
+    """Strip SSML markup down to spoken text."""
+    text = re.sub(r'<!--.*?-->', '', ssml, flags=re.DOTALL)
+    text = re.sub(r'<[^>]+>', '', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def break_seconds(tag: str) -> Tuple[str, float]:
+    """Return (label, seconds) for a <break/> tag."""
+    match = re.search(r'time="([\d.]+)(ms|s)"', tag)
+    if match:
+        value = float(match.group(1))
+        seconds = value / 1000 if match.group(2) == 'ms' else value
+        return f"{match.group(1)}{match.group(2)}", seconds
+    strength = re.search(r'strength="([^"]+)"', tag)
+    label = strength.group(1) if strength else 'medium'
+    return label, BREAK_STRENGTH_SECONDS.get(label, 0.5)
+
+
+def parse_chunk_ssml(chunk_ssml: str) -> Tuple[List[PhraseSpec], List[BreakSpec]]:
+    """Split one chunk's SSML into phrases and the breaks between them.
+
+    Phrases are only recorded when they contain spoken text; consecutive
+    breaks stay separate entries.
+    """
+    speak = re.search(r'<speak[^>]*>(.*)</speak>', chunk_ssml, re.DOTALL)
+    body = speak.group(1) if speak else chunk_ssml
+
+    phrases: List[PhraseSpec] = []
+    breaks: List[BreakSpec] = []
+    chars = 0
+    for part in BREAK_PATTERN.split(body):
+        if BREAK_PATTERN.fullmatch(part):
+            label, seconds = break_seconds(part)
+            breaks.append(BreakSpec(label, seconds, chars))
+            continue
+        text = ssml_to_text(part)
+        if text:
+            phrases.append(PhraseSpec(text, chars))
+            chars += len(text) + 1
+    return phrases, breaks
+
+
+# =============================================================================
+# ENERGY ANALYSIS
+# =============================================================================
+
+def to_mono_float(samples: np.ndarray, channels: int = 1) -> np.ndarray:
+    """Interleaved integer or float samples → mono float32 in [-1, 1]."""
+    data = np.asarray(samples)
+    scale = float(np.iinfo(data.dtype).max) if np.issubdtype(data.dtype, np.integer) else 1.0
+    data = data.astype(np.float32) / scale
+    if channels > 1:
+        data = data.reshape(-1, channels).mean(axis=1)
+    return data
+
+
+def frame_db(samples: np.ndarray, hop: int) -> np.ndarray:
+    """RMS level per ``hop``-sample frame in dB relative to the loudest frame."""
+    frames = len(samples) // hop
+    if frames == 0:
+        return np.zeros(0, dtype=np.float32)
+    blocks = samples[:frames * hop].reshape(frames, hop)
+    rms = np.sqrt(np.mean(blocks.astype(np.float64) ** 2, axis=1))
+    db = 20 * np.log10(rms + 1e-10)
+    return db - db.max()
+
+
+def silent_runs(db: np.ndarray, threshold_db: float, min_frames: int) -> List[Tuple[int, int]]:
+    """Frame ranges [start, end) of at least ``min_frames`` below ``threshold_db``."""
+    quiet = np.concatenate(([False], db < threshold_db, [False]))
+    edges = np.flatnonzero(np.diff(quiet.astype(np.int8)))
+    starts, ends = edges[0::2], edges[1::2]
+    return [(int(s), int(e)) for s, e in zip(starts, ends) if e - s >= min_frames]
+
+
+def _refine_onset(samples: np.ndarray, frame_start: int, hop: int, level: float) -> int:
+    """Sample index of the first sample above ``level`` within the onset frame."""
+    lo = max(0, (frame_start - 1) * hop)
+    hi = min(len(samples), (frame_start + 1) * hop)
+    above = np.flatnonzero(np.abs(samples[lo:hi]) >= level)
+    return lo + int(above[0]) if len(above) else frame_start * hop
+
+
+def _refine_offset(samples: np.ndarray, frame_end: int, hop: int, level: float) -> int:
+    """Sample index just past the last sample above ``level`` within the offset frame."""
+    lo = max(0, (frame_end - 1) * hop)
+    hi = min(len(samples), (frame_end + 1) * hop)
+    above = np.flatnonzero(np.abs(samples[lo:hi]) >= level)
+    return lo + int(above[-1]) + 1 if len(above) else frame_end * hop
+
+
+# =============================================================================
+# BREAK ALIGNMENT
+# =============================================================================
+
+def align_breaks(
+    breaks: Sequence[BreakSpec],
+    silences: Sequence[Tuple[int, int]],
+    expected: Sequence[float],
+    length: int,
+    sample_rate: int
+) -> List[Optional[int]]:
+    """Match breaks to silences in order (dynamic programming).
+
+    Cost of a match is the relative duration mismatch plus the distance from
+    the break's expected position (as a fraction of the chunk). Silences may
+    be skipped (sentence pauses); breaks may stay unmatched at a fixed cost.
+
+    Returns:
+        Index into ``silences`` per break, or None if unmatched
+    """
+    n, m = len(breaks), len(silences)
+    inf = float('inf')
+    cost = np.full((n + 1, m + 1), inf)
+    move = np.zeros((n + 1, m + 1), dtype=np.int8)  # 0 skip silence, 1 skip break, 2 match
+    cost[0, :] = 0.0
+
+    for i in range(1, n + 1):
+        want = breaks[i - 1].seconds
+        cost[i, 0] = cost[i - 1, 0] + UNMATCHED_BREAK_COST
+        move[i, 0] = 1
+        for j in range(1, m + 1):
+            best, how = cost[i, j - 1], 0
+            if cost[i - 1, j] + UNMATCHED_BREAK_COST < best:
+                best, how = cost[i - 1, j] + UNMATCHED_BREAK_COST, 1
+            start, end = silences[j - 1]
+            got = (end - start) / sample_rate
+            if got >= 0.6 * want - 0.05:
+                mismatch = abs(got - want) / max(want, 0.25)
+                position = abs((start + end) / 2 - expected[i - 1]) / max(length, 1)
+                match = cost[i - 1, j - 1] + min(mismatch, 2.0) + POSITION_WEIGHT * position
+                if match < best:
+                    best, how = match, 2
+            cost[i, j], move[i, j] = best, how
+
+    matched: List[Optional[int]] = [None] * n
+    i, j = n, m
+    while i > 0:
+        how = move[i, j]
+        if how == 2:
+            matched[i - 1] = j - 1
+            i, j = i - 1, j - 1
+        elif how == 1:
+            i -= 1
+        else:
+            j -= 1
+    return matched
+
+
+def chunk_timing(
+    chunk_ssml: str,
+    samples: np.ndarray,
+    sample_rate: int,
+    start_sample: int = 0
+) -> Dict[str, Any]:
+    """Locate phrases and breaks of one chunk in its decoded mono samples.
+
+    Args:
+        chunk_ssml: The SSML document sent to TTS for this chunk
+        samples: Mono float samples of the chunk
+        sample_rate: Sample rate of ``samples``
+        start_sample: Offset of the chunk in the concatenated track
+
+    Returns:
+        Chunk dict as stored in the sidecar (absolute sample offsets)
+    """
+    phrases, breaks = parse_chunk_ssml(chunk_ssml)
+    length = len(samples)
+    hop = max(1, int(sample_rate * ANALYSIS_HOP_SECONDS))
+    db = frame_db(samples, hop)
+    runs = silent_runs(db, BREAK_SILENCE_DB, max(1, int(MIN_BREAK_SILENCE_SECONDS / ANALYSIS_HOP_SECONDS)))
+    silences = [(s * hop, min(length, e * hop)) for s, e in runs]
+    if runs and runs[-1][1] == len(db):
+        silences[-1] = (silences[-1][0], length)  # Trailing silence runs to the chunk end
+
+    # Expected break positions: spread speech time by characters, add break time
+    total_chars = max(1, sum(len(p.text) + 1 for p in phrases))
+    speech_samples = max(0.0, length - sample_rate * sum(b.seconds for b in breaks))
+    expected = []
+    pause_before = 0.0
+    for spec in breaks:
+        expected.append(spec.chars_before / total_chars * speech_samples + pause_before * sample_rate
+                        + spec.seconds * sample_rate / 2)
+        pause_before += spec.seconds
+
+    matched = align_breaks(breaks, silences, expected, length, sample_rate)
+
+    # Break spans in chunk samples; interpolate unmatched ones between anchors
+    spans: List[Tuple[int, int]] = []
+    for k, spec in enumerate(breaks):
+        if matched[k] is not None:
+            spans.append(silences[matched[k]])
+            continue
+        prev_end, prev_chars = 0, 0
+        for p in range(k - 1, -1, -1):
+            if matched[p] is not None:
+                prev_end, prev_chars = silences[matched[p]][1], breaks[p].chars_before
+                break
+        next_start, next_chars = length, total_chars
+        for q in range(k + 1, len(breaks)):
+            if matched[q] is not None:
+                next_start, next_chars = silences[matched[q]][0], breaks[q].chars_before
+                break
+        frac = (spec.chars_before - prev_chars) / max(1, next_chars - prev_chars)
+        at = int(prev_end + frac * (next_start - prev_end))
+        spans.append((at, at))
+
+    # Phrase k runs from the end of the last break before it to the start of the next
+    phrase_entries = []
+    for phrase in phrases:
+        start, end = 0, length
+        for spec, span in zip(breaks, spans):
+            if spec.chars_before <= phrase.chars_before:
+                start = span[1]
+            elif end == length:
+                end = span[0]
+        phrase_entries.append({
+            'text': phrase.text,
+            'start_sample': start_sample + start,
+            'end_sample': start_sample + max(start, end),
+        })
+
+    return {
+        'start_sample': start_sample,
+        'num_samples': length,
+        'phrases': phrase_entries,
+        'breaks': [
+            {
+                'time': spec.time,
+                'start_sample': start_sample + span[0],
+                'end_sample': start_sample + span[1],
+                'detected': matched[k] is not None,
+            }
+            for k, (spec, span) in enumerate(zip(breaks, spans))
+        ],
+    }
+
+
+def build_timing_sidecar(
+    chunk_ssml: Sequence[str],
+    chunk_audio: Sequence[np.ndarray],
+    sample_rate: int,
+    audio_name: str = ''
+) -> Dict[str, Any]:
+    """Build the sidecar for chunks concatenated in order.
+
+    Args:
+        chunk_ssml: SSML document per chunk
+        chunk_audio: Decoded mono samples per chunk, exactly as concatenated
+        sample_rate: Sample rate of the decoded chunks
+        audio_name: File name of the audio the sidecar describes
+    """
+    chunks = []
+    offset = 0
+    for index, (ssml, samples) in enumerate(zip(chunk_ssml, chunk_audio), 1):
+        entry = chunk_timing(ssml, samples, sample_rate, offset)
+        chunks.append({'index': index, **entry})
+        offset += len(samples)
+    return {
+        'version': TIMING_VERSION,
+        'audio': audio_name,
+        'sample_rate': sample_rate,
+        'total_samples': offset,
+        'chunks': chunks,
+    }
+
+
+# =============================================================================
+# SIDECAR FILES
+# =============================================================================
+
+def timing_sidecar_path(audio_path: Path) -> Path:
+    """``voice.mp3`` → ``voice.timing.json``."""
+    audio_path = Path(audio_path)
+    return audio_path.with_name(f"{audio_path.stem}.timing.json")
+
+
+def write_timing_sidecar(timing: Dict[str, Any], audio_path: Path) -> Path:
+    path = timing_sidecar_path(audio_path)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(timing, f, indent=1)
+    return path
+
+
+def load_timing_sidecar(path: Path) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        timing = json.load(f)
+    if timing.get('version') != TIMING_VERSION:
+        raise ValueError(f"Unsupported timing sidecar version: {timing.get('version')}")
+    return timing
+
+
+def sidecar_segments(timing: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Phrase segments in seconds: [{'start', 'end', 'text'}]."""
+    rate = float(timing['sample_rate'])
+    return [
+        {
+            'start': phrase['start_sample'] / rate,
+            'end': phrase['end_sample'] / rate,
+            'text': phrase['text'],
+        }
+        for chunk in timing['chunks']
+        for phrase in chunk['phrases']
+    ]
+
+
+def load_audio_samples(audio_path: Path, sample_rate: int) -> np.ndarray:
+    """Decode audio to mono float samples at ``sample_rate`` with ffmpeg."""
+    result = subprocess.run([
+        'ffmpeg', '-v', 'error', '-i', str(audio_path),
+        '-f', 's16le', '-ac', '1', '-ar', str(sample_rate), '-'
+    ], capture_output=True, check=True)
+    return to_mono_float(np.frombuffer(result.stdout, dtype=np.int16))
+
+
+# =============================================================================
+# ONSET REFINEMENT
+# =============================================================================
+
+def refine_phrase(
+    samples: np.ndarray,
+    sample_rate: int,
+    start_sample: int,
+    end_sample: int,
+    text: str
+) -> Dict[str, Any]:
+    """Refine a phrase span to speech onset/offset and estimate word boundaries.
+
+    Speech regions are runs of frames above ``SPEECH_GAP_DB`` (relative to the
+    phrase peak) separated by gaps of at least ``MIN_WORD_GAP_SECONDS``. Words
+    are spread over the concatenated speech time by character count, then each
+    word start is snapped to the nearest region onset within 150 ms.
+
+    Returns:
+        {'start', 'end', 'words': [(word, start, end)]} in seconds
+    """
+    segment = samples[start_sample:end_sample]
+    words = text.split()
+    hop = max(1, int(sample_rate * ANALYSIS_HOP_SECONDS))
+    db = frame_db(segment, hop)
+    fallback = {'start': start_sample / sample_rate, 'end': end_sample / sample_rate, 'words': []}
+    if len(db) == 0 or not words:
+        return fallback
+
+    loud = db >= SPEECH_GAP_DB
+    if not loud.any():
+        return fallback
+    peak = float(np.max(np.abs(segment)))
+    level = peak * 10 ** (SPEECH_GAP_DB / 20)
+
+    gaps = silent_runs(db, SPEECH_GAP_DB, max(1, int(MIN_WORD_GAP_SECONDS / ANALYSIS_HOP_SECONDS)))
+    first, last = int(np.argmax(loud)), len(loud) - int(np.argmax(loud[::-1]))
+    regions = []
+    cursor = first
+    for gap_start, gap_end in gaps:
+        if gap_start <= first or gap_end >= last:
+            continue
+        regions.append((cursor, gap_start))
+        cursor = gap_end
+    regions.append((cursor, last))
+
+    spans = [
+        (_refine_onset(segment, s, hop, level), _refine_offset(segment, e, hop, level))
+        for s, e in regions
+    ]
+    onsets = np.array([s for s, _ in spans])
+    speech = np.array([e - s for s, e in spans], dtype=np.float64)
+    cumulative = np.concatenate(([0.0], np.cumsum(speech)))
+
+    def speech_to_sample(t: float) -> int:
+        k = min(len(spans) - 1, int(np.searchsorted(cumulative, t, side='right')) - 1)
+        return spans[k][0] + int(t - cumulative[k])
+
+    weights = np.array([len(w) + 1 for w in words], dtype=np.float64)
+    bounds = np.concatenate(([0.0], np.cumsum(weights))) / weights.sum() * cumulative[-1]
+    snap = int(0.15 * sample_rate)
+    word_times = []
+    for w, word in enumerate(words):
+        begin = speech_to_sample(bounds[w])
+        nearest = onsets[np.argmin(np.abs(onsets - begin))]
+        if abs(nearest - begin) <= snap:
+            begin = int(nearest)
+        word_times.append([word, begin, speech_to_sample(bounds[w + 1])])
+    for w in range(len(word_times) - 1):  # Keep words ordered after snapping
+        word_times[w][2] = min(word_times[w][2], word_times[w + 1][1])
+    word_times[-1][2] = spans[-1][1]
+
+    return {
+        'start': (start_sample + spans[0][0]) / sample_rate,
+        'end': (start_sample + spans[-1][1]) / sample_rate,
+        'words': [
+            (word, (start_sample + b) / sample_rate, (start_sample + max(b, e)) / sample_rate)
+            for word, b, e in word_times
+        ],
+    }
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Load test for the coin RAG MCP stdio server.
+
+Starts ``coin_rag_mcp_server.py`` as a subprocess, pipes a mixed stream of
+tools/call requests into it (optionally cancelling some slow calls), and
+reports per-tool p50/p99 latency measured from request write to response
+read. Responses are matched to requests by id, so out-of-order replies are
+handled.
+
+Usage:
+    python3 scripts/mcp/coin_mcp_load_test.py
+    python3 scripts/mcp/coin_mcp_load_test.py --requests 400 --rate 50 --workers 8
+    python3 scripts/mcp/coin_mcp_load_test.py --compare-serial   # also run with 1 worker
+    python3 scripts/mcp/coin_mcp_load_test.py --cancel-every 5 --json
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SERVER = PROJECT_ROOT / "scripts" / "mcp" / "coin_rag_mcp_server.py"
+
+# (tool, arguments, weight): cheap calculators dominate, with slow search/scrape mixed in
+REQUEST_MIX = [
+    ("coin_search", {"query": "1921-D Morgan dollar value", "limit": 5}, 2),
+    ("coin_key_date_check", {"coin_type": "morgan dollar", "year": 1893, "mintmark": "S"}, 1),
+    ("coin_get_spot_price", {}, 1),
+    ("coin_rag_stats", {}, 2),
+    ("coin_bullion_sort", {"coin_type": "morgan dollar", "year": 1921, "condition": "circulated"}, 4),
+    ("coin_junk_silver_calc", {"face_value": 10, "spot_price": 30.0}, 4),
+    ("coin_get_pricing_config", {}, 2),
+]
+
+SLOW_TOOLS = {"coin_search", "coin_key_date_check", "coin_get_spot_price"}
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run_load(
+    requests: int = 200,
+    rate: float = 0.0,
+    workers: Optional[int] = None,
+    cancel_every: int = 0,
+    warm: bool = True,
+    seed: int = 7,
+) -> Dict[str, Any]:
+    """Drive one server process and collect per-tool latencies."""
+    env = dict(os.environ)
+    if workers is not None:
+        env["COIN_MCP_WORKERS"] = str(workers)
+    env["COIN_MCP_WARM"] = "1" if warm else "0"
+
+    proc = subprocess.Popen(
+        [sys.executable, str(SERVER)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=env,
+        cwd=str(PROJECT_ROOT),
+    )
+
+    sent: Dict[int, tuple] = {}
+    latencies: Dict[str, List[float]] = {}
+    outcomes: Dict[str, Dict[str, int]] = {}
+    lock = threading.Lock()
+    all_done = threading.Event()
+    initialized = threading.Event()
+    expected = requests + 1  # + initialize
+
+    def reader():
+        received = 0
+        for line in proc.stdout:
+            now = time.perf_counter()
+            msg = json.loads(line)
+            with lock:
+                entry = sent.pop(msg.get("id"), None)
+            if entry is None:
+                continue
+            tool, started = entry
+            received += 1
+            if tool == "initialize":
+                initialized.set()
+            if "error" in msg:
+                outcome = "cancelled" if msg["error"].get("code") == -32800 else "error"
+            else:
+                outcome = "ok"
+            latencies.setdefault(tool, []).append((now - started) * 1000)
+            counts = outcomes.setdefault(tool, {"ok": 0, "error": 0, "cancelled": 0})
+            counts[outcome] += 1
+            if received >= expected:
+                break
+        all_done.set()
+
+    def send(payload: Dict[str, Any], tool: Optional[str] = None):
+        if tool is not None:
+            with lock:
+                sent[payload["id"]] = (tool, time.perf_counter())
+        proc.stdin.write((json.dumps(payload) + "\n").encode("utf-8"))
+        proc.stdin.flush()
+
+    threading.Thread(target=reader, daemon=True).start()
+
+    rng = random.Random(seed)
+    tools = [(name, args) for name, args, weight in REQUEST_MIX for _ in range(weight)]
+    send({"jsonrpc": "2.0", "id": 0, "method": "initialize", "params": {}}, tool="initialize")
+    if not initialized.wait(timeout=60):  # Exclude interpreter/module start-up from latencies
+        proc.kill()
+        raise SystemExit("Server did not answer initialize within 60s")
+
+    start = time.perf_counter()
+    slow_sent = 0
+    for rpc_id in range(1, requests + 1):
+        name, args = rng.choice(tools)
+        send({"jsonrpc": "2.0", "id": rpc_id, "method": "tools/call",
+              "params": {"name": name, "arguments": args}}, tool=name)
+        if name in SLOW_TOOLS:
+            slow_sent += 1
+            if cancel_every and slow_sent % cancel_every == 0:
+                send({"jsonrpc": "2.0", "method": "$/cancelRequest", "params": {"id": rpc_id}})
+        if rate > 0:
+            time.sleep(1.0 / rate)
+
+    finished = all_done.wait(timeout=300)
+    wall = time.perf_counter() - start
+    proc.stdin.close()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+    tools_report = {}
+    for tool, values in sorted(latencies.items()):
+        if tool == "initialize":
+            continue
+        tools_report[tool] = {
+            "count": len(values),
+            "p50_ms": round(_percentile(values, 50), 1),
+            "p99_ms": round(_percentile(values, 99), 1),
+            **outcomes[tool],
+        }
+    return {
+        "workers": workers or "default",
+        "requests": requests,
+        "wall_seconds": round(wall, 2),
+        "complete": finished,
+        "unanswered": len(sent),
+        "tools": tools_report,
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [
+        f"Workers: {report['workers']}  requests: {report['requests']}  "
+        f"wall: {report['wall_seconds']}s  unanswered: {report['unanswered']}",
+        f"{'tool':26} {'n':>5} {'p50 ms':>9} {'p99 ms':>9} {'ok':>5} {'err':>5} {'cxl':>5}",
+        "-" * 70,
+    ]
+    for tool, stats in report["tools"].items():
+        lines.append(
+            f"{tool:26} {stats['count']:>5} {stats['p50_ms']:>9.1f} {stats['p99_ms']:>9.1f} "
+            f"{stats['ok']:>5} {stats['error']:>5} {stats['cancelled']:>5}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the coin RAG MCP server")
+    parser.add_argument("--requests", type=int, default=200, help="tools/call requests to send (default: 200)")
+    parser.add_argument("--rate", type=float, default=0.0, help="Requests per second (default: as fast as possible)")
+    parser.add_argument("--workers", type=int, help="Server worker threads (COIN_MCP_WORKERS)")
+    parser.add_argument("--cancel-every", type=int, default=0, help="Cancel every Nth slow call")
+    parser.add_argument("--no-warm", action="store_true", help="Disable background pipeline warm-up")
+    parser.add_argument("--compare-serial", action="store_true", help="Also run with a single worker")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    reports = [run_load(args.requests, args.rate, args.workers, args.cancel_every, not args.no_warm)]
+    if args.compare_serial:
+        reports.append(run_load(args.requests, args.rate, 1, args.cancel_every, not args.no_warm))
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        print("\n\n".join(format_report(r) for r in reports))
+
+
+if __name__ == "__main__":
+    main()
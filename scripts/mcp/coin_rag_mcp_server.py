@@ -7,6 +7,19 @@ semantic search specifically for coin-related content (bullion, numismatics,
 key dates, pricing, grading, etc.)
 
 This is a focused subset of the dreamweaving-rag for coin-specific queries.
+
+Requests are dispatched concurrently on bounded thread pools and responses
+are written as they complete (matched to requests by id). Tools that hit the
+embeddings index or the network run on their own pool, so a slow coin_search
+or spot price scrape does not block cheap calculator calls.
+Pending requests can be cancelled with ``$/cancelRequest`` (or MCP's
+``notifications/cancelled``). The embeddings pipeline is warmed in the
+background at startup.
+
+Environment:
+    COIN_MCP_WORKERS   Worker threads for slow tools/call (default: 8; cheap
+                       tools get half as many, minimum 2)
+    COIN_MCP_WARM      Set to 0 to skip warming the pipeline at startup
 """
 
 from __future__ import annotations
@@ -14,7 +27,9 @@ from __future__ import annotations
 import json
 import os
 import sys
+import threading
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -24,6 +39,12 @@ import yaml
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
+MAX_WORKERS = max(1, int(os.environ.get("COIN_MCP_WORKERS", "8")))
+MAX_PENDING = MAX_WORKERS * 4  # Stop reading stdin once a pool has this many calls queued
+WARM_PIPELINE = os.environ.get("COIN_MCP_WARM", "1") != "0"
+
+REQUEST_CANCELLED = -32800
+
 
 # =============================================================================
 # PRICING CONFIG LOADER
@@ -97,9 +118,14 @@ def _read_message(stream) -> Optional[Dict[str, Any]]:
     return json.loads(line.decode("utf-8"))
 
 
+_stdout_lock = threading.Lock()
+
+
 def _write_message(payload: Dict[str, Any]) -> None:
-    sys.stdout.write(json.dumps(payload, ensure_ascii=False) + "\n")
-    sys.stdout.flush()
+    line = json.dumps(payload, ensure_ascii=False) + "\n"
+    with _stdout_lock:
+        sys.stdout.write(line)
+        sys.stdout.flush()
 
 
 @dataclass
@@ -117,6 +143,7 @@ def _rpc_error(err: JsonRpcError) -> Dict[str, Any]:
 
 
 _pipeline = None
+_pipeline_lock = threading.Lock()
 
 # Coin-related keywords for filtering results
 COIN_KEYWORDS = [
@@ -215,46 +242,75 @@ BUNDLES = {
 def _get_pipeline():
     global _pipeline
     if _pipeline is None:
-        from scripts.ai.notion_embeddings_pipeline import NotionEmbeddingsPipeline
-        _pipeline = NotionEmbeddingsPipeline(quiet=True)
+        # Concurrent callers (and the startup warm-up) share a single load
+        with _pipeline_lock:
+            if _pipeline is None:
+                from scripts.ai.notion_embeddings_pipeline import NotionEmbeddingsPipeline
+                _pipeline = NotionEmbeddingsPipeline(quiet=True)
     return _pipeline
 
 
+def _warm_pipeline() -> None:
+    try:
+        _get_pipeline()
+        _log("Coin RAG pipeline warmed")
+    except Exception as e:
+        _log(f"Pipeline warm-up failed (will retry on first search): {e}")
+
+
 def _is_coin_related(text: str) -> bool:
     """Check if text is related to coins/precious metals."""
     text_lower = text.lower()
     return any(kw in text_lower for kw in COIN_KEYWORDS)
 
 
-def _tool_coin_search(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Search for coin-related information in the knowledge base."""
-    query = (args.get("query") or "").strip()
-    if not query:
-        raise JsonRpcError(-32602, "Missing required argument: query")
+COIN_DOMAIN = "coins"
 
-    limit = int(args.get("limit", 10))
-    score_threshold = float(args.get("score_threshold", 0.4))
-    
-    # Search with higher limit to filter for coin content
+
+def _legacy_coin_search(query: str, limit: int, score_threshold: float) -> list:
+    """Over-fetch dense results and keep coin-related hits (pre-domain indexes)."""
     raw_results = _get_pipeline().search(
         query=query,
         limit=limit * 3,  # Get extra to filter
         score_threshold=score_threshold,
     )
-    
-    # Filter for coin-related content
+
     coin_results = []
     for r in raw_results:
         title = r.get("title", "").lower()
         text = r.get("text", "").lower()
-        
+
         # Check if coin-related
         if _is_coin_related(title) or _is_coin_related(text):
             coin_results.append(r)
             if len(coin_results) >= limit:
                 break
-    
-    return {"results": coin_results, "total_found": len(coin_results)}
+    return coin_results
+
+
+def _tool_coin_search(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Search for coin-related information in the knowledge base."""
+    query = (args.get("query") or "").strip()
+    if not query:
+        raise JsonRpcError(-32602, "Missing required argument: query")
+
+    limit = int(args.get("limit", 10))
+    score_threshold = float(args.get("score_threshold", 0.4))
+
+    pipeline = _get_pipeline()
+    if pipeline.lexical.count(COIN_DOMAIN) == 0:
+        # Index predates domain payloads (run --rebuild-lexical); filter after retrieval
+        coin_results = _legacy_coin_search(query, limit, score_threshold)
+        return {"results": coin_results, "total_found": len(coin_results), "retrieval": "dense"}
+
+    # BM25 + vector fused, both filtered to the coin domain inside the index
+    coin_results = pipeline.hybrid_search(
+        query=query,
+        limit=limit,
+        score_threshold=score_threshold,
+        domain=COIN_DOMAIN,
+    )
+    return {"results": coin_results, "total_found": len(coin_results), "retrieval": "hybrid"}
 
 
 def _tool_key_date_check(args: Dict[str, Any]) -> Dict[str, Any]:
@@ -1061,33 +1117,138 @@ def _handle_request(req: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     raise JsonRpcError(-32601, f"Method not found: {method}")
 
 
+# Tools that query the embeddings index or the network
+SLOW_TOOLS = {
+    "coin_search",
+    "coin_key_date_check",
+    "coin_pricing_guide",
+    "coin_rag_stats",
+    "coin_get_spot_price",
+}
+
+
+def _is_slow_call(params: Dict[str, Any]) -> bool:
+    name = params.get("name")
+    if name == "coin_junk_silver_calc":
+        # Fetches the spot price unless one is supplied
+        return (params.get("arguments") or {}).get("spot_price") is None
+    return name in SLOW_TOOLS
+
+
+def _error_response(rpc_id: Any, err: JsonRpcError) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": rpc_id, "error": _rpc_error(err)}
+
+
+class RequestDispatcher:
+    """
+    Runs tools/call requests on bounded worker pools (one for SLOW_TOOLS,
+    one for everything else).
+
+    Responses are written out of order as each call finishes. Cheap methods
+    (initialize, tools/list, cancellation) are answered inline by the reader.
+    A cancelled call that has not started is dropped; one that is already
+    running finishes in the background but its result is discarded. Either
+    way the client gets a RequestCancelled error for it.
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS, max_pending: int = MAX_PENDING):
+        self._slow = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="coin-mcp-slow")
+        self._fast = ThreadPoolExecutor(max_workers=max(2, max_workers // 2), thread_name_prefix="coin-mcp")
+        self._slots = {
+            self._slow: threading.BoundedSemaphore(max_pending),
+            self._fast: threading.BoundedSemaphore(max_pending),
+        }
+        self._lock = threading.Lock()
+        self._inflight: Dict[Any, Future] = {}
+        self._cancelled: set = set()
+
+    def submit(self, req: Dict[str, Any]) -> None:
+        method = req.get("method")
+        rpc_id = req.get("id")
+
+        if method in ("$/cancelRequest", "notifications/cancelled"):
+            params = req.get("params") or {}
+            self.cancel(params.get("id", params.get("requestId")))
+            return
+
+        if method != "tools/call" or rpc_id is None:
+            self._respond(req, lambda: _handle_request(req))
+            return
+
+        pool = self._slow if _is_slow_call(req.get("params") or {}) else self._fast
+        slots = self._slots[pool]
+        slots.acquire()  # Backpressure: block the reader while the pool is saturated
+        with self._lock:
+            future = pool.submit(self._run, req)
+            self._inflight[rpc_id] = future
+        future.add_done_callback(lambda _f: slots.release())
+
+    def cancel(self, rpc_id: Any) -> None:
+        with self._lock:
+            future = self._inflight.pop(rpc_id, None)
+            if future is None:
+                return  # Unknown or already answered
+            if not future.cancel():
+                self._cancelled.add(rpc_id)  # Running: discard its result
+        _write_message(_error_response(rpc_id, JsonRpcError(REQUEST_CANCELLED, "Request cancelled")))
+
+    def shutdown(self) -> None:
+        """Finish outstanding calls (stdin closed)."""
+        self._slow.shutdown(wait=True)
+        self._fast.shutdown(wait=True)
+
+    def _run(self, req: Dict[str, Any]) -> None:
+        rpc_id = req.get("id")
+        self._respond(req, lambda: _handle_request(req), finished=rpc_id)
+
+    def _respond(self, req: Dict[str, Any], handler, finished: Any = None) -> None:
+        rpc_id = req.get("id")
+        try:
+            resp = handler()
+        except JsonRpcError as e:
+            resp = None if rpc_id is None else _error_response(rpc_id, e)
+        except Exception as e:
+            _log(f"Unhandled error in {req.get('method')}: {e}\n{traceback.format_exc()}")
+            resp = None if rpc_id is None else _error_response(rpc_id, JsonRpcError(-32603, f"Internal error: {e}"))
+
+        if finished is not None:
+            with self._lock:
+                if finished in self._cancelled:
+                    self._cancelled.discard(finished)
+                    return
+                self._inflight.pop(finished, None)
+
+        if resp is not None:
+            _write_message(resp)
+
+
 def main() -> int:
     os.chdir(PROJECT_ROOT)
     sys.path.insert(0, str(PROJECT_ROOT))
 
+    if WARM_PIPELINE:
+        threading.Thread(target=_warm_pipeline, name="coin-mcp-warm", daemon=True).start()
+
     stdin = sys.stdin.buffer
+    dispatcher = RequestDispatcher()
 
-    while True:
-        try:
-            req = _read_message(stdin)
+    try:
+        while True:
+            try:
+                req = _read_message(stdin)
+            except json.JSONDecodeError as e:
+                _write_message({"jsonrpc": "2.0", "id": None,
+                                "error": _rpc_error(JsonRpcError(-32700, f"Parse error: {e}"))})
+                continue
             if req is None:
+                dispatcher.shutdown()
                 return 0
-
-            try:
-                resp = _handle_request(req)
-            except JsonRpcError as e:
-                if req.get("id") is None:
-                    resp = None
-                else:
-                    resp = {"jsonrpc": "2.0", "id": req.get("id"), "error": _rpc_error(e)}
-
-            if resp is not None:
-                _write_message(resp)
-        except KeyboardInterrupt:
-            return 0
-        except Exception as e:
-            _log(f"Fatal MCP server error: {e}\n{traceback.format_exc()}")
-            return 1
+            dispatcher.submit(req)
+    except KeyboardInterrupt:
+        return 0
+    except Exception as e:
+        _log(f"Fatal MCP server error: {e}\n{traceback.format_exc()}")
+        return 1
 
 
 if __name__ == "__main__":
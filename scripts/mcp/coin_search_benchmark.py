@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Coin search retrieval benchmark.
+
+Compares the legacy coin search (dense search over-fetching 3x, then the
+``_is_coin_related`` substring filter) with hybrid BM25 + vector search
+filtered to the ``coins`` domain inside the index.
+
+Relevance is defined per query by terms that a relevant chunk must
+contain (e.g. "1921-D Morgan" -> "1921-d" and "morgan"); ground truth is
+every indexed chunk containing all of them, found by scrolling the
+collection. Reports latency (median/p95) and recall@k per path.
+
+Usage:
+    python3 scripts/mcp/coin_search_benchmark.py
+    python3 scripts/mcp/coin_search_benchmark.py --k 10 --repeat 5 --json
+"""
+
+import argparse
+import json
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Set
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.mcp import coin_rag_mcp_server as server
+
+# Fixed query set: (query, terms every relevant chunk must contain)
+BENCHMARK_QUERIES = [
+    ("1921-D Morgan", ["1921-d", "morgan"]),
+    ("1893-S Morgan dollar key date", ["1893-s"]),
+    ("1928 Peace dollar value", ["1928", "peace"]),
+    ("Carson City CC mint Morgan", ["carson city"]),
+    ("junk silver melt value per dollar face value", ["junk silver"]),
+    ("Mexican Libertad silver bullion", ["libertad"]),
+    ("PCGS vs NGC grading", ["pcgs", "ngc"]),
+    ("VAM variety doubled die", ["vam"]),
+    ("Walking Liberty half dollar", ["walking liberty"]),
+    ("coin storage capsules and flips", ["capsule"]),
+    ("stamp collecting starter kit tongs", ["tongs"]),
+    ("40% silver Kennedy half", ["kennedy", "40%"]),
+]
+
+
+def _term_pattern(term: str) -> re.Pattern:
+    return re.compile(r"(?<![a-z0-9])" + re.escape(term.lower()) + r"(?![a-z0-9])")
+
+
+def ground_truth(pipeline, queries) -> Dict[str, Set[str]]:
+    """Point ids of every chunk containing all of a query's terms."""
+    patterns = {q: [_term_pattern(t) for t in terms] for q, terms in queries}
+    relevant: Dict[str, Set[str]] = {q: set() for q, _ in queries}
+    offset = None
+    while True:
+        points, offset = pipeline.qdrant.scroll(
+            collection_name=pipeline.collection_name,
+            limit=256,
+            offset=offset,
+            with_payload=True,
+            with_vectors=False
+        )
+        for point in points:
+            text = f"{point.payload.get('title', '')}\n{point.payload.get('chunk_text', '')}".lower()
+            for query, pats in patterns.items():
+                if all(p.search(text) for p in pats):
+                    relevant[query].add(str(point.id))
+        if not points or offset is None:
+            break
+    return relevant
+
+
+def recall_at_k(result_ids: List[str], relevant: Set[str], k: int) -> float:
+    if not relevant:
+        return 1.0
+    hits = len(set(result_ids[:k]) & relevant)
+    return hits / min(k, len(relevant))
+
+
+def run_benchmark(k: int = 10, repeat: int = 3, score_threshold: float = 0.4) -> Dict:
+    pipeline = server._get_pipeline()
+    if pipeline.lexical.count(server.COIN_DOMAIN) == 0:
+        raise SystemExit(
+            "No coin-domain chunks in the BM25 index. Run:\n"
+            "  python3 -m scripts.ai.notion_embeddings_pipeline --rebuild-lexical"
+        )
+
+    relevant = ground_truth(pipeline, BENCHMARK_QUERIES)
+    paths = {
+        "legacy": lambda q: server._legacy_coin_search(q, k, score_threshold),
+        "hybrid": lambda q: pipeline.hybrid_search(
+            q, limit=k, score_threshold=score_threshold, domain=server.COIN_DOMAIN
+        ),
+    }
+
+    # Warm the embedding model so the first query does not skew latency
+    pipeline.search("silver coin", limit=1)
+
+    report = {"k": k, "repeat": repeat, "queries": [], "paths": {}}
+    latencies = {name: [] for name in paths}
+    recalls = {name: [] for name in paths}
+
+    for query, terms in BENCHMARK_QUERIES:
+        row = {"query": query, "relevant": len(relevant[query])}
+        for name, fn in paths.items():
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                results = fn(query)
+                timings.append((time.perf_counter() - start) * 1000)
+            ids = [r.get("id", "") for r in results]
+            recall = recall_at_k(ids, relevant[query], k)
+            latencies[name].extend(timings)
+            recalls[name].append(recall)
+            row[name] = {"median_ms": round(statistics.median(timings), 1), "recall": round(recall, 3)}
+        report["queries"].append(row)
+
+    for name in paths:
+        ordered = sorted(latencies[name])
+        report["paths"][name] = {
+            "median_ms": round(statistics.median(ordered), 1),
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1),
+            f"mean_recall@{k}": round(statistics.mean(recalls[name]), 3),
+        }
+    return report
+
+
+def format_report(report: Dict) -> str:
+    k = report["k"]
+    lines = [
+        f"Coin search benchmark (k={k}, repeat={report['repeat']})",
+        "",
+        f"{'query':40} {'rel':>4}  {'legacy ms':>9} {'R@k':>5}  {'hybrid ms':>9} {'R@k':>5}",
+        "-" * 80,
+    ]
+    for row in report["queries"]:
+        lines.append(
+            f"{row['query'][:40]:40} {row['relevant']:>4}  "
+            f"{row['legacy']['median_ms']:>9.1f} {row['legacy']['recall']:>5.2f}  "
+            f"{row['hybrid']['median_ms']:>9.1f} {row['hybrid']['recall']:>5.2f}"
+        )
+    lines.append("-" * 80)
+    for name, stats in report["paths"].items():
+        lines.append(
+            f"{name:8} median {stats['median_ms']:.1f} ms  p95 {stats['p95_ms']:.1f} ms  "
+            f"mean recall@{k} {stats[f'mean_recall@{k}']:.3f}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark legacy vs hybrid coin search")
+    parser.add_argument("--k", type=int, default=10, help="Results per query (default: 10)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per query (default: 3)")
+    parser.add_argument("--score-threshold", type=float, default=0.4, help="Dense score threshold")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    report = run_benchmark(k=args.k, repeat=args.repeat, score_threshold=args.score_threshold)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,7 @@ Usage:
 
 import os
 import re
+import sys
 import random
 from datetime import datetime
 from pathlib import Path
@@ -30,6 +31,10 @@ import yaml
 # Project root detection
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.utilities.knowledge_snapshot import load_knowledge
 
 
 class AnchorEntry:
@@ -147,8 +152,7 @@ class AnchorSelector:
         if not self.registry_path.exists():
             raise FileNotFoundError(f"Anchor registry not found: {self.registry_path}")
 
-        with open(self.registry_path, "r") as f:
-            data = yaml.safe_load(f)
+        data = load_knowledge(self.registry_path)
 
         # Parse each category's anchors
         for category in ["breath", "auditory", "visual", "kinesthetic", "symbolic",
@@ -164,8 +168,8 @@ class AnchorSelector:
     def _load_history(self):
         """Load usage history from file."""
         if self.history_path.exists():
-            with open(self.history_path, "r") as f:
-                self.history = yaml.safe_load(f) or {}
+            # Updated in place and written back by _save_history()
+            self.history = load_knowledge(self.history_path, mutable=True) or {}
         else:
             self.history = {
                 "sessions": [],
@@ -21,6 +21,7 @@ Usage:
     )
 """
 
+import sys
 import yaml
 import logging
 from pathlib import Path
@@ -28,6 +29,12 @@ from datetime import datetime, timedelta
 from typing import Optional
 from dataclasses import dataclass, field
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.utilities.knowledge_snapshot import load_knowledge
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -123,8 +130,7 @@ class ArchetypeSelector:
             logger.warning(f"Archetype codex not found at {codex_path}")
             return {}
 
-        with open(codex_path, 'r') as f:
-            data = yaml.safe_load(f)
+        data = load_knowledge(codex_path)
 
         # Flatten the nested family structure into a flat archetype dict
         archetypes = {}
@@ -154,8 +160,8 @@ class ArchetypeSelector:
                 'family_rotation': {'last_session_families': [], 'family_usage_counts': {}}
             }
 
-        with open(history_path, 'r') as f:
-            return yaml.safe_load(f) or {}
+        # Updated in place and written back by save_history()
+        return load_knowledge(history_path, mutable=True) or {}
 
     def _load_family_index(self) -> dict:
         """Load family index for outcome mapping."""
@@ -163,8 +169,7 @@ class ArchetypeSelector:
         if not index_path.exists():
             return {}
 
-        with open(index_path, 'r') as f:
-            return yaml.safe_load(f) or {}
+        return load_knowledge(index_path) or {}
 
     def select_archetypes(
         self,
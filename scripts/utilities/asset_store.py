@@ -0,0 +1,547 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Asset Store
+
+Shared assets (ambience beds, SFX, signature tones, background images) are
+stored once under their BLAKE2b digest and placed into session directories
+as links instead of copies. Each placement is tried in this order:
+
+1. reflink  - copy-on-write clone (Btrfs, XFS, ...), fully independent file
+2. hardlink - same inode as the stored object
+3. symlink  - link to the stored object
+4. copy     - plain copy when nothing else works (e.g. across filesystems)
+
+Stored objects are read-only. A hardlinked or symlinked placement shares
+the object's data, so tools that rewrite a placed file must replace it
+(write elsewhere and rename) or call ``detach()`` first. Pipeline outputs
+(``output/`` in a session) are rewritten in place by their tools, so they
+are only ever placed as reflinks or copies and are left alone by dedupe.
+
+Every placement is a row in the StateDatabase ``asset_refs`` table and
+bumps the object's refcount in ``asset_objects``. ``gc()`` drops refs whose
+files were deleted or replaced, then deletes objects that have had no refs
+for longer than a grace period.
+
+Usage:
+    from scripts.utilities.asset_store import AssetStore
+
+    store = AssetStore()
+    store.place(library_wav, session_dir / 'assets' / 'ambience.wav', session_name='my-session')
+
+CLI:
+    python -m scripts.utilities.asset_store dedupe [--dry-run]   # convert existing sessions
+    python -m scripts.utilities.asset_store gc [--dry-run]
+    python -m scripts.utilities.asset_store stats
+
+Environment:
+    ASSET_STORE_DIR     Object directory (default: data/asset_store)
+"""
+
+import errno
+import fnmatch
+import hashlib
+import os
+import shutil
+import stat
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:  # Windows
+    fcntl = None
+    HAS_FCNTL = False
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+DEFAULT_STORE_DIR = Path(os.environ.get('ASSET_STORE_DIR', PROJECT_ROOT / 'data' / 'asset_store'))
+SESSIONS_DIR = PROJECT_ROOT / 'sessions'
+
+LINK_METHODS = ('reflink', 'hardlink', 'symlink', 'copy')
+HASH_CHUNK = 1 << 20
+GC_GRACE_SECONDS = 3600  # Unreferenced objects survive this long (covers in-flight placements)
+
+# Session files considered by dedupe: shared media, not working files like SSML or manifests
+DEDUPE_EXTENSIONS = {
+    '.wav', '.mp3', '.flac', '.ogg', '.m4a', '.aac',
+    '.png', '.jpg', '.jpeg', '.webp',
+}
+DEDUPE_MIN_BYTES = 64 * 1024
+
+# Session-relative globs of files that tools rewrite in place (e.g. a thumbnail
+# re-render copying over output/youtube_thumbnail.png). These never share an
+# inode with the store: placements use COPY_METHODS and dedupe skips them.
+REWRITTEN_GLOBS = ('output/*',)
+COPY_METHODS = ('reflink', 'copy')
+
+_FICLONE = 0x40049409  # Linux ioctl: clone src_fd's extents into dst_fd
+
+
+def file_digest(path: Path) -> str:
+    """BLAKE2b-256 of a file's contents (hex)."""
+    h = hashlib.blake2b(digest_size=32)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def reflink(src: Path, dst: Path) -> bool:
+    """Clone src to a new file dst with copy-on-write; False where unsupported."""
+    if not HAS_FCNTL or not sys.platform.startswith('linux'):
+        return False
+    try:
+        with open(src, 'rb') as fin, open(dst, 'wb') as fout:
+            fcntl.ioctl(fout.fileno(), _FICLONE, fin.fileno())
+        return True
+    except OSError:
+        try:
+            os.unlink(dst)
+        except OSError:
+            pass
+        return False
+
+
+@dataclass
+class Placement:
+    """A file placed from the store."""
+    path: Path
+    digest: str
+    method: str
+    size: int
+    reused: bool = False  # Already held this object; nothing was written
+
+
+class AssetStore:
+    """Content-addressed object store with linked placements and refcounted GC."""
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        db=None,
+        methods: Sequence[str] = LINK_METHODS,
+    ):
+        """
+        Args:
+            root: Store directory (default: ASSET_STORE_DIR or data/asset_store)
+            db: StateDatabase, or None to open the default one on first use
+            methods: Placement methods to try, in order
+        """
+        self.root = Path(root) if root else DEFAULT_STORE_DIR
+        self.objects_dir = self.root / 'objects'
+        self.tmp_dir = self.root / 'tmp'
+        self.methods = tuple(methods)
+        self._db = db
+
+    @property
+    def db(self):
+        if self._db is None:
+            from scripts.automation.state_db import StateDatabase
+            self._db = StateDatabase()
+        return self._db
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ==================== Objects ====================
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def put(self, src: Path, digest: Optional[str] = None, move: bool = False) -> Tuple[str, int]:
+        """
+        Store a file's contents (no-op if an identical object exists).
+
+        Args:
+            src: File to store
+            digest: Its digest, if already known
+            move: Take the file itself into the store instead of copying it
+
+        Returns:
+            (digest, size)
+        """
+        src = Path(src)
+        digest = digest or file_digest(src)
+        size = src.stat().st_size
+        obj = self.object_path(digest)
+
+        if not obj.exists():
+            obj.parent.mkdir(parents=True, exist_ok=True)
+            self.tmp_dir.mkdir(parents=True, exist_ok=True)
+            staged = self.tmp_dir / f"{digest}.{os.getpid()}"
+            if move:
+                os.replace(src, staged)
+            elif not reflink(src, staged):
+                shutil.copyfile(src, staged)
+            os.chmod(staged, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(staged, obj)
+        elif move:
+            os.unlink(src)
+
+        self.db.register_asset_object(digest, size)
+        return digest, size
+
+    # ==================== Placements ====================
+
+    def place(
+        self,
+        src: Path,
+        dest: Path,
+        session_name: Optional[str] = None,
+        move: bool = False,
+    ) -> Placement:
+        """
+        Put ``src`` into the store and place it at ``dest``.
+
+        ``dest`` is replaced atomically, so a previous file there (even one
+        linked to another object) is never written through.
+
+        Args:
+            src: Source file (library asset, generated image, ...)
+            dest: Where the session expects the file
+            session_name: Owning session (default: taken from a path under sessions/)
+            move: Consume ``src`` (for temporary files)
+
+        Returns:
+            Placement describing how the file was placed
+        """
+        dest = Path(dest).absolute()
+        digest, size = self.put(src, move=move)
+        return self._place_object(digest, size, dest, session_name)
+
+    def _place_object(self, digest: str, size: int, dest: Path, session_name: Optional[str]) -> Placement:
+        obj = self.object_path(digest)
+        session_name = session_name or _session_of(dest)
+
+        current = self._holds(dest, digest)
+        if current:
+            self._record(dest, digest, current, session_name)
+            return Placement(dest, digest, current, size, reused=True)
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        staged = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+        methods = self.methods
+        if _is_rewritten(dest):
+            methods = tuple(m for m in methods if m in COPY_METHODS) or COPY_METHODS
+        method = self._materialize(obj, staged, methods)
+        os.replace(staged, dest)
+
+        self._record(dest, digest, method, session_name)
+        return Placement(dest, digest, method, size)
+
+    def _materialize(self, obj: Path, staged: Path, methods: Sequence[str]) -> str:
+        """Create ``staged`` from the object with the first of ``methods`` that works."""
+        for method in methods:
+            try:
+                if method == 'reflink':
+                    if not reflink(obj, staged):
+                        continue
+                    os.chmod(staged, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)
+                elif method == 'hardlink':
+                    os.link(obj, staged)
+                elif method == 'symlink':
+                    os.symlink(obj, staged)
+                elif method == 'copy':
+                    shutil.copyfile(obj, staged)
+                    os.chmod(staged, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)
+                else:
+                    raise ValueError(f"Unknown placement method: {method}")
+                return method
+            except OSError as e:
+                if e.errno == errno.EEXIST:
+                    os.unlink(staged)
+                    return self._materialize(obj, staged, methods)
+                continue
+        raise OSError(f"Could not place {obj} with any of: {', '.join(methods)}")
+
+    def _holds(self, path: Path, digest: str) -> Optional[str]:
+        """How ``path`` already holds the object, if it does without reading it."""
+        obj = self.object_path(digest)
+        try:
+            if path.is_symlink():
+                return 'symlink' if Path(os.readlink(path)) == obj else None
+            if os.path.samefile(path, obj):
+                return 'hardlink'
+        except OSError:
+            return None
+
+        # A reflink or copy is an independent file; trust its ref while it is untouched
+        ref = self.db.get_asset_ref(str(path))
+        if ref and ref['digest'] == digest and self._unchanged(path, ref):
+            return ref['method']
+        return None
+
+    def _record(self, path: Path, digest: str, method: str, session_name: Optional[str]):
+        st = os.lstat(path)
+        self.db.add_asset_ref(
+            str(path), digest, method,
+            session_name=session_name,
+            inode=st.st_ino,
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+        )
+
+    @staticmethod
+    def _unchanged(path: Path, ref: Dict) -> bool:
+        """Whether a placed file still looks like it did when placed."""
+        try:
+            st = os.lstat(path)
+        except OSError:
+            return False
+        if ref['method'] in ('hardlink', 'symlink'):
+            return st.st_ino == ref['inode']
+        return st.st_size == ref['size'] and st.st_mtime_ns == ref['mtime_ns']
+
+    def release(self, path: Path) -> Optional[str]:
+        """Stop tracking a placed file (e.g. before deleting it yourself)."""
+        return self.db.remove_asset_ref(str(Path(path).absolute()))
+
+    def detach(self, path: Path) -> Path:
+        """Replace a linked placement with a private writable copy and release it."""
+        path = Path(path).absolute()
+        staged = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        shutil.copyfile(path, staged)
+        os.chmod(staged, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)
+        os.replace(staged, path)
+        self.release(path)
+        return path
+
+    # ==================== Garbage Collection ====================
+
+    def gc(self, grace_seconds: float = GC_GRACE_SECONDS, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Drop stale refs, then delete objects unreferenced for ``grace_seconds``.
+
+        A ref is stale when its file is gone or was replaced or edited since
+        placement.
+
+        Returns:
+            Counts of stale refs, deleted objects and bytes freed
+        """
+        stale = [ref for ref in self.db.get_asset_refs() if not self._unchanged(Path(ref['path']), ref)]
+        if not dry_run:
+            for ref in stale:
+                self.db.remove_asset_ref(ref['path'])
+
+        cutoff = time.time() - grace_seconds
+        deleted, freed = 0, 0
+        for obj in self.db.get_unreferenced_assets(cutoff):
+            if dry_run:
+                deleted += 1
+                freed += obj['size']
+            elif self.db.delete_asset_object(obj['digest'], cutoff):
+                obj_path = self.object_path(obj['digest'])
+                try:
+                    os.unlink(obj_path)
+                    obj_path.parent.rmdir()
+                except OSError:
+                    pass
+                deleted += 1
+                freed += obj['size']
+
+        return {'stale_refs': len(stale), 'deleted_objects': deleted, 'freed_bytes': freed}
+
+    # ==================== Dedupe ====================
+
+    def dedupe(
+        self,
+        sessions_dir: Path = SESSIONS_DIR,
+        dry_run: bool = False,
+        min_bytes: int = DEDUPE_MIN_BYTES,
+        extensions: Iterable[str] = DEDUPE_EXTENSIONS,
+    ) -> Dict[str, int]:
+        """
+        Convert duplicate media files in existing sessions to store placements.
+
+        Only contents found more than once (or already in the store) are
+        converted; files unique to one session are left as they are. The
+        first copy of each content is moved into the store, so no extra
+        space is needed while converting. Pipeline outputs matching
+        ``REWRITTEN_GLOBS`` are never converted.
+
+        Returns:
+            Counts of files scanned, hashed, converted and detached, and bytes reclaimed
+        """
+        extensions = {e.lower() for e in extensions}
+        by_size: Dict[int, List[Path]] = defaultdict(list)
+        scanned, detached = 0, 0
+        for path in sorted(Path(sessions_dir).rglob('*')):
+            if path.suffix.lower() not in extensions or not path.is_file():
+                continue
+            if _is_rewritten(path, sessions_dir):
+                # Undo links an earlier dedupe made before outputs were excluded
+                ref = self.db.get_asset_ref(str(path.absolute()))
+                if ref and ref['method'] in ('hardlink', 'symlink'):
+                    detached += 1
+                    if not dry_run:
+                        self.detach(path)
+                continue
+            if path.is_symlink():
+                continue
+            size = path.stat().st_size
+            if size >= min_bytes:
+                by_size[size].append(path)
+                scanned += 1
+
+        # Only hash files that could have a twin: same size as another file
+        # or as an object already in the store
+        stored_sizes = self._stored_sizes()
+        by_digest: Dict[str, List[Path]] = defaultdict(list)
+        hashed = 0
+        for size, paths in by_size.items():
+            if len(paths) < 2 and size not in stored_sizes:
+                continue
+            for path in paths:
+                by_digest[file_digest(path)].append(path)
+                hashed += 1
+
+        converted, reclaimed = 0, 0
+        for digest, paths in by_digest.items():
+            in_store = self.object_path(digest).exists()
+            if len(paths) < 2 and not in_store:
+                continue
+
+            seen_inodes = set()
+            for i, path in enumerate(paths):
+                st = path.stat()
+                inode = (st.st_dev, st.st_ino)
+                # Already sharing storage with a file converted before it
+                shared = inode in seen_inodes or bool(self._holds(path, digest))
+                seen_inodes.add(inode)
+                if shared:
+                    continue
+
+                if dry_run:
+                    # The first copy of a new object becomes the object itself
+                    if in_store or i > 0:
+                        reclaimed += st.st_size
+                    converted += 1
+                    continue
+
+                if not in_store:
+                    # The first copy becomes the object: hardlinked in when possible, else moved
+                    self._adopt(path, digest)
+                    in_store = True
+                else:
+                    placement = self._place_object(digest, st.st_size, path.absolute(), None)
+                    if placement.method != 'copy':
+                        reclaimed += st.st_size
+                seen_inodes.add((st.st_dev, path.stat().st_ino))
+                converted += 1
+
+        return {
+            'scanned': scanned,
+            'hashed': hashed,
+            'converted': converted,
+            'detached': detached,
+            'reclaimed_bytes': reclaimed,
+        }
+
+    def _adopt(self, path: Path, digest: str):
+        """Make an existing session file the stored object without copying its data."""
+        obj = self.object_path(digest)
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(path, obj)
+            os.chmod(obj, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            size = obj.stat().st_size
+            self.db.register_asset_object(digest, size)
+            self._record(path.absolute(), digest, 'hardlink', _session_of(path))
+        except OSError:
+            # Store on another filesystem: take a copy, then place as usual
+            self.put(path, digest=digest)
+            self._place_object(digest, path.stat().st_size, path.absolute(), None)
+
+    def _stored_sizes(self) -> set:
+        return {obj['size'] for obj in self.db.get_asset_objects()}
+
+    def stats(self) -> Dict:
+        return self.db.get_asset_store_stats()
+
+
+def _is_rewritten(path: Path, sessions_dir: Optional[Path] = None) -> bool:
+    """Whether a session file is a pipeline output that tools rewrite in place."""
+    sessions_dir = Path(sessions_dir or SESSIONS_DIR).absolute()
+    try:
+        parts = Path(path).absolute().relative_to(sessions_dir).parts
+    except ValueError:
+        return False
+    rel = '/'.join(parts[1:])
+    return any(fnmatch.fnmatchcase(rel, pattern) for pattern in REWRITTEN_GLOBS)
+
+
+def _session_of(path: Path) -> Optional[str]:
+    """Session directory name for a path under sessions/, if it is one."""
+    try:
+        return Path(path).resolve().relative_to(SESSIONS_DIR.resolve()).parts[0]
+    except (ValueError, IndexError):
+        return None
+
+
+def _format_bytes(n: float) -> str:
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(n) < 1024 or unit == 'GB':
+            return f"{n:.1f} {unit}" if unit != 'B' else f"{int(n)} B"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+def main():
+    """CLI interface for the asset store"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Content-addressed asset store')
+    parser.add_argument('command', choices=['dedupe', 'gc', 'stats'], help='Command to execute')
+    parser.add_argument('--sessions-dir', type=Path, default=SESSIONS_DIR,
+                        help='Sessions directory to dedupe (default: sessions/)')
+    parser.add_argument('--dry-run', action='store_true', help='Report without changing anything')
+    parser.add_argument('--grace', type=float, default=GC_GRACE_SECONDS,
+                        help='Seconds an unreferenced object is kept (gc)')
+
+    args = parser.parse_args()
+
+    with AssetStore() as store:
+        if args.command == 'dedupe':
+            result = store.dedupe(args.sessions_dir, dry_run=args.dry_run)
+            prefix = "Would reclaim" if args.dry_run else "Reclaimed"
+            print(f"Scanned {result['scanned']} media files, hashed {result['hashed']}")
+            print(f"{'Would convert' if args.dry_run else 'Converted'} {result['converted']} files")
+            if result['detached']:
+                print(f"{'Would detach' if args.dry_run else 'Detached'} {result['detached']} linked pipeline outputs")
+            print(f"✓ {prefix} {_format_bytes(result['reclaimed_bytes'])}")
+
+        elif args.command == 'gc':
+            result = store.gc(args.grace, dry_run=args.dry_run)
+            print(f"Stale refs: {result['stale_refs']}")
+            print(f"{'Would delete' if args.dry_run else 'Deleted'} {result['deleted_objects']} objects "
+                  f"({_format_bytes(result['freed_bytes'])})")
+
+        elif args.command == 'stats':
+            result = store.stats()
+            saved = result['logical_bytes'] - result['stored_bytes']
+            print(f"Objects:     {result['objects']} ({_format_bytes(result['stored_bytes'])})")
+            print(f"Placements:  {result['refs']} ({_format_bytes(result['logical_bytes'])} as copies)")
+            print(f"Saved:       {_format_bytes(saved)}")
+            for method, count in sorted(result['by_method'].items()):
+                print(f"  {method}: {count}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,8 +5,8 @@ Provides easy access to reusable audio assets
 """
 
 import os
+import sys
 import yaml
-import subprocess
 from pathlib import Path
 from typing import Optional, List, Dict
 
@@ -19,6 +19,7 @@ class AudioLibrary:
         self.assets_dir = self.project_root / 'assets' / 'audio'
         self.catalog_path = self.assets_dir / 'LIBRARY_CATALOG.yaml'
         self.catalog = self._load_catalog()
+        self._store = None
 
     def _find_project_root(self) -> Path:
         """Find project root directory"""
@@ -86,9 +87,23 @@ class AudioLibrary:
             return info.get('duration')
         return None
 
+    @property
+    def store(self):
+        """Content-addressed store that session placements go through"""
+        if self._store is None:
+            if str(self.project_root) not in sys.path:
+                sys.path.insert(0, str(self.project_root))
+            from scripts.utilities.asset_store import AssetStore
+            self._store = AssetStore()
+        return self._store
+
     def copy_to_session(self, asset_name: str, dest_path: str):
         """
-        Copy asset to session directory.
+        Place asset in a session directory.
+
+        The asset is stored once in the asset store and linked into the
+        session (reflink, hardlink or symlink, falling back to a copy), so
+        the placed file is read-only. Replace it rather than editing it.
 
         For security, destination must be within the project's sessions directory.
 
@@ -96,6 +111,9 @@ class AudioLibrary:
             asset_name: Name of the asset to copy
             dest_path: Destination path (must be within sessions/)
 
+        Returns:
+            Placement (path, digest, method, size)
+
         Raises:
             FileNotFoundError: If asset doesn't exist
             ValueError: If destination is outside safe directory
@@ -117,9 +135,8 @@ class AudioLibrary:
                 f"Got: {dest}"
             )
 
-        dest.parent.mkdir(parents=True, exist_ok=True)
-
-        subprocess.run(['cp', str(src_path), str(dest)], check=True)
+        session_name = dest.relative_to(safe_dir).parts[0]
+        return self.store.place(src_path, dest, session_name=session_name)
 
     def verify_assets(self) -> Dict[str, bool]:
         """Verify all cataloged assets exist"""
@@ -290,5 +307,4 @@ def main():
 
 
 if __name__ == '__main__':
-    import sys
     sys.exit(main())
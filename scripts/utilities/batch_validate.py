@@ -0,0 +1,565 @@
+#!/usr/bin/env python3
+"""
+Batch Validation Runner
+
+Validates sessions and products across a process pool and streams every
+result into a single JSON-lines report followed by a summary line.
+
+The validator modules and their rule tables are imported once per worker
+by the pool initializer, and the pattern scanners compiled from those
+tables are cached for the worker's lifetime instead of rebuilt per item.
+With ``--changed-since`` only sessions/products that have a file modified
+after the cutoff are re-validated, so a nightly sweep skips the unchanged
+library.
+
+Item kinds:
+    session          HypnoticStandardsValidator (validate_hypnotic_standards.py)
+    session_metrics  extract_session_metrics (session_consistency_report.py)
+    response         validate_response (product_builder antigravity)
+    product          all responses + check_quality_gate for one product
+                     (options: min_words, threshold, check_responses)
+
+Usage:
+    python3 scripts/utilities/batch_validate.py --all
+    python3 scripts/utilities/batch_validate.py --sessions --workers 8
+    python3 scripts/utilities/batch_validate.py --all --changed-since 24h --output reports/nightly.jsonl
+    python3 scripts/utilities/batch_validate.py --all --changed-since last --output reports/nightly.jsonl
+
+--changed-since accepts an ISO date/time (2026-01-31, 2026-01-31T02:00),
+a relative age (90m, 24h, 7d) or ``last`` (start time of the previous run
+recorded in the --output report).
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# Directories never considered when looking for modified files
+SKIP_DIRS = {".git", "__pycache__", ".compile_cache", "node_modules"}
+
+_RELATIVE_AGE = re.compile(r'^(\d+(?:\.\d+)?)\s*([mhdw])$')
+_AGE_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+# =============================================================================
+# DATA STRUCTURES
+# =============================================================================
+
+@dataclass
+class BatchItem:
+    """One unit of validation work."""
+    kind: str
+    path: Path
+    options: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of validating one item."""
+    kind: str
+    name: str
+    path: str
+    valid: bool
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    elapsed_ms: float = 0.0
+    report: str = ""        # Human-readable output of the underlying validator
+    payload: Any = None     # Validator's native result object
+
+    def to_record(self) -> Dict[str, Any]:
+        return {
+            "type": "result",
+            "kind": self.kind,
+            "name": self.name,
+            "path": self.path,
+            "valid": self.valid,
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "metrics": self.metrics,
+            "elapsed_ms": round(self.elapsed_ms, 1),
+        }
+
+
+@dataclass
+class BatchSummary:
+    """Totals for one batch run."""
+    started_at: float
+    workers: int
+    results: List[BatchItemResult] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    changed_since: Optional[float] = None
+    elapsed_s: float = 0.0
+
+    @property
+    def valid_count(self) -> int:
+        return sum(1 for r in self.results if r.valid)
+
+    @property
+    def all_valid(self) -> bool:
+        return self.valid_count == len(self.results)
+
+    def to_record(self) -> Dict[str, Any]:
+        by_kind: Dict[str, Dict[str, int]] = {}
+        for r in self.results:
+            counts = by_kind.setdefault(r.kind, {"total": 0, "valid": 0})
+            counts["total"] += 1
+            counts["valid"] += int(r.valid)
+        return {
+            "type": "summary",
+            "started_at": datetime.fromtimestamp(self.started_at).isoformat(),
+            "started_ts": self.started_at,
+            "changed_since": (
+                datetime.fromtimestamp(self.changed_since).isoformat()
+                if self.changed_since else None
+            ),
+            "workers": self.workers,
+            "total": len(self.results),
+            "valid": self.valid_count,
+            "invalid": len(self.results) - self.valid_count,
+            "skipped_unchanged": len(self.skipped),
+            "by_kind": by_kind,
+            "elapsed_s": round(self.elapsed_s, 2),
+        }
+
+
+# =============================================================================
+# ITEM VALIDATORS (run inside workers)
+# =============================================================================
+
+def _validate_session(item: BatchItem) -> BatchItemResult:
+    from scripts.utilities.validate_hypnotic_standards import HypnoticStandardsValidator
+
+    validator = HypnoticStandardsValidator(item.path)
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        result = validator.validate()
+
+    return BatchItemResult(
+        kind=item.kind,
+        name=item.name,
+        path=str(item.path),
+        valid=result.valid,
+        errors=result.manifest_errors + result.script_errors + result.audio_errors + result.file_errors,
+        warnings=list(result.warnings),
+        metrics={
+            "word_count": result.word_count,
+            "anchor_count": result.anchor_count,
+            "sense_coverage": result.sense_coverage,
+            "deepening_count": result.deepening_count,
+            "break_count": result.break_count,
+        },
+        report=log.getvalue() + validator.get_report(),
+        payload=result,
+    )
+
+
+def _session_metrics(item: BatchItem) -> BatchItemResult:
+    from scripts.utilities.session_consistency_report import extract_session_metrics
+
+    metrics = extract_session_metrics(item.path)
+    return BatchItemResult(
+        kind=item.kind,
+        name=item.name,
+        path=str(item.path),
+        valid=metrics.is_compliant,
+        errors=list(metrics.compliance_issues),
+        metrics={
+            "word_count": metrics.word_count,
+            "anchor_count": metrics.anchor_count,
+            "sense_coverage": metrics.sense_coverage,
+            "section_count": metrics.section_count,
+        },
+        payload=metrics,
+    )
+
+
+def _validate_response(item: BatchItem) -> BatchItemResult:
+    from agents.product_builder.core.antigravity import validate_response
+
+    result = validate_response(item.path, min_words=item.options.get("min_words", 1500))
+    return BatchItemResult(
+        kind=item.kind,
+        name=item.name,
+        path=str(item.path),
+        valid=result.is_valid,
+        errors=list(result.issues),
+        warnings=list(result.warnings),
+        metrics={"word_count": result.word_count},
+        payload=result,
+    )
+
+
+def _validate_product(item: BatchItem) -> BatchItemResult:
+    from agents.product_builder.core.antigravity import check_quality_gate, validate_response
+
+    errors: List[str] = []
+    warnings: List[str] = []
+    min_words = item.options.get("min_words", 1500)
+
+    responses_dir = item.path / "output" / "responses"
+    response_files = []
+    if item.options.get("check_responses", True) and responses_dir.exists():
+        response_files = sorted(responses_dir.glob("*.response.md"))
+    invalid_responses = 0
+    total_words = 0
+    for response_file in response_files:
+        result = validate_response(response_file, min_words=min_words)
+        total_words += result.word_count
+        if not result.is_valid:
+            invalid_responses += 1
+            errors.extend(f"[{response_file.name}] {issue}" for issue in result.issues)
+
+    gate = check_quality_gate(item.path, item.options.get("threshold"))
+    errors.extend(gate.blocking_issues)
+    warnings.extend(gate.warnings)
+
+    return BatchItemResult(
+        kind=item.kind,
+        name=item.name,
+        path=str(item.path),
+        valid=gate.passed and invalid_responses == 0,
+        errors=errors,
+        warnings=warnings,
+        metrics={
+            "quality_score": round(gate.score, 1),
+            "threshold": gate.threshold,
+            "responses": len(response_files),
+            "invalid_responses": invalid_responses,
+            "total_words": total_words,
+        },
+        payload=gate,
+    )
+
+
+VALIDATORS: Dict[str, Callable[[BatchItem], BatchItemResult]] = {
+    "session": _validate_session,
+    "session_metrics": _session_metrics,
+    "response": _validate_response,
+    "product": _validate_product,
+}
+
+
+def _init_worker(kinds: Iterable[str]) -> None:
+    """Import validator modules and compile their rule scanners once per worker."""
+    kinds = set(kinds)
+    if kinds & {"session", "session_metrics"}:
+        import scripts.utilities.session_consistency_report  # noqa: F401
+        import scripts.utilities.validate_hypnotic_standards  # noqa: F401
+    if kinds & {"response", "product"}:
+        import agents.product_builder.core.antigravity  # noqa: F401
+
+
+def run_item(item: BatchItem) -> BatchItemResult:
+    """Validate one item; validator crashes become an invalid result."""
+    start = time.perf_counter()
+    try:
+        result = VALIDATORS[item.kind](item)
+    except Exception as e:
+        result = BatchItemResult(
+            kind=item.kind,
+            name=item.name,
+            path=str(item.path),
+            valid=False,
+            errors=[f"Validator failed: {type(e).__name__}: {e}"],
+        )
+    result.elapsed_ms = (time.perf_counter() - start) * 1000
+    return result
+
+
+# =============================================================================
+# CHANGE DETECTION
+# =============================================================================
+
+def read_last_run(report_path: Path) -> Optional[float]:
+    """Start time of the previous run recorded in a JSON-lines report."""
+    if not report_path or not report_path.exists():
+        return None
+    started = None
+    with open(report_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("type") == "summary":
+                started = record.get("started_ts")
+    return started
+
+
+def parse_changed_since(value: Optional[str], report_path: Optional[Path] = None) -> Optional[float]:
+    """Convert a --changed-since value to a POSIX timestamp."""
+    if not value:
+        return None
+    value = value.strip()
+
+    if value == "last":
+        started = read_last_run(report_path) if report_path else None
+        if started is None:
+            print("No previous run found in report; validating everything")
+        return started
+
+    match = _RELATIVE_AGE.match(value)
+    if match:
+        age = timedelta(**{_AGE_UNITS[match.group(2)]: float(match.group(1))})
+        return (datetime.now() - age).timestamp()
+
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise ValueError(
+            f"Invalid --changed-since value '{value}' (use ISO date, 24h/7d, or 'last')"
+        )
+
+
+def modified_since(path: Path, cutoff: float) -> bool:
+    """True if path, or any file/directory below it, was modified after cutoff."""
+    try:
+        if path.stat().st_mtime > cutoff:
+            return True
+    except OSError:
+        return True
+    if not path.is_dir():
+        return False
+
+    stack = [str(path)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in SKIP_DIRS:
+                            continue
+                        if entry.stat(follow_symlinks=False).st_mtime > cutoff:
+                            return True
+                        stack.append(entry.path)
+                    elif entry.stat(follow_symlinks=False).st_mtime > cutoff:
+                        return True
+                except OSError:
+                    continue
+    return False
+
+
+# =============================================================================
+# DISCOVERY
+# =============================================================================
+
+def find_all_sessions(project_root: Path) -> List[Path]:
+    """Find all session directories."""
+    sessions_dir = project_root / "sessions"
+    if not sessions_dir.exists():
+        return []
+    return sorted(
+        d for d in sessions_dir.iterdir()
+        if d.is_dir() and d.name != "_template" and not d.name.startswith(".")
+    )
+
+
+def find_all_products(project_root: Path) -> List[Path]:
+    """Find product directories that have build output to validate."""
+    products_dir = project_root / "products"
+    if not products_dir.exists():
+        return []
+    return sorted(
+        d for d in products_dir.iterdir()
+        if d.is_dir() and not d.name.startswith(".") and (d / "output").exists()
+    )
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+class BatchValidator:
+    """
+    Fans validation items out across a process pool.
+
+    Results are streamed (JSON lines) to ``report_path`` as they complete;
+    ``run`` returns them in input order.
+
+    Args:
+        workers: Worker processes (1 = run in-process, None = CPU count)
+        report_path: JSON-lines report destination (optional)
+        changed_since: Skip items with no file modified after this timestamp
+    """
+
+    def __init__(self, workers: Optional[int] = None, report_path: Optional[Path] = None,
+                 changed_since: Optional[float] = None):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.report_path = Path(report_path) if report_path else None
+        self.changed_since = changed_since
+
+    def select(self, items: List[BatchItem]) -> Tuple[List[BatchItem], List[str]]:
+        """Split items into (to validate, skipped as unchanged)."""
+        if self.changed_since is None:
+            return items, []
+        selected, skipped = [], []
+        for item in items:
+            if modified_since(item.path, self.changed_since):
+                selected.append(item)
+            else:
+                skipped.append(str(item.path))
+        return selected, skipped
+
+    def run(self, items: List[BatchItem],
+            on_result: Optional[Callable[[BatchItemResult], None]] = None) -> BatchSummary:
+        """Validate items, streaming each result to the report and ``on_result``."""
+        summary = BatchSummary(
+            started_at=time.time(),
+            workers=self.workers,
+            changed_since=self.changed_since,
+        )
+        start = time.perf_counter()
+        selected, summary.skipped = self.select(items)
+        ordered: List[Optional[BatchItemResult]] = [None] * len(selected)
+
+        report = None
+        if self.report_path:
+            self.report_path.parent.mkdir(parents=True, exist_ok=True)
+            report = open(self.report_path, 'w', encoding='utf-8')
+
+        def emit(index: int, result: BatchItemResult) -> None:
+            ordered[index] = result
+            if report:
+                report.write(json.dumps(result.to_record()) + "\n")
+                report.flush()
+            if on_result:
+                on_result(result)
+
+        try:
+            if self.workers == 1 or len(selected) <= 1:
+                for index, item in enumerate(selected):
+                    emit(index, run_item(item))
+            else:
+                kinds = sorted({item.kind for item in selected})
+                with ProcessPoolExecutor(
+                    max_workers=min(self.workers, len(selected)),
+                    initializer=_init_worker,
+                    initargs=(kinds,),
+                ) as pool:
+                    futures = {pool.submit(run_item, item): i for i, item in enumerate(selected)}
+                    for future in as_completed(futures):
+                        emit(futures[future], future.result())
+
+            summary.results = [r for r in ordered if r is not None]
+            summary.elapsed_s = time.perf_counter() - start
+            if report:
+                report.write(json.dumps(summary.to_record()) + "\n")
+        finally:
+            if report:
+                report.close()
+
+        return summary
+
+
+def build_items(project_root: Path, sessions: bool, products: bool,
+                min_words: int = 1500, threshold: Optional[float] = None) -> List[BatchItem]:
+    """Collect session and product items for a sweep."""
+    items: List[BatchItem] = []
+    if sessions:
+        items.extend(BatchItem("session", p) for p in find_all_sessions(project_root))
+    if products:
+        options = {"min_words": min_words, "threshold": threshold}
+        items.extend(BatchItem("product", p, dict(options)) for p in find_all_products(project_root))
+    return items
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Validate sessions and products in parallel with a JSON-lines report"
+    )
+    parser.add_argument("--all", action="store_true", help="Validate sessions and products")
+    parser.add_argument("--sessions", action="store_true", help="Validate all sessions")
+    parser.add_argument("--products", action="store_true", help="Validate all products")
+    parser.add_argument("paths", nargs="*", help="Specific session or product directories")
+    parser.add_argument("--workers", "-w", type=int, default=None,
+                        help="Worker processes (default: CPU count, 1 = in-process)")
+    parser.add_argument("--changed-since",
+                        help="Only validate items modified since ISO date, age (24h, 7d) or 'last'")
+    parser.add_argument("--output", "-o", help="JSON-lines report path")
+    parser.add_argument("--min-words", type=int, default=1500, help="Min words per response")
+    parser.add_argument("--threshold", type=float, default=None, help="Product quality gate threshold")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Print every item's errors")
+
+    args = parser.parse_args()
+
+    if not (args.all or args.sessions or args.products or args.paths):
+        parser.print_help()
+        sys.exit(1)
+
+    project_root = PROJECT_ROOT
+    items = build_items(
+        project_root,
+        sessions=args.all or args.sessions,
+        products=args.all or args.products,
+        min_words=args.min_words,
+        threshold=args.threshold,
+    )
+    for raw in args.paths:
+        path = Path(raw).resolve()
+        kind = "session" if (path / "manifest.yaml").exists() else "product"
+        items.append(BatchItem(kind, path, {"min_words": args.min_words, "threshold": args.threshold}))
+
+    report_path = Path(args.output) if args.output else None
+    try:
+        changed_since = parse_changed_since(args.changed_since, report_path)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(2)
+
+    def show(result: BatchItemResult) -> None:
+        status = "✓" if result.valid else "✗"
+        print(f"  {status} [{result.kind}] {result.name} ({result.elapsed_ms:.0f} ms)")
+        if args.verbose:
+            for error in result.errors:
+                print(f"      - {error}")
+
+    runner = BatchValidator(workers=args.workers, report_path=report_path, changed_since=changed_since)
+    print(f"Validating {len(items)} items on {runner.workers} workers...")
+    summary = runner.run(items, on_result=show)
+
+    record = summary.to_record()
+    print(f"\n{'='*60}")
+    print("BATCH VALIDATION SUMMARY")
+    print(f"{'='*60}")
+    print(f"Validated: {record['total']}  |  Valid: {record['valid']}  |  Invalid: {record['invalid']}")
+    if changed_since is not None:
+        print(f"Skipped (unchanged since {record['changed_since']}): {record['skipped_unchanged']}")
+    print(f"Elapsed: {record['elapsed_s']:.2f}s")
+    if report_path:
+        print(f"Report: {report_path}")
+
+    sys.exit(0 if summary.all_valid else 1)
+
+
+if __name__ == "__main__":
+    main()
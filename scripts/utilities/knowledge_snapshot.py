@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+"""
+Compiled knowledge snapshot.
+
+Reads YAML/JSON files under ``knowledge/`` once and keeps the parsed
+objects in a versioned binary snapshot (``knowledge/.snapshot/``), so a
+generation run does not re-parse the same large YAML files with the
+pure-Python loader in every module that needs them.
+
+Layout::
+
+    knowledge/.snapshot/
+        knowledge.pickle   # {version, entries: {relpath: (mtime_ns, size, sha256, pickled data)}}
+        manifest.json      # relpath -> mtime_ns, size, sha256 (human readable)
+
+``load_knowledge(path)`` returns the parsed file as shared, read-only
+objects (``ReadOnlyDict`` / ``ReadOnlyList``; both are real dict/list
+subclasses so ``json`` and ``yaml`` dumping keep working). Files are
+re-validated by mtime and size on every call and only changed files are
+re-parsed; a touched-but-identical file is recognised by its hash.
+Pass ``mutable=True`` for a private plain-dict copy (e.g. history files
+that are updated and written back).
+
+Usage:
+    from scripts.utilities.knowledge_snapshot import load_knowledge
+    codex = load_knowledge("archetypes/archetype_codex.yaml")
+
+CLI:
+    python3 scripts/utilities/knowledge_snapshot.py --build
+    python3 scripts/utilities/knowledge_snapshot.py --stats
+    python3 scripts/utilities/knowledge_snapshot.py --benchmark
+"""
+
+import argparse
+import atexit
+import hashlib
+import json
+import os
+import pickle
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import yaml
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+KNOWLEDGE_ROOT = PROJECT_ROOT / "knowledge"
+SNAPSHOT_VERSION = 1
+SOURCE_SUFFIXES = (".yaml", ".yml", ".json")
+
+# LibYAML when available (same results as SafeLoader, much faster)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# =============================================================================
+# READ-ONLY CONTAINERS
+# =============================================================================
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError(
+        "Knowledge snapshot objects are shared and read-only; "
+        "use load_knowledge(..., mutable=True) or thaw() for a private copy"
+    )
+
+
+class ReadOnlyDict(dict):
+    """dict that refuses in-place modification."""
+    __slots__ = ()
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = __ior__ = _readonly
+
+    def copy(self) -> dict:
+        return dict(self)
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo) -> dict:
+        return thaw(self)
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class ReadOnlyList(list):
+    """list that refuses in-place modification."""
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def copy(self) -> list:
+        return list(self)
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo) -> list:
+        return thaw(self)
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def freeze(obj: Any) -> Any:
+    """Recursively convert dicts/lists to their read-only counterparts."""
+    if isinstance(obj, dict):
+        return ReadOnlyDict((k, freeze(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return ReadOnlyList(freeze(v) for v in obj)
+    return obj
+
+
+def thaw(obj: Any) -> Any:
+    """Recursively convert (read-only) dicts/lists back to plain, mutable ones."""
+    if isinstance(obj, dict):
+        return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [thaw(v) for v in obj]
+    return obj
+
+
+# Dump read-only containers exactly like plain ones
+for _dumper in (yaml.SafeDumper, yaml.Dumper):
+    yaml.add_representer(ReadOnlyDict, yaml.representer.SafeRepresenter.represent_dict, Dumper=_dumper)
+    yaml.add_representer(ReadOnlyList, yaml.representer.SafeRepresenter.represent_list, Dumper=_dumper)
+
+
+# =============================================================================
+# SNAPSHOT
+# =============================================================================
+
+@dataclass
+class SnapshotEntry:
+    """One compiled source file."""
+    mtime_ns: int
+    size: int
+    sha256: str
+    blob: bytes  # pickled parsed data
+
+
+def _parse(path: Path, raw: bytes) -> Any:
+    if path.suffix == ".json":
+        return json.loads(raw.decode("utf-8"))
+    return yaml.load(raw.decode("utf-8"), Loader=_YamlLoader)
+
+
+class KnowledgeSnapshot:
+    """
+    Parsed knowledge files backed by an on-disk snapshot.
+
+    Files inside ``root`` are persisted to the snapshot; files elsewhere
+    are cached in memory only.
+    """
+
+    def __init__(self, root: Path = KNOWLEDGE_ROOT, snapshot_dir: Optional[Path] = None):
+        self.root = Path(root).resolve()
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir else self.root / ".snapshot"
+        self.snapshot_path = self.snapshot_dir / "knowledge.pickle"
+        self.manifest_path = self.snapshot_dir / "manifest.json"
+        self._lock = threading.RLock()
+        self._entries: Optional[Dict[str, SnapshotEntry]] = None  # Loaded lazily
+        self._dirty: Dict[str, Optional[SnapshotEntry]] = {}      # None = removed
+        self._objects: Dict[str, Tuple[int, int, Any]] = {}       # key -> (mtime_ns, size, frozen)
+        self._paths: Dict[Union[str, Path], Tuple[Path, str]] = {}  # requested path -> (resolved, key)
+        self.stats = {"memory": 0, "snapshot": 0, "parsed": 0}
+        self.errors: Dict[str, str] = {}  # relpath -> parse error from the last build()
+
+    # ─── Public API ───────────────────────────────────────────────
+
+    def load(self, path: Union[str, Path], mutable: bool = False) -> Any:
+        """
+        Parsed contents of ``path`` (absolute, or relative to the knowledge root).
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        resolved = self._paths.get(path)
+        if resolved is None:
+            full = self._resolve(path)
+            resolved = self._paths[path] = (full, self._key(full))
+        full, key = resolved
+        stat = full.stat()
+
+        with self._lock:
+            cached = self._objects.get(key)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                self.stats["memory"] += 1
+                data = cached[2]
+            else:
+                data = freeze(self._load_entry(key, full, stat))
+                self._objects[key] = (stat.st_mtime_ns, stat.st_size, data)
+
+        return thaw(data) if mutable else data
+
+    def build(self, paths: Optional[Iterable[Path]] = None) -> Dict[str, int]:
+        """Compile every knowledge file (or ``paths``) and write the snapshot."""
+        with self._lock:
+            entries = self._snapshot_entries()
+            sources = list(paths) if paths is not None else self.source_files()
+            seen = set()
+            counts = {"files": 0, "reused": 0, "parsed": 0, "removed": 0, "errors": 0}
+            self.errors = {}
+            for full in sources:
+                key = self._key(full)
+                seen.add(key)
+                counts["files"] += 1
+                before = self.stats["parsed"]
+                try:
+                    self._load_entry(key, full, full.stat())
+                except (yaml.YAMLError, ValueError, UnicodeDecodeError) as e:
+                    # Not loadable by its callers either; leave it out of the snapshot
+                    self.errors[key] = str(e).splitlines()[0]
+                    counts["errors"] += 1
+                    continue
+                counts["parsed" if self.stats["parsed"] > before else "reused"] += 1
+            if paths is None:
+                for key in [k for k in entries if k not in seen]:
+                    entries.pop(key)
+                    self._dirty[key] = None
+                    counts["removed"] += 1
+            self.save()
+            return counts
+
+    def source_files(self) -> List[Path]:
+        return sorted(
+            p for p in self.root.rglob("*")
+            if p.suffix in SOURCE_SUFFIXES and p.is_file() and self.snapshot_dir not in p.parents
+        )
+
+    def save(self) -> bool:
+        """Write pending changes, merging with whatever another process saved meanwhile."""
+        with self._lock:
+            if not self._dirty:
+                return False
+            merged = self._read_snapshot()
+            for key, entry in self._dirty.items():
+                if entry is None:
+                    merged.pop(key, None)
+                else:
+                    merged[key] = entry
+
+            self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+            payload = {
+                "version": SNAPSHOT_VERSION,
+                "entries": {k: (e.mtime_ns, e.size, e.sha256, e.blob) for k, e in merged.items()},
+            }
+            tmp = self.snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(self.snapshot_path)
+
+            manifest = {
+                "version": SNAPSHOT_VERSION,
+                "files": {k: {"mtime_ns": e.mtime_ns, "size": e.size, "sha256": e.sha256}
+                          for k, e in sorted(merged.items())},
+            }
+            tmp = self.manifest_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(manifest, indent=2))
+            tmp.replace(self.manifest_path)
+
+            self._entries = merged
+            self._dirty.clear()
+            return True
+
+    def clear_memory(self) -> None:
+        """Forget in-process objects (the on-disk snapshot is kept)."""
+        with self._lock:
+            self._objects.clear()
+            self._entries = None
+
+    # ─── Internals ────────────────────────────────────────────────
+
+    def _resolve(self, path: Union[str, Path]) -> Path:
+        path = Path(path)
+        if not path.is_absolute():
+            parts = path.parts
+            # Accept both "archetypes/x.yaml" and "knowledge/archetypes/x.yaml"
+            if parts and parts[0] == self.root.name and not (self.root / path).exists():
+                path = Path(*parts[1:])
+            path = self.root / path
+        return path.resolve()
+
+    def _key(self, full: Path) -> str:
+        try:
+            return full.relative_to(self.root).as_posix()
+        except ValueError:
+            return str(full)  # Outside the knowledge root: memory-only
+
+    def _persistable(self, key: str) -> bool:
+        return not os.path.isabs(key)
+
+    def _read_snapshot(self) -> Dict[str, SnapshotEntry]:
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                payload = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != SNAPSHOT_VERSION:
+            return {}
+        return {k: SnapshotEntry(*v) for k, v in payload.get("entries", {}).items()}
+
+    def _snapshot_entries(self) -> Dict[str, SnapshotEntry]:
+        if self._entries is None:
+            self._entries = self._read_snapshot()
+        return self._entries
+
+    def _load_entry(self, key: str, full: Path, stat: os.stat_result) -> Any:
+        persist = self._persistable(key)
+        entry = self._snapshot_entries().get(key) if persist else None
+
+        if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            self.stats["snapshot"] += 1
+            return pickle.loads(entry.blob)
+
+        raw = full.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if entry and entry.sha256 == digest:
+            # Touched but unchanged: keep the compiled data, refresh stat
+            data = pickle.loads(entry.blob)
+            self.stats["snapshot"] += 1
+        else:
+            data = _parse(full, raw)
+            self.stats["parsed"] += 1
+
+        if persist:
+            new_entry = SnapshotEntry(stat.st_mtime_ns, stat.st_size, digest,
+                                      pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+            self._entries[key] = new_entry
+            self._dirty[key] = new_entry
+        return data
+
+
+# =============================================================================
+# MODULE-LEVEL API
+# =============================================================================
+
+_default: Optional[KnowledgeSnapshot] = None
+_default_lock = threading.Lock()
+
+
+def get_snapshot() -> KnowledgeSnapshot:
+    """Process-wide snapshot for the project's knowledge/ tree."""
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = KnowledgeSnapshot()
+                atexit.register(_save_default)
+    return _default
+
+
+def _save_default() -> None:
+    try:
+        if _default is not None:
+            _default.save()
+    except OSError:
+        pass  # Read-only checkout: the snapshot is an optimisation only
+
+
+def load_knowledge(path: Union[str, Path], mutable: bool = False) -> Any:
+    """
+    Parsed YAML/JSON knowledge file, shared and read-only unless ``mutable``.
+
+    Args:
+        path: Path relative to knowledge/ (e.g. "anchors/anchor_registry.yaml")
+              or an absolute path
+        mutable: Return a private plain-dict/list copy that may be modified
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    return get_snapshot().load(path, mutable=mutable)
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+# Knowledge files read during one auto_generate session, with how many
+# times the pre-snapshot code parsed each one
+SESSION_KNOWLEDGE_ACCESS = [
+    ("archetypes/archetype_codex.yaml", 1),          # ArchetypeSelector
+    ("archetypes/archetype_history.yaml", 1),        # ArchetypeSelector
+    ("indexes/archetype_family_index.yaml", 1),      # ArchetypeSelector
+    ("anchors/anchor_registry.yaml", 1),             # AnchorSelector
+    ("anchors/anchor_history.yaml", 1),              # AnchorSelector
+    ("audio/binaural_presets.yaml", 1),              # binaural_preset_loader
+    ("lessons_learned.yaml", 4),                     # CreativeWorkflow, GenerationPlanner, pre_generation_check, auto_generate
+    ("outcome_registry.yaml", 2),                    # validate_outcome (pre + post generation)
+    ("canonical_lexicon.yaml", 2),                   # knowledge_tools (description + knowledge graph)
+    ("copywriting_templates.yaml", 1),               # knowledge_tools
+]
+
+
+def benchmark(repeat: int = 5) -> Dict[str, Any]:
+    """Cold (no snapshot), snapshot (new process) and warm load times for a session's access pattern."""
+    import tempfile
+    import shutil
+
+    access = [(rel, n) for rel, n in SESSION_KNOWLEDGE_ACCESS if (KNOWLEDGE_ROOT / rel).exists()]
+
+    def run_yaml():
+        for rel, n in access:
+            for _ in range(n):
+                yaml.safe_load((KNOWLEDGE_ROOT / rel).read_text(encoding="utf-8"))
+
+    def run_snapshot(snap: KnowledgeSnapshot):
+        for rel, n in access:
+            for _ in range(n):
+                snap.load(rel)
+
+    def timed(fn) -> float:
+        start = time.perf_counter()
+        fn()
+        return (time.perf_counter() - start) * 1000
+
+    results = {"files": len(access), "accesses": sum(n for _, n in access)}
+    results["yaml_safe_load_ms"] = min(timed(run_yaml) for _ in range(repeat))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        no_snapshot, from_snapshot, warm = [], [], []
+        for _ in range(repeat):
+            shutil.rmtree(Path(tmp) / "snap", ignore_errors=True)
+            snap = KnowledgeSnapshot(KNOWLEDGE_ROOT, Path(tmp) / "snap")
+            no_snapshot.append(timed(lambda: run_snapshot(snap)))
+            snap.save()
+
+            fresh = KnowledgeSnapshot(KNOWLEDGE_ROOT, Path(tmp) / "snap")  # As a new process would
+            from_snapshot.append(timed(lambda: run_snapshot(fresh)))
+            warm.append(timed(lambda: run_snapshot(fresh)))
+
+    results["cold_no_snapshot_ms"] = min(no_snapshot)
+    results["cold_from_snapshot_ms"] = min(from_snapshot)
+    results["warm_ms"] = min(warm)
+    results["warm_per_access_us"] = results["warm_ms"] * 1000 / results["accesses"]
+    return {k: round(v, 2) if isinstance(v, float) else v for k, v in results.items()}
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile knowledge/ into a binary snapshot")
+    parser.add_argument("--build", action="store_true", help="Compile every YAML/JSON file under knowledge/")
+    parser.add_argument("--stats", action="store_true", help="Show snapshot contents and staleness")
+    parser.add_argument("--benchmark", action="store_true", help="Time a session's knowledge access pattern")
+    parser.add_argument("--repeat", type=int, default=5, help="Benchmark repetitions (default: 5)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    snapshot = get_snapshot()
+
+    if args.build:
+        start = time.perf_counter()
+        counts = snapshot.build()
+        counts["seconds"] = round(time.perf_counter() - start, 2)
+        if args.json:
+            print(json.dumps(counts, indent=2))
+        else:
+            print(f"✓ Snapshot: {counts['files']} files ({counts['parsed']} parsed, "
+                  f"{counts['reused']} reused, {counts['removed']} removed) in {counts['seconds']}s")
+            print(f"  {snapshot.snapshot_path}")
+            for key, error in snapshot.errors.items():
+                print(f"  ⚠ Skipped {key}: {error}")
+
+    if args.stats:
+        entries = snapshot._snapshot_entries()
+        stale = []
+        for key, entry in entries.items():
+            full = snapshot.root / key
+            if not full.exists():
+                stale.append((key, "missing"))
+            elif full.stat().st_mtime_ns != entry.mtime_ns or full.stat().st_size != entry.size:
+                stale.append((key, "changed"))
+        size = snapshot.snapshot_path.stat().st_size if snapshot.snapshot_path.exists() else 0
+        report = {"entries": len(entries), "bytes": size, "stale": dict(stale)}
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            print(f"Snapshot entries: {len(entries)} ({size / 1024:.0f} KiB)")
+            for key, reason in stale:
+                print(f"  ⚠ {key}: {reason}")
+
+    if args.benchmark:
+        report = benchmark(repeat=args.repeat)
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            print(f"Session knowledge access: {report['files']} files, {report['accesses']} loads")
+            print(f"  yaml.safe_load each time:  {report['yaml_safe_load_ms']:>9.2f} ms")
+            print(f"  cold, no snapshot yet:     {report['cold_no_snapshot_ms']:>9.2f} ms")
+            print(f"  cold, from snapshot:       {report['cold_from_snapshot_ms']:>9.2f} ms")
+            print(f"  warm (in-process):         {report['warm_ms']:>9.2f} ms "
+                  f"({report['warm_per_access_us']:.1f} µs/load)")
+
+    if not (args.build or args.stats or args.benchmark):
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -25,6 +25,10 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 import yaml
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
 
 # =============================================================================
 # STANDARDS REFERENCE
@@ -748,6 +752,12 @@ def main():
         default="md",
         help="Output format"
     )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Extract session metrics on N worker processes (default: 1)"
+    )
 
     args = parser.parse_args()
 
@@ -761,11 +771,21 @@ def main():
     print(f"Analyzing {len(sessions)} sessions...")
 
     # Extract metrics from all sessions
+    from scripts.utilities.batch_validate import BatchItem, BatchValidator
+
+    summary = BatchValidator(workers=args.workers).run(
+        [BatchItem("session_metrics", session_path) for session_path in sessions],
+        on_result=lambda item: print(f"  Processed: {item.name}"),
+    )
     all_metrics = []
-    for session_path in sessions:
-        print(f"  Processing: {session_path.name}")
-        metrics = extract_session_metrics(session_path)
-        all_metrics.append(metrics)
+    for item in summary.results:
+        if item.payload is None:
+            # Extraction crashed; report it as a non-compliant session
+            metrics = SessionMetrics(name=item.name, path=Path(item.path))
+            metrics.is_compliant = False
+            metrics.compliance_issues.extend(item.errors)
+            item.payload = metrics
+        all_metrics.append(item.payload)
 
     # Analyze consistency
     analysis = analyze_consistency(all_metrics)
@@ -3,13 +3,17 @@
 Spot Price Fetcher
 
 Fetches live silver and gold spot prices via web scraping.
-Primary source: APMEX
-Fallback: JM Bullion
+Sources: goldprice.org API, APMEX, JM Bullion, Kitco
 
 Features:
 - In-memory caching (15 minute TTL)
 - Database persistence for cross-process caching
-- Graceful fallback between sources
+- Stale-while-revalidate: prices up to STALE_TTL_MINUTES old are returned
+  immediately while one background refresh (single-flight across
+  processes via a StateDatabase lock row) fetches new ones
+- Hedged fetching: sources start on staggered delays (or as soon as every
+  running source has failed); the first valid answer wins and the rest
+  are abandoned
 - CLI mode for testing
 
 Usage:
@@ -25,11 +29,16 @@ CLI:
 """
 
 import logging
+import os
+import queue
 import re
+import socket
 import sys
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
 from bs4 import BeautifulSoup
@@ -46,7 +55,18 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 CACHE_TTL_MINUTES = 15
+STALE_TTL_MINUTES = 60       # Serve stale prices (and revalidate) up to this age
 REQUEST_TIMEOUT = 10
+HEDGE_DELAY_SECONDS = 0.75   # Stagger between source launches
+REFRESH_LOCK_NAME = 'spot_prices'
+
+# Source endpoints (overridable, e.g. to point at local stub servers)
+SOURCE_URLS = {
+    'goldprice.org': "https://data-asg.goldprice.org/dbXRates/USD",
+    'apmex': "https://www.apmex.com/spot-prices",
+    'jmbullion': "https://www.jmbullion.com/",
+    'kitco': "https://www.kitco.com/",
+}
 
 # In-memory cache
 _cache: Dict[str, Any] = {
@@ -84,7 +104,7 @@ def _fetch_goldprice_api() -> Optional[Dict[str, float]]:
 
     Returns prices in USD per troy ounce.
     """
-    url = "https://data-asg.goldprice.org/dbXRates/USD"
+    url = SOURCE_URLS['goldprice.org']
     headers = {'User-Agent': DEFAULT_USER_AGENT}
 
     try:
@@ -163,7 +183,7 @@ def _scrape_apmex() -> Optional[Dict[str, float]]:
     Note: APMEX may block automated requests. This is a fallback.
     """
     # Try the spot prices specific page which may have less protection
-    url = "https://www.apmex.com/spot-prices"
+    url = SOURCE_URLS['apmex']
     headers = {
         'User-Agent': DEFAULT_USER_AGENT,
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -219,7 +239,7 @@ def _scrape_jmbullion() -> Optional[Dict[str, float]]:
 
     JM Bullion displays spot prices prominently in the header.
     """
-    url = "https://www.jmbullion.com/"
+    url = SOURCE_URLS['jmbullion']
     headers = {'User-Agent': DEFAULT_USER_AGENT}
 
     try:
@@ -282,7 +302,7 @@ def _scrape_kitco() -> Optional[Dict[str, float]]:
 
     Kitco is a reliable metals information site with clear spot displays.
     """
-    url = "https://www.kitco.com/"
+    url = SOURCE_URLS['kitco']
     headers = {'User-Agent': DEFAULT_USER_AGENT}
 
     try:
@@ -326,19 +346,112 @@ def _scrape_kitco() -> Optional[Dict[str, float]]:
         return None
 
 
+# =============================================================================
+# HEDGED FETCHING
+# =============================================================================
+
+# (name, fetch function) in order of reliability
+SOURCES: List[Tuple[str, Callable[[], Optional[Dict[str, float]]]]] = [
+    ('goldprice.org', _fetch_goldprice_api),
+    ('apmex', _scrape_apmex),
+    ('jmbullion', _scrape_jmbullion),
+    ('kitco', _scrape_kitco),
+]
+
+
+def _is_valid(result: Optional[Dict[str, float]]) -> bool:
+    return bool(result) and bool(result.get('silver'))
+
+
+def _fetch_hedged(
+    sources: Optional[List[Tuple[str, Callable]]] = None,
+    hedge_delay: float = HEDGE_DELAY_SECONDS,
+    deadline: Optional[float] = None
+) -> Tuple[Optional[Dict[str, float]], Optional[str]]:
+    """
+    Race the sources with staggered starts and return the first valid answer.
+
+    Source i+1 starts ``hedge_delay`` seconds after source i, or immediately
+    once every running source has failed, so a blocked source never costs a
+    full timeout before the next one starts. Sources not yet started when a
+    winner arrives are skipped; in-flight ones run out on daemon threads and
+    their results are ignored.
+
+    Returns:
+        (result, source name) or (None, None) if every source failed
+    """
+    sources = list(sources or SOURCES)
+    if deadline is None:
+        deadline = REQUEST_TIMEOUT + hedge_delay * len(sources)
+
+    results: "queue.Queue[Tuple[str, Optional[Dict[str, float]]]]" = queue.Queue()
+    done = threading.Event()
+
+    def run(name: str, fetch: Callable):
+        if done.is_set():
+            return
+        try:
+            result = fetch()
+        except Exception as e:
+            logger.error(f"{name} fetch failed: {e}")
+            result = None
+        results.put((name, result))
+
+    start = time.monotonic()
+    launched = 0
+    in_flight = 0
+    next_launch = start
+
+    try:
+        while True:
+            now = time.monotonic()
+            if launched < len(sources) and (now >= next_launch or in_flight == 0):
+                name, fetch = sources[launched]
+                logger.debug(f"Hedged fetch: starting {name} at +{now - start:.2f}s")
+                threading.Thread(target=run, args=(name, fetch), daemon=True,
+                                 name=f"spot-{name}").start()
+                launched += 1
+                in_flight += 1
+                next_launch = now + hedge_delay
+                continue
+
+            if in_flight == 0:
+                return None, None  # Every source failed
+
+            remaining = start + deadline - now
+            if remaining <= 0:
+                logger.error(f"Hedged fetch: no valid answer within {deadline:.1f}s")
+                return None, None
+            wait = remaining if launched >= len(sources) else min(remaining, max(0.0, next_launch - now))
+            try:
+                name, result = results.get(timeout=wait)
+            except queue.Empty:
+                continue
+
+            in_flight -= 1
+            if _is_valid(result):
+                logger.info(f"Hedged fetch: {name} won at +{time.monotonic() - start:.2f}s")
+                return result, name
+    finally:
+        done.set()
+
+
 # =============================================================================
 # DATABASE CACHING
 # =============================================================================
 
-def _get_db_cached_price(metal: str, max_age_minutes: int = 15) -> Optional[Dict[str, Any]]:
-    """Get cached price from database if fresh enough."""
+def _get_db_cached_price(metal: str, max_age_minutes: float = CACHE_TTL_MINUTES) -> Optional[Dict[str, Any]]:
+    """Get cached price from database if younger than max_age_minutes."""
     try:
         from scripts.automation.state_db import StateDatabase
-        db = StateDatabase()
-        cached = db.get_latest_spot_price(metal)
+        with StateDatabase() as db:
+            cached = db.get_latest_spot_price(metal)
         if cached:
-            fetched_at = datetime.fromisoformat(cached['fetched_at'])
-            age_minutes = (datetime.now() - fetched_at).total_seconds() / 60
+            # fetched_at defaults to SQLite CURRENT_TIMESTAMP, which is UTC
+            fetched_at = datetime.fromisoformat(str(cached['fetched_at']))
+            if fetched_at.tzinfo is None:
+                fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+            age_minutes = (datetime.now(timezone.utc) - fetched_at).total_seconds() / 60
             if age_minutes < max_age_minutes:
                 logger.debug(f"Using DB cached {metal} price (age: {age_minutes:.1f} min)")
                 return {
@@ -357,13 +470,82 @@ def _save_to_db_cache(metal: str, price: float, source: str):
     """Save fetched price to database cache."""
     try:
         from scripts.automation.state_db import StateDatabase
-        db = StateDatabase()
-        db.save_spot_price(metal, price, source)
+        with StateDatabase() as db:
+            db.save_spot_price(metal, price, source)
         logger.debug(f"Saved {metal}=${price} to DB cache (source: {source})")
     except Exception as e:
         logger.warning(f"Failed to save to DB cache: {e}")
 
 
+# =============================================================================
+# STALE-WHILE-REVALIDATE
+# =============================================================================
+
+_fetch_lock = threading.Lock()       # Single-flight synchronous fetches in this process
+_refresh_lock = threading.Lock()     # At most one background refresh per process
+
+
+def _lock_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def _store(result: Dict[str, float], source: str, fetched_at: datetime):
+    """Update the in-memory and database caches with a fresh result."""
+    _cache['silver'] = result['silver']
+    _cache['gold'] = result.get('gold')
+    _cache['source'] = source
+    _cache['fetched_at'] = fetched_at
+
+    _save_to_db_cache('silver', result['silver'], source)
+    if result.get('gold'):
+        _save_to_db_cache('gold', result['gold'], source)
+
+
+def _background_refresh():
+    """Refresh prices unless another process already holds the refresh lock."""
+    owner = _lock_owner()
+    lock_ttl = REQUEST_TIMEOUT + HEDGE_DELAY_SECONDS * len(SOURCES) + 5
+    try:
+        from scripts.automation.state_db import StateDatabase
+        with StateDatabase() as db:
+            if not db.acquire_refresh_lock(REFRESH_LOCK_NAME, owner, lock_ttl):
+                logger.debug("Spot price refresh already running in another process")
+                return
+        try:
+            result, source = _fetch_hedged()
+            if _is_valid(result):
+                _store(result, source, datetime.now())
+        finally:
+            with StateDatabase() as db:
+                db.release_refresh_lock(REFRESH_LOCK_NAME, owner)
+    except Exception as e:
+        logger.warning(f"Background spot price refresh failed: {e}")
+    finally:
+        _refresh_lock.release()
+
+
+def _revalidate() -> bool:
+    """Start one background refresh; returns False if one is already running here."""
+    if not _refresh_lock.acquire(blocking=False):
+        return False
+    threading.Thread(target=_background_refresh, daemon=True, name='spot-revalidate').start()
+    return True
+
+
+def _cached_response(silver, gold, source, fetched_at: str, age_minutes: float) -> Dict[str, Any]:
+    stale = age_minutes >= CACHE_TTL_MINUTES
+    return {
+        'silver': silver,
+        'gold': gold,
+        'source': source,
+        'fetched_at': fetched_at,
+        'cached': True,
+        'cache_age_minutes': round(age_minutes, 1),
+        'stale': stale,
+        'revalidating': _revalidate() if stale else False,
+    }
+
+
 # =============================================================================
 # MAIN FUNCTION
 # =============================================================================
@@ -375,7 +557,11 @@ def get_spot_prices(force_refresh: bool = False) -> Dict[str, Any]:
     Uses a multi-layer caching strategy:
     1. In-memory cache (fastest, same process)
     2. Database cache (persists across processes)
-    3. Fresh scrape from web (APMEX -> JM Bullion -> Kitco)
+    3. Hedged fetch from the web (goldprice.org / APMEX / JM Bullion / Kitco)
+
+    Prices older than CACHE_TTL_MINUTES but younger than STALE_TTL_MINUTES
+    are returned immediately with ``stale: True`` while a background
+    refresh runs.
 
     Args:
         force_refresh: If True, bypass all caches and fetch fresh data
@@ -387,97 +573,41 @@ def get_spot_prices(force_refresh: bool = False) -> Dict[str, Any]:
             'source': 'apmex',         # Source site
             'fetched_at': '2025-...',  # ISO timestamp
             'cached': True/False,      # Whether from cache
-            'cache_age_minutes': 5.2   # How old the cache is
+            'cache_age_minutes': 5.2,  # How old the cache is
+            'stale': False,            # Served past CACHE_TTL_MINUTES
+            'revalidating': False      # Background refresh started by this call
         }
     """
     global _cache
 
-    now = datetime.now()
-
-    # Check in-memory cache first (unless forcing refresh)
-    if not force_refresh and _cache['fetched_at']:
-        age_minutes = (now - _cache['fetched_at']).total_seconds() / 60
-        if age_minutes < CACHE_TTL_MINUTES:
-            logger.debug(f"Using in-memory cache (age: {age_minutes:.1f} min)")
-            return {
-                'silver': _cache['silver'],
-                'gold': _cache['gold'],
-                'source': _cache['source'],
-                'fetched_at': _cache['fetched_at'].isoformat(),
-                'cached': True,
-                'cache_age_minutes': round(age_minutes, 1)
-            }
-
-    # Check database cache next
     if not force_refresh:
-        silver_cached = _get_db_cached_price('silver', CACHE_TTL_MINUTES)
-        gold_cached = _get_db_cached_price('gold', CACHE_TTL_MINUTES)
+        cached = _lookup_cache()
+        if cached:
+            return cached
+
+    # Fresh fetch required; concurrent callers in this process share one fetch
+    with _fetch_lock:
+        if not force_refresh:
+            cached = _lookup_cache()
+            if cached:
+                return cached
 
-        if silver_cached and gold_cached:
-            # Update in-memory cache
-            _cache['silver'] = silver_cached['price']
-            _cache['gold'] = gold_cached['price']
-            _cache['source'] = silver_cached['source']
-            _cache['fetched_at'] = datetime.fromisoformat(silver_cached['fetched_at'])
+        now = datetime.now()
+        result, source = _fetch_hedged()
 
+        # Handle failure case
+        if not _is_valid(result):
+            logger.error("All spot price sources failed")
             return {
-                'silver': silver_cached['price'],
-                'gold': gold_cached['price'],
-                'source': silver_cached['source'],
-                'fetched_at': silver_cached['fetched_at'],
-                'cached': True,
-                'cache_age_minutes': round(silver_cached['age_minutes'], 1)
+                'silver': None,
+                'gold': None,
+                'source': None,
+                'fetched_at': now.isoformat(),
+                'cached': False,
+                'error': 'All sources failed - please provide spot price manually'
             }
 
-    # Fresh fetch required - try sources in order of reliability
-    result = None
-    source = None
-
-    # Try goldprice.org API first (most reliable - direct JSON endpoint)
-    result = _fetch_goldprice_api()
-    if result and result.get('silver'):
-        source = 'goldprice.org'
-
-    # Fallback to APMEX (may be blocked)
-    if not result or not result.get('silver'):
-        result = _scrape_apmex()
-        if result and result.get('silver'):
-            source = 'apmex'
-
-    # Fallback to JM Bullion
-    if not result or not result.get('silver'):
-        result = _scrape_jmbullion()
-        if result and result.get('silver'):
-            source = 'jmbullion'
-
-    # Fallback to Kitco
-    if not result or not result.get('silver'):
-        result = _scrape_kitco()
-        if result and result.get('silver'):
-            source = 'kitco'
-
-    # Handle failure case
-    if not result or not result.get('silver'):
-        logger.error("All spot price sources failed")
-        return {
-            'silver': None,
-            'gold': None,
-            'source': None,
-            'fetched_at': now.isoformat(),
-            'cached': False,
-            'error': 'All sources failed - please provide spot price manually'
-        }
-
-    # Update caches
-    _cache['silver'] = result['silver']
-    _cache['gold'] = result.get('gold')
-    _cache['source'] = source
-    _cache['fetched_at'] = now
-
-    # Save to database
-    _save_to_db_cache('silver', result['silver'], source)
-    if result.get('gold'):
-        _save_to_db_cache('gold', result['gold'], source)
+        _store(result, source, now)
 
     return {
         'silver': result['silver'],
@@ -485,10 +615,43 @@ def get_spot_prices(force_refresh: bool = False) -> Dict[str, Any]:
         'source': source,
         'fetched_at': now.isoformat(),
         'cached': False,
-        'cache_age_minutes': 0
+        'cache_age_minutes': 0,
+        'stale': False,
+        'revalidating': False,
     }
 
 
+def _lookup_cache() -> Optional[Dict[str, Any]]:
+    """Fresh or stale-but-servable prices from memory, then the database."""
+    now = datetime.now()
+
+    # In-memory cache first
+    if _cache['fetched_at']:
+        age_minutes = (now - _cache['fetched_at']).total_seconds() / 60
+        if age_minutes < STALE_TTL_MINUTES:
+            logger.debug(f"Using in-memory cache (age: {age_minutes:.1f} min)")
+            return _cached_response(
+                _cache['silver'], _cache['gold'], _cache['source'],
+                _cache['fetched_at'].isoformat(), age_minutes
+            )
+
+    # Database cache next (shared across processes)
+    silver_cached = _get_db_cached_price('silver', STALE_TTL_MINUTES)
+    gold_cached = _get_db_cached_price('gold', STALE_TTL_MINUTES)
+    if silver_cached and gold_cached:
+        age_minutes = silver_cached['age_minutes']
+        # Update in-memory cache (ages kept in local time)
+        _cache['silver'] = silver_cached['price']
+        _cache['gold'] = gold_cached['price']
+        _cache['source'] = silver_cached['source']
+        _cache['fetched_at'] = now - timedelta(minutes=age_minutes)
+        return _cached_response(
+            silver_cached['price'], gold_cached['price'], silver_cached['source'],
+            str(silver_cached['fetched_at']), age_minutes
+        )
+    return None
+
+
 def get_silver_spot(force_refresh: bool = False) -> Optional[float]:
     """Convenience function to get just the silver spot price."""
     prices = get_spot_prices(force_refresh=force_refresh)
@@ -550,6 +713,8 @@ if __name__ == '__main__':
         print(f"Cached: {prices.get('cached', False)}")
         if prices.get('cache_age_minutes'):
             print(f"Cache Age: {prices['cache_age_minutes']} minutes")
+        if prices.get('stale'):
+            print(f"Stale: True (revalidating: {prices.get('revalidating', False)})")
         if prices.get('error'):
             print(f"Error: {prices['error']}")
 
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Single-pass multi-pattern text scanner shared by the content validators.
+
+The validators (validate_ssml, validate_nlp, validate_hypnotic_standards,
+validate_christ_centered), the product AIDetector and the categorization
+keyword matcher each ran dozens to hundreds of separate ``re.search`` /
+``re.findall`` / ``str.count`` passes over the same script. A
+``TextScanner`` is compiled once per pattern set (and cached) and then
+finds every pattern in a single scan:
+
+1. Every literal phrase, plus the literal prefixes extracted from each
+   regex (``as you\\s+\\w+`` -> ``"as you"``, ``(shrink|tiny)`` ->
+   ``{"shrink", "tiny"}``), is inserted into a trie. The trie is emitted
+   as one nested alternation regex (Aho-Corasick style: shared prefixes
+   are walked once) and run in a single ``finditer`` pass by ``sre`` in C.
+   A prefix-closure table maps the longest needle found at a position to
+   every shorter needle that also starts there.
+2. Regexes are only attempted (anchored ``match``) at positions where one
+   of their prefixes occurred.
+
+Per-pattern results are identical to running ``finditer``/``findall`` (or
+``str.count`` for literals) on each pattern separately: matches of one
+pattern never overlap each other, but different patterns may overlap.
+Regexes without a selective literal prefix (e.g. ``[a-z]\\s*<break``)
+fall back to their own ``finditer``.
+
+Usage:
+    from scripts.utilities.text_scanner import get_scanner
+
+    scanner = get_scanner(regexes=[r'as you\\s+\\w+', r'notice how'], flags=re.IGNORECASE)
+    result = scanner.scan(text)
+    result.count(r'notice how'), result.spans(r'as you\\s+\\w+')
+
+    python scripts/utilities/text_scanner.py --benchmark
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:  # Python 3.11+
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_parse  # type: ignore
+    import sre_constants  # type: ignore
+
+# Prefix extraction limits: keep the candidate set selective
+MAX_PREFIXES_PER_PATTERN = 64
+MIN_PREFIX_LENGTH = 2
+
+Span = Tuple[int, int]
+
+
+# =============================================================================
+# REGEX LITERAL-PREFIX EXTRACTION
+# =============================================================================
+
+def _class_literals(items) -> Optional[List[str]]:
+    """Expand a character class made only of literals/small ranges."""
+    chars: List[str] = []
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            chars.append(chr(av))
+        elif op is sre_constants.RANGE and av[1] - av[0] < 16:
+            chars.extend(chr(c) for c in range(av[0], av[1] + 1))
+        else:
+            return None
+    return chars
+
+
+def _combine(prefixes: Set[str], suffixes: Iterable[str]) -> Optional[Set[str]]:
+    combined = {p + s for p in prefixes for s in suffixes}
+    return combined if len(combined) <= MAX_PREFIXES_PER_PATTERN else None
+
+
+def _prefixes(items) -> Tuple[Set[str], bool]:
+    """
+    Walk a parsed pattern and collect the literal strings every match
+    must start with. Returns (prefixes, complete) where complete means
+    the whole sequence was literal.
+    """
+    prefixes = {""}
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            prefixes = {p + chr(av) for p in prefixes}
+        elif op is sre_constants.AT:
+            continue  # zero-width (\b, ^); checked by the anchored match
+        elif op is sre_constants.IN:
+            chars = _class_literals(av)
+            combined = _combine(prefixes, chars) if chars else None
+            if combined is None:
+                return prefixes, False
+            prefixes = combined
+        elif op is sre_constants.SUBPATTERN:
+            _group, add_flags, del_flags, sub = av
+            if add_flags or del_flags:
+                return prefixes, False
+            inner, complete = _prefixes(sub)
+            combined = _combine(prefixes, inner)
+            if combined is None:
+                return prefixes, False
+            prefixes = combined
+            if not complete:
+                return prefixes, False
+        elif op is sre_constants.BRANCH:
+            alternatives = [_prefixes(alt) for alt in av[1]]
+            inner = set().union(*(alt for alt, _ in alternatives))
+            combined = _combine(prefixes, inner)
+            if combined is None:
+                return prefixes, False
+            prefixes = combined
+            if not all(complete for _, complete in alternatives):
+                return prefixes, False
+        else:
+            return prefixes, False
+    return prefixes, True
+
+
+def literal_prefixes(pattern: str, flags: int = 0) -> Optional[Set[str]]:
+    """
+    Lower-cased literal prefixes that every match of ``pattern`` starts with,
+    or None when the pattern has no selective literal prefix.
+    """
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except re.error:
+        return None
+    prefixes, _ = _prefixes(list(parsed))
+    if not prefixes or min(len(p) for p in prefixes) < MIN_PREFIX_LENGTH:
+        return None
+    return {p.lower() for p in prefixes}
+
+
+# =============================================================================
+# TRIE ALTERNATION
+# =============================================================================
+
+def _trie_regex(needles: Iterable[str]) -> str:
+    """Build a nested alternation that walks shared prefixes once (longest wins)."""
+    trie: Dict = {}
+    for needle in needles:
+        node = trie
+        for ch in needle:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def emit(node: Dict) -> str:
+        children = [(ch, child) for ch, child in node.items() if ch != ""]
+        if not children:
+            return ""
+        alternatives = [re.escape(ch) + emit(child) for ch, child in sorted(children)]
+        body = alternatives[0] if len(alternatives) == 1 else "(?:" + "|".join(alternatives) + ")"
+        if "" in node:
+            body = "(?:" + body + ")?"
+        return body
+
+    return emit(trie)
+
+
+# =============================================================================
+# SCANNER
+# =============================================================================
+
+@dataclass
+class ScanResult:
+    """Per-pattern match spans from a single scan."""
+    text: str
+    matches: Dict[str, List[Span]] = field(default_factory=dict)
+    compiled: Dict[str, "re.Pattern"] = field(default_factory=dict, repr=False)
+
+    def spans(self, pattern: str) -> List[Span]:
+        return self.matches.get(pattern, [])
+
+    def count(self, pattern: str) -> int:
+        return len(self.matches.get(pattern, []))
+
+    def found(self, pattern: str) -> bool:
+        return bool(self.matches.get(pattern))
+
+    def first(self, pattern: str) -> Optional[Span]:
+        spans = self.matches.get(pattern)
+        return spans[0] if spans else None
+
+    def texts(self, pattern: str) -> List[str]:
+        return [self.text[start:end] for start, end in self.matches.get(pattern, [])]
+
+    def match_objects(self, pattern: str) -> List["re.Match"]:
+        """Re-materialize ``re.Match`` objects (for group access) of a regex."""
+        compiled = self.compiled[pattern]
+        return [compiled.match(self.text, start) for start, _ in self.matches.get(pattern, [])]
+
+    def findall(self, pattern: str) -> List:
+        """Same shape as ``re.findall`` (group text when the regex has groups)."""
+        compiled = self.compiled.get(pattern)
+        if compiled is None or compiled.groups == 0:
+            return self.texts(pattern)
+        if compiled.groups == 1:
+            return [m.group(1) for m in self.match_objects(pattern)]
+        return [m.groups() for m in self.match_objects(pattern)]
+
+    def total(self, patterns: Iterable[str]) -> int:
+        return sum(self.count(p) for p in patterns)
+
+    def any(self, patterns: Iterable[str]) -> bool:
+        return any(self.found(p) for p in patterns)
+
+
+class TextScanner:
+    """
+    Compiled multi-pattern scanner.
+
+    Args:
+        literals: Plain phrases, counted like ``str.count`` (non-overlapping)
+        regexes: Regular expressions, matched like ``re.finditer``
+        flags: ``re`` flags applied to every regex
+        literal_ignore_case: Match literals case-insensitively
+    """
+
+    def __init__(self, literals: Sequence[str] = (), regexes: Sequence[str] = (),
+                 flags: int = 0, literal_ignore_case: bool = False):
+        self.flags = flags
+        self.literal_ignore_case = literal_ignore_case
+        self.literals = list(dict.fromkeys(literals))
+        self.regexes = list(dict.fromkeys(regexes))
+
+        self._compiled: Dict[str, re.Pattern] = {}
+        self._fallback: List[str] = []
+        owners: Dict[str, List[str]] = {}
+
+        for literal in self.literals:
+            if literal:
+                owners.setdefault(literal.lower(), []).append(literal)
+
+        for pattern in self.regexes:
+            self._compiled[pattern] = re.compile(pattern, flags)
+            prefixes = literal_prefixes(pattern, flags)
+            if prefixes is None:
+                self._fallback.append(pattern)
+                continue
+            for prefix in prefixes:
+                owners.setdefault(prefix, []).append(pattern)
+
+        # Prefix closure: needle -> every owner whose needle is a prefix of it
+        self._closure: Dict[str, List[str]] = {}
+        for needle in owners:
+            found: List[str] = []
+            for length in range(1, len(needle) + 1):
+                for owner in owners.get(needle[:length], ()):
+                    if owner not in found:
+                        found.append(owner)
+            self._closure[needle] = found
+
+        self._needle_re = None
+        if owners:
+            self._needle_re = re.compile("(?=(" + _trie_regex(owners) + "))", re.IGNORECASE)
+
+    def scan(self, text: str) -> ScanResult:
+        """Find every pattern in ``text`` in one pass."""
+        result = ScanResult(text=text, matches={p: [] for p in self.literals + self.regexes},
+                            compiled=self._compiled)
+        if not text:
+            return result
+
+        candidates: Dict[str, List[int]] = {}
+        if self._needle_re is not None:
+            closure = self._closure
+            for m in self._needle_re.finditer(text):
+                pos = m.start()
+                for owner in closure.get(m.group(1).lower(), ()):
+                    candidates.setdefault(owner, []).append(pos)
+
+        for literal in self.literals:
+            positions = candidates.get(literal)
+            if not positions:
+                continue
+            spans = result.matches[literal]
+            size = len(literal)
+            last_end = 0
+            for pos in positions:
+                if pos < last_end:
+                    continue
+                if not self.literal_ignore_case and not text.startswith(literal, pos):
+                    continue
+                spans.append((pos, pos + size))
+                last_end = pos + size
+
+        for pattern, compiled in self._compiled.items():
+            spans = result.matches[pattern]
+            if pattern in candidates:
+                last_end = -1
+                for pos in candidates[pattern]:
+                    if pos < last_end:
+                        continue
+                    m = compiled.match(text, pos)
+                    if m:
+                        spans.append(m.span())
+                        last_end = max(m.end(), pos + 1)
+                    else:
+                        last_end = pos + 1  # skip duplicate candidates at pos
+
+        for pattern in self._fallback:
+            result.matches[pattern] = [m.span() for m in self._compiled[pattern].finditer(text)]
+
+        return result
+
+
+@lru_cache(maxsize=128)
+def _cached_scanner(literals: Tuple[str, ...], regexes: Tuple[str, ...],
+                    flags: int, literal_ignore_case: bool) -> TextScanner:
+    return TextScanner(literals, regexes, flags, literal_ignore_case)
+
+
+def get_scanner(literals: Iterable[str] = (), regexes: Iterable[str] = (),
+                flags: int = 0, literal_ignore_case: bool = False) -> TextScanner:
+    """Return a compiled scanner for this pattern set, built once per process."""
+    return _cached_scanner(tuple(literals), tuple(regexes), int(flags), literal_ignore_case)
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def _benchmark(repeat: int = 5) -> None:
+    import random
+
+    rng = random.Random(42)
+    vocabulary = ("you relax deeper natural safe notice how as you continue breath light "
+                  "warm feel whenever you the more you drift float calm bless peace journey "
+                  "<emphasis>let go</emphasis> <break time=\"2s\"/> in order to arguably").split()
+    text = " ".join(rng.choice(vocabulary) for _ in range(60_000))
+    regexes = [
+        r'as you continue', r'while you\s+\w+', r'when you notice', r'the more you.*the more',
+        r'as you\s+\w+', r'notice how', r'<emphasis[^>]*>([^<]+)</emphasis>', r'\bfear\b',
+        r'(deeper|deep|descend|drift|float|sinking|falling)', r'(whenever|each time|every time)',
+        r'(bless|blessing|peace|light|love|journey|go forth|namaste|be well)',
+        r'(feel|feeling|touch|warm|cool|cold|hot|soft|smooth|rough|pressure)',
+        r'(breath|breathe|inhale|exhale|breathing)', r'rate=["\']0\.\d+["\']',
+    ] + [rf'\bword{i}\b' for i in range(150)]
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        baseline = {p: len(re.findall(p, text, re.IGNORECASE)) for p in regexes}
+    separate = (time.perf_counter() - start) / repeat
+
+    scanner = get_scanner(regexes=regexes, flags=re.IGNORECASE)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = scanner.scan(text)
+    single = (time.perf_counter() - start) / repeat
+
+    mismatches = [p for p in regexes if result.count(p) != baseline[p]]
+    print(f"Text: {len(text):,} chars, {len(regexes)} patterns")
+    print(f"  separate re.findall: {separate * 1000:8.1f} ms")
+    print(f"  TextScanner.scan:    {single * 1000:8.1f} ms")
+    print(f"  count mismatches:    {len(mismatches)}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--benchmark" in sys.argv:
+        _benchmark()
+    else:
+        print(__doc__)
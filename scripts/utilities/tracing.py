@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Lightweight stage tracing for the production pipeline.
+
+A trace is one build (a build_session run, an auto_generate run, one
+nightly session, one worker job) and its spans are the stages inside it.
+Every span records:
+
+- wall time
+- CPU used by this process
+- CPU used by child processes reaped while the span was open (ffmpeg, TTS
+  helpers, the auto_generate subprocess) via ``getrusage(RUSAGE_CHILDREN)``
+- peak RSS seen while the span was open, sampled from /proc by one shared
+  background thread, plus the largest child RSS if it grew during the span
+
+Finished traces are written to the ``stage_timings`` table in
+StateDatabase in one transaction. ``scripts/automation/perf.py report``
+reads them back as per-stage percentiles.
+
+CPU and child CPU are process-wide counters, so when spans from different
+traces overlap (concurrent worker jobs) each span also sees the others' work.
+
+Usage:
+    from scripts.utilities.tracing import trace, span
+
+    with trace("build_session", session_name="garden-of-eden"):
+        with span("audio"):
+            run_audio(args)
+        with span("video") as stage:
+            if not run_video(args):
+                stage.fail("video assembly returned no output")
+
+Environment:
+    PERF_TRACE=0        Disable tracing (spans become no-ops)
+    PERF_TRACE_DB       Database path (default: data/automation_state.db)
+"""
+
+import contextvars
+import logging
+import os
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:  # Windows
+    resource = None
+    HAS_RESOURCE = False
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+logger = logging.getLogger(__name__)
+
+TRACE_ENABLED = os.environ.get("PERF_TRACE", "1") != "0"
+TOTAL_STAGE = "total"  # Root span of every trace
+RSS_SAMPLE_INTERVAL = 0.1  # Seconds between background RSS samples
+
+_PAGE_MB = (os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096) / (1024 * 1024)
+# ru_maxrss is KiB on Linux and bytes on macOS
+_MAXRSS_MB = 1 / (1024 * 1024) if sys.platform == "darwin" else 1 / 1024
+_statm = {"pid": None, "fd": None}  # /proc/self/statm kept open per process
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("perf_span", default=None)
+
+
+def current_rss_mb() -> Optional[float]:
+    """Resident set size of this process right now, or the high-water mark off Linux."""
+    try:
+        if _statm["pid"] != os.getpid():  # First call, or a forked child
+            _statm["fd"] = os.open("/proc/self/statm", os.O_RDONLY)
+            _statm["pid"] = os.getpid()
+        return int(os.pread(_statm["fd"], 64, 0).split()[1]) * _PAGE_MB
+    except (OSError, AttributeError, IndexError, ValueError):
+        if HAS_RESOURCE:
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_MB
+        return None
+
+
+def _children_usage():
+    """(CPU seconds, max RSS MB) of reaped child processes."""
+    if not HAS_RESOURCE:
+        return 0.0, 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime, usage.ru_maxrss * _MAXRSS_MB
+
+
+@dataclass(eq=False)
+class Span:
+    """One timed stage inside a trace."""
+    trace: "Trace"
+    stage: str
+    parent: Optional[str]
+    depth: int
+    started_at: float = field(default_factory=time.time)
+    wall_s: Optional[float] = None
+    cpu_s: Optional[float] = None
+    child_cpu_s: Optional[float] = None
+    peak_rss_mb: float = 0.0
+    child_peak_rss_mb: Optional[float] = None
+    status: str = "ok"
+    error: Optional[str] = None
+
+    def fail(self, error: Any = None):
+        """Mark the stage failed without raising (for stages that report errors as values)."""
+        self.status = "error"
+        if error is not None:
+            self.error = str(error)[:500]
+
+    def _observe(self, rss: Optional[float]):
+        if rss is not None and rss > self.peak_rss_mb:
+            self.peak_rss_mb = rss
+
+
+class _NullSpan:
+    """Stand-in yielded when tracing is off or no trace is active."""
+    trace = None
+    stage = None
+    status = "ok"
+
+    def fail(self, error: Any = None):
+        pass
+
+
+class _NullTrace(_NullSpan):
+    trace_id = None
+    pipeline = None
+    session_name = None
+    spans: List[Span] = []
+
+    def rows(self) -> List[Dict[str, Any]]:
+        return []
+
+    def save(self, db=None) -> int:
+        return 0
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _RssSampler:
+    """One daemon thread that raises peak_rss_mb on every open span.
+
+    The thread starts with the first open span and exits once none are
+    left, so an idle process pays nothing.
+    """
+
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self._open: List[Span] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, span: Span):
+        with self._lock:
+            self._open.append(span)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="perf-rss-sampler", daemon=True)
+                self._thread.start()
+
+    def remove(self, span: Span):
+        with self._lock:
+            try:
+                self._open.remove(span)
+            except ValueError:
+                pass
+
+    def _loop(self):
+        while True:
+            time.sleep(self.interval)
+            rss = current_rss_mb()
+            with self._lock:
+                if not self._open:
+                    self._thread = None
+                    return
+                for span in self._open:
+                    span._observe(rss)
+
+
+_SAMPLER = _RssSampler()
+
+
+class Trace:
+    """Spans of one build, saved together when the build finishes."""
+
+    def __init__(self, pipeline: str, session_name: Optional[str] = None):
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.pipeline = pipeline
+        self.session_name = session_name
+        self.spans: List[Span] = []
+        self.root: Optional[Span] = None
+
+    def fail(self, error: Any = None):
+        """Mark the whole build failed."""
+        if self.root is not None:
+            self.root.fail(error)
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Finished spans as stage_timings rows, in start order."""
+        return [
+            {
+                "trace_id": self.trace_id,
+                "pipeline": self.pipeline,
+                "session_name": self.session_name,
+                "stage": s.stage,
+                "parent": s.parent,
+                "depth": s.depth,
+                "started_at": s.started_at,
+                "wall_s": s.wall_s,
+                "cpu_s": s.cpu_s,
+                "child_cpu_s": s.child_cpu_s,
+                "peak_rss_mb": round(s.peak_rss_mb, 1) if s.peak_rss_mb else None,
+                "child_peak_rss_mb": s.child_peak_rss_mb,
+                "status": s.status,
+                "error": s.error,
+            }
+            for s in sorted(self.spans, key=lambda s: s.started_at)
+            if s.wall_s is not None
+        ]
+
+    def save(self, db=None) -> int:
+        """Write finished spans to stage_timings. Never raises.
+
+        Args:
+            db: StateDatabase, database path, or None for PERF_TRACE_DB / the default
+
+        Returns:
+            Number of rows written
+        """
+        rows = self.rows()
+        if not rows:
+            return 0
+        try:
+            if db is not None and hasattr(db, "record_stage_timings"):
+                return db.record_stage_timings(rows)
+
+            if str(PROJECT_ROOT) not in sys.path:
+                sys.path.insert(0, str(PROJECT_ROOT))
+            from scripts.automation.state_db import StateDatabase
+
+            path = db or os.environ.get("PERF_TRACE_DB")
+            with StateDatabase(Path(path) if path else None) as state:
+                return state.record_stage_timings(rows)
+        except Exception as e:
+            logger.warning(f"Could not save stage timings for {self.pipeline}: {e}")
+            return 0
+
+
+def _run_span(tr: Trace, stage: str, parent: Optional[Span]) -> Iterator[Span]:
+    """Generator body shared by trace() and span(); yields the open span."""
+    s = Span(
+        trace=tr,
+        stage=stage,
+        parent=parent.stage if parent is not None else None,
+        depth=parent.depth + 1 if parent is not None else 0,
+    )
+    s._observe(current_rss_mb())
+    child_cpu0, child_rss0 = _children_usage()
+    token = _current_span.set(s)
+    _SAMPLER.add(s)
+    cpu0 = time.process_time()
+    t0 = time.perf_counter()
+    try:
+        yield s
+    except BaseException as e:
+        if not (isinstance(e, SystemExit) and not e.code):
+            s.fail(e if str(e) else type(e).__name__)
+        raise
+    finally:
+        s.wall_s = round(time.perf_counter() - t0, 4)
+        s.cpu_s = round(time.process_time() - cpu0, 4)
+        _SAMPLER.remove(s)
+        _current_span.reset(token)
+        child_cpu1, child_rss1 = _children_usage()
+        s.child_cpu_s = round(child_cpu1 - child_cpu0, 4)
+        if child_rss1 > child_rss0:
+            s.child_peak_rss_mb = round(child_rss1, 1)
+        s._observe(current_rss_mb())
+        tr.spans.append(s)
+
+
+@contextmanager
+def trace(
+    pipeline: str,
+    session_name: Optional[str] = None,
+    db=None,
+    save: bool = True,
+) -> Iterator[Trace]:
+    """Trace one build; its own span is recorded as stage 'total'.
+
+    Args:
+        pipeline: Build kind, e.g. 'build_session', 'auto_generate', 'nightly'
+        session_name: Session being built (can be set later on the trace)
+        db: StateDatabase or path to save into (see Trace.save)
+        save: Save on exit; pass False to call trace.save() yourself
+              (e.g. from a thread in async code)
+    """
+    if not TRACE_ENABLED:
+        yield _NullTrace()
+        return
+
+    tr = Trace(pipeline, session_name)
+    try:
+        with contextmanager(_run_span)(tr, TOTAL_STAGE, None) as root:
+            tr.root = root
+            yield tr
+    finally:
+        if save:
+            tr.save(db)
+
+
+@contextmanager
+def span(stage: str) -> Iterator[Any]:
+    """Time a stage of the current trace; a no-op when no trace is active."""
+    parent = _current_span.get()
+    if parent is None:
+        yield _NULL_SPAN
+        return
+    yield from _run_span(parent.trace, stage, parent)
+
+
+def current_trace() -> Optional[Trace]:
+    """The trace the caller is running inside, if any."""
+    s = _current_span.get()
+    return s.trace if s is not None else None
@@ -38,6 +38,13 @@ import yaml
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
+from functools import lru_cache
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.utilities.text_scanner import ScanResult, get_scanner
 
 
 # =============================================================================
@@ -336,31 +343,42 @@ def get_first_n_words(text: str, n: int = 500) -> str:
     return ' '.join(words[:n])
 
 
+@lru_cache(maxsize=256)
+def _valid_patterns(patterns: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Drop invalid regex patterns (they are skipped, not fatal)."""
+    valid = []
+    for pattern in patterns:
+        try:
+            re.compile(pattern, re.IGNORECASE)
+        except re.error:
+            continue
+        valid.append(pattern)
+    return tuple(valid)
+
+
+def scan_patterns(content: str, patterns: List[str]) -> Tuple[Tuple[str, ...], ScanResult]:
+    """Find every valid pattern in content with a single case-insensitive scan."""
+    valid = _valid_patterns(tuple(patterns))
+    return valid, get_scanner(regexes=valid, flags=re.IGNORECASE).scan(content)
+
+
 def find_pattern_matches(content: str, patterns: List[str]) -> List[Tuple[str, str, int]]:
     """
     Find all pattern matches in content.
     Returns list of (pattern, match_text, position).
     """
+    valid, scan = scan_patterns(content, patterns)
     matches = []
-    for pattern in patterns:
-        try:
-            for m in re.finditer(pattern, content, re.IGNORECASE):
-                matches.append((pattern, m.group(), m.start()))
-        except re.error:
-            # Skip invalid regex patterns
-            continue
+    for pattern in valid:
+        for start, end in scan.spans(pattern):
+            matches.append((pattern, content[start:end], start))
     return matches
 
 
 def count_pattern_occurrences(content: str, patterns: List[str]) -> int:
     """Count total occurrences of any pattern in content."""
-    count = 0
-    for pattern in patterns:
-        try:
-            count += len(re.findall(pattern, content, re.IGNORECASE))
-        except re.error:
-            continue
-    return count
+    valid, scan = scan_patterns(content, patterns)
+    return scan.total(valid)
 
 
 def check_forbidden_patterns(text_content: str) -> List[Dict]:
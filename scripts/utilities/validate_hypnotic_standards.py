@@ -30,6 +30,12 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 import yaml
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.utilities.text_scanner import get_scanner
+
 
 # =============================================================================
 # STANDARDS DEFINITIONS
@@ -152,6 +158,17 @@ CLOSING_ELEMENTS = {
     ],
 }
 
+# Cross-session metric patterns (case-sensitive)
+METRIC_ANCHOR_PATTERNS = [
+    r'whenever you',
+    r'each time you',
+    r'every time you',
+    r'when you notice',
+    r'when you feel',
+]
+METRIC_DEEPENING_PATTERN = r'(deeper|deep|descend|drift|float|sink)'
+METRIC_BREAK_PATTERN = r'<break[^>]*>'
+
 # Voice enhancement required settings
 VOICE_ENHANCEMENT_REQUIRED = [
     "warmth_drive",
@@ -486,9 +503,12 @@ class HypnoticStandardsValidator:
 
     def _validate_elements(self, content: str, elements: Dict, section: str, required: bool):
         """Validate specific elements are present in content."""
+        scanner = get_scanner(
+            regexes=[pattern for pattern, _ in elements.values()], flags=re.IGNORECASE
+        )
+        scan = scanner.scan(content)
         for element_id, (pattern, description) in elements.items():
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            count = len(matches)
+            count = scan.count(pattern)
             present = count > 0
 
             result = ValidationResult(
@@ -587,31 +607,24 @@ class HypnoticStandardsValidator:
             words = text_only.split()
             self.result.word_count = len(words)
 
+        # All metric patterns are case-sensitive and found in one scan
+        sense_patterns = [pattern for pattern, _ in JOURNEY_SENSES.values()]
+        scan = get_scanner(
+            regexes=METRIC_ANCHOR_PATTERNS + sense_patterns
+            + [METRIC_DEEPENING_PATTERN, METRIC_BREAK_PATTERN]
+        ).scan(self.script_content)
+
         # Count anchors
-        anchor_patterns = [
-            r'whenever you',
-            r'each time you',
-            r'every time you',
-            r'when you notice',
-            r'when you feel',
-        ]
-        for pattern in anchor_patterns:
-            self.result.anchor_count += len(re.findall(pattern, self.script_content))
+        self.result.anchor_count += scan.total(METRIC_ANCHOR_PATTERNS)
 
         # Count senses covered
-        sense_count = 0
-        for sense, (pattern, _) in JOURNEY_SENSES.items():
-            if re.search(pattern, self.script_content):
-                sense_count += 1
-        self.result.sense_coverage = sense_count
+        self.result.sense_coverage = sum(1 for pattern in sense_patterns if scan.found(pattern))
 
         # Count deepening phrases
-        deepening_pattern = r'(deeper|deep|descend|drift|float|sink)'
-        self.result.deepening_count = len(re.findall(deepening_pattern, self.script_content))
+        self.result.deepening_count = scan.count(METRIC_DEEPENING_PATTERN)
 
         # Count breaks
-        break_pattern = r'<break[^>]*>'
-        self.result.break_count = len(re.findall(break_pattern, self.script_content))
+        self.result.break_count = scan.count(METRIC_BREAK_PATTERN)
 
     def get_report(self) -> str:
         """Generate formatted validation report."""
@@ -863,6 +876,20 @@ def main():
         action="store_true",
         help="Output results as JSON"
     )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Validate sessions on N worker processes (default: 1)"
+    )
+    parser.add_argument(
+        "--changed-since",
+        help="Only validate sessions modified since ISO date, age (24h, 7d) or 'last'"
+    )
+    parser.add_argument(
+        "--jsonl",
+        help="Stream results to a JSON-lines report (plus summary line)"
+    )
 
     args = parser.parse_args()
 
@@ -881,13 +908,30 @@ def main():
         print("No sessions found")
         sys.exit(0)
 
-    # Validate all sessions
-    results = []
-    for session_path in sessions:
-        validator = HypnoticStandardsValidator(session_path)
-        result = validator.validate()
-        results.append(result)
-        print(validator.get_report())
+    # Validate all sessions (fanned out across workers when --workers > 1)
+    from scripts.utilities.batch_validate import BatchItem, BatchValidator, parse_changed_since
+
+    report_path = Path(args.jsonl) if args.jsonl else None
+    try:
+        changed_since = parse_changed_since(args.changed_since, report_path)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(2)
+
+    runner = BatchValidator(workers=args.workers, report_path=report_path, changed_since=changed_since)
+    summary = runner.run(
+        [BatchItem("session", Path(p)) for p in sessions],
+        on_result=lambda item: print(item.report or "\n".join(item.errors)),
+    )
+    results = [item.payload for item in summary.results if item.payload is not None]
+    # A worker that raised leaves no payload; those sessions count as failures
+    crashed = [item for item in summary.results if item.payload is None]
+
+    if summary.skipped:
+        print(f"Skipped {len(summary.skipped)} sessions unchanged since {args.changed_since}")
+    if not summary.results:
+        print("No sessions to validate")
+        sys.exit(0)
 
     # Cross-session comparison
     if args.compare and len(results) > 1:
@@ -895,13 +939,16 @@ def main():
         print(comparator.get_report())
 
     # Summary
+    total = len(summary.results)
     valid_count = sum(1 for r in results if r.valid)
     print(f"\n{'='*70}")
     print("SUMMARY")
     print(f"{'='*70}")
-    print(f"Sessions validated: {len(results)}")
-    print(f"Valid sessions: {valid_count}/{len(results)}")
-    print(f"Compliance rate: {valid_count/len(results)*100:.1f}%")
+    print(f"Sessions validated: {total}")
+    print(f"Valid sessions: {valid_count}/{total}")
+    if crashed:
+        print(f"Crashed: {len(crashed)} ({', '.join(item.name for item in crashed)})")
+    print(f"Compliance rate: {valid_count/total*100:.1f}%")
 
     # JSON output
     if args.json:
@@ -920,12 +967,15 @@ def main():
                     }
                 }
                 for r in results
+            ] + [
+                {"name": item.name, "valid": False, "errors": item.errors, "warnings": item.warnings, "metrics": {}}
+                for item in crashed
             ]
         }
         print("\n" + json.dumps(output, indent=2))
 
     # Exit code
-    sys.exit(0 if valid_count == len(results) else 1)
+    sys.exit(0 if valid_count == total else 1)
 
 
 if __name__ == "__main__":
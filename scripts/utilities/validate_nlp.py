@@ -24,6 +24,12 @@ from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.utilities.text_scanner import ScanResult, get_scanner
+
 
 # =============================================================================
 # VALIDATION REQUIREMENTS
@@ -334,6 +340,31 @@ class ValidationReport:
     summary: str = ""
 
 
+# =============================================================================
+# SINGLE-PASS SCANNING
+# =============================================================================
+
+def _section_pattern(name: str) -> str:
+    return rf'(?:<!--|SECTION|#)\s*{re.escape(name)}'
+
+
+STRUCTURE_PATTERNS = [_section_pattern(name) for names in REQUIRED_SECTIONS for name in names]
+
+# Every pattern matched against the lower-cased script, in one scanner
+LOWERCASE_PATTERNS = (
+    [p for config in NLP_PATTERNS.values() for p in config['patterns']]
+    + [p for config in SENSORY_PATTERNS.values() for p in config['patterns']]
+    + [p for t in ('physical', 'symbolic', 'sensory') for p in ANCHOR_PATTERNS[t]]
+    + [p for config in ANCHOR_CATEGORY_PATTERNS.values() for p in config['patterns']]
+    + NEGATIVE_PATTERNS
+)
+
+
+def scan_script(content: str) -> ScanResult:
+    """Scan the lower-cased script once for every NLP/sensory/anchor/negative pattern."""
+    return get_scanner(regexes=LOWERCASE_PATTERNS).scan(content.lower())
+
+
 # =============================================================================
 # VALIDATION FUNCTIONS
 # =============================================================================
@@ -342,12 +373,12 @@ def validate_structure(content: str) -> ValidationResult:
     """Validate that all 5 required sections are present."""
     found_sections = []
     missing_sections = []
+    scan = get_scanner(regexes=STRUCTURE_PATTERNS, flags=re.IGNORECASE).scan(content)
 
     for section_names in REQUIRED_SECTIONS:
         found = False
         for name in section_names:
-            pattern = rf'(?:<!--|SECTION|#)\s*{re.escape(name)}'
-            if re.search(pattern, content, re.IGNORECASE):
+            if scan.found(_section_pattern(name)):
                 found = True
                 found_sections.append(section_names[0])
                 break
@@ -371,16 +402,16 @@ def validate_structure(content: str) -> ValidationResult:
     return result
 
 
-def validate_nlp_patterns(content: str) -> Dict[str, ValidationResult]:
+def validate_nlp_patterns(content: str, scan: Optional[ScanResult] = None) -> Dict[str, ValidationResult]:
     """Validate NLP pattern requirements."""
     results = {}
-    content_lower = content.lower()
+    scan = scan or scan_script(content)
 
     for pattern_name, config in NLP_PATTERNS.items():
         matches = []
         for pattern in config['patterns']:
-            for match in re.finditer(pattern, content_lower):
-                matches.append(match.group(0)[:50])  # First 50 chars
+            for match_text in scan.texts(pattern):
+                matches.append(match_text[:50])  # First 50 chars
 
         passed = len(matches) >= config['min_count']
 
@@ -405,16 +436,15 @@ def validate_nlp_patterns(content: str) -> Dict[str, ValidationResult]:
     return results
 
 
-def validate_sensory_language(content: str) -> Dict[str, ValidationResult]:
+def validate_sensory_language(content: str, scan: Optional[ScanResult] = None) -> Dict[str, ValidationResult]:
     """Validate sensory language engagement."""
     results = {}
-    content_lower = content.lower()
+    scan = scan or scan_script(content)
 
     for sense, config in SENSORY_PATTERNS.items():
         matches = []
         for pattern in config['patterns']:
-            for match in re.finditer(pattern, content_lower):
-                matches.append(match.group(0))
+            matches.extend(scan.texts(pattern))
 
         # Remove duplicates
         matches = list(set(matches))
@@ -440,19 +470,19 @@ def validate_sensory_language(content: str) -> Dict[str, ValidationResult]:
     return results
 
 
-def validate_anchors(content: str) -> ValidationResult:
+def validate_anchors(content: str, scan: Optional[ScanResult] = None) -> ValidationResult:
     """Validate post-hypnotic anchors."""
-    content_lower = content.lower()
+    scan = scan or scan_script(content)
     anchor_types_found = []
     all_matches = []
 
     for anchor_type in ['physical', 'symbolic', 'sensory']:
         patterns = ANCHOR_PATTERNS[anchor_type]
         for pattern in patterns:
-            if re.search(pattern, content_lower):
+            if scan.found(pattern):
                 anchor_types_found.append(anchor_type)
-                for match in re.finditer(pattern, content_lower):
-                    all_matches.append(f"[{anchor_type}] {match.group(0)[:40]}")
+                for match_text in scan.texts(pattern):
+                    all_matches.append(f"[{anchor_type}] {match_text[:40]}")
                 break
 
     passed = len(set(anchor_types_found)) >= ANCHOR_PATTERNS['min_count']
@@ -476,7 +506,7 @@ def validate_anchors(content: str) -> ValidationResult:
     return result
 
 
-def validate_anchor_variety(content: str) -> ValidationResult:
+def validate_anchor_variety(content: str, scan: Optional[ScanResult] = None) -> ValidationResult:
     """
     Validate anchor variety across all 10 categories.
 
@@ -486,15 +516,15 @@ def validate_anchor_variety(content: str) -> ValidationResult:
     - At least 1 physical/kinesthetic anchor (body-based)
     - At least 1 symbolic/verbal anchor (mental)
     """
-    content_lower = content.lower()
+    scan = scan or scan_script(content)
     categories_found = {}
     all_matches = []
 
     for category, config in ANCHOR_CATEGORY_PATTERNS.items():
         matches = []
         for pattern in config['patterns']:
-            for match in re.finditer(pattern, content_lower):
-                matches.append(match.group(0)[:50])
+            for match_text in scan.texts(pattern):
+                matches.append(match_text[:50])
 
         if matches:
             categories_found[category] = matches
@@ -543,15 +573,16 @@ def validate_anchor_variety(content: str) -> ValidationResult:
     return result
 
 
-def validate_positive_language(content: str) -> ValidationResult:
+def validate_positive_language(content: str, scan: Optional[ScanResult] = None) -> ValidationResult:
     """Check for negative/fear-based language."""
-    content_lower = content.lower()
+    scan = scan or scan_script(content)
+    content_lower = scan.text
     negative_matches = []
 
     for pattern in NEGATIVE_PATTERNS:
-        for match in re.finditer(pattern, content_lower):
-            context_start = max(0, match.start() - 20)
-            context_end = min(len(content_lower), match.end() + 20)
+        for start, end in scan.spans(pattern):
+            context_start = max(0, start - 20)
+            context_end = min(len(content_lower), end + 20)
             context = content_lower[context_start:context_end]
             negative_matches.append(f"'{context.strip()}'")
 
@@ -604,34 +635,37 @@ def validate_script(script_path: str, verbose: bool = False) -> ValidationReport
     if not structure_result.passed:
         report.passed = False
 
+    # One scan of the lower-cased script feeds every pattern check below
+    scan = scan_script(content)
+
     # NLP patterns
-    nlp_results = validate_nlp_patterns(content)
+    nlp_results = validate_nlp_patterns(content, scan)
     for name, result in nlp_results.items():
         report.checks[f'nlp_{name}'] = result
         if not result.passed:
             report.passed = False
 
     # Sensory language
-    sensory_results = validate_sensory_language(content)
+    sensory_results = validate_sensory_language(content, scan)
     for name, result in sensory_results.items():
         report.checks[f'sensory_{name}'] = result
         if not result.passed and SENSORY_PATTERNS[name]['min_count'] > 0:
             report.passed = False
 
     # Anchors (legacy basic check)
-    anchor_result = validate_anchors(content)
+    anchor_result = validate_anchors(content, scan)
     report.checks['anchors'] = anchor_result
     if not anchor_result.passed:
         report.passed = False
 
     # Anchor variety (enhanced 10-category check)
-    anchor_variety_result = validate_anchor_variety(content)
+    anchor_variety_result = validate_anchor_variety(content, scan)
     report.checks['anchor_variety'] = anchor_variety_result
     if not anchor_variety_result.passed:
         report.warnings.append("Anchor variety could be improved")
 
     # Positive language
-    positive_result = validate_positive_language(content)
+    positive_result = validate_positive_language(content, scan)
     report.checks['positive_language'] = positive_result
     if not positive_result.passed:
         report.warnings.append("Contains potentially negative language")
@@ -22,6 +22,12 @@ import yaml
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.utilities.knowledge_snapshot import load_knowledge
+
 # =============================================================================
 # PATTERN DETECTION REGEXES
 # =============================================================================
@@ -474,8 +480,7 @@ def load_outcome_registry() -> Dict:
         print(f"   Error: Outcome registry not found: {registry_path}")
         return {}
 
-    with open(registry_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    return load_knowledge(registry_path)
 
 
 def load_manifest(session_path: Path) -> Optional[Dict]:
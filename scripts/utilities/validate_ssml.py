@@ -21,8 +21,154 @@ import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.utilities.text_scanner import get_scanner
+
 # Version 2.0 - Enhanced with distribution, rhythm, and safety checks
 
+# =============================================================================
+# PATTERN SETS (compiled once into shared single-pass scanners)
+# =============================================================================
+
+SAFETY_PATTERNS = [
+    r'remain.*in control',
+    r'return to.*awareness',
+    r'at any time.*choose',
+    r'completely safe',
+    r'fully aware.*in control',
+    r'safe.*throughout',
+    r'your choice.*return',
+]
+
+# Patterns that indicate fractionation loops (first three are the core loops)
+LOOP_PATTERNS = [
+    r'deeper.*natural.*natural.*deeper',
+    r'relaxed.*safe.*safe.*relaxed',
+    r'go.*deeper.*wait.*already.*deeper',
+    r'deeper you go.*more.*more.*deeper',
+    r'comfortable.*safe.*safe.*comfortable',
+    r'open.*trusting.*trusting.*open',
+]
+FRACTIONATION_PATTERNS = LOOP_PATTERNS[:3]
+YES_SET_PATTERN = r"you'?re\s+\w+.*you'?re\s+\w+.*you'?re\s+\w+"
+
+TEMPORAL_PATTERN = r'(minutes|hours|days)\s+ahead'
+
+DOUBLE_BIND_PATTERNS = [
+    r'(can|may)\s+\w+.*or\s+\w+.*whichever',
+    r'choose\s+to.*or.*wait',
+    r'quickly\s+or\s+slowly',
+]
+
+# Phase 1: NLP Submodality Shifts
+SUBMODALITY_PATTERNS = [
+    r'(shrink|smaller|tiny|distance|far\s+away|fading)',
+    r'growing\s+smaller',
+    r'(brighten|brighter|expand|larger|vivid)',
+    r'fills?\s+(your\s+)?(entire\s+)?awareness',
+    r'(color|colour)\s+(shift|transform|change)',
+    r'(weight|heavy)\s+(lift|dissolve|transform)',
+    r'becoming\s+(lighter|weightless)',
+]
+
+# Phase 1: Expectancy Priming
+EXPECTANCY_PATTERNS = [
+    r'(most\s+people|many\s+(people|have))\s+(find|found|experience)',
+    r'(your\s+mind|you)\s+already\s+know',
+    r'(natural|innate)\s+(ability|capacity|wisdom)',
+    r'something\s+(powerful|profound)\s+(is\s+about|will)',
+    r'(open|ready|prepared)\s+to\s+receive',
+]
+
+# Phase 1: Identity Reframing
+IDENTITY_PATTERNS = [
+    r'(version|self)\s+(of\s+you|who)\s+(has\s+already|that\s+has)',
+    r'step\s+(into|forward\s+into)\s+(this|that|the)\s+(new|version)',
+    r'becoming\s+who\s+you\s+(already\s+)?are',
+    r'(always\s+been|has\s+always\s+been)\s+part\s+of\s+you',
+    r'this\s+is\s+who\s+you\s+(are|have\s+always\s+been)',
+]
+
+# Phase 2: Parts Integration
+PARTS_PATTERNS = [
+    r'(part|parts)\s+of\s+(you|yourself)',
+    r'(different|various|all)\s+parts',
+    r'(thank|appreciate)\s+(this|that)\s+part',
+    r'(parts|all\s+parts)\s+(coming|come)\s+together',
+]
+
+# Phase 2: Schema Rewriting
+SCHEMA_PATTERNS = [
+    r'(old|ancient|deep)\s+(belief|pattern|story)',
+    r'(no\s+longer|doesn\'t)\s+(serve|apply|fit)',
+    r'(new|deeper)\s+(truth|belief|knowing)',
+    r'settling\s+into\s+(your\s+)?(cells|bones|body)',
+    r'(you\s+are|I\s+am)\s+(enough|worthy|complete)',
+]
+
+# Phase 3: Association/Dissociation
+ASSOC_DISSOC_PATTERNS = [
+    r'step\s+(back|away)\s+from',
+    r'(watch|observe|see)\s+(yourself|from\s+outside)',
+    r'step\s+(fully\s+)?into\s+(this|that|the)',
+    r'(fill|fills)\s+every\s+part\s+of\s+you',
+]
+
+# Phase 4: Symbolic Catharsis
+CATHARSIS_PATTERNS = [
+    r'(cast|throw|release)\s+(into|to)\s+(the\s+)?(fire|flame)',
+    r'(wash|water|stream|river)\s+(away|dissolve|carry)',
+    r'(wind|breeze)\s+(carry|scatter)',
+    r'(return|bury|place)\s+(to|in|into)\s+(the\s+)?earth',
+    r'(dissolve|melt)\s+(into|in)\s+(pure\s+)?light',
+]
+
+# Raw SSML markup checks (case-sensitive)
+EMPHASIS_OPEN_PATTERN = r'<emphasis'
+BREAK_OPEN_PATTERN = r'<break'
+RATE_VIOLATION_PATTERN = r'rate=["\']0\.\d+["\']'
+EMPHASIS_WITH_NESTED_PATTERN = r'<emphasis[^>]*>([^<]*(?:<[^/][^>]*>[^<]*)+)</emphasis>'
+NESTED_EMPHASIS_PATTERN = r'<emphasis[^>]*>[^<]*<emphasis[^>]*>'
+BREAK_WITHOUT_PUNCT_PATTERN = r'[a-zA-Z]\s*<break'
+
+# Text markers that will be vocalized (checked case-insensitively on raw SSML)
+TEXT_MARKERS = [
+    ('pause', r'\bpause\b(?![^<]*>)'),  # 'pause' not inside tag
+    ('breathe', r'\bbreathe\b(?![^<]*>)'),
+    ('silence', r'\bsilence\b(?![^<]*>)'),
+]
+
+TEXT_PATTERNS = (
+    [TEMPORAL_PATTERN] + DOUBLE_BIND_PATTERNS + SUBMODALITY_PATTERNS + EXPECTANCY_PATTERNS
+    + IDENTITY_PATTERNS + PARTS_PATTERNS + SCHEMA_PATTERNS + ASSOC_DISSOC_PATTERNS
+    + CATHARSIS_PATTERNS
+)
+SPANNING_PATTERNS = LOOP_PATTERNS + [YES_SET_PATTERN]
+MARKUP_PATTERNS = [
+    EMPHASIS_OPEN_PATTERN, BREAK_OPEN_PATTERN, RATE_VIOLATION_PATTERN,
+    EMPHASIS_WITH_NESTED_PATTERN, NESTED_EMPHASIS_PATTERN, BREAK_WITHOUT_PUNCT_PATTERN,
+]
+MARKER_PATTERNS = [pattern for _, pattern in TEXT_MARKERS]
+
+
+def scan_text(text_content):
+    """Scan spoken text once for every hypnotic-pattern family."""
+    return (
+        get_scanner(regexes=TEXT_PATTERNS, flags=re.IGNORECASE).scan(text_content),
+        get_scanner(regexes=SPANNING_PATTERNS, flags=re.IGNORECASE | re.DOTALL).scan(text_content),
+    )
+
+
+def scan_markup(content):
+    """Scan raw SSML once for markup and vocalized-marker checks."""
+    return (
+        get_scanner(regexes=MARKUP_PATTERNS).scan(content),
+        get_scanner(regexes=MARKER_PATTERNS, flags=re.IGNORECASE).scan(content),
+    )
+
 def strip_ns(tag):
     """Return tag name without namespace."""
     return tag.split('}', 1)[-1] if '}' in tag else tag
@@ -36,30 +182,23 @@ def check_safety_clause(text_content):
     words = text_content.split()
     first_500 = ' '.join(words[:500])
 
-    safety_patterns = [
-        r'remain.*in control',
-        r'return to.*awareness',
-        r'at any time.*choose',
-        r'completely safe',
-        r'fully aware.*in control',
-        r'safe.*throughout',
-        r'your choice.*return',
-    ]
-
-    for pattern in safety_patterns:
-        if re.search(pattern, first_500, re.IGNORECASE):
-            return True, "Safety/autonomy clause present in opening"
+    scan = get_scanner(regexes=SAFETY_PATTERNS, flags=re.IGNORECASE).scan(first_500)
+    if scan.any(SAFETY_PATTERNS):
+        return True, "Safety/autonomy clause present in opening"
 
     return False, "No safety/autonomy clause in first 500 words"
 
 
-def analyze_emphasis_distribution(content, word_count):
+def analyze_emphasis_distribution(content, word_count, markup_scan=None):
     """
     Analyze distribution of embedded commands (emphasis tags).
     Returns dict with metrics and status.
     """
+    if markup_scan is None:
+        markup_scan, _ = scan_markup(content)
+
     # Find all emphasis tag positions in content
-    emphasis_positions = [m.start() for m in re.finditer(r'<emphasis', content)]
+    emphasis_positions = [start for start, _ in markup_scan.spans(EMPHASIS_OPEN_PATTERN)]
     emphasis_count = len(emphasis_positions)
 
     # Calculate per 100 words
@@ -90,27 +229,19 @@ def analyze_emphasis_distribution(content, word_count):
     return result
 
 
-def analyze_fractionation_distribution(text_content):
+def analyze_fractionation_distribution(text_content, spanning_scan=None):
     """
     Analyze fractionation loop positions to ensure proper distribution.
     Returns dict with metrics and status.
     """
-    # Patterns that indicate fractionation loops
-    loop_patterns = [
-        r'deeper.*natural.*natural.*deeper',
-        r'relaxed.*safe.*safe.*relaxed',
-        r'go.*deeper.*wait.*already.*deeper',
-        r'deeper you go.*more.*more.*deeper',
-        r'comfortable.*safe.*safe.*comfortable',
-        r'open.*trusting.*trusting.*open',
-    ]
+    if spanning_scan is None:
+        _, spanning_scan = scan_text(text_content)
 
     positions = []
-    for pattern in loop_patterns:
-        matches = list(re.finditer(pattern, text_content, re.IGNORECASE | re.DOTALL))
-        for m in matches:
+    for pattern in LOOP_PATTERNS:
+        for start, _ in spanning_scan.spans(pattern):
             # Calculate position as percentage of text
-            pos_pct = (m.start() / len(text_content) * 100) if text_content else 0
+            pos_pct = (start / len(text_content) * 100) if text_content else 0
             positions.append(pos_pct)
 
     positions.sort()
@@ -198,12 +329,14 @@ def analyze_rhythm(text_content):
     return result
 
 
-def analyze_breath_pacing(content, word_count):
+def analyze_breath_pacing(content, word_count, markup_scan=None):
     """
     Analyze break frequency relative to word count.
     Returns dict with metrics.
     """
-    break_count = len(re.findall(r'<break', content))
+    if markup_scan is None:
+        markup_scan, _ = scan_markup(content)
+    break_count = markup_scan.count(BREAK_OPEN_PATTERN)
 
     # Find words between breaks
     # Split content by break tags
@@ -335,6 +468,10 @@ def validate_ssml(file_path):
     print(f"   Estimated duration: {estimated_minutes:.1f} minutes")
     print()
 
+    # Single pass per pattern family over spoken text and raw markup
+    text_scan, spanning_scan = scan_text(text_content)
+    markup_scan, marker_scan = scan_markup(content)
+
     # =========================================================================
     # SAFETY CHECK (HARD FAIL)
     # =========================================================================
@@ -361,15 +498,7 @@ def validate_ssml(file_path):
     print()
 
     # Check for fractionation loops (circular deepening patterns)
-    fractionation_patterns = [
-        r'deeper.*natural.*natural.*deeper',
-        r'relaxed.*safe.*safe.*relaxed',
-        r'go.*deeper.*wait.*already.*deeper',
-    ]
-    fractionation_found = 0
-    for pattern in fractionation_patterns:
-        if re.search(pattern, text_content, re.IGNORECASE | re.DOTALL):
-            fractionation_found += 1
+    fractionation_found = sum(1 for p in FRACTIONATION_PATTERNS if spanning_scan.found(p))
 
     if fractionation_found >= 2:
         print(f"   ✅ Fractionation loops: {fractionation_found} found (≥2 required)")
@@ -379,33 +508,26 @@ def validate_ssml(file_path):
         print("   ⚠️  No fractionation loops detected (2 required)")
 
     # Check for yes-sets (3+ truisms in sequence)
-    yes_set_pattern = r"you'?re\s+\w+.*you'?re\s+\w+.*you'?re\s+\w+"
-    if re.search(yes_set_pattern, text_content, re.IGNORECASE | re.DOTALL):
+    if spanning_scan.found(YES_SET_PATTERN):
         print("   ✅ Yes-set pattern detected")
     else:
         print("   ⚠️  No yes-set detected (3+ truisms recommended in opening)")
 
     # Check for temporal dissociation
-    temporal_pattern = r'(minutes|hours|days)\s+ahead'
-    if re.search(temporal_pattern, text_content, re.IGNORECASE):
+    if text_scan.found(TEMPORAL_PATTERN):
         print("   ✅ Temporal dissociation/future pacing detected")
     else:
         print("   ⚠️  No temporal dissociation detected (required in integration)")
 
     # Check for double-binds
-    double_bind_patterns = [
-        r'(can|may)\s+\w+.*or\s+\w+.*whichever',
-        r'choose\s+to.*or.*wait',
-        r'quickly\s+or\s+slowly',
-    ]
-    double_bind_found = any(re.search(p, text_content, re.IGNORECASE) for p in double_bind_patterns)
+    double_bind_found = text_scan.any(DOUBLE_BIND_PATTERNS)
     if double_bind_found:
         print("   ✅ Double-bind pattern detected")
     else:
         print("   ⚠️  No double-bind detected (recommended in journey)")
 
     # Check for rate violations (should always be 1.0)
-    rate_violations = re.findall(r'rate=["\']0\.\d+["\']', content)
+    rate_violations = markup_scan.findall(RATE_VIOLATION_PATTERN)
     if rate_violations:
         print(f"   ❌ Rate violations found: {rate_violations[:3]}")
         print("      Use rate=\"1.0\" for all sections (L015)")
@@ -421,30 +543,14 @@ def validate_ssml(file_path):
     print()
 
     # Phase 1: NLP Submodality Shifts
-    submodality_patterns = [
-        r'(shrink|smaller|tiny|distance|far\s+away|fading)',
-        r'growing\s+smaller',
-        r'(brighten|brighter|expand|larger|vivid)',
-        r'fills?\s+(your\s+)?(entire\s+)?awareness',
-        r'(color|colour)\s+(shift|transform|change)',
-        r'(weight|heavy)\s+(lift|dissolve|transform)',
-        r'becoming\s+(lighter|weightless)',
-    ]
-    submodality_found = sum(1 for p in submodality_patterns if re.search(p, text_content, re.IGNORECASE))
+    submodality_found = sum(1 for p in SUBMODALITY_PATTERNS if text_scan.found(p))
     if submodality_found >= 1:
         print(f"   ✅ Submodality shifts: {submodality_found} types detected")
     else:
         print("   ⚠️  No submodality shifts detected (recommended for transformation)")
 
     # Phase 1: Expectancy Priming
-    expectancy_patterns = [
-        r'(most\s+people|many\s+(people|have))\s+(find|found|experience)',
-        r'(your\s+mind|you)\s+already\s+know',
-        r'(natural|innate)\s+(ability|capacity|wisdom)',
-        r'something\s+(powerful|profound)\s+(is\s+about|will)',
-        r'(open|ready|prepared)\s+to\s+receive',
-    ]
-    expectancy_found = sum(1 for p in expectancy_patterns if re.search(p, text_content, re.IGNORECASE))
+    expectancy_found = sum(1 for p in EXPECTANCY_PATTERNS if text_scan.found(p))
     if expectancy_found >= 2:
         print(f"   ✅ Expectancy priming: {expectancy_found} patterns (≥2 required)")
     elif expectancy_found == 1:
@@ -453,68 +559,35 @@ def validate_ssml(file_path):
         print("   ⚠️  No expectancy priming detected (add to pre-talk)")
 
     # Phase 1: Identity Reframing
-    identity_patterns = [
-        r'(version|self)\s+(of\s+you|who)\s+(has\s+already|that\s+has)',
-        r'step\s+(into|forward\s+into)\s+(this|that|the)\s+(new|version)',
-        r'becoming\s+who\s+you\s+(already\s+)?are',
-        r'(always\s+been|has\s+always\s+been)\s+part\s+of\s+you',
-        r'this\s+is\s+who\s+you\s+(are|have\s+always\s+been)',
-    ]
-    identity_found = any(re.search(p, text_content, re.IGNORECASE) for p in identity_patterns)
+    identity_found = text_scan.any(IDENTITY_PATTERNS)
     if identity_found:
         print("   ✅ Identity reframing detected")
     else:
         print("   ⚠️  No identity reframing detected (recommended for transformation)")
 
     # Phase 2: Parts Integration
-    parts_patterns = [
-        r'(part|parts)\s+of\s+(you|yourself)',
-        r'(different|various|all)\s+parts',
-        r'(thank|appreciate)\s+(this|that)\s+part',
-        r'(parts|all\s+parts)\s+(coming|come)\s+together',
-    ]
-    parts_found = any(re.search(p, text_content, re.IGNORECASE) for p in parts_patterns)
+    parts_found = text_scan.any(PARTS_PATTERNS)
     if parts_found:
         print("   ✅ Parts integration language detected")
     else:
         print("   ℹ️  No parts integration (optional for healing outcomes)")
 
     # Phase 2: Schema Rewriting
-    schema_patterns = [
-        r'(old|ancient|deep)\s+(belief|pattern|story)',
-        r'(no\s+longer|doesn\'t)\s+(serve|apply|fit)',
-        r'(new|deeper)\s+(truth|belief|knowing)',
-        r'settling\s+into\s+(your\s+)?(cells|bones|body)',
-        r'(you\s+are|I\s+am)\s+(enough|worthy|complete)',
-    ]
-    schema_found = any(re.search(p, text_content, re.IGNORECASE) for p in schema_patterns)
+    schema_found = text_scan.any(SCHEMA_PATTERNS)
     if schema_found:
         print("   ✅ Schema rewriting detected")
     else:
         print("   ℹ️  No schema rewriting (optional for transformation)")
 
     # Phase 3: Association/Dissociation
-    assoc_dissoc_patterns = [
-        r'step\s+(back|away)\s+from',
-        r'(watch|observe|see)\s+(yourself|from\s+outside)',
-        r'step\s+(fully\s+)?into\s+(this|that|the)',
-        r'(fill|fills)\s+every\s+part\s+of\s+you',
-    ]
-    assoc_dissoc_found = any(re.search(p, text_content, re.IGNORECASE) for p in assoc_dissoc_patterns)
+    assoc_dissoc_found = text_scan.any(ASSOC_DISSOC_PATTERNS)
     if assoc_dissoc_found:
         print("   ✅ Association/dissociation cues detected")
     else:
         print("   ℹ️  No association/dissociation (optional for healing)")
 
     # Phase 4: Symbolic Catharsis
-    catharsis_patterns = [
-        r'(cast|throw|release)\s+(into|to)\s+(the\s+)?(fire|flame)',
-        r'(wash|water|stream|river)\s+(away|dissolve|carry)',
-        r'(wind|breeze)\s+(carry|scatter)',
-        r'(return|bury|place)\s+(to|in|into)\s+(the\s+)?earth',
-        r'(dissolve|melt)\s+(into|in)\s+(pure\s+)?light',
-    ]
-    catharsis_found = any(re.search(p, text_content, re.IGNORECASE) for p in catharsis_patterns)
+    catharsis_found = text_scan.any(CATHARSIS_PATTERNS)
     if catharsis_found:
         print("   ✅ Symbolic catharsis detected")
     else:
@@ -529,7 +602,7 @@ def validate_ssml(file_path):
     print()
 
     # Analyze embedded command distribution
-    emphasis_dist = analyze_emphasis_distribution(content, word_count)
+    emphasis_dist = analyze_emphasis_distribution(content, word_count, markup_scan)
     print("   Embedded Commands:")
     print(f"   ├── Total: {emphasis_dist['total']} ", end="")
     if emphasis_dist['total'] >= 10:
@@ -546,7 +619,7 @@ def validate_ssml(file_path):
     print()
 
     # Analyze fractionation loop distribution
-    frac_dist = analyze_fractionation_distribution(text_content)
+    frac_dist = analyze_fractionation_distribution(text_content, spanning_scan)
     print("   Fractionation Loops:")
     print(f"   ├── Count: {frac_dist['count']} ", end="")
     if frac_dist['count'] >= 2:
@@ -577,7 +650,7 @@ def validate_ssml(file_path):
     print()
 
     # Analyze breath pacing
-    pacing = analyze_breath_pacing(content, word_count)
+    pacing = analyze_breath_pacing(content, word_count, markup_scan)
     print("   Breath Pacing:")
     print(f"   ├── Total breaks: {pacing['total_breaks']}")
     print(f"   ├── Max words between breaks: {pacing['max_words_between']} ", end="")
@@ -599,11 +672,7 @@ def validate_ssml(file_path):
     neural2_issues = []
 
     # Check for nested tags inside emphasis (Neural2 doesn't support this)
-    emphasis_with_nested = re.findall(
-        r'<emphasis[^>]*>([^<]*(?:<[^/][^>]*>[^<]*)+)</emphasis>',
-        content,
-        re.DOTALL
-    )
+    emphasis_with_nested = markup_scan.findall(EMPHASIS_WITH_NESTED_PATTERN)
     if emphasis_with_nested:
         neural2_issues.append(f"Found {len(emphasis_with_nested)} <emphasis> tags with nested SSML tags inside")
         print(f"   ❌ Found {len(emphasis_with_nested)} <emphasis> tags containing other tags")
@@ -617,7 +686,7 @@ def validate_ssml(file_path):
         print("   ✅ No nested tags inside <emphasis>")
 
     # Check for nested emphasis tags
-    nested_emphasis = re.findall(r'<emphasis[^>]*>[^<]*<emphasis[^>]*>', content)
+    nested_emphasis = markup_scan.findall(NESTED_EMPHASIS_PATTERN)
     if nested_emphasis:
         neural2_issues.append(f"Found {len(nested_emphasis)} nested <emphasis> tags")
         print(f"   ❌ Found {len(nested_emphasis)} nested <emphasis> tags")
@@ -648,7 +717,7 @@ def validate_ssml(file_path):
         issues_found = True
 
     # Check for breaks without preceding punctuation (L016)
-    breaks_without_punct = re.findall(r'[a-zA-Z]\s*<break', content)
+    breaks_without_punct = markup_scan.findall(BREAK_WITHOUT_PUNCT_PATTERN)
     if breaks_without_punct:
         print(f"⚠️  Warning: {len(breaks_without_punct)} breaks without preceding punctuation (L016)")
         print("   Add comma, ellipsis, or period before <break> tags to prevent word cutoff")
@@ -671,13 +740,8 @@ def validate_ssml(file_path):
             issues_found = True
 
     # Check for common text markers that will be vocalized
-    text_markers = [
-        ('pause', r'\bpause\b(?![^<]*>)'),  # 'pause' not inside tag
-        ('breathe', r'\bbreathe\b(?![^<]*>)'),
-        ('silence', r'\bsilence\b(?![^<]*>)'),
-    ]
-    for name, pattern in text_markers:
-        matches = re.findall(pattern, content, re.IGNORECASE)
+    for name, pattern in TEXT_MARKERS:
+        matches = marker_scan.findall(pattern)
         if matches:
             print(f"⚠️  Warning: Found '{name}' as plain text (verify it's intentional)")
             issues_found = True
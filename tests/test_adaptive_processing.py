@@ -0,0 +1,56 @@
+"""Block-boundary tests for the streaming adaptive processing chain."""
+
+import numpy as np
+import pytest
+
+from scripts.core.audio.adaptive_processing import STAGE_PRESETS, create_adaptive_chain
+
+SAMPLE_RATE = 48000
+DURATION = 10.0
+SAMPLES = int(DURATION * SAMPLE_RATE)
+STAGES = [
+    {'name': 'induction', 'start': 0, 'end': 3, **STAGE_PRESETS['induction']},
+    {'name': 'journey', 'start': 3, 'end': 7, **STAGE_PRESETS['journey']},
+    {'name': 'awakening', 'start': 7, 'end': 10, **STAGE_PRESETS['awakening']},
+]
+
+
+@pytest.fixture(scope='module')
+def signals():
+    t = np.linspace(0, DURATION, SAMPLES, dtype=np.float32)
+    rng = np.random.default_rng(7)
+    tone = 0.3 * np.sin(2 * np.pi * 440 * t)
+    return {
+        'tone': np.stack([tone, tone], axis=1).astype(np.float32),
+        'noise': (0.1 * rng.standard_normal((SAMPLES, 2))).astype(np.float32),
+        'voice': ((np.sin(2 * np.pi * 0.5 * t) > 0) * 0.2
+                  * rng.standard_normal(SAMPLES).astype(np.float32)),
+    }
+
+
+def render(audio, voice, block):
+    chain = create_adaptive_chain(SAMPLE_RATE, STAGES, SAMPLES, voice_track=voice)
+    return chain.render(audio, block)
+
+
+def boundary_jump_ratio(audio, block):
+    """Largest sample step across block boundaries over the largest step elsewhere."""
+    steps = np.abs(np.diff(audio, axis=0)).max(axis=-1)
+    at_boundary = np.zeros(len(steps), dtype=bool)
+    at_boundary[np.arange(block, len(audio), block) - 1] = True
+    return float(steps[at_boundary].max() / steps[~at_boundary].max())
+
+
+def test_output_does_not_depend_on_block_size(signals):
+    reference = render(signals['noise'], signals['voice'], SAMPLE_RATE)
+
+    for block in (4801, 1023):
+        rendered = render(signals['noise'], signals['voice'], block)
+        assert np.abs(rendered - reference).max() < 1e-6, f"{block}-sample blocks drift"
+
+
+@pytest.mark.parametrize('block', [SAMPLE_RATE, 4801, 1023])
+def test_no_step_at_block_boundaries(signals, block):
+    rendered = render(signals['tone'], signals['voice'], block)
+
+    assert boundary_jump_ratio(rendered, block) <= 1.0
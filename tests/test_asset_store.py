@@ -0,0 +1,84 @@
+"""Tests for asset store dedupe and placements of files tools rewrite."""
+
+import os
+import shutil
+
+import pytest
+
+from scripts.automation.state_db import StateDatabase
+from scripts.utilities import asset_store
+from scripts.utilities.asset_store import AssetStore
+
+MEDIA = os.urandom(128 * 1024)
+RENDER = os.urandom(128 * 1024)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(asset_store, 'SESSIONS_DIR', tmp_path / 'sessions')
+    with StateDatabase(tmp_path / 'state.db') as db:
+        yield AssetStore(tmp_path / 'store', db=db)
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def test_dedupe_leaves_pipeline_outputs_independent(store, tmp_path):
+    sessions = tmp_path / 'sessions'
+    thumbs, beds = [], []
+    for name in ('first', 'second'):
+        thumbs.append(write(sessions / name / 'output' / 'youtube_thumbnail.png', MEDIA))
+        thumbs.append(write(sessions / name / 'output' / 'youtube_package' / 'thumbnail.png', MEDIA))
+        beds.append(write(sessions / name / 'assets' / 'ambience.wav', RENDER))
+
+    result = store.dedupe(sessions)
+
+    assert result['converted'] == 2  # only the library-sourced ambience beds
+    assert os.path.samefile(beds[0], beds[1])
+
+    # A thumbnail re-render copies over the placed file in place
+    rerender = write(tmp_path / 'render.png', os.urandom(128 * 1024))
+    shutil.copy(rerender, thumbs[0])
+
+    for other in thumbs[1:]:
+        assert other.read_bytes() == MEDIA
+    objects = [obj for obj in store.objects_dir.rglob('*') if obj.is_file()]
+    assert [obj.read_bytes() for obj in objects] == [RENDER]
+
+
+def test_placement_into_output_is_never_linked(store, tmp_path):
+    library = write(tmp_path / 'library' / 'thumbnail.png', MEDIA)
+    sessions = tmp_path / 'sessions'
+    first = store.place(library, sessions / 'first' / 'output' / 'youtube_thumbnail.png')
+    second = store.place(library, sessions / 'second' / 'output' / 'youtube_thumbnail.png')
+
+    assert first.method in asset_store.COPY_METHODS
+    assert second.method in asset_store.COPY_METHODS
+
+    first.path.write_bytes(RENDER)
+
+    assert second.path.read_bytes() == MEDIA
+    assert store.object_path(first.digest).read_bytes() == MEDIA
+
+
+def test_dedupe_detaches_previously_linked_outputs(store, tmp_path):
+    library = write(tmp_path / 'library' / 'thumbnail.png', MEDIA)
+    sessions = tmp_path / 'sessions'
+    digest, _ = store.put(library)
+    # Hardlinked placements as an earlier dedupe left them
+    placed = []
+    for name in ('first', 'second'):
+        path = sessions / name / 'output' / 'thumbnail.png'
+        path.parent.mkdir(parents=True)
+        os.link(store.object_path(digest), path)
+        store._record(path, digest, 'hardlink', name)
+        placed.append(path)
+
+    assert store.dedupe(sessions)['detached'] == 2
+
+    placed[0].write_bytes(RENDER)
+    assert placed[1].read_bytes() == MEDIA
+    assert store.object_path(digest).read_bytes() == MEDIA
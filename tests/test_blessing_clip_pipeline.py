@@ -0,0 +1,115 @@
+"""Clip boundary tests for the fused blessing clip renderers.
+
+A synthetic testsrc2 + sine source and a hand-written SRT stand in for a
+session and its Whisper transcript. Every rendered clip must last its
+segment's duration to within one video frame (audio: plus one AAC frame).
+"""
+
+import shutil
+from datetime import timedelta
+
+import pytest
+
+srt = pytest.importorskip("srt")
+
+from scripts.automation.blessing_clip_pipeline import (
+    DEFAULT_CONFIG,
+    _synthetic_source,
+    build_render_jobs,
+    detect_segments,
+    parse_srt_file,
+    render_clip,
+    render_fanout,
+    stream_duration,
+)
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None,
+        reason="ffmpeg/ffprobe not installed",
+    ),
+]
+
+FPS = 25
+SOURCE_SECONDS = 50.0
+# Continuous narration every 2.5 s from 0.37 s (fractional times keep cuts
+# off the keyframe grid), with a keyword line at these caption indices
+KEYWORD_LINES = {2: "Let the light rest in your heart", 9: "Feel the peace of stillness",
+                 15: "A blessing for your heart"}
+CAPTIONS = [(0.37 + 2.5 * i, KEYWORD_LINES.get(i, "Breathe slowly")) for i in range(18)]
+
+
+@pytest.fixture(scope="module")
+def session(tmp_path_factory):
+    root = tmp_path_factory.mktemp("blessing")
+    video = root / "source.mp4"
+    _synthetic_source(video, SOURCE_SECONDS, "320x240", FPS)
+
+    transcript = root / "transcript.srt"
+    transcript.write_text(srt.compose([
+        srt.Subtitle(index=i, start=timedelta(seconds=start), end=timedelta(seconds=start + 2.0), content=text)
+        for i, (start, text) in enumerate(CAPTIONS, start=1)
+    ]), encoding="utf-8")
+    captions = parse_srt_file(transcript)
+    segments = detect_segments(
+        captions=captions,
+        keywords=DEFAULT_CONFIG["keywords"],
+        pause_gap=DEFAULT_CONFIG["pause_gap_seconds"],
+        pad_pre=DEFAULT_CONFIG["pad_pre_seconds"],
+        pad_post=DEFAULT_CONFIG["pad_post_seconds"],
+        min_len=DEFAULT_CONFIG["min_len_seconds"],
+        max_len=DEFAULT_CONFIG["max_len_seconds"],
+        max_clips=DEFAULT_CONFIG["max_clips"],
+        total_duration=SOURCE_SECONDS,
+    )
+    return video, captions, sorted(segments, key=lambda s: s.start)
+
+
+def make_jobs(session, root):
+    _, captions, segments = session
+    jobs, _ = build_render_jobs(
+        segments,
+        captions,
+        raw_dir=root / "clips_raw",
+        sub_dir=root / "clips_sub",
+        final_dir=root / "clips_final",
+        burn=True,
+        overlay=DEFAULT_CONFIG["overlay"],
+        keep_raw=False,
+    )
+    return jobs
+
+
+def assert_clip_durations(jobs):
+    for job in jobs:
+        video = stream_duration(job.output_path, "v")
+        audio = stream_duration(job.output_path, "a")
+        assert video is not None and abs(video - job.duration) <= 1.0 / FPS, job.output_path.name
+        assert audio is not None and abs(audio - job.duration) <= 1.0 / FPS + 1024 / 48000, job.output_path.name
+
+
+def test_fixture_yields_several_segments(session):
+    _, _, segments = session
+
+    assert len(segments) == len(KEYWORD_LINES)
+    assert all(seg.start % 1 for seg in segments)  # off the keyframe grid
+
+
+def test_render_clip_matches_segment_durations(session, tmp_path):
+    video, _, _ = session
+    jobs = make_jobs(session, tmp_path)
+
+    for job in jobs:
+        render_clip(video, job, DEFAULT_CONFIG["render"])
+
+    assert_clip_durations(jobs)
+
+
+def test_render_fanout_matches_segment_durations(session, tmp_path):
+    video, _, _ = session
+    jobs = make_jobs(session, tmp_path)
+
+    render_fanout(video, jobs, DEFAULT_CONFIG["render"])
+
+    assert_clip_durations(jobs)
@@ -0,0 +1,179 @@
+"""Tests for fitting a voice track to a target length without re-synthesis."""
+
+import numpy as np
+import pytest
+
+from scripts.automation.state_db import StateDatabase
+from scripts.core.duration_fit import (
+    FIT_TOLERANCE_SECONDS,
+    MAX_STRETCH,
+    ScriptStats,
+    _dominant_hz,
+    fit_duration,
+    load_rate_model,
+    pauses_from_timing,
+    record_tts_run,
+    remap_timing,
+    synthetic_speech,
+    wsola,
+)
+
+SAMPLE_RATE = 24000
+PHRASES = 16
+
+
+@pytest.fixture(scope='module')
+def script():
+    rng = np.random.default_rng(0)
+    return rng.integers(30, 110, PHRASES), rng.choice([0.5, 1.0, 1.5, 2.0, 3.0], PHRASES)
+
+
+@pytest.fixture(scope='module')
+def track(script):
+    chars, breaks = script
+    return synthetic_speech(chars, breaks, SAMPLE_RATE, seed=0)
+
+
+@pytest.fixture(scope='module')
+def sparse_track(script):
+    chars, _ = script
+    return synthetic_speech(chars[:6], np.full(6, 0.35), SAMPLE_RATE, seed=1)
+
+
+def fit_to(samples, ratio, pauses=None):
+    return fit_duration(samples, SAMPLE_RATE, len(samples) / SAMPLE_RATE * ratio, pauses)
+
+
+@pytest.mark.parametrize('ratio', [1.05, 0.90, 1.20])
+def test_pause_only_fit_hits_target(track, ratio):
+    samples, _ = track
+
+    result = fit_to(samples, ratio)
+
+    assert abs(result.error_seconds) <= FIT_TOLERANCE_SECONDS
+    assert result.stretch == 1.0
+    assert result.padded_samples == 0
+    assert result.pauses == PHRASES
+
+
+def test_sidecar_pause_spans_are_used(track):
+    samples, pauses = track
+
+    result = fit_to(samples, 1.20, pauses)
+
+    assert abs(result.error_seconds) <= FIT_TOLERANCE_SECONDS
+    assert result.stretch == 1.0
+    assert result.pauses == len(pauses)
+
+
+def test_large_cut_adds_wsola_stretch(track):
+    samples, _ = track
+
+    result = fit_to(samples, 0.84)
+
+    assert abs(result.error_seconds) <= FIT_TOLERANCE_SECONDS
+    assert 1 - MAX_STRETCH <= result.stretch < 1.0
+    assert result.pause_change_samples < 0
+
+
+def test_short_pauses_fall_back_to_wsola(sparse_track):
+    samples, _ = sparse_track
+
+    result = fit_to(samples, 1.18)
+
+    assert abs(result.error_seconds) <= FIT_TOLERANCE_SECONDS
+    assert 1.0 < result.stretch <= 1 + MAX_STRETCH
+    assert result.padded_samples == 0
+
+
+def test_target_beyond_limits_is_reported(track):
+    samples, _ = track
+
+    shorter = fit_to(samples, 0.70)
+    longer = fit_to(samples, 2.50)
+
+    assert shorter.error_seconds > FIT_TOLERANCE_SECONDS
+    assert shorter.stretch == pytest.approx(1 - MAX_STRETCH)
+    assert longer.padded_samples > 0
+    assert longer.error_seconds == 0
+
+
+def test_wsola_keeps_pitch():
+    tone = np.sin(2 * np.pi * 220 * np.arange(SAMPLE_RATE * 2) / SAMPLE_RATE)
+
+    stretched = wsola(tone, SAMPLE_RATE, 1 + MAX_STRETCH)
+
+    assert len(stretched) == pytest.approx(len(tone) * (1 + MAX_STRETCH), abs=SAMPLE_RATE * 0.01)
+    assert _dominant_hz(stretched, SAMPLE_RATE) == pytest.approx(220, rel=0.02)
+
+
+def test_stereo_track_is_fitted(track):
+    samples, _ = track
+    stereo = np.stack([samples, samples], axis=1)
+
+    result = fit_to(stereo, 0.90)
+
+    assert result.samples.shape[1] == 2
+    assert abs(result.error_seconds) <= FIT_TOLERANCE_SECONDS
+
+
+def test_remap_timing_follows_resized_pauses(track):
+    samples, pauses = track
+    phrase_starts = [0] + [end for _, end in pauses[:-1]]
+    timing = {
+        'sample_rate': SAMPLE_RATE,
+        'total_samples': len(samples),
+        'chunks': [{
+            'start_sample': 0,
+            'num_samples': len(samples),
+            'phrases': [{'start_sample': s, 'end_sample': p[0], 'text': f'phrase {i}'}
+                        for i, (s, p) in enumerate(zip(phrase_starts, pauses))],
+            'breaks': [{'start_sample': s, 'end_sample': e, 'seconds': (e - s) / SAMPLE_RATE, 'detected': True}
+                       for s, e in pauses],
+        }],
+    }
+
+    result = fit_duration(samples, SAMPLE_RATE, len(samples) / SAMPLE_RATE + 1.5,
+                          pauses_from_timing(timing, SAMPLE_RATE, len(samples)))
+    fitted = remap_timing(timing, result)
+
+    chunk = fitted['chunks'][0]
+    assert fitted['total_samples'] == len(result.samples)
+    assert chunk['start_sample'] + chunk['num_samples'] == len(result.samples)
+    # Speech is untouched: phrases keep their length, breaks absorb the change
+    for old, new in zip(timing['chunks'][0]['phrases'], chunk['phrases']):
+        assert new['end_sample'] - new['start_sample'] == pytest.approx(
+            old['end_sample'] - old['start_sample'], abs=1)
+    grown = sum((n['end_sample'] - n['start_sample']) - (o['end_sample'] - o['start_sample'])
+                for o, n in zip(timing['chunks'][0]['breaks'], chunk['breaks']))
+    assert grown == pytest.approx(result.pause_change_samples, abs=len(pauses))
+    # Each phrase still starts where the previous break ends
+    for brk, phrase in zip(chunk['breaks'], chunk['phrases'][1:]):
+        assert phrase['start_sample'] == brk['end_sample']
+
+
+def test_recorded_runs_predict_a_single_pass_rate(script, tmp_path):
+    chars, breaks = script
+    true_spc, true_exponent = 0.065, 0.9
+    stats = ScriptStats(int(chars.sum()), float(breaks.sum()))
+    rng = np.random.default_rng(1)
+
+    with StateDatabase(tmp_path / 'state.db') as db:
+        db.init_schema()
+        for run in range(8):
+            rate = float(rng.uniform(0.72, 1.0))
+            duration = stats.break_seconds + stats.spoken_chars * true_spc / rate ** true_exponent
+            assert record_tts_run('synthetic', 'voice-a', rate, stats,
+                                  duration * float(rng.normal(1.0, 0.02)), f'run-{run}', db=db)
+        model = load_rate_model('synthetic', 'voice-a', db=db)
+
+    assert model.runs == 8
+
+    source, _ = synthetic_speech(chars, breaks, SAMPLE_RATE, seed=0)
+    target = len(source) / SAMPLE_RATE * 1.1
+    rate = model.rate_for(stats, target)
+    voice, _ = synthetic_speech(chars, breaks, SAMPLE_RATE, rate, true_spc, true_exponent, seed=0)
+    result = fit_duration(voice, SAMPLE_RATE, target)
+
+    assert abs(len(voice) / SAMPLE_RATE - target) / target < 0.05
+    assert abs(result.error_seconds) <= FIT_TOLERANCE_SECONDS
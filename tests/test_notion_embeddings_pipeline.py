@@ -0,0 +1,69 @@
+"""Tests for chunk domain classification and lexical search in the Notion embeddings pipeline."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from scripts.ai.notion_embeddings_pipeline import DEFAULT_DOMAIN, LexicalIndex, classify_domain
+
+
+@pytest.mark.parametrize("title", [
+    "Golden Light Meditation",
+    "Gold Light Meditation",
+    "Mint Tea Ritual",
+    "Eagle Spirit Journey",
+    "Proof of concept",
+    "Mercury Retrograde Reflection",
+    "Quarter Moon Breathwork",
+    "Silver Cord Astral Journey",
+    "Troy and the Golden Gate",
+    "Stamp of the Soul",
+])
+def test_meditation_titles_stay_general(title):
+    text = "Breathe in the silver moonlight and feel the gold warmth of the sun."
+    assert classify_domain(title, text, database="Meditation Scripts") == DEFAULT_DOMAIN
+
+
+@pytest.mark.parametrize("title", [
+    "1921 Morgan Dollar Guide",
+    "Walking Liberty Half Dollar Key Dates",
+    "PCGS vs NGC grading",
+    "Peace Dollar VAM varieties",
+    "Bullion stacking basics",
+])
+def test_numismatic_titles_are_coins(title):
+    assert classify_domain(title, "") == "coins"
+
+
+def test_coin_database_name_is_coins():
+    assert classify_domain("Weekly notes", "", database="Coin Inventory") == "coins"
+
+
+def test_ambiguous_body_terms_alone_stay_general():
+    text = "A gold eagle of mint green light, a silver quarter moon, proof of mercury rising."
+    assert classify_domain("Evening journey", text) == DEFAULT_DOMAIN
+
+
+def test_ambiguous_body_terms_count_with_a_strong_term():
+    text = "This silver coin still carries its original luster."
+    assert classify_domain("Collection notes", text) == "coins"
+
+
+def test_single_strong_body_term_is_not_enough():
+    text = "She held a coin in her palm as the visualization began."
+    assert classify_domain("Abundance Meditation", text) == DEFAULT_DOMAIN
+
+
+def test_lexical_search_ignores_domain_and_type_values(tmp_path):
+    index = LexicalIndex(tmp_path / "lexical.sqlite")
+    index.upsert([
+        SimpleNamespace(id="11111111-1111-1111-1111-111111111111", payload={
+            "domain": "coins", "type": "page", "title": "1921 Morgan Dollar",
+            "chunk_text": "Mint luster on the reverse."}),
+        SimpleNamespace(id="22222222-2222-2222-2222-222222222222", payload={
+            "domain": "coins", "type": "page", "title": "Collecting coins",
+            "chunk_text": "Start with a page of the grading guide."}),
+    ])
+
+    assert [hit["title"] for hit in index.search("coins")] == ["Collecting coins"]
+    assert [hit["title"] for hit in index.search("page", domain="coins")] == ["Collecting coins"]
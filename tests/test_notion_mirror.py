@@ -0,0 +1,141 @@
+"""Tests for the local Notion mirror and mirror-backed knowledge lookups.
+
+The Notion API is replaced by FixtureNotionClient serving build_fixture()
+pages, so every request the sync makes can be counted.
+"""
+
+import pytest
+
+from scripts.ai import knowledge_tools
+from scripts.ai.notion_knowledge_retriever import NotionKnowledgeRetriever
+from scripts.ai.notion_mirror import FixtureNotionClient, NotionMirror, build_fixture
+
+DATABASES = ("archetypes", "realms", "frequencies", "rituals")
+PAGES_PER_DB = 40
+
+
+class RecordingClient(FixtureNotionClient):
+    """Fixture client that also records each request."""
+
+    def __init__(self, fixture):
+        super().__init__(fixture, latency_ms=0)
+        self.requests = []
+
+    def _query(self, database_id, filter=None, **kwargs):
+        self.requests.append(("query", database_id, filter))
+        return super()._query(database_id, filter=filter, **kwargs)
+
+    def _children(self, block_id, **kwargs):
+        self.requests.append(("children", block_id, None))
+        return super()._children(block_id, **kwargs)
+
+
+@pytest.fixture
+def fixture():
+    return build_fixture(PAGES_PER_DB)
+
+
+@pytest.fixture
+def client(fixture):
+    return RecordingClient(fixture)
+
+
+@pytest.fixture
+def retriever(client):
+    config = {
+        "databases": {key: {"id": f"db-{key}"} for key in DATABASES},
+        "extraction": {"max_depth": 10},
+    }
+    return NotionKnowledgeRetriever(client=client, config=config)
+
+
+@pytest.fixture
+def mirror(tmp_path, retriever, client):
+    mirror = NotionMirror(tmp_path / "mirror.sqlite")
+    mirror.sync(retriever)
+    client.requests.clear()
+    return mirror
+
+
+def test_full_sync_mirrors_every_page_and_block_tree(tmp_path, retriever, client):
+    mirror = NotionMirror(tmp_path / "mirror.sqlite")
+
+    report = mirror.sync(retriever)
+
+    assert {key: counts["updated"] for key, counts in report.items()} == {key: PAGES_PER_DB for key in DATABASES}
+    assert sum(1 for kind, _, _ in client.requests if kind == "query") == len(DATABASES)
+    # Each page has one paragraph with one nested child: two list calls
+    assert sum(1 for kind, _, _ in client.requests if kind == "children") == 2 * PAGES_PER_DB * len(DATABASES)
+    blocks = mirror.page_blocks("archetypes-000")
+    assert [b["type"] for b in blocks] == ["paragraph"]
+    assert [c["type"] for c in blocks[0]["children"]] == ["bulleted_list_item"]
+
+
+def test_incremental_sync_only_queries_the_delta(mirror, retriever, client, fixture):
+    cursors = {row["database_key"]: row["last_edited_cursor"] for row in mirror.stats()}
+    edited = fixture["databases"]["db-archetypes"][0]
+    edited["last_edited_time"] = "2025-07-01T12:00:00.000Z"
+    edited["properties"]["Shadow Aspect"]["rich_text"][0]["plain_text"] = "Navigator shadow (revised)"
+
+    report = mirror.sync(retriever)
+
+    queries = [(db_id, flt) for kind, db_id, flt in client.requests if kind == "query"]
+    assert queries == [
+        (f"db-{key}", {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": cursors[key]}})
+        for key in DATABASES
+    ]
+    # Only the edited page's block tree is re-read
+    assert [block_id for kind, block_id, _ in client.requests if kind == "children"] == [
+        "archetypes-000", "archetypes-000-b1",
+    ]
+    assert {key: counts["updated"] for key, counts in report.items()} == {
+        "archetypes": 1, "realms": 0, "frequencies": 0, "rituals": 0,
+    }
+    assert mirror.lookup("archetypes", "Navigator")["Shadow Aspect"] == "Navigator shadow (revised)"
+
+
+def test_incremental_sync_without_changes_fetches_no_blocks(mirror, retriever, client):
+    report = mirror.sync(retriever)
+
+    assert [kind for kind, _, _ in client.requests] == ["query"] * len(DATABASES)
+    assert all(counts["updated"] == 0 for counts in report.values())
+
+
+def test_full_sync_prunes_deleted_pages(mirror, retriever, fixture):
+    fixture["databases"]["db-realms"].pop()
+
+    report = mirror.sync(retriever, ["realms"], full=True)
+
+    assert report["realms"]["pruned"] == 1
+    assert len(mirror.entries("realms")) == PAGES_PER_DB - 1
+
+
+def test_get_archetype_reads_mirror_without_calling_notion(mirror, retriever, client, monkeypatch):
+    live = retriever.query_database("archetypes", filter_name="Navigator")[0]
+    client.requests.clear()
+
+    monkeypatch.setattr(knowledge_tools, "_mirror", mirror)
+    monkeypatch.setattr(knowledge_tools, "NotionKnowledgeRetriever", lambda: retriever)
+    knowledge_tools.clear_lookup_cache()
+    try:
+        results = [knowledge_tools.get_archetype("Navigator") for _ in range(50)]
+        cache = knowledge_tools._mirror_entry.cache_info()
+    finally:
+        knowledge_tools.clear_lookup_cache()
+
+    assert client.requests == []
+    assert all(result == live for result in results)
+    assert (cache.misses, cache.hits) == (1, 49)
+
+
+def test_get_archetype_online_bypasses_mirror(mirror, retriever, client, monkeypatch):
+    monkeypatch.setattr(knowledge_tools, "_mirror", mirror)
+    monkeypatch.setattr(knowledge_tools, "NotionKnowledgeRetriever", lambda: retriever)
+    knowledge_tools.clear_lookup_cache()
+    try:
+        result = knowledge_tools.get_archetype("Navigator", online=True)
+    finally:
+        knowledge_tools.clear_lookup_cache()
+
+    assert result["Name"] == "Navigator"
+    assert [kind for kind, _, _ in client.requests] == ["query"]
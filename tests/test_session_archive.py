@@ -0,0 +1,40 @@
+"""Tests for choosing which session files an archive may drop."""
+
+from scripts.automation.session_archive import plan_archive
+
+
+def make_session(root, files):
+    for rel in files:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b'x')
+    return root
+
+
+def test_final_video_is_always_archived(tmp_path):
+    session = make_session(tmp_path, [
+        'manifest.yaml',
+        'images/scene_01.png',
+        'output/voice.mp3',
+        'output/session_mixed.wav',
+        'output/video/session_final.mp4',
+        'output/video/composite_with_images.mp4',
+    ])
+
+    plan = plan_archive(session)
+
+    assert 'output/video/session_final.mp4' in plan.pack
+    assert plan.dropped == {
+        'output/session_mixed.wav': 'mix',
+        'output/video/composite_with_images.mp4': 'video',
+    }
+
+
+def test_video_intermediates_kept_without_voice(tmp_path):
+    session = make_session(tmp_path, [
+        'manifest.yaml',
+        'images/scene_01.png',
+        'output/video/composite_with_images.mp4',
+    ])
+
+    assert plan_archive(session).dropped == {}
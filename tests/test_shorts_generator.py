@@ -0,0 +1,86 @@
+"""Frame-accuracy tests for single-pass Shorts rendering.
+
+Each rendered short must have exactly the clip's frame count, and its first
+frame must match the source frame at the clip start (PSNR against source
+frames -1/0/+1), for one clip and for overlapping clips sharing a decode.
+"""
+
+import shutil
+import subprocess
+
+import pytest
+
+from scripts.automation.shorts_generator import (
+    ShortClip,
+    ShortsGenerator,
+    _boundary_offset,
+    _count_frames,
+    _ffmpeg_has_filter,
+)
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(shutil.which('ffmpeg') is None, reason='ffmpeg not installed'),
+]
+
+FPS = 30
+CLIP_SECONDS = 3.0
+EXPECTED_FRAMES = round(CLIP_SECONDS * FPS)
+# Odd starts land between keyframes and off frame boundaries
+STARTS = [7.31, 8.81, 10.31]
+
+
+@pytest.fixture(scope='module')
+def source(tmp_path_factory):
+    path = tmp_path_factory.mktemp('shorts') / 'source.mp4'
+    subprocess.run([
+        'ffmpeg', '-y', '-v', 'error',
+        '-f', 'lavfi', '-i', f'testsrc2=size=960x540:rate={FPS}:duration=20',
+        '-f', 'lavfi', '-i', 'sine=frequency=440:sample_rate=48000:duration=20',
+        '-c:v', 'libx264', '-preset', 'ultrafast', '-g', str(FPS * 2),
+        '-c:a', 'aac', '-shortest', str(path)
+    ], check=True)
+    return path
+
+
+@pytest.fixture(scope='module')
+def generator():
+    config = {'shorts': {'duration_seconds': 40, 'cta_duration_seconds': 8}}
+    generator = ShortsGenerator(config, db=None, youtube_client=None)
+    generator.draw_text = _ffmpeg_has_filter('drawtext')
+    return generator
+
+
+def clip_at(tmp_path, start, name):
+    return ShortClip(start, CLIP_SECONDS, tmp_path / f'{name}.mp4', 'salars.net/dreamweavings/test')
+
+
+def assert_frame_accurate(clip, source):
+    assert _count_frames(clip.output_path) == EXPECTED_FRAMES
+    assert _boundary_offset(clip.output_path, source, clip.start, FPS) == 0
+
+
+def test_single_pass_render_is_frame_accurate(tmp_path, source, generator):
+    clip = clip_at(tmp_path, STARTS[0], 'single')
+
+    assert generator.render_shorts(source, [clip])
+
+    assert_frame_accurate(clip, source)
+    assert not list(tmp_path.glob('.*.partial.mp4'))
+
+
+def test_shared_decode_render_is_frame_accurate(tmp_path, source, generator):
+    clips = [clip_at(tmp_path, start, f'shared_{i}') for i, start in enumerate(STARTS)]
+
+    assert generator.render_shorts(source, clips)
+
+    for clip in clips:
+        assert_frame_accurate(clip, source)
+
+
+def test_three_step_render_matches_frame_count(tmp_path, source, generator):
+    clip = clip_at(tmp_path, STARTS[0], 'legacy')
+
+    assert generator.render_three_step(source, clip)
+
+    assert _count_frames(clip.output_path) == EXPECTED_FRAMES
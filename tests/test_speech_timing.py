@@ -0,0 +1,53 @@
+"""Cue timing accuracy of the voice timing sidecar on synthetic speech."""
+
+import numpy as np
+import pytest
+
+from scripts.ai.vtt_generator import _speech_fixture
+from scripts.core.speech_timing import (
+    ANALYSIS_HOP_SECONDS,
+    build_timing_sidecar,
+    refine_phrase,
+)
+
+SAMPLE_RATE = 24000
+
+
+@pytest.fixture(scope='module', params=[7, 11])
+def fixture(request):
+    rng = np.random.default_rng(request.param)
+    chunk_ssml, chunk_audio, chunk_starts, onsets = _speech_fixture(rng, 6, SAMPLE_RATE)
+    timing = build_timing_sidecar(chunk_ssml, chunk_audio, SAMPLE_RATE, 'fixture.wav')
+    return timing, np.concatenate(chunk_audio), chunk_starts, np.array(onsets) / SAMPLE_RATE
+
+
+def test_chunk_offsets_are_sample_exact(fixture):
+    timing, _, chunk_starts, _ = fixture
+
+    errors = [c['start_sample'] - start for c, start in zip(timing['chunks'], chunk_starts)]
+
+    assert errors == [0] * len(chunk_starts)
+
+
+def test_every_break_is_located(fixture):
+    timing = fixture[0]
+
+    breaks = [b for c in timing['chunks'] for b in c['breaks']]
+
+    assert breaks and all(b['detected'] for b in breaks)
+
+
+def test_refined_cues_within_one_frame(fixture):
+    timing, samples, _, truth = fixture
+    phrases = [p for c in timing['chunks'] for p in c['phrases']]
+
+    refined = np.array([
+        refine_phrase(samples, SAMPLE_RATE, p['start_sample'], p['end_sample'], p['text'])['start']
+        for p in phrases
+    ])
+    error = np.abs(refined - truth)
+    first_in_chunk = np.cumsum([0] + [len(c['phrases']) for c in timing['chunks']])[:-1]
+
+    assert len(phrases) == len(truth)
+    assert error.max() <= ANALYSIS_HOP_SECONDS
+    assert error[first_in_chunk].max() <= ANALYSIS_HOP_SECONDS
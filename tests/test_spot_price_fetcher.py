@@ -0,0 +1,194 @@
+"""Tests for hedged spot price fetching and stale-while-revalidate caching.
+
+Sources are pointed at a local stub server with slow, blocked (403),
+malformed and good endpoints.
+"""
+
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("bs4")
+
+from scripts.automation import state_db
+from scripts.automation.state_db import StateDatabase
+from scripts.utilities import spot_price_fetcher as spf
+
+SLOW_SECONDS = 3.0
+API_BODY = '{"items": [{"xauPrice": 2400.10, "xagPrice": 30.55}]}'
+PAGE_BODY = '<html><body>Gold: $2,401.20 Silver: $30.60</body></html>'
+
+
+@pytest.fixture
+def stub_server():
+    """Local HTTP server; yields (base URL, per-path hit counter)."""
+    hits = Counter()
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits[self.path] += 1
+            if self.path == '/slow':
+                time.sleep(SLOW_SECONDS)
+                status, body = 200, API_BODY
+            elif self.path == '/api':
+                status, body = 200, API_BODY
+            elif self.path == '/blocked':
+                status, body = 403, 'Access denied'
+            elif self.path == '/malformed':
+                status, body = 200, '<html><body>Prices unavailable</body></html>'
+            else:
+                status, body = 200, PAGE_BODY
+            try:
+                self.send_response(status)
+                self.end_headers()
+                self.wfile.write(body.encode())
+            except OSError:
+                pass  # Client abandoned the request
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", hits
+    server.shutdown()
+    server.server_close()
+
+
+def point_sources(monkeypatch, base, **paths):
+    for name, path in paths.items():
+        monkeypatch.setitem(spf.SOURCE_URLS, name, f"{base}{path}")
+
+
+@pytest.fixture
+def state_dir(tmp_path, monkeypatch):
+    """Empty in-memory cache and a fresh StateDatabase in tmp_path."""
+    monkeypatch.setattr(state_db, 'DEFAULT_DB_PATH', tmp_path / 'state.db')
+    with StateDatabase() as db:
+        db.init_schema()
+    monkeypatch.setattr(spf, '_cache', {'silver': None, 'gold': None, 'source': None, 'fetched_at': None})
+    return tmp_path
+
+
+def test_blocked_and_malformed_sources_return_none(stub_server, monkeypatch):
+    base, _ = stub_server
+    point_sources(monkeypatch, base, **{'goldprice.org': '/blocked', 'jmbullion': '/malformed'})
+
+    assert spf._fetch_goldprice_api() is None
+    assert spf._scrape_jmbullion() is None
+
+
+def test_hedged_fetch_skips_slow_blocked_and_malformed_sources(stub_server, monkeypatch):
+    base, hits = stub_server
+    point_sources(monkeypatch, base, **{
+        'goldprice.org': '/slow',
+        'apmex': '/blocked',
+        'jmbullion': '/malformed',
+        'kitco': '/good',
+    })
+
+    start = time.monotonic()
+    result, source = spf._fetch_hedged(hedge_delay=0.2)
+    elapsed = time.monotonic() - start
+
+    assert source == 'kitco'
+    assert result == {'silver': 30.60, 'gold': 2401.20}
+    assert elapsed < SLOW_SECONDS / 2
+    assert hits['/blocked'] == 1 and hits['/malformed'] == 1
+
+
+def test_hedged_fetch_takes_first_valid_answer_and_skips_the_rest(stub_server, monkeypatch):
+    base, hits = stub_server
+    point_sources(monkeypatch, base, **{
+        'goldprice.org': '/api',
+        'apmex': '/good',
+        'jmbullion': '/good',
+        'kitco': '/good',
+    })
+
+    result, source = spf._fetch_hedged(hedge_delay=1.0)
+
+    assert source == 'goldprice.org'
+    assert result == {'silver': 30.55, 'gold': 2400.10}
+    assert hits['/good'] == 0
+
+
+def test_hedged_fetch_starts_next_source_as_soon_as_running_ones_fail(stub_server, monkeypatch):
+    base, hits = stub_server
+    point_sources(monkeypatch, base, **{
+        'goldprice.org': '/blocked',
+        'apmex': '/blocked',
+        'jmbullion': '/malformed',
+        'kitco': '/malformed',
+    })
+
+    start = time.monotonic()
+    result, source = spf._fetch_hedged(hedge_delay=5.0)
+    elapsed = time.monotonic() - start
+
+    assert (result, source) == (None, None)
+    assert elapsed < 5.0
+    assert sum(hits.values()) == 4
+
+
+def test_stale_prices_are_served_while_one_refresh_runs(stub_server, monkeypatch, state_dir):
+    base, hits = stub_server
+    point_sources(monkeypatch, base, **{'goldprice.org': '/api'})
+    with StateDatabase() as db:
+        for metal, price in (('silver', 29.00), ('gold', 2300.00)):
+            db.conn.execute(
+                "INSERT INTO spot_price_cache (metal, price_usd, source, fetched_at) "
+                "VALUES (?, ?, 'kitco', datetime('now', '-30 minutes'))",
+                (metal, price),
+            )
+        db.conn.commit()
+
+    barrier = threading.Barrier(20)
+    responses = []
+
+    def reader():
+        barrier.wait()
+        responses.append(spf.get_spot_prices())
+
+    threads = [threading.Thread(target=reader) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(responses) == 20
+    assert all(r['stale'] and r['cached'] and r['silver'] == 29.00 for r in responses)
+    assert all(29.5 <= r['cache_age_minutes'] <= 31 for r in responses)
+    assert sum(r['revalidating'] for r in responses) == 1
+
+    deadline = time.monotonic() + 5
+    while spf._cache['silver'] != 30.55 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    time.sleep(0.1)  # let the refresh release its lock
+
+    assert hits['/api'] == 1
+    fresh = spf.get_spot_prices()
+    assert fresh['silver'] == 30.55 and not fresh['stale']
+    with StateDatabase() as db:
+        assert db.get_latest_spot_price('silver')['price_usd'] == 30.55
+        assert db.conn.execute("SELECT COUNT(*) FROM refresh_locks").fetchone()[0] == 0
+
+
+def test_refresh_is_skipped_while_another_process_holds_the_lock(stub_server, monkeypatch, state_dir):
+    base, hits = stub_server
+    point_sources(monkeypatch, base, **{'goldprice.org': '/api'})
+    with StateDatabase() as db:
+        assert db.acquire_refresh_lock(spf.REFRESH_LOCK_NAME, 'other-host:1:1', ttl_seconds=60)
+
+    assert spf._revalidate()
+    deadline = time.monotonic() + 5
+    while spf._refresh_lock.locked() and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert not spf._refresh_lock.locked()
+    assert hits['/api'] == 0
+    assert spf._cache['silver'] is None
@@ -0,0 +1,294 @@
+"""Tests for the worker's Redis claim, lease, reaper and dead-letter paths."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # fakeredis needs lupa to run the Lua scripts
+
+import worker
+from worker import (
+    DEAD_LETTER_LIST,
+    DELIVERIES_KEY,
+    LEASES_KEY,
+    PROCESSING_LIST,
+    DreamweavingWorker,
+    lease_member,
+)
+
+PENDING, SPECULATIVE = worker.QUEUES
+
+
+def make_worker(**kwargs):
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return DreamweavingWorker(redis_client=redis, clients=object(), **kwargs)
+
+
+def payload(job_id, **extra):
+    return json.dumps({"id": job_id, "type": "standard", **extra})
+
+
+async def run_job(w, queue, job_payload):
+    """Run one claimed job the way ``run()`` does (slot taken first)."""
+    await w._slots.acquire()
+    await w._run(queue, job_payload)
+
+
+def test_claim_prefers_pending_over_speculative():
+    async def scenario():
+        w = make_worker()
+        await w.redis.rpush(SPECULATIVE, payload("spec-1"))
+        await w.redis.rpush(PENDING, payload("pend-1"), payload("pend-2"))
+
+        claimed = [await w.claim() for _ in range(3)]
+        return w, claimed
+
+    w, claimed = asyncio.run(scenario())
+
+    assert [q for q, _ in claimed] == [PENDING, PENDING, SPECULATIVE]
+    assert [json.loads(p)["id"] for _, p in claimed] == ["pend-1", "pend-2", "spec-1"]
+
+
+def test_claim_moves_job_to_processing_and_leases_it():
+    async def scenario():
+        w = make_worker(visibility_timeout=60)
+        job = payload("job-1")
+        await w.redis.rpush(PENDING, job)
+
+        before = time.time()
+        queue, claimed = await w.claim()
+        return (w, job, queue, claimed, before,
+                await w.redis.lrange(PENDING, 0, -1),
+                await w.redis.lrange(PROCESSING_LIST, 0, -1),
+                await w.redis.zscore(LEASES_KEY, lease_member(queue, claimed)))
+
+    w, job, queue, claimed, before, pending, processing, deadline = asyncio.run(scenario())
+
+    assert (queue, claimed) == (PENDING, job)
+    assert pending == []
+    assert processing == [job]
+    assert before + 60 <= deadline <= time.time() + 60
+
+
+def test_claim_returns_none_when_all_queues_are_empty(monkeypatch):
+    monkeypatch.setattr(worker, "POLL_TIMEOUT", 0.1)
+
+    async def scenario():
+        w = make_worker()
+        return await w.claim(), await w.redis.zcard(LEASES_KEY)
+
+    assert asyncio.run(scenario()) == (None, 0)
+
+
+def test_successful_job_is_acked(monkeypatch):
+    seen = []
+
+    async def process_job(job, clients):
+        seen.append(job["id"])
+
+    monkeypatch.setattr(worker, "process_job", process_job)
+
+    async def scenario():
+        w = make_worker()
+        await w.redis.rpush(PENDING, payload("ok-1"))
+        queue, job = await w.claim()
+        await run_job(w, queue, job)
+        return (w,
+                await w.redis.lrange(PROCESSING_LIST, 0, -1),
+                await w.redis.zcard(LEASES_KEY),
+                await w.redis.hgetall(DELIVERIES_KEY))
+
+    w, processing, leases, deliveries = asyncio.run(scenario())
+
+    assert seen == ["ok-1"]
+    assert processing == [] and leases == 0 and deliveries == {}
+    assert w.metrics.counters["jobs_completed"] == 1
+    assert w.metrics.in_flight == 0
+
+
+def test_malformed_payload_is_acked_without_processing(monkeypatch):
+    async def process_job(job, clients):
+        raise AssertionError("malformed payload must not be processed")
+
+    monkeypatch.setattr(worker, "process_job", process_job)
+
+    async def scenario():
+        w = make_worker()
+        await w.redis.rpush(PENDING, "{not json")
+        queue, job = await w.claim()
+        await run_job(w, queue, job)
+        return w, await w.redis.llen(PROCESSING_LIST), await w.redis.zcard(LEASES_KEY)
+
+    w, processing, leases = asyncio.run(scenario())
+
+    assert (processing, leases) == (0, 0)
+    assert w.metrics.counters["jobs_malformed"] == 1
+
+
+def test_failed_job_is_retried_then_dead_lettered(monkeypatch):
+    attempts = []
+
+    async def process_job(job, clients):
+        attempts.append(job["id"])
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(worker, "process_job", process_job)
+
+    async def scenario():
+        w = make_worker(max_deliveries=3)
+        job = payload("flaky-1")
+        await w.redis.rpush(PENDING, job)
+
+        queues_after = []
+        for attempt in range(3):
+            queue, claimed = await w.claim()
+            if attempt == 0:
+                await w.redis.rpush(PENDING, payload("other"))
+            await run_job(w, queue, claimed)
+            queues_after.append(await w.redis.lrange(PENDING, 0, -1))
+            if attempt == 0:
+                await w.redis.lrem(PENDING, 1, payload("other"))
+
+        return (w, job, queues_after,
+                await w.redis.lrange(DEAD_LETTER_LIST, 0, -1),
+                await w.redis.llen(PROCESSING_LIST),
+                await w.redis.zcard(LEASES_KEY),
+                await w.redis.hgetall(DELIVERIES_KEY))
+
+    w, job, queues_after, dead, processing, leases, deliveries = asyncio.run(scenario())
+
+    assert attempts == ["flaky-1"] * 3
+    # A failed job goes to the tail of its queue until it runs out of deliveries
+    assert queues_after[0] == [payload("other"), job]
+    assert queues_after[2] == []
+    assert dead == [job]
+    assert (processing, leases, deliveries) == (0, 0, {})
+    assert w.metrics.counters["jobs_requeued"] == 2
+    assert w.metrics.counters["jobs_dead_lettered"] == 1
+
+
+def test_reaper_returns_expired_job_to_head_of_its_queue():
+    async def scenario():
+        w = make_worker()
+        stalled = payload("stalled-1")
+        await w.redis.rpush(SPECULATIVE, stalled, payload("next"))
+        queue, claimed = await w.claim()
+
+        # Worker died: the lease is never renewed and runs out
+        await w.redis.zadd(LEASES_KEY, {lease_member(queue, claimed): time.time() - 1})
+        reaped = await w.reap_expired()
+        return (w, stalled, reaped,
+                await w.redis.lrange(SPECULATIVE, 0, -1),
+                await w.redis.llen(PROCESSING_LIST),
+                await w.redis.zcard(LEASES_KEY))
+
+    w, stalled, reaped, speculative, processing, leases = asyncio.run(scenario())
+
+    assert reaped == 1
+    assert speculative == [stalled, payload("next")]
+    assert (processing, leases) == (0, 0)
+    assert w.metrics.counters["jobs_requeued"] == 1
+
+
+def test_reaper_dead_letters_job_out_of_deliveries():
+    async def scenario():
+        w = make_worker(max_deliveries=2)
+        job = payload("poison-1")
+        await w.redis.rpush(PENDING, job)
+        queue, claimed = await w.claim()
+        await w.redis.hset(DELIVERIES_KEY, "poison-1", 2)
+        await w.redis.zadd(LEASES_KEY, {lease_member(queue, claimed): time.time() - 1})
+
+        await w.reap_expired()
+        return (w, job,
+                await w.redis.lrange(DEAD_LETTER_LIST, 0, -1),
+                await w.redis.llen(PENDING),
+                await w.redis.hgetall(DELIVERIES_KEY))
+
+    w, job, dead, pending, deliveries = asyncio.run(scenario())
+
+    assert dead == [job]
+    assert pending == 0 and deliveries == {}
+    assert w.metrics.counters["jobs_dead_lettered"] == 1
+
+
+def test_concurrent_reapers_requeue_a_job_once():
+    async def scenario():
+        redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        a = DreamweavingWorker(redis_client=redis, clients=object())
+        b = DreamweavingWorker(redis_client=redis, clients=object())
+        job = payload("once-1")
+        await redis.rpush(PENDING, job)
+        queue, claimed = await a.claim()
+        await redis.zadd(LEASES_KEY, {lease_member(queue, claimed): time.time() - 1})
+
+        await asyncio.gather(a.reap_expired(), b.reap_expired())
+        return job, await redis.lrange(PENDING, 0, -1)
+
+    job, pending = asyncio.run(scenario())
+
+    assert pending == [job]
+
+
+def test_reaper_leases_orphaned_processing_entries():
+    async def scenario():
+        w = make_worker(visibility_timeout=60)
+        orphan = payload("orphan-1")
+        # Claimer died between BLMOVE and ZADD: in processing, no lease
+        await w.redis.rpush(PROCESSING_LIST, orphan)
+
+        reaped = await w.reap_expired()
+        return (orphan, reaped,
+                await w.redis.zscore(LEASES_KEY, lease_member(PENDING, orphan)))
+
+    orphan, reaped, deadline = asyncio.run(scenario())
+
+    assert reaped == 0
+    assert deadline is not None and deadline > time.time()
+
+
+def test_lease_renewal_extends_but_never_resurrects(monkeypatch):
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def fast_sleep(seconds):
+        sleeps.append(seconds)
+        await real_sleep(0)
+        if len(sleeps) >= 3:
+            raise asyncio.CancelledError
+
+    async def scenario():
+        w = make_worker(visibility_timeout=30)
+        live = lease_member(PENDING, payload("live-1"))
+        reaped = lease_member(PENDING, payload("reaped-1"))
+        await w.redis.zadd(LEASES_KEY, {live: time.time() + 1})
+
+        monkeypatch.setattr(worker.asyncio, "sleep", fast_sleep)
+        for member in (live, reaped):
+            sleeps.clear()
+            with pytest.raises(asyncio.CancelledError):
+                await w._renew_lease(member)
+        monkeypatch.undo()
+
+        return (await w.redis.zscore(LEASES_KEY, live),
+                await w.redis.zscore(LEASES_KEY, reaped))
+
+    started = time.time()
+    live_deadline, reaped_deadline = asyncio.run(scenario())
+
+    assert sleeps[0] == 10.0  # a third of the visibility timeout
+    assert live_deadline >= started + 30
+    assert reaped_deadline is None
+
+
+def test_process_job_surfaces_trace_setup_error(monkeypatch):
+    def broken_trace(name, save=True):
+        raise RuntimeError("trace store unavailable")
+
+    monkeypatch.setattr(worker, "trace", broken_trace)
+
+    with pytest.raises(RuntimeError, match="trace store unavailable"):
+        asyncio.run(worker.process_job({"id": "job-1", "type": "standard"}, clients=object()))
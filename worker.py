@@ -1,18 +1,51 @@
 #!/usr/bin/env python3
+"""
+Dreamweaving Redis worker.
+
+Async consumer for the ``dreamweaving_pending`` (high priority) and
+``dreamweaving_speculative`` (low priority) job lists.
+
+Delivery is at-least-once: a claimed job is atomically moved to
+``dreamweaving_processing`` and leased in ``dreamweaving_leases`` until it
+is acknowledged. Running jobs renew their lease; if a worker dies, a
+reaper moves expired jobs back to the head of their source queue. Jobs
+that fail (or expire) ``MAX_DELIVERIES`` times go to ``dreamweaving_dead``.
+
+Up to ``WORKER_CONCURRENCY`` jobs run at once, sharing one Redis pool and
+one OpenAI / Text-to-Speech / S3 / HTTP client for the worker's lifetime.
+
+Environment:
+    REDIS_URL               redis://localhost:6379/0
+    WORKER_CONCURRENCY      Max jobs in flight (default: 4)
+    VISIBILITY_TIMEOUT      Lease seconds before a job is requeued (default: 300)
+    MAX_DELIVERIES          Deliveries before dead-lettering (default: 5)
+    METRICS_PORT            Serve Prometheus text on /metrics (default: 0 = off)
+    METRICS_LOG_INTERVAL    Seconds between metrics log lines (default: 60)
+    PERF_TRACE              0 disables per-job stage timings (default: on)
+    PERF_TRACE_DB           Stage timings database (default: data/automation_state.db)
+"""
+import asyncio
+import hashlib
+import json
+import logging
 import os
+import signal
 import sys
-import json
 import time
-import logging
-import requests
+from collections import Counter, deque
+from typing import Dict, List, Optional
+
 import boto3
 import google.generativeai as genai
-from redis import Redis
+import httpx
 from dotenv import load_dotenv
+from redis import asyncio as aioredis
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from scripts.utilities.tracing import span, trace
+
 # Load environment variables
 load_dotenv()
 
@@ -23,6 +56,20 @@ logger = logging.getLogger(__name__)
 # Redis Connection
 REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 QUEUE_NAME = 'dreamweaving_pending'
+# PRIORITY: dreamweaving_pending (High) > dreamweaving_speculative (Low)
+QUEUES = [QUEUE_NAME, 'dreamweaving_speculative']
+PROCESSING_LIST = 'dreamweaving_processing'
+LEASES_KEY = 'dreamweaving_leases'          # zset: "<queue>\n<payload>" -> lease deadline
+DELIVERIES_KEY = 'dreamweaving_deliveries'  # hash: job key -> delivery count
+DEAD_LETTER_LIST = 'dreamweaving_dead'
+
+# Worker tuning
+WORKER_CONCURRENCY = int(os.getenv('WORKER_CONCURRENCY', '4'))
+VISIBILITY_TIMEOUT = float(os.getenv('VISIBILITY_TIMEOUT', '300'))
+MAX_DELIVERIES = int(os.getenv('MAX_DELIVERIES', '5'))
+METRICS_PORT = int(os.getenv('METRICS_PORT', '0'))
+METRICS_LOG_INTERVAL = float(os.getenv('METRICS_LOG_INTERVAL', '60'))
+POLL_TIMEOUT = 1  # seconds a blocking claim waits before re-checking all queues
 
 # AI & Cloud Configuration
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
@@ -32,22 +79,176 @@ R2_SECRET_KEY = os.getenv('R2_SECRET_ACCESS_KEY')
 R2_ENDPOINT = os.getenv('R2_ENDPOINT_URL')
 CALLBACK_URL = os.getenv('APP_CALLBACK_URL', 'http://localhost:3000/api/internal/dreamweaving/callback')
 
-# Initialize Clients
+PROMPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'prompts', 'soul_of_the_coin.md')
+
 if GEMINI_API_KEY:
     genai.configure(api_key=GEMINI_API_KEY)
 
-s3 = None
-if R2_ENDPOINT and R2_ACCESS_KEY:
-    s3 = boto3.client('s3',
-        endpoint_url=R2_ENDPOINT,
-        aws_access_key_id=R2_ACCESS_KEY,
-        aws_secret_access_key=R2_SECRET_KEY
-    )
 
-def handle_soul_of_the_coin(job_id, data):
+# Move the head of a source queue into the processing list and lease it, atomically
+CLAIM_SCRIPT = """
+local payload = redis.call('LMOVE', KEYS[1], KEYS[2], 'LEFT', 'RIGHT')
+if payload then
+    redis.call('ZADD', KEYS[3], ARGV[1], KEYS[1] .. '\\n' .. payload)
+end
+return payload
+"""
+
+# Drop a finished job from the processing list, its lease and delivery count
+ACK_SCRIPT = """
+redis.call('LREM', KEYS[1], 1, ARGV[2])
+redis.call('ZREM', KEYS[2], ARGV[1])
+redis.call('HDEL', KEYS[3], ARGV[3])
+return 1
+"""
+
+# Return a leased job to a list (retry queue or dead letter). Only the
+# caller that removes the lease moves the job, so concurrent reapers
+# never duplicate it.
+REQUEUE_SCRIPT = """
+if redis.call('ZREM', KEYS[2], ARGV[1]) == 1 then
+    redis.call('LREM', KEYS[1], 1, ARGV[2])
+    redis.call(ARGV[3], KEYS[3], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+
+def lease_member(queue: str, payload: str) -> str:
+    return f"{queue}\n{payload}"
+
+
+def job_key(job: Optional[Dict], payload: str) -> str:
+    """Stable key for delivery counting (job id, else payload hash)."""
+    if isinstance(job, dict) and job.get('id'):
+        return str(job['id'])
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+# =============================================================================
+# METRICS
+# =============================================================================
+
+class WorkerMetrics:
+    """Queue depth, job latency and failure counters for one worker."""
+
+    def __init__(self, window: int = 1000):
+        self.started_at = time.time()
+        self.counters: Counter = Counter()
+        self.in_flight = 0
+        self.queue_depth: Dict[str, int] = {}
+        self.latency = deque(maxlen=window)     # seconds from claim to ack
+        self.queue_wait = deque(maxlen=window)  # seconds from enqueue to claim
+
+    @staticmethod
+    def _percentile(values, pct: float) -> float:
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+    def observe_job(self, job_type: str, latency: float, wait: Optional[float], ok: bool):
+        self.counters['jobs_completed' if ok else 'jobs_failed'] += 1
+        self.counters[f"jobs_{'completed' if ok else 'failed'}:{job_type}"] += 1
+        self.latency.append(latency)
+        if wait is not None:
+            self.queue_wait.append(wait)
+
+    def snapshot(self) -> Dict:
+        return {
+            'uptime_s': round(time.time() - self.started_at, 1),
+            'in_flight': self.in_flight,
+            'queue_depth': dict(self.queue_depth),
+            'counters': dict(self.counters),
+            'latency_p50_s': round(self._percentile(self.latency, 0.50), 3),
+            'latency_p95_s': round(self._percentile(self.latency, 0.95), 3),
+            'queue_wait_p50_s': round(self._percentile(self.queue_wait, 0.50), 3),
+            'queue_wait_p95_s': round(self._percentile(self.queue_wait, 0.95), 3),
+        }
+
+    def prometheus(self) -> str:
+        """Render metrics in Prometheus text exposition format."""
+        lines = [
+            f"dreamweaving_worker_uptime_seconds {time.time() - self.started_at:.1f}",
+            f"dreamweaving_worker_in_flight {self.in_flight}",
+        ]
+        for queue, depth in self.queue_depth.items():
+            lines.append(f'dreamweaving_queue_depth{{queue="{queue}"}} {depth}')
+        for name, value in sorted(self.counters.items()):
+            metric, _, job_type = name.partition(':')
+            label = f'{{type="{job_type}"}}' if job_type else ''
+            lines.append(f"dreamweaving_worker_{metric}_total{label} {value}")
+        for name, values in (('job_latency', self.latency), ('queue_wait', self.queue_wait)):
+            for pct in (0.5, 0.95, 0.99):
+                lines.append(
+                    f'dreamweaving_{name}_seconds{{quantile="{pct}"}} {self._percentile(values, pct):.3f}'
+                )
+        return "\n".join(lines) + "\n"
+
+
+# =============================================================================
+# SHARED CLIENTS
+# =============================================================================
+
+class WorkerClients:
+    """Lazily created API/TTS/S3/HTTP clients reused by every job."""
+
+    def __init__(self):
+        self._openai = None
+        self._tts = None
+        self._s3 = None
+        self.http = httpx.AsyncClient(timeout=30.0)
+        self._prompt_template: Optional[str] = None
+
+    @property
+    def openai(self):
+        if self._openai is None:
+            from openai import AsyncOpenAI
+            self._openai = AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        return self._openai
+
+    @property
+    def tts(self):
+        if self._tts is None:
+            from google.cloud import texttospeech
+            self._tts = texttospeech.TextToSpeechAsyncClient()
+        return self._tts
+
+    @property
+    def s3(self):
+        if self._s3 is None and R2_ENDPOINT and R2_ACCESS_KEY:
+            self._s3 = boto3.client('s3',
+                endpoint_url=R2_ENDPOINT,
+                aws_access_key_id=R2_ACCESS_KEY,
+                aws_secret_access_key=R2_SECRET_KEY
+            )
+        return self._s3
+
+    def prompt_template(self) -> Optional[str]:
+        if self._prompt_template is None and os.path.exists(PROMPT_PATH):
+            with open(PROMPT_PATH, 'r') as f:
+                self._prompt_template = f.read()
+        return self._prompt_template
+
+    async def close(self):
+        await self.http.aclose()
+        if self._openai is not None:
+            await self._openai.close()
+        if self._tts is not None:
+            transport = getattr(self._tts, 'transport', None)
+            if transport is not None:
+                await transport.close()
+
+
+# =============================================================================
+# JOB HANDLERS
+# =============================================================================
+
+async def handle_soul_of_the_coin(job_id, data, clients: WorkerClients):
     """
     1. Load Prompt
-    2. Generate Story (Gemini)
+    2. Generate Story (OpenAI)
     3. Generate Audio (Google TTS)
     4. Upload to R2
     5. Callback to Next.js
@@ -60,28 +261,24 @@ def handle_soul_of_the_coin(job_id, data):
     logger.info(f"🔮 Generating Soul for {product_name}...")
 
     # 1. Load Prompt
-    prompt_path = os.path.join(os.path.dirname(__file__), 'prompts', 'soul_of_the_coin.md')
-    if not os.path.exists(prompt_path):
-        logger.error(f"❌ Prompt not found at {prompt_path}")
+    prompt_template = clients.prompt_template()
+    if prompt_template is None:
+        logger.error(f"❌ Prompt not found at {PROMPT_PATH}")
         return
 
-    with open(prompt_path, 'r') as f:
-        prompt_template = f.read()
-    
     prompt = prompt_template.replace('{{product_name}}', product_name).replace('{{customer_name}}', customer_name)
-    
+
     # 2. Generate Story (OpenAI Fallback since Gemini Key missing)
     story_text = "The soul of this coin is silent..."
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": "You are a mystical storyteller."},
-                {"role": "user", "content": prompt}
-            ]
-        )
+        with span("story"):
+            response = await clients.openai.chat.completions.create(
+                model="gpt-4o",
+                messages=[
+                    {"role": "system", "content": "You are a mystical storyteller."},
+                    {"role": "user", "content": prompt}
+                ]
+            )
         story_text = response.choices[0].message.content
         logger.info(f"📜 Story Generated (OpenAI): {len(story_text)} chars")
     except Exception as e:
@@ -93,16 +290,14 @@ def handle_soul_of_the_coin(job_id, data):
     output_dir = f"/tmp/{job_id}"
     os.makedirs(output_dir, exist_ok=True)
     audio_path = f"{output_dir}/soul.mp3"
-    
-    tts_success = False
+
     try:
         from google.cloud import texttospeech
-        client = texttospeech.TextToSpeechClient()
         synthesis_input = texttospeech.SynthesisInput(text=story_text)
-        
+
         # Mystical voice configuration
         voice = texttospeech.VoiceSelectionParams(
-            language_code="en-US", 
+            language_code="en-US",
             name="en-US-Journey-F"
         )
         audio_config = texttospeech.AudioConfig(
@@ -111,36 +306,38 @@ def handle_soul_of_the_coin(job_id, data):
             pitch=-2.0
         )
 
-        response = client.synthesize_speech(
-            input=synthesis_input, voice=voice, audio_config=audio_config
-        )
+        with span("tts"):
+            response = await clients.tts.synthesize_speech(
+                input=synthesis_input, voice=voice, audio_config=audio_config
+            )
 
         with open(audio_path, "wb") as out:
             out.write(response.audio_content)
-        
-        tts_success = True
+
         logger.info(f"🔊 Audio Generated: {audio_path}")
     except Exception as e:
         logger.error(f"❌ TTS Error: {e} - Falling back to dummy audio")
         # Create a dummy file for testing if TTS fails
         with open(audio_path, "wb") as f:
-            f.write(b"dummy audio content") 
-        tts_success = True # We consider dummy creation as 'success' for pipeline verification
+            f.write(b"dummy audio content")
 
     # 4. Upload to R2
     public_url = ""
+    s3 = clients.s3
     if s3 and order_id:
         try:
             object_key = f"souls/{order_id}/{job_id}.mp3"
             # contentType is important for browser playback
-            s3.upload_file(
-                audio_path, 
-                R2_BUCKET_NAME, 
-                object_key,
-                ExtraArgs={'ContentType': 'audio/mpeg'}
-            )
+            with span("upload"):
+                await asyncio.to_thread(
+                    s3.upload_file,
+                    audio_path,
+                    R2_BUCKET_NAME,
+                    object_key,
+                    ExtraArgs={'ContentType': 'audio/mpeg'}
+                )
             # Assuming public domain mapping
-            public_url = f"https://media.salars.net/{object_key}" 
+            public_url = f"https://media.salars.net/{object_key}"
             logger.info(f"☁️ Uploaded to {public_url}")
         except Exception as e:
             logger.error(f"❌ Upload Error: {e}")
@@ -157,63 +354,294 @@ def handle_soul_of_the_coin(job_id, data):
                     "audioUrl": public_url
                 }
             }
-            res = requests.post(CALLBACK_URL, json=callback_payload)
+            with span("callback"):
+                res = await clients.http.post(CALLBACK_URL, json=callback_payload)
             logger.info(f"📞 Callback sent: {res.status_code}")
         except Exception as e:
             logger.error(f"❌ Callback Error: {e}")
 
-def process_job(job):
+
+async def process_job(job, clients: WorkerClients):
     """
-    Process a single job.
+    Process a single job. Exceptions propagate so the job can be retried.
     job structure: { "id": "...", "type": "...", "data": { ... } }
     """
-    try:
-        job_type = job.get('type', 'standard')
-        data = job.get('data', {})
-        job_id = job.get('id')
-        
-        logger.info(f"🔨 Processing Job {job_id} [{job_type}]...")
-        
-        if job_type == 'soul_of_the_coin':
-            handle_soul_of_the_coin(job_id, data)
-        else:
-            # Simulate generic work
-            time.sleep(2) 
-        
-        logger.info(f"✅ Job {job_id} Completed.")
-        
-    except Exception as e:
-        logger.error(f"❌ Error processing job: {e}")
+    job_type = job.get('type', 'standard')
+    data = job.get('data', {})
+    job_id = job.get('id')
 
-def start_worker():
-    """Starts a simple Redis List consumer worker."""
-    logger.info(f"🚀 Starting Dreamweaving List Consumer...")
-    logger.info(f"🔌 Connecting to Redis at {REDIS_URL}")
-    
+    logger.info(f"🔨 Processing Job {job_id} [{job_type}]...")
+
+    job_trace = None
     try:
-        conn = Redis.from_url(REDIS_URL)
-        logger.info(f"👂 Waiting for jobs in list: {QUEUE_NAME}")
-        
+        with trace(f"worker.{job_type}", save=False) as job_trace:
+            if job_type == 'soul_of_the_coin':
+                await handle_soul_of_the_coin(job_id, data, clients)
+            else:
+                # Simulate generic work
+                await asyncio.sleep(2)
+    finally:
+        # Saved from a thread so the SQLite write stays off the event loop
+        if job_trace is not None:
+            await asyncio.to_thread(job_trace.save)
+
+    logger.info(f"✅ Job {job_id} Completed.")
+
+
+def _enqueue_wait(job: Dict, claimed_at: float) -> Optional[float]:
+    """Seconds the job waited in the queue, if the producer stamped it."""
+    enqueued = job.get('enqueuedAt') or job.get('createdAt')
+    if not isinstance(enqueued, (int, float)):
+        return None
+    if enqueued > 1e12:  # milliseconds (JS Date.now())
+        enqueued /= 1000.0
+    return max(0.0, claimed_at - enqueued)
+
+
+# =============================================================================
+# WORKER
+# =============================================================================
+
+class DreamweavingWorker:
+    """Concurrent, at-least-once consumer of the dreamweaving job lists."""
+
+    def __init__(self, redis_url: str = REDIS_URL, concurrency: int = WORKER_CONCURRENCY,
+                 visibility_timeout: float = VISIBILITY_TIMEOUT, max_deliveries: int = MAX_DELIVERIES,
+                 queues: Optional[List[str]] = None, redis_client=None, clients: Optional[WorkerClients] = None):
+        self.redis = redis_client or aioredis.from_url(redis_url, decode_responses=True)
+        self.concurrency = max(1, concurrency)
+        self.visibility_timeout = visibility_timeout
+        self.max_deliveries = max_deliveries
+        self.queues = queues or list(QUEUES)
+        self.clients = clients or WorkerClients()
+        self.metrics = WorkerMetrics()
+
+        self._claim = self.redis.register_script(CLAIM_SCRIPT)
+        self._ack = self.redis.register_script(ACK_SCRIPT)
+        self._requeue = self.redis.register_script(REQUEUE_SCRIPT)
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._tasks: set = set()
+        self._stopping = asyncio.Event()
+
+    # ─── Claiming ──────────────────────────────────────────────────
+
+    def _deadline(self) -> float:
+        return time.time() + self.visibility_timeout
+
+    async def claim(self):
+        """Claim the next job by priority. Returns (queue, payload) or None."""
+        for queue in self.queues:
+            payload = await self._claim(keys=[queue, PROCESSING_LIST, LEASES_KEY], args=[self._deadline()])
+            if payload is not None:
+                return queue, payload
+
+        # All queues empty: block on the high-priority queue only, so lower
+        # priority work is still picked up within POLL_TIMEOUT.
+        payload = await self.redis.blmove(self.queues[0], PROCESSING_LIST, POLL_TIMEOUT, 'LEFT', 'RIGHT')
+        if payload is None:
+            return None
+        await self.redis.zadd(LEASES_KEY, {lease_member(self.queues[0], payload): self._deadline()})
+        return self.queues[0], payload
+
+    async def _renew_lease(self, member: str):
+        """Keep a running job's lease alive (XX: never resurrect a reaped lease)."""
+        interval = max(1.0, self.visibility_timeout / 3)
         while True:
-            # Blocking pop (wait indefinitely for a job)
-            # blpop returns tuple (key, value)
-            # PRIORITY: dreamweaving_pending (High) > dreamweaving_speculative (Low)
-            result = conn.blpop(['dreamweaving_pending', 'dreamweaving_speculative'], timeout=5)
-            
-            if result:
-                _, payload = result
-                try:
-                    job = json.loads(payload)
-                    process_job(job)
-                except json.JSONDecodeError:
-                    logger.error("❌ Failed to decode JSON payload")
-            
-    except KeyboardInterrupt:
+            await asyncio.sleep(interval)
+            await self.redis.zadd(LEASES_KEY, {member: self._deadline()}, xx=True)
+
+    async def _retry_or_bury(self, queue: str, payload: str, key: str, member: str, head: bool) -> str:
+        deliveries = int(await self.redis.hget(DELIVERIES_KEY, key) or 0)
+        if deliveries >= self.max_deliveries:
+            moved = await self._requeue(keys=[PROCESSING_LIST, LEASES_KEY, DEAD_LETTER_LIST],
+                                        args=[member, payload, 'RPUSH'])
+            if moved:
+                await self.redis.hdel(DELIVERIES_KEY, key)
+                self.metrics.counters['jobs_dead_lettered'] += 1
+            return 'dead'
+        moved = await self._requeue(keys=[PROCESSING_LIST, LEASES_KEY, queue],
+                                    args=[member, payload, 'LPUSH' if head else 'RPUSH'])
+        if moved:
+            self.metrics.counters['jobs_requeued'] += 1
+        return 'requeued'
+
+    # ─── Running jobs ──────────────────────────────────────────────
+
+    async def _run(self, queue: str, payload: str):
+        member = lease_member(queue, payload)
+        claimed_at = time.time()
+        start = time.perf_counter()
+        renewer = asyncio.create_task(self._renew_lease(member))
+        self.metrics.in_flight += 1
+
+        job = None
+        try:
+            job = json.loads(payload)
+        except json.JSONDecodeError:
+            pass
+        key = job_key(job, payload)
+
+        try:
+            if not isinstance(job, dict):
+                logger.error("❌ Failed to decode JSON payload")
+                self.metrics.counters['jobs_malformed'] += 1
+                await self._ack(keys=[PROCESSING_LIST, LEASES_KEY, DELIVERIES_KEY], args=[member, payload, key])
+                return
+
+            await self.redis.hincrby(DELIVERIES_KEY, key, 1)
+            job_type = job.get('type', 'standard')
+            try:
+                await process_job(job, self.clients)
+            except Exception as e:
+                logger.error(f"❌ Error processing job {job.get('id')}: {e}")
+                self.metrics.observe_job(job_type, time.perf_counter() - start,
+                                         _enqueue_wait(job, claimed_at), ok=False)
+                outcome = await self._retry_or_bury(queue, payload, key, member, head=False)
+                logger.info(f"↩️ Job {job.get('id')} {outcome}")
+                return
+
+            await self._ack(keys=[PROCESSING_LIST, LEASES_KEY, DELIVERIES_KEY], args=[member, payload, key])
+            self.metrics.observe_job(job_type, time.perf_counter() - start,
+                                     _enqueue_wait(job, claimed_at), ok=True)
+        finally:
+            renewer.cancel()
+            self.metrics.in_flight -= 1
+            self._slots.release()
+
+    # ─── Background loops ──────────────────────────────────────────
+
+    async def reap_expired(self) -> int:
+        """Requeue jobs whose lease expired (worker died or stalled)."""
+        now = time.time()
+        reaped = 0
+        for member in await self.redis.zrangebyscore(LEASES_KEY, '-inf', now):
+            queue, _, payload = member.partition('\n')
+            try:
+                key = job_key(json.loads(payload), payload)
+            except json.JSONDecodeError:
+                key = job_key(None, payload)
+            outcome = await self._retry_or_bury(queue, payload, key, member, head=True)
+            logger.warning(f"⏰ Lease expired, job {outcome}: {key}")
+            reaped += 1
+
+        # Jobs in the processing list without a lease (claimer died between
+        # BLMOVE and ZADD) get a fresh lease so the next sweep can reap them.
+        leased = {m.partition('\n')[2] for m in await self.redis.zrange(LEASES_KEY, 0, -1)}
+        for payload in await self.redis.lrange(PROCESSING_LIST, 0, -1):
+            if payload not in leased:
+                await self.redis.zadd(LEASES_KEY, {lease_member(self.queues[0], payload): self._deadline()}, nx=True)
+        return reaped
+
+    async def _reaper_loop(self):
+        interval = max(1.0, min(30.0, self.visibility_timeout / 4))
+        while not self._stopping.is_set():
+            try:
+                await self.reap_expired()
+            except Exception as e:
+                logger.error(f"❌ Reaper error: {e}")
+            await asyncio.sleep(interval)
+
+    async def refresh_queue_depth(self):
+        lists = self.queues + [PROCESSING_LIST, DEAD_LETTER_LIST]
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for name in lists:
+                pipe.llen(name)
+            depths = await pipe.execute()
+        self.metrics.queue_depth = dict(zip(lists, depths))
+
+    async def _metrics_loop(self):
+        while not self._stopping.is_set():
+            await asyncio.sleep(METRICS_LOG_INTERVAL)
+            try:
+                await self.refresh_queue_depth()
+                logger.info(f"📊 Worker metrics: {json.dumps(self.metrics.snapshot())}")
+            except Exception as e:
+                logger.error(f"❌ Metrics error: {e}")
+
+    async def _serve_metrics(self, reader, writer):
+        try:
+            await reader.readuntil(b"\r\n\r\n")
+            await self.refresh_queue_depth()
+            body = self.metrics.prometheus().encode('utf-8')
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/plain; version=0.0.4\r\n"
+                + f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode('ascii')
+                + body
+            )
+            await writer.drain()
+        except Exception as e:
+            logger.debug(f"Metrics request failed: {e}")
+        finally:
+            writer.close()
+
+    # ─── Lifecycle ─────────────────────────────────────────────────
+
+    def stop(self):
         logger.info("🛑 Worker stopping...")
-    except Exception as e:
-        logger.error(f"❌ Worker crashed: {e}")
-        time.sleep(5) # Prevent tight loop on error
-        start_worker()
+        self._stopping.set()
+
+    async def run(self):
+        logger.info(f"🚀 Starting Dreamweaving worker (concurrency={self.concurrency}, "
+                    f"visibility={self.visibility_timeout:.0f}s)")
+        logger.info(f"👂 Waiting for jobs in lists: {', '.join(self.queues)}")
+
+        background = [
+            asyncio.create_task(self._reaper_loop()),
+            asyncio.create_task(self._metrics_loop()),
+        ]
+        server = None
+        if METRICS_PORT:
+            server = await asyncio.start_server(self._serve_metrics, '0.0.0.0', METRICS_PORT)
+            logger.info(f"📊 Metrics on :{METRICS_PORT}/metrics")
+
+        try:
+            while not self._stopping.is_set():
+                await self._slots.acquire()
+                if self._stopping.is_set():
+                    self._slots.release()
+                    break
+                try:
+                    claimed = await self.claim()
+                except Exception as e:
+                    self._slots.release()
+                    logger.error(f"❌ Redis error: {e}")
+                    await asyncio.sleep(5)  # Prevent tight loop on error
+                    continue
+                if claimed is None:
+                    self._slots.release()
+                    continue
+                task = asyncio.create_task(self._run(*claimed))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        finally:
+            # Let in-flight jobs finish; anything unfinished stays leased and is reaped later
+            if self._tasks:
+                logger.info(f"⏳ Waiting for {len(self._tasks)} in-flight jobs...")
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+            for task in background:
+                task.cancel()
+            if server:
+                server.close()
+            await self.clients.close()
+            await self.redis.aclose()
+
+
+async def main():
+    worker = DreamweavingWorker()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:  # Windows
+            pass
+    logger.info(f"🔌 Connecting to Redis at {REDIS_URL}")
+    await worker.run()
+
+
+def start_worker():
+    """Starts the async Redis list consumer."""
+    asyncio.run(main())
+
 
 if __name__ == '__main__':
     start_worker()